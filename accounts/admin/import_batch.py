@@ -36,6 +36,7 @@ class ImportBatchAdmin(admin.ModelAdmin):
         "emails_queued",
         "errors",
         "summary",
+        "timings",
         "studio_link",
     ]
     ordering = ["-started_at"]
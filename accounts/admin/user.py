@@ -1,7 +1,8 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
 from accounts.models import User
+from accounts.sessions import delete_user_sessions
 from studio.admin_links import studio_link
 
 
@@ -17,6 +18,7 @@ class UserAdmin(BaseUserAdmin):
     search_fields = ["email", "first_name", "last_name"]
     ordering = ["-date_joined"]
     readonly_fields = ["studio_link"]
+    actions = ["sign_out_everywhere"]
 
     @admin.display(description='Studio')
     def studio_link(self, obj):
@@ -26,6 +28,14 @@ class UserAdmin(BaseUserAdmin):
             lambda o: {'user_id': o.pk},
         )
 
+    @admin.action(description="Sign selected users out of all sessions")
+    def sign_out_everywhere(self, request, queryset):
+        """Delete every stored session of the selected users."""
+        deleted = sum(delete_user_sessions(user) for user in queryset.only("pk"))
+        self.message_user(
+            request, f"Deleted {deleted} session(s).", messages.SUCCESS,
+        )
+
     # Override fieldsets to remove username references
     fieldsets = (
         (None, {"fields": ("email", "password")}),
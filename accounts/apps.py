@@ -9,6 +9,7 @@ class AccountsConfig(AppConfig):
             pre_social_login,
             social_account_added,
         )
+        from django.db.models.signals import post_save
 
         from accounts.signals import (
             mark_email_verified_on_social_login,
@@ -17,6 +18,7 @@ class AccountsConfig(AppConfig):
             set_signup_source_oauth_on_social_signup,
             set_slack_user_id_on_social_login,
             set_slack_user_id_on_social_signup,
+            sync_user_tag_index_on_save,
         )
 
         pre_social_login.connect(mark_email_verified_on_social_login)
@@ -28,6 +30,11 @@ class AccountsConfig(AppConfig):
         # Issue #768: stamp signup_source='oauth' + account_activated=True
         # when a brand-new social account is linked.
         social_account_added.connect(set_signup_source_oauth_on_social_signup)
+        post_save.connect(
+            sync_user_tag_index_on_save,
+            sender=self.get_model("User"),
+            dispatch_uid="accounts.sync_user_tag_index",
+        )
 
         from accounts.services.import_course_db import register_course_db_import_adapter
 
@@ -2,14 +2,18 @@
 
 Reads the ``Authorization: Token <key>`` header, verifies the submitted key
 against hashed ``accounts.models.Token`` rows, sets ``request.user`` to the
-token's owner, and bumps ``last_used_at``. Returns a JSON 401 (NOT a redirect
+token's owner, and bumps ``last_used_at`` (at most once per
+``API_TOKEN_LAST_USED_GRANULARITY`` seconds). Returns a JSON 401 (NOT a redirect
 to /accounts/login/) when the header is missing or invalid; clients are
 scripts that should never be redirected to a browser login page.
 """
 
+from datetime import timedelta
 from functools import wraps
 
+from django.conf import settings
 from django.contrib.auth.decorators import user_passes_test
+from django.db.models import Q
 from django.http import HttpResponseForbidden, JsonResponse
 from django.utils import timezone
 
@@ -21,13 +25,38 @@ def _json_auth_error(message, code):
     return JsonResponse({"error": message, "code": code}, status=401)
 
 
+def _record_token_use(token):
+    """Bump ``token.last_used_at`` unless it is fresher than the granularity.
+
+    Read-only endpoints and ``asl_cli`` bursts would otherwise write the
+    token row on every call. ``token`` was just loaded by
+    ``Token.authenticate``, so its ``last_used_at`` is current as of this
+    request and most calls return without a query. The UPDATE is also
+    conditional, so concurrent requests that all saw a stale value
+    produce one row change, not one per request.
+    """
+    now = timezone.now()
+    granularity = timedelta(
+        seconds=getattr(settings, "API_TOKEN_LAST_USED_GRANULARITY", 60),
+    )
+    if token.last_used_at is not None and now - token.last_used_at < granularity:
+        return
+    updated = Token.objects.filter(
+        Q(last_used_at__isnull=True) | Q(last_used_at__lt=now - granularity),
+        pk=token.pk,
+    ).update(last_used_at=now)
+    if updated:
+        token.last_used_at = now
+
+
 def token_required(view_func):
     """Require a valid ``Authorization: Token <key>`` header.
 
     On success: sets ``request.user`` to the token's owner and updates
-    ``last_used_at`` via ``update_fields=['last_used_at']`` to avoid touching
+    ``last_used_at`` with a queryset ``update()`` to avoid touching
     unrelated columns (and to skip the User.save() free-tier branch on every
-    API call).
+    API call). The write is skipped while the stored value is fresher than
+    ``API_TOKEN_LAST_USED_GRANULARITY``; see ``_record_token_use``.
 
     The token owner must still be staff. Non-staff tokens intentionally return
     the same invalid-token shape as unknown tokens so callers cannot discover
@@ -60,8 +89,7 @@ def token_required(view_func):
         if not is_staff_user(token.user):
             return JsonResponse({"error": "Invalid token"}, status=401)
 
-        token.last_used_at = timezone.now()
-        Token.objects.filter(pk=token.pk).update(last_used_at=token.last_used_at)
+        _record_token_use(token)
 
         request.user = token.user
         # Issue #764: stash the token on the request so audit-logging views
@@ -103,8 +131,7 @@ def token_required_any_user(view_func):
         if token is None:
             return JsonResponse({"error": "Invalid token"}, status=401)
 
-        token.last_used_at = timezone.now()
-        Token.objects.filter(pk=token.pk).update(last_used_at=token.last_used_at)
+        _record_token_use(token)
 
         request.user = token.user
         request.auth_token = token
@@ -0,0 +1,39 @@
+# Generated by Django 6.1.2 on 2026-10-17 01:58
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_user_tags(apps, schema_editor):
+    User = apps.get_model("accounts", "User")
+    UserTag = apps.get_model("accounts", "UserTag")
+    rows = []
+    for user_id, tags in User.objects.exclude(tags=[]).values_list("pk", "tags").iterator():
+        if not isinstance(tags, list):
+            continue
+        for tag in {tag for tag in tags if isinstance(tag, str) and tag}:
+            rows.append(UserTag(user_id=user_id, tag=tag))
+    UserTag.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0025_alter_user_signup_source'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag', models.TextField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tag_index', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('tag', 'user'), name='accounts_usertag_tag_user_uniq')],
+            },
+        ),
+        migrations.RunPython(backfill_user_tags, migrations.RunPython.noop),
+    ]
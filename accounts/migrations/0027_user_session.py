@@ -0,0 +1,52 @@
+# Generated by Django 6.1.2 on 2026-10-17 02:35
+
+from django.contrib.auth import SESSION_KEY
+from django.contrib.sessions.backends.db import SessionStore
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def copy_live_sessions(apps, schema_editor):
+    """Carry unexpired ``django_session`` rows over so nobody is logged out."""
+    Session = apps.get_model("sessions", "Session")
+    UserSession = apps.get_model("accounts", "UserSession")
+    # Payloads are copied verbatim: the new store keeps the ``SessionStore``
+    # class name, so its signing salt matches the one they were written with.
+    decoder = SessionStore()
+    rows = []
+    for session in Session.objects.filter(expire_date__gt=timezone.now()).iterator():
+        user_id = decoder.decode(session.session_data).get(SESSION_KEY)
+        rows.append(UserSession(
+            session_key=session.session_key,
+            session_data=session.session_data,
+            expire_date=session.expire_date,
+            user_id=int(user_id) if str(user_id or "").isdigit() else None,
+        ))
+    UserSession.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0026_user_tag_index'),
+        ('sessions', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSession',
+            fields=[
+                ('session_key', models.CharField(max_length=40, primary_key=True, serialize=False, verbose_name='session key')),
+                ('session_data', models.TextField(verbose_name='session data')),
+                ('expire_date', models.DateTimeField(db_index=True, verbose_name='expire date')),
+                ('user_id', models.BigIntegerField(db_index=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'session',
+                'verbose_name_plural': 'sessions',
+                'db_table': 'accounts_user_session',
+                'abstract': False,
+            },
+        ),
+        migrations.RunPython(copy_live_sessions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-17 03:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0027_user_session'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importbatch',
+            name='timings',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -6,3 +6,5 @@ from .privacy import *
 from .tier_override import *
 from .token import *
 from .user import *
+from .user_session import *
+from .user_tag import *
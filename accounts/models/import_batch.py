@@ -45,6 +45,9 @@ class ImportBatch(models.Model):
     errors = models.JSONField(default=list, blank=True)
     summary = models.TextField(blank=True, default="")
     params = models.JSONField(default=dict, blank=True)
+    # Wall-clock seconds spent waiting on the source adapter, reconciling
+    # rows and queueing welcome emails, written when the batch finishes.
+    timings = models.JSONField(default=dict, blank=True)
 
     class Meta:
         ordering = ["-started_at"]
@@ -9,6 +9,10 @@ from django.db import models
 from django.utils import timezone
 from django.utils.crypto import salted_hmac
 
+from accounts.utils.api_key_cache import VerifiedKeyCache, authenticate_cached
+
+_verified_keys = VerifiedKeyCache()
+
 
 class MemberAPIKey(models.Model):
     """A scoped, hashed API key owned by one member.
@@ -106,14 +110,18 @@ class MemberAPIKey(models.Model):
             lookup_prefix=lookup_prefix,
             revoked_at__isnull=True,
         )
+        candidate = authenticate_cached(
+            _verified_keys,
+            candidates,
+            plaintext_key,
+            lambda row: check_password(plaintext_key, row.key_hash),
+        )
+        if candidate is None:
+            return None
         required = set(required_scopes or [])
-        for candidate in candidates:
-            if not check_password(plaintext_key, candidate.key_hash):
-                continue
-            if required and not required.issubset(set(candidate.scopes or [])):
-                return None
-            return candidate
-        return None
+        if required and not required.issubset(set(candidate.scopes or [])):
+            return None
+        return candidate
 
     @property
     def masked_prefix(self):
@@ -127,6 +135,7 @@ class MemberAPIKey(models.Model):
         if self.revoked_at is None:
             self.revoked_at = timezone.now()
             self.save(update_fields=["revoked_at"])
+        _verified_keys.discard_pk(self.pk)
 
     def mark_used(self, request):
         ip_hash = ""
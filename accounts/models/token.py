@@ -8,7 +8,9 @@ single explicit way to cut access (deleting the row).
 The plaintext credential is generated via ``secrets.token_urlsafe(32)`` and
 returned only on the in-memory instance created or rotated during that request.
 The database stores a non-secret row identifier, a password-style hash, and a
-lookup prefix used to narrow authentication candidates.
+lookup prefix used to narrow authentication candidates. Verified keys are
+remembered per process by SHA-256 digest (``accounts.utils.api_key_cache``)
+so repeat requests skip the PBKDF2 check.
 """
 
 import secrets
@@ -19,6 +21,10 @@ from django.contrib.auth.hashers import check_password, make_password
 from django.core.exceptions import ValidationError
 from django.db import models
 
+from accounts.utils.api_key_cache import VerifiedKeyCache, authenticate_cached
+
+_verified_keys = VerifiedKeyCache()
+
 
 def generate_token_identifier():
     """Return a non-secret stable row identifier for Studio forms/URLs."""
@@ -137,6 +143,7 @@ class Token(models.Model):
         """Replace the credential hash and return the new plaintext once."""
         self.set_plaintext_key(self.generate_plaintext_key())
         self.save(update_fields=["key_hash", "lookup_prefix"])
+        _verified_keys.discard_pk(self.pk)
         return self.key
 
     @classmethod
@@ -147,10 +154,12 @@ class Token(models.Model):
         candidates = cls.objects.select_related("user").filter(
             lookup_prefix=lookup_prefix,
         )
-        for candidate in candidates:
-            if check_password(plaintext_key, candidate.key_hash):
-                return candidate
-        return None
+        return authenticate_cached(
+            _verified_keys,
+            candidates,
+            plaintext_key,
+            lambda candidate: check_password(plaintext_key, candidate.key_hash),
+        )
 
     @property
     def key_prefix(self):
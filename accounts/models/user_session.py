@@ -0,0 +1,26 @@
+from django.contrib.sessions.base_session import AbstractBaseSession
+from django.db import models
+
+
+class UserSession(AbstractBaseSession):
+    """Database session row that records which user it is logged in as.
+
+    Django's stock ``django_session`` table only holds the signed payload,
+    so finding a user's sessions meant decoding every row. The
+    ``accounts.sessions`` engine copies ``_auth_user_id`` into ``user_id``
+    on every save, which turns "sign this user out everywhere" into one
+    indexed ``DELETE``. ``user_id`` is a plain column rather than a foreign
+    key: a session may outlive its user for a request, and deleting a user
+    should not cascade through here.
+    """
+
+    user_id = models.BigIntegerField(null=True, db_index=True)
+
+    class Meta(AbstractBaseSession.Meta):
+        db_table = "accounts_user_session"
+
+    @classmethod
+    def get_session_store_class(cls):
+        from accounts.sessions import SessionStore
+
+        return SessionStore
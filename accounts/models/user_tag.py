@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.db import models
+
+
+class UserTag(models.Model):
+    """One contact tag on one user: an indexed copy of ``User.tags``.
+
+    ``User.tags`` stays the source of truth (a JSON list that the API,
+    imports and Studio read and write). This table mirrors it one row per
+    ``(user, tag)`` so exact-tag filters are indexed joins and tag search
+    scans the ``(tag, user)`` index instead of every user row. The rows are
+    rewritten by ``accounts.utils.tags.sync_user_tag_index`` whenever a user
+    is saved with ``tags`` among the written fields.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="tag_index",
+    )
+    tag = models.TextField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tag", "user"],
+                name="accounts_usertag_tag_user_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.tag} -> {self.user_id}"
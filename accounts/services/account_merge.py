@@ -41,6 +41,7 @@ from django.utils import timezone
 
 from accounts.models import EmailAlias, TierOverride
 from accounts.services.email_resolution import normalize_email
+from accounts.sessions import delete_user_sessions
 from accounts.utils.tags import normalize_tags
 from community.models import CommunityAuditLog
 
@@ -365,6 +366,15 @@ def _strategy_reader_profile(plan, related_model, field_name, canonical, seconda
     plan.record_move(related_model._meta.label, field_name, moved=0, dropped=1)
 
 
+def _strategy_user_tag_index(plan, related_model, field_name, canonical, secondary):
+    """accounts.UserTag: derived index of ``User.tags`` -- never repointed.
+
+    Each side's rows are rewritten from its own ``tags`` list when it is saved;
+    ``_reconcile_scalars`` saves canonical with the unioned tags, so moving
+    secondary's rows would only leave secondary's index out of step.
+    """
+
+
 # Keyed by ``(app_label.ModelName, field_name)``.
 #
 # These cover the cases the generic unique-key walker cannot express correctly:
@@ -382,6 +392,7 @@ _SPECIAL_STRATEGIES = {
     ("account.EmailAddress", "user"): _strategy_email_address,
     ("email_app.EmailLog", "user"): _strategy_email_log,
     ("bookclub.ReaderProfile", "user"): _strategy_reader_profile,
+    ("accounts.UserTag", "user"): _strategy_user_tag_index,
 }
 
 
@@ -851,6 +862,8 @@ def merge_accounts(
                 secondary.stripe_customer_id = ""
                 secondary.subscription_id = ""
             secondary.save(update_fields=update_fields)
+            # Sign the deactivated login out of every browser it is open in.
+            delete_user_sessions(secondary)
             plan.secondary_deactivated = True
 
             _write_audit(plan, canonical, actor_label)
@@ -11,7 +11,6 @@ from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import requests
 from django.apps import apps
-from django.contrib.sessions.models import Session
 from django.core.mail import send_mail
 from django.db import transaction
 from django.db.models import Q
@@ -19,6 +18,7 @@ from django.utils import timezone
 from django.utils.crypto import salted_hmac
 
 from accounts.models import PrivacyRequestLog
+from accounts.sessions import delete_user_sessions
 from integrations.config import get_config, is_enabled, site_base_url
 
 logger = logging.getLogger(__name__)
@@ -1153,16 +1153,7 @@ def _increment(summary, section, key, amount):
 
 
 def _delete_user_sessions(user, summary):
-    deleted = 0
-    for session in Session.objects.all():
-        try:
-            data = session.get_decoded()
-        except Exception:
-            continue
-        if data.get("_auth_user_id") == str(user.pk):
-            session.delete()
-            deleted += 1
-    _increment(summary, "erased", "sessions", deleted)
+    _increment(summary, "erased", "sessions", delete_user_sessions(user))
 
 
 def _erase_local_slack_threads(user, summary):
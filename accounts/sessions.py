@@ -0,0 +1,49 @@
+"""Session engine that indexes sessions by user (``SESSION_ENGINE``).
+
+A drop-in subclass of Django's database backend whose rows are
+:class:`accounts.models.UserSession`, carrying the logged-in user id next
+to the payload. :func:`delete_user_sessions` uses that column to sign a
+user out of every browser. Privacy deletion, account merge and the admin
+"sign out everywhere" action all go through it.
+"""
+
+from django.contrib.auth import SESSION_KEY
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+
+from accounts.models import UserSession
+
+
+def _user_id(data):
+    try:
+        return int(data[SESSION_KEY])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class SessionStore(DBStore):
+    # Keep the class name: Django salts the payload signature with it, and
+    # rows copied from ``django_session`` must still decode.
+
+    @classmethod
+    def get_model_class(cls):
+        return UserSession
+
+    def create_model_instance(self, data):
+        obj = super().create_model_instance(data)
+        obj.user_id = _user_id(data)
+        return obj
+
+    async def acreate_model_instance(self, data):
+        obj = await super().acreate_model_instance(data)
+        obj.user_id = _user_id(data)
+        return obj
+
+
+def delete_user_sessions(user):
+    """Delete every stored session logged in as ``user``.
+
+    Returns:
+        int: Number of sessions deleted.
+    """
+    deleted, _ = UserSession.objects.filter(user_id=user.pk).delete()
+    return deleted
@@ -7,6 +7,7 @@ from accounts.models.user import (
 from accounts.services.free_welcome import send_free_welcome_email
 from accounts.utils.activation import mark_activated
 from accounts.utils.names import set_name_from_external
+from accounts.utils.tags import sync_user_tag_index
 
 
 def mark_email_verified_on_social_login(sender, request, sociallogin, **kwargs):
@@ -236,3 +237,16 @@ def populate_name_from_social(sender, request, sociallogin, **kwargs):
 
     if changed:
         user.save(update_fields=["first_name", "last_name"])
+
+
+def sync_user_tag_index_on_save(sender, instance, created, update_fields=None, raw=False, **kwargs):
+    """Keep the ``UserTag`` index in step with ``User.tags``.
+
+    Saves that name their ``update_fields`` without ``tags`` (logins,
+    profile edits) cannot have changed the tags and are skipped.
+    """
+    if raw:
+        return
+    if update_fields is not None and "tags" not in update_fields:
+        return
+    sync_user_tag_index(instance, created=created)
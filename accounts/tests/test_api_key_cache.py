@@ -0,0 +1,145 @@
+"""Tests for the verified API key digest cache (``accounts.utils.api_key_cache``).
+
+A repeat request with the same key must skip ``check_password``; revoke,
+delete and rotate must still lock the key out on the very next request,
+even in a process whose cache still holds the digest.
+"""
+
+from unittest.mock import patch
+
+from django.contrib.auth.hashers import check_password
+from django.test import TestCase, override_settings
+
+from accounts.models import MemberAPIKey, Token, User
+from accounts.models import member_api_key as member_api_key_module
+from accounts.models import token as token_module
+from accounts.utils.api_key_cache import VerifiedKeyCache
+
+
+class TokenVerifyCacheTest(TestCase):
+    def setUp(self):
+        token_module._verified_keys.clear()
+        self.user = User.objects.create_user(
+            email="cache-staff@test.com", is_staff=True,
+        )
+        self.token, self.plaintext = Token.create_for_user(user=self.user)
+
+    def test_repeat_authentication_skips_password_check(self):
+        with patch.object(
+            token_module, "check_password", wraps=check_password,
+        ) as slow_check:
+            self.assertEqual(Token.authenticate(self.plaintext), self.token)
+            self.assertEqual(Token.authenticate(self.plaintext), self.token)
+            self.assertEqual(Token.authenticate(self.plaintext), self.token)
+
+        self.assertEqual(slow_check.call_count, 1)
+
+    def test_api_requests_verify_the_key_once(self):
+        with patch.object(
+            token_module, "check_password", wraps=check_password,
+        ) as slow_check:
+            statuses = [
+                self.client.get(
+                    "/api/users", HTTP_AUTHORIZATION=f"Token {self.plaintext}",
+                ).status_code
+                for _ in range(5)
+            ]
+
+        self.assertEqual(statuses, [200] * 5)
+        self.assertEqual(slow_check.call_count, 1)
+
+    def test_wrong_key_is_not_cached(self):
+        bad_key = self.plaintext[:-1] + ("A" if self.plaintext[-1] != "A" else "B")
+
+        self.assertIsNone(Token.authenticate(bad_key))
+        self.assertIsNone(Token.authenticate(bad_key))
+
+    def test_deleted_token_rejected_with_warm_cache(self):
+        Token.authenticate(self.plaintext)
+
+        Token.objects.filter(pk=self.token.pk).delete()
+
+        self.assertIsNone(Token.authenticate(self.plaintext))
+
+    def test_rotation_in_another_process_rejects_old_key(self):
+        Token.authenticate(self.plaintext)
+
+        # Another process rotates: the row's hash changes but this
+        # process's cache still holds the old digest.
+        other = Token.objects.get(pk=self.token.pk)
+        other.set_plaintext_key(Token.generate_plaintext_key())
+        Token.objects.filter(pk=other.pk).update(
+            key_hash=other.key_hash, lookup_prefix=other.lookup_prefix,
+        )
+
+        self.assertIsNone(Token.authenticate(self.plaintext))
+        self.assertEqual(Token.authenticate(other.key), other)
+
+    @override_settings(API_KEY_VERIFY_CACHE_TTL=0)
+    def test_zero_ttl_disables_cache(self):
+        with patch.object(
+            token_module, "check_password", wraps=check_password,
+        ) as slow_check:
+            Token.authenticate(self.plaintext)
+            Token.authenticate(self.plaintext)
+
+        self.assertEqual(slow_check.call_count, 2)
+
+
+class MemberAPIKeyVerifyCacheTest(TestCase):
+    def setUp(self):
+        member_api_key_module._verified_keys.clear()
+        self.user = User.objects.create_user(email="cache-member@test.com")
+        self.member_key, self.plaintext = MemberAPIKey.create_for_user(
+            user=self.user, name="cli", scopes=["plans:read"],
+        )
+
+    def test_repeat_authentication_skips_password_check(self):
+        with patch.object(
+            member_api_key_module, "check_password", wraps=check_password,
+        ) as slow_check:
+            MemberAPIKey.authenticate(self.plaintext)
+            MemberAPIKey.authenticate(self.plaintext)
+
+        self.assertEqual(slow_check.call_count, 1)
+
+    def test_revoked_in_another_process_rejected_with_warm_cache(self):
+        MemberAPIKey.authenticate(self.plaintext)
+
+        MemberAPIKey.objects.filter(pk=self.member_key.pk).update(
+            revoked_at=self.member_key.created_at,
+        )
+
+        self.assertIsNone(MemberAPIKey.authenticate(self.plaintext))
+
+    def test_scope_check_applies_to_cache_hits(self):
+        MemberAPIKey.authenticate(self.plaintext)
+
+        self.assertIsNone(
+            MemberAPIKey.authenticate(
+                self.plaintext, required_scopes=["plans:write"],
+            ),
+        )
+
+
+class VerifiedKeyCacheTest(TestCase):
+    def test_lru_bound(self):
+        cache = VerifiedKeyCache(max_entries=2)
+        cache.add("a", 1, "h1")
+        cache.add("b", 2, "h2")
+        cache.add("c", 3, "h3")
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), (3, "h3"))
+
+    def test_discard_pk_drops_all_digests_for_row(self):
+        cache = VerifiedKeyCache()
+        cache.add("a", 1, "h1")
+        cache.add("b", 1, "h1")
+        cache.add("c", 2, "h2")
+
+        cache.discard_pk(1)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), (2, "h2"))
@@ -462,6 +462,29 @@ class ImportUsersServiceTest(TestCase):
         fiftieth = Schedule.objects.order_by("next_run")[50]
         self.assertGreaterEqual((fiftieth.next_run - first.next_run).total_seconds(), 3600)
 
+    def test_batch_records_time_spent_in_adapter_and_runner(self):
+        clock = [100.0]
+
+        def slow_source():
+            for email in ("first@example.com", "second@example.com"):
+                clock[0] += 5
+                yield ImportRow(email=email)
+
+        with patch.object(import_users.time, "monotonic", side_effect=lambda: clock[0]):
+            batch = run_import_batch("slack", slow_source, send_welcome=False)
+
+        batch.refresh_from_db()
+        self.assertEqual(
+            batch.timings,
+            {
+                "rows": 2,
+                "source_seconds": 10.0,
+                "reconcile_seconds": 0.0,
+                "welcome_seconds": 0.0,
+                "total_seconds": 10.0,
+            },
+        )
+
 
 class QueueImportedWelcomeEmailsTest(TestCase):
     """``queue_imported_welcome_emails`` writes ``q_options.task_name``.
@@ -3,7 +3,6 @@ from datetime import date, timedelta
 from unittest.mock import patch
 
 from allauth.socialaccount.models import SocialAccount
-from django.contrib.sessions.models import Session
 from django.test import TestCase, tag
 from django.utils import timezone
 
@@ -13,6 +12,7 @@ from accounts.models import (
     MemberAPIKey,
     PrivacyRequestLog,
     User,
+    UserSession,
 )
 from accounts.services.privacy import (
     REDACTED,
@@ -482,7 +482,7 @@ class PrivacyDeletionSuccessTest(TierSetupMixin, TestCase):
         self.assertEqual(response.status_code, 302)
         self.assertEqual(response.url, "/account/deleted")
         self.assertFalse(User.objects.filter(email="delete-success@test.com").exists())
-        self.assertFalse(Session.objects.filter(session_key=session_key).exists())
+        self.assertFalse(UserSession.objects.filter(session_key=session_key).exists())
         self.assertFalse(
             self.client.login(
                 email="delete-success@test.com",
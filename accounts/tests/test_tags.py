@@ -3,6 +3,7 @@
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 
+from accounts.models import UserTag
 from accounts.utils.tags import (
     add_tag,
     count_users_with_tag,
@@ -11,6 +12,8 @@ from accounts.utils.tags import (
     normalize_tags,
     remove_tag,
     rename_tag,
+    user_ids_with_exact_tag,
+    user_ids_with_tag_containing,
 )
 
 User = get_user_model()
@@ -286,3 +289,53 @@ class CountUsersWithTagTest(TestCase):
             email='a@test.com', password='x', tags=['paid'],
         )
         self.assertEqual(count_users_with_tag(''), 0)
+
+
+def _indexed_tags(user):
+    return sorted(
+        UserTag.objects.filter(user=user).values_list('tag', flat=True),
+    )
+
+
+class UserTagIndexTest(TestCase):
+    """The ``UserTag`` index follows every save that writes ``User.tags``."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='indexed@test.com', password='x', tags=['paid', 'beta'],
+        )
+
+    def test_create_indexes_tags(self):
+        self.assertEqual(_indexed_tags(self.user), ['beta', 'paid'])
+
+    def test_add_and_remove_tag_update_index(self):
+        add_tag(self.user, 'VIP')
+        remove_tag(self.user, 'beta')
+
+        self.assertEqual(_indexed_tags(self.user), ['paid', 'vip'])
+
+    def test_rename_and_delete_update_index(self):
+        rename_tag('paid', 'customer')
+        delete_tag('beta')
+
+        self.assertEqual(_indexed_tags(self.user), ['customer'])
+
+    def test_save_without_tags_in_update_fields_is_skipped(self):
+        self.user.tags = ['ignored']
+        self.user.save(update_fields=['first_name'])
+
+        self.assertEqual(_indexed_tags(self.user), ['beta', 'paid'])
+
+    def test_exact_and_substring_lookups(self):
+        other = User.objects.create_user(
+            email='other@test.com', password='x', tags=['paid-annual'],
+        )
+
+        exact = User.objects.filter(pk__in=user_ids_with_exact_tag('Paid'))
+        containing = User.objects.filter(
+            pk__in=user_ids_with_tag_containing('PAID'),
+        )
+
+        self.assertEqual(list(exact), [self.user])
+        self.assertEqual(set(containing), {self.user, other})
+        self.assertFalse(user_ids_with_exact_tag('').exists())
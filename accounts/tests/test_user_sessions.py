@@ -0,0 +1,92 @@
+"""Tests for the user-indexed session engine (``accounts.sessions``)."""
+
+import json
+
+from django.contrib.admin.sites import site
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.test import Client, RequestFactory, TestCase
+
+from accounts.models import Token, User, UserSession
+from accounts.sessions import SessionStore, delete_user_sessions
+
+
+def _logged_in_client(user):
+    client = Client()
+    client.force_login(user)
+    return client
+
+
+class UserSessionEngineTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email="member@test.com", password="pw")
+        self.other = User.objects.create_user(email="other@test.com", password="pw")
+
+    def test_login_records_the_user_id(self):
+        client = _logged_in_client(self.user)
+
+        row = UserSession.objects.get(session_key=client.session.session_key)
+
+        self.assertEqual(row.user_id, self.user.pk)
+
+    def test_anonymous_session_has_no_user(self):
+        store = SessionStore()
+        store["cart"] = "x"
+        store.save()
+
+        self.assertIsNone(UserSession.objects.get(session_key=store.session_key).user_id)
+
+    def test_logout_clears_the_user_id_from_the_store(self):
+        client = _logged_in_client(self.user)
+        client.logout()
+
+        self.assertFalse(UserSession.objects.filter(user_id=self.user.pk).exists())
+
+    def test_delete_user_sessions_removes_only_that_user(self):
+        first, second = _logged_in_client(self.user), _logged_in_client(self.user)
+        bystander = _logged_in_client(self.other)
+
+        self.assertEqual(delete_user_sessions(self.user), 2)
+
+        for client in (first, second):
+            self.assertFalse(
+                UserSession.objects.filter(session_key=client.session.session_key).exists()
+            )
+        self.assertEqual(bystander.get("/account/").status_code, 200)
+        self.assertEqual(first.get("/account/").status_code, 302)
+
+    def test_admin_action_signs_selected_users_out(self):
+        _logged_in_client(self.user)
+        _logged_in_client(self.other)
+        request = RequestFactory().post("/admin/accounts/user/")
+        request.session = SessionStore()
+        request._messages = FallbackStorage(request)
+
+        site._registry[User].sign_out_everywhere(
+            request, User.objects.filter(pk=self.user.pk),
+        )
+
+        self.assertEqual(
+            list(UserSession.objects.exclude(user_id=None).values_list("user_id", flat=True)),
+            [self.other.pk],
+        )
+
+
+class AccountMergeSessionTest(TestCase):
+    def test_merge_signs_the_secondary_out(self):
+        staff = User.objects.create_user(email="staff@test.com", is_staff=True)
+        token = Token.objects.create(user=staff, name="merge")
+        User.objects.create_user(email="keep@test.com", password="pw")
+        secondary = User.objects.create_user(email="dupe@test.com", password="pw")
+        _logged_in_client(secondary)
+
+        response = self.client.post(
+            "/api/users/merge",
+            data=json.dumps(
+                {"canonical_email": "keep@test.com", "merge_email": "dupe@test.com"}
+            ),
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Token {token.key}",
+        )
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertFalse(UserSession.objects.filter(user_id=secondary.pk).exists())
@@ -0,0 +1,107 @@
+"""Per-process cache of verified API key digests.
+
+``Token.authenticate`` and ``MemberAPIKey.authenticate`` verify the
+presented key with ``check_password``, which is PBKDF2 with several hundred
+thousand iterations: tens of milliseconds of CPU on every API request. The
+keys themselves are 256-bit random strings, so once a key has been verified
+a SHA-256 digest of it identifies it just as well.
+
+``VerifiedKeyCache`` maps that digest to ``(row pk, key_hash)``. A hit still
+loads the row (the same single query as before), and is only accepted when
+the row's current ``key_hash`` equals the cached one. Deleting, revoking or
+rotating a key therefore takes effect immediately in every process — the
+row is gone, filtered out, or carries a different hash — and the cache only
+ever skips the PBKDF2 step. Entries expire after
+``API_KEY_VERIFY_CACHE_TTL`` seconds and the cache is LRU-bounded.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+_DEFAULT_TTL = 300
+_DEFAULT_MAX_ENTRIES = 1024
+
+
+def key_digest(plaintext_key):
+    """Return the SHA-256 hex digest used as the cache key."""
+    return hashlib.sha256(plaintext_key.encode("utf-8")).hexdigest()
+
+
+class VerifiedKeyCache:
+    """Bounded, TTL'd map of key digest -> ``(pk, key_hash)``."""
+
+    def __init__(self, max_entries=_DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, digest):
+        """Return the cached ``(pk, key_hash)`` or ``None``."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            pk, key_hash, expires_at = entry
+            if expires_at <= now:
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return pk, key_hash
+
+    def add(self, digest, pk, key_hash):
+        ttl = getattr(settings, "API_KEY_VERIFY_CACHE_TTL", _DEFAULT_TTL)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[digest] = (pk, key_hash, time.monotonic() + ttl)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, digest):
+        with self._lock:
+            self._entries.pop(digest, None)
+
+    def discard_pk(self, pk):
+        """Drop every entry for row ``pk`` (revoke / rotate / delete)."""
+        with self._lock:
+            stale = [
+                digest
+                for digest, (entry_pk, _hash, _exp) in self._entries.items()
+                if entry_pk == pk
+            ]
+            for digest in stale:
+                del self._entries[digest]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def authenticate_cached(cache, queryset, plaintext_key, verify):
+    """Return the row in ``queryset`` matching ``plaintext_key``, or None.
+
+    ``queryset`` is the candidate queryset the caller would have scanned
+    (already narrowed by lookup prefix and any revocation filter).
+    ``verify(row)`` runs the slow hash check. A cache hit re-reads the row
+    by pk from the same queryset and compares ``key_hash`` instead.
+    """
+    digest = key_digest(plaintext_key)
+    cached = cache.get(digest)
+    if cached is not None:
+        pk, key_hash = cached
+        row = queryset.filter(pk=pk).first()
+        if row is not None and row.key_hash == key_hash:
+            return row
+        cache.discard(digest)
+
+    for candidate in queryset:
+        if verify(candidate):
+            cache.add(digest, candidate.pk, candidate.key_hash)
+            return candidate
+    return None
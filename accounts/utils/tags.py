@@ -10,6 +10,10 @@ view code never has to touch the JSON list directly. The ``rename_tag`` /
 ``delete_tag`` helpers (issue #694) operate across every user that carries the
 tag in a single transaction so operators can clean up the global tag namespace
 without iterating one user at a time.
+
+Reads go through the ``UserTag`` index (one row per user and tag) rather
+than scanning every ``User.tags`` list; :func:`sync_user_tag_index` keeps it
+in step with the JSON column on every save that writes ``tags``.
 """
 
 import re
@@ -17,6 +21,8 @@ import re
 from django.contrib.auth import get_user_model
 from django.db import transaction
 
+from accounts.models import UserTag
+
 
 def normalize_tag(tag):
     """Normalize a single operator contact tag."""
@@ -53,6 +59,8 @@ __all__ = [
     'list_all_tags',
     'count_users_with_tag',
     'user_ids_with_exact_tag',
+    'user_ids_with_tag_containing',
+    'sync_user_tag_index',
 ]
 
 
@@ -94,22 +102,40 @@ def remove_tag(user, raw):
     return normalized
 
 
+def sync_user_tag_index(user, created=False):
+    """Rewrite ``user``'s ``UserTag`` rows to match ``user.tags``.
+
+    Called from the ``User`` post_save receiver. Only the difference is
+    written: a save that leaves the tags unchanged costs one read.
+    """
+    wanted = {
+        tag for tag in (user.tags if isinstance(user.tags, list) else [])
+        if isinstance(tag, str) and tag
+    }
+    existing = set() if created else set(
+        UserTag.objects.filter(user_id=user.pk).values_list('tag', flat=True)
+    )
+    stale = existing - wanted
+    if stale:
+        UserTag.objects.filter(user_id=user.pk, tag__in=stale).delete()
+    missing = wanted - existing
+    if missing:
+        UserTag.objects.bulk_create(
+            [UserTag(user_id=user.pk, tag=tag) for tag in sorted(missing)],
+            ignore_conflicts=True,
+        )
+
+
 def list_all_tags():
     """Return the sorted, deduped union of every contact tag across users.
 
     Powers the user-list tag picker (issue #694) and the user-detail
-    ``<datalist>``. Reads only the ``tags`` column to avoid materializing
-    full User rows and normalizes defensively in case any rows pre-date the
-    normalization helper.
+    ``<datalist>``. Reads the distinct tags of the ``UserTag`` index and
+    normalizes defensively in case any rows pre-date the normalization
+    helper.
     """
-    User = get_user_model()
-    seen = set()
-    for tag_list in User.objects.values_list('tags', flat=True):
-        if not tag_list:
-            continue
-        for tag in normalize_tags(tag_list):
-            seen.add(tag)
-    return sorted(seen)
+    tags = UserTag.objects.values_list('tag', flat=True).distinct()
+    return sorted({normalize_tag(tag) for tag in tags} - {''})
 
 
 def count_users_with_tag(name):
@@ -122,25 +148,32 @@ def count_users_with_tag(name):
     normalized = normalize_tag(name)
     if not normalized:
         return 0
-    User = get_user_model()
-    count = 0
-    for tag_list in User.objects.values_list('tags', flat=True):
-        if isinstance(tag_list, list) and normalized in tag_list:
-            count += 1
-    return count
+    return UserTag.objects.filter(tag=normalized).count()
 
 
 def user_ids_with_exact_tag(name):
-    """Return user IDs carrying the normalized tag as an exact list item."""
+    """Return user IDs carrying the normalized tag as an exact list item.
+
+    The result is a ``user_id`` subquery over the ``UserTag`` index, meant
+    for ``pk__in`` / ``user_id__in`` filters, so the database does the
+    join. An empty input yields an empty queryset.
+    """
     normalized = normalize_tag(name)
     if not normalized:
-        return []
-    User = get_user_model()
-    return [
-        user_id
-        for user_id, tags in User.objects.values_list('id', 'tags').iterator()
-        if isinstance(tags, list) and normalized in tags
-    ]
+        return UserTag.objects.none().values('user_id')
+    return UserTag.objects.filter(tag=normalized).values('user_id')
+
+
+def user_ids_with_tag_containing(text):
+    """Return user IDs with any contact tag containing ``text``, case-insensitively.
+
+    Like :func:`user_ids_with_exact_tag` this is a ``user_id`` subquery; the
+    substring match scans the ``(tag, user)`` index, whose size is the
+    number of tag assignments rather than the number of users.
+    """
+    if not text:
+        return UserTag.objects.none().values('user_id')
+    return UserTag.objects.filter(tag__icontains=text).values('user_id')
 
 
 def rename_tag(old, new):
@@ -180,11 +213,13 @@ def rename_tag(old, new):
     User = get_user_model()
     affected = 0
     with transaction.atomic():
-        # Only iterate users that actually carry the old tag. ``tags`` is a
-        # JSONField list, so we filter in Python to stay portable across
-        # sqlite / postgres without leaning on ``contains`` lookups that
-        # don't work the same way everywhere.
-        for user in User.objects.exclude(tags=[]).only('id', 'tags'):
+        # Only iterate users that actually carry the old tag, found through
+        # the ``UserTag`` index. The JSON list is still checked in Python
+        # before each write.
+        carriers = User.objects.filter(
+            pk__in=user_ids_with_exact_tag(old_normalized),
+        ).only('id', 'tags')
+        for user in carriers:
             current = list(user.tags or [])
             if old_normalized not in current:
                 continue
@@ -224,7 +259,10 @@ def delete_tag(name):
     User = get_user_model()
     affected = 0
     with transaction.atomic():
-        for user in User.objects.exclude(tags=[]).only('id', 'tags'):
+        carriers = User.objects.filter(
+            pk__in=user_ids_with_exact_tag(normalized),
+        ).only('id', 'tags')
+        for user in carriers:
             current = list(user.tags or [])
             if normalized not in current:
                 continue
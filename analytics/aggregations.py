@@ -4,15 +4,16 @@ All metrics on the UTM Analytics surface go through this module so the
 three views (`utm_dashboard`, `utm_campaign_detail`, `utm_link_detail`)
 share logic and can be unit-tested in isolation.
 
-Performance: aggregate queries with `.values().annotate(Count(...))`
-over indexed columns (`CampaignVisit.utm_campaign`, `CampaignVisit.ts`,
-`UserAttribution.first_touch_utm_campaign`,
-`UserAttribution.first_touch_ts`, `ConversionAttribution.created_at`,
-`ConversionAttribution.first_touch_utm_campaign`) keep us well under
-100ms for low-thousand-row date windows. If any single rollup grows past
-~500ms in production, replace it with a precomputed daily rollup table
-written by a `compute_utm_rollups` management command — TODO until that
-day comes.
+Performance: visit, signup, conversion and MRR totals are read from the
+precomputed ``UtmDailyRollup`` table for every whole day in the window
+that ``compute_utm_rollups`` has marked current, and from raw
+``CampaignVisit`` / ``UserAttribution`` / ``ConversionAttribution`` rows
+only for the remainder: today's partial day, the partial first day of a
+rolling window and any day whose marker was dropped by a late write (see
+``analytics.services.utm_rollups``). Unique-visitor counts cannot be
+summed across days, so they still aggregate raw rows over the indexed
+``CampaignVisit.ts`` / ``anonymous_id`` columns. The ``*_for`` helpers
+keep returning raw querysets for the drill-down tables.
 
 The helpers handle the case where ``ConversionAttribution`` is absent
 (``has_conversion_data`` returns False before #195 was merged) by
@@ -20,13 +21,22 @@ returning empty querysets / 0 / Decimal('0'). The dashboard hides MRR
 and Paid columns in that case.
 """
 
+from collections import defaultdict
 from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
 from decimal import Decimal
 
-from django.db.models import Count
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 
-from analytics.models import CampaignVisit, UserAttribution
+from analytics.models import (
+    CampaignVisit,
+    UserAttribution,
+    UtmDailyRollup,
+    UtmRollupDay,
+)
+from analytics.services.utm_rollups import day_bounds, rollup_day_of
 
 # Module-top import of ConversionAttribution. The `analytics` app does not
 # formally depend on `payments`, so we wrap the import in a try/except so
@@ -96,6 +106,130 @@ def resolve_window(range_key, start_str=None, end_str=None, *, now=None):
     return now - timedelta(days=days), now
 
 
+# ---------------------------------------------------------------------------
+# Rollup-aware totals
+# ---------------------------------------------------------------------------
+
+def _utm_lookups(campaign_slug=None, utm_content=None, utm_source=None,
+                 utm_medium=None):
+    """Map the public filter kwargs to UTM key names, dropping blanks."""
+    lookups = {
+        'utm_campaign': campaign_slug,
+        'utm_content': utm_content,
+        'utm_source': utm_source,
+        'utm_medium': utm_medium,
+    }
+    return {key: value for key, value in lookups.items() if value}
+
+
+def _metric_source(metric, attribution):
+    """Return ``(model, ts_field, utm_prefix, aggregate, rollup_column)``.
+
+    ``metric`` is one of ``visits``, ``signups``, ``conversions``, ``mrr``.
+    ``model`` is None for conversion metrics when the model is absent.
+    """
+    if metric == 'visits':
+        return CampaignVisit, 'ts', '', Count('id'), 'visits'
+    touch = 'last_touch' if attribution == 'last_touch' else 'first_touch'
+    prefix = f'{touch}_'
+    if metric == 'signups':
+        return (
+            UserAttribution, prefix + 'ts', prefix, Count('pk'),
+            f'{touch}_signups',
+        )
+    model = _conversion_model()
+    if metric == 'conversions':
+        return model, 'created_at', prefix, Count('pk'), f'{touch}_conversions'
+    return model, 'created_at', prefix, Sum('mrr_eur'), f'{touch}_mrr_eur'
+
+
+def _split_window(start, end):
+    """Split the inclusive ``[start, end]`` window for rollup reads.
+
+    Returns ``(days, raw_ranges)``: the whole UTC days inside the window
+    that have a ``UtmRollupDay`` marker, and the half-open ``[lo, hi)``
+    datetime ranges covering everything else.
+    """
+    end_exclusive = end + timedelta(microseconds=1)
+    first_day = rollup_day_of(start)
+    if day_bounds(first_day)[0] < start:
+        first_day += timedelta(days=1)
+    last_day = rollup_day_of(end_exclusive) - timedelta(days=1)
+
+    days = []
+    if first_day <= last_day:
+        days = sorted(
+            UtmRollupDay.objects
+            .filter(day__gte=first_day, day__lte=last_day)
+            .values_list('day', flat=True)
+        )
+
+    raw_ranges = []
+    cursor = start
+    for day in days:
+        day_start, day_end = day_bounds(day)
+        if cursor < day_start:
+            raw_ranges.append((cursor, day_start))
+        cursor = day_end
+    if cursor < end_exclusive:
+        raw_ranges.append((cursor, end_exclusive))
+    return days, raw_ranges
+
+
+def _metric_totals(start, end, metric, *, group_by=(),
+                   attribution='first_touch', **filters):
+    """Sum a metric over the window, grouped by rollup key fields.
+
+    ``group_by`` names ``UtmDailyRollup`` fields (``day`` and the
+    ``utm_*`` keys). Returns ``{tuple(group values): total}``; with no
+    ``group_by`` the single key is ``()``. Marked whole days come from
+    ``UtmDailyRollup``; the rest of the window from the metric's raw model.
+    """
+    model, ts_field, prefix, aggregate, column = _metric_source(metric, attribution)
+    totals = defaultdict(int)
+    if model is None:
+        return totals
+    lookups = _utm_lookups(**filters)
+    days, raw_ranges = _split_window(start, end)
+
+    if days:
+        rollups = UtmDailyRollup.objects.filter(day__in=days, **lookups).order_by()
+        if group_by:
+            rows = rollups.values(*group_by).annotate(total=Sum(column))
+        else:
+            rows = [rollups.aggregate(total=Sum(column))]
+        for row in rows:
+            totals[tuple(row[field] for field in group_by)] += row['total'] or 0
+
+    if raw_ranges:
+        in_window = Q()
+        for lo, hi in raw_ranges:
+            in_window |= Q(**{f'{ts_field}__gte': lo, f'{ts_field}__lt': hi})
+        qs = model.objects.filter(
+            in_window, **{prefix + key: value for key, value in lookups.items()}
+        ).order_by()
+        if group_by:
+            fields = []
+            expressions = {}
+            for field in group_by:
+                if field == 'day':
+                    expressions['day'] = TruncDate(ts_field, tzinfo=dt_timezone.utc)
+                elif prefix:
+                    expressions[field] = F(prefix + field)
+                else:
+                    fields.append(field)
+            rows = qs.values(*fields, **expressions).annotate(total=aggregate)
+        else:
+            rows = [qs.aggregate(total=aggregate)]
+        for row in rows:
+            totals[tuple(row[field] for field in group_by)] += row['total'] or 0
+    return totals
+
+
+def _metric_total(start, end, metric, **filters):
+    return _metric_totals(start, end, metric, **filters).get((), 0)
+
+
 # ---------------------------------------------------------------------------
 # Visits
 # ---------------------------------------------------------------------------
@@ -116,7 +250,7 @@ def visits_for(start, end, *, campaign_slug=None, utm_content=None,
 
 
 def visit_count(start, end, **filters):
-    return visits_for(start, end, **filters).count()
+    return _metric_total(start, end, 'visits', **filters)
 
 
 def unique_visitor_count(start, end, **filters):
@@ -131,14 +265,8 @@ def unique_visitor_count(start, end, **filters):
 
 def distinct_utm_values(start, end, field, **filters):
     """Return a sorted list of distinct non-empty values for a UTM field."""
-    qs = visits_for(start, end, **filters)
-    values = (
-        qs.exclude(**{field: ''})
-        .order_by()  # clear default `-ts` ordering so distinct() is on `field` only
-        .values_list(field, flat=True)
-        .distinct()
-    )
-    return sorted(values)
+    totals = _metric_totals(start, end, 'visits', group_by=(field,), **filters)
+    return sorted(key[0] for key, visits in totals.items() if key[0] and visits)
 
 
 # ---------------------------------------------------------------------------
@@ -179,7 +307,7 @@ def signups_for(start, end, *, campaign_slug=None, utm_content=None,
 
 
 def signup_count(start, end, **filters):
-    return signups_for(start, end, **filters).count()
+    return _metric_total(start, end, 'signups', **filters)
 
 
 # ---------------------------------------------------------------------------
@@ -212,10 +340,7 @@ def conversions_for(start, end, *, campaign_slug=None, utm_content=None,
 
 
 def conversion_count(start, end, **filters):
-    qs = conversions_for(start, end, **filters)
-    if not hasattr(qs, 'count'):
-        return 0
-    return qs.count()
+    return _metric_total(start, end, 'conversions', **filters)
 
 
 def mrr_for(start, end, **filters):
@@ -229,14 +354,7 @@ def mrr_for(start, end, **filters):
     Returns ``Decimal('0')`` when there are no rows so the dashboard
     never has to handle ``None``.
     """
-    qs = conversions_for(start, end, **filters)
-    if _conversion_model() is None:
-        return Decimal('0')
-    total = 0
-    for amount in qs.values_list('mrr_eur', flat=True):
-        if amount is not None:
-            total += int(amount)
-    return Decimal(total)
+    return Decimal(_metric_total(start, end, 'mrr', **filters))
 
 
 # ---------------------------------------------------------------------------
@@ -268,37 +386,17 @@ def daily_buckets(start, end, *, metric='visits', campaign_slug=None,
     sparkline polyline has consistent x-axis spacing even on zero-count
     days. ``metric`` is one of ``visits``, ``signups``.
     """
-    if metric == 'signups':
-        qs = signups_for(
-            start, end,
-            campaign_slug=campaign_slug,
-            utm_content=utm_content,
-            utm_source=utm_source,
-            utm_medium=utm_medium,
-            attribution=attribution,
-        )
-        ts_field = _attribution_field(attribution, 'ts')
-    else:
-        qs = visits_for(
-            start, end,
-            campaign_slug=campaign_slug,
-            utm_content=utm_content,
-            utm_source=utm_source,
-            utm_medium=utm_medium,
-        )
-        ts_field = 'ts'
-
-    raw = qs.extra(select={'day': f'DATE({ts_field})'}).values('day').annotate(c=Count('*'))
-    # Some backends return strings, some date objects.
-    by_day = {}
-    for row in raw:
-        day = row['day']
-        if isinstance(day, str):
-            try:
-                day = datetime.strptime(day, '%Y-%m-%d').date()
-            except ValueError:
-                continue
-        by_day[day] = row['c']
+    totals = _metric_totals(
+        start, end,
+        'signups' if metric == 'signups' else 'visits',
+        group_by=('day',),
+        campaign_slug=campaign_slug,
+        utm_content=utm_content,
+        utm_source=utm_source,
+        utm_medium=utm_medium,
+        attribution=attribution,
+    )
+    by_day = {key[0]: count for key, count in totals.items()}
 
     out = []
     cursor = start.date()
@@ -313,6 +411,64 @@ def daily_buckets(start, end, *, metric='visits', campaign_slug=None,
 # Per-campaign rollup (one row per Campaign with at least one visit)
 # ---------------------------------------------------------------------------
 
+def _totals_by(start, end, metric, field, **filters):
+    """``{value of field: total}`` for one metric over the window."""
+    totals = _metric_totals(start, end, metric, group_by=(field,), **filters)
+    return {key[0]: total for key, total in totals.items()}
+
+
+def _uniques_by(start, end, field, values, **filters):
+    """Raw distinct ``anonymous_id`` count per value of ``field``."""
+    return dict(
+        visits_for(start, end, **filters)
+        .filter(**{f'{field}__in': values})
+        .order_by()
+        .values(field)
+        .annotate(n=Count('anonymous_id', distinct=True))
+        .values_list(field, 'n')
+    )
+
+
+def _breakdown_rows(start, end, field, *, attribution, **filters):
+    """Dashboard metric rows, one per ``field`` value with visits.
+
+    One grouped read per metric instead of one query per row and metric.
+    Rows are sorted by visits desc.
+    """
+    visits = {
+        value: count
+        for value, count in _totals_by(start, end, 'visits', field, **filters).items()
+        if count
+    }
+    if not visits:
+        return []
+    uniques = _uniques_by(start, end, field, list(visits), **filters)
+    signups = _totals_by(
+        start, end, 'signups', field, attribution=attribution, **filters,
+    )
+    conversions = _totals_by(
+        start, end, 'conversions', field, attribution=attribution, **filters,
+    )
+    mrr = _totals_by(start, end, 'mrr', field, attribution=attribution, **filters)
+
+    out = []
+    for value in sorted(visits, key=lambda v: (-visits[v], v)):
+        unique_visitors = uniques.get(value, 0)
+        value_signups = signups.get(value, 0)
+        value_conversions = conversions.get(value, 0)
+        out.append({
+            'value': value,
+            'visits': visits[value],
+            'unique_visitors': unique_visitors,
+            'signups': value_signups,
+            'conversions': value_conversions,
+            'mrr': Decimal(mrr.get(value, 0)),
+            'visit_to_signup_pct': conversion_rate(value_signups, unique_visitors),
+            'signup_to_paid_pct': conversion_rate(value_conversions, value_signups),
+        })
+    return out
+
+
 def campaign_rollup(start, end, *, utm_source=None, utm_medium=None,
                     attribution='first_touch'):
     """Return a list of dicts, one per campaign with visits in window.
@@ -320,132 +476,61 @@ def campaign_rollup(start, end, *, utm_source=None, utm_medium=None,
     Each dict has the keys used by the dashboard table: ``slug``,
     ``visits``, ``unique_visitors``, ``signups``, ``conversions``,
     ``mrr``, ``visit_to_signup_pct``, ``signup_to_paid_pct``,
-    ``utm_source``, ``utm_medium``. Rows are sorted by ``visits`` desc.
+    ``utm_sources``, ``utm_mediums``. Rows are sorted by ``visits`` desc.
     """
-    visit_qs = visits_for(start, end, utm_source=utm_source, utm_medium=utm_medium)
-    rows = (
-        visit_qs.exclude(utm_campaign='')
-        .values('utm_campaign')
-        .annotate(
-            visits=Count('id'),
-            unique_visitors=Count('anonymous_id', distinct=True),
+    filters = dict(utm_source=utm_source, utm_medium=utm_medium)
+    rows = [
+        row for row in _breakdown_rows(
+            start, end, 'utm_campaign', attribution=attribution, **filters,
         )
-        .order_by('-visits')
+        if row['value']
+    ]
+    if not rows:
+        return []
+
+    # Distinct source / medium values for visits to each campaign
+    pairs = _metric_totals(
+        start, end, 'visits',
+        group_by=('utm_campaign', 'utm_source', 'utm_medium'),
+        **filters,
     )
+    sources = defaultdict(set)
+    mediums = defaultdict(set)
+    for (slug, source, medium), count in pairs.items():
+        if not count:
+            continue
+        if source:
+            sources[slug].add(source)
+        if medium:
+            mediums[slug].add(medium)
 
     out = []
     for row in rows:
-        slug = row['utm_campaign']
-        signups = signup_count(
-            start, end,
-            campaign_slug=slug,
-            utm_source=utm_source,
-            utm_medium=utm_medium,
-            attribution=attribution,
-        )
-        conversions = conversion_count(
-            start, end,
-            campaign_slug=slug,
-            utm_source=utm_source,
-            utm_medium=utm_medium,
-            attribution=attribution,
-        )
-        mrr = mrr_for(
-            start, end,
-            campaign_slug=slug,
-            utm_source=utm_source,
-            utm_medium=utm_medium,
-            attribution=attribution,
-        )
-
-        # Distinct source / medium values for visits to this campaign
-        sources = sorted(
-            visit_qs.filter(utm_campaign=slug)
-            .exclude(utm_source='')
-            .order_by()
-            .values_list('utm_source', flat=True)
-            .distinct()
-        )
-        mediums = sorted(
-            visit_qs.filter(utm_campaign=slug)
-            .exclude(utm_medium='')
-            .order_by()
-            .values_list('utm_medium', flat=True)
-            .distinct()
-        )
-
+        slug = row.pop('value')
         out.append({
             'slug': slug,
-            'visits': row['visits'],
-            'unique_visitors': row['unique_visitors'],
-            'signups': signups,
-            'conversions': conversions,
-            'mrr': mrr,
-            'visit_to_signup_pct': conversion_rate(signups, row['unique_visitors']),
-            'signup_to_paid_pct': conversion_rate(conversions, signups),
-            'utm_sources': sources,
-            'utm_mediums': mediums,
+            **row,
+            'utm_sources': sorted(sources[slug]),
+            'utm_mediums': sorted(mediums[slug]),
         })
     return out
 
 
 def utm_content_rollup(start, end, *, campaign_slug, utm_source=None,
                        utm_medium=None, attribution='first_touch'):
-    """One row per ``utm_content`` value within a single campaign."""
-    visit_qs = visits_for(
-        start, end,
+    """One row per ``utm_content`` value within a single campaign.
+
+    Blank ``utm_content`` is its own row, matched exactly, so "no-content"
+    visits, signups and conversions are counted together.
+    """
+    rows = _breakdown_rows(
+        start, end, 'utm_content',
+        attribution=attribution,
         campaign_slug=campaign_slug,
         utm_source=utm_source,
         utm_medium=utm_medium,
     )
-    rows = (
-        visit_qs.values('utm_content')
-        .annotate(
-            visits=Count('id'),
-            unique_visitors=Count('anonymous_id', distinct=True),
-        )
-        .order_by('-visits')
-    )
-
-    out = []
-    for row in rows:
-        content = row['utm_content']
-        # Pass blank utm_content through as exact match to count "no-content" visits.
-        signups = signup_count(
-            start, end,
-            campaign_slug=campaign_slug,
-            utm_content=content,
-            utm_source=utm_source,
-            utm_medium=utm_medium,
-            attribution=attribution,
-        )
-        conversions = conversion_count(
-            start, end,
-            campaign_slug=campaign_slug,
-            utm_content=content,
-            utm_source=utm_source,
-            utm_medium=utm_medium,
-            attribution=attribution,
-        )
-        mrr = mrr_for(
-            start, end,
-            campaign_slug=campaign_slug,
-            utm_content=content,
-            utm_source=utm_source,
-            utm_medium=utm_medium,
-            attribution=attribution,
-        )
-        out.append({
-            'utm_content': content,
-            'visits': row['visits'],
-            'unique_visitors': row['unique_visitors'],
-            'signups': signups,
-            'conversions': conversions,
-            'mrr': mrr,
-            'visit_to_signup_pct': conversion_rate(signups, row['unique_visitors']),
-            'signup_to_paid_pct': conversion_rate(conversions, signups),
-        })
-    return out
+    return [{'utm_content': row.pop('value'), **row} for row in rows]
 
 
 # ---------------------------------------------------------------------------
@@ -481,23 +566,10 @@ def kpi_strip(start, end, *, campaign_slug=None, utm_content=None,
 
 def filter_options(start, end):
     """Distinct source / medium values seen in the date window."""
-    base_qs = CampaignVisit.objects.filter(ts__gte=start, ts__lte=end)
-    # `.order_by()` clears the model's default `ordering = ['-ts']`,
-    # otherwise `.distinct()` would include `ts` in the SELECT and we'd
-    # get one row per (source, ts) pair instead of distinct sources.
-    sources = sorted(
-        base_qs.exclude(utm_source='')
-        .order_by()
-        .values_list('utm_source', flat=True)
-        .distinct()
-    )
-    mediums = sorted(
-        base_qs.exclude(utm_medium='')
-        .order_by()
-        .values_list('utm_medium', flat=True)
-        .distinct()
-    )
-    return {'sources': sources, 'mediums': mediums}
+    return {
+        'sources': distinct_utm_values(start, end, 'utm_source'),
+        'mediums': distinct_utm_values(start, end, 'utm_medium'),
+    }
 
 
 # ---------------------------------------------------------------------------
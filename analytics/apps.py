@@ -11,10 +11,12 @@ class AnalyticsConfig(AppConfig):
         # signup_path for OAuth signups.
         from django.apps import apps
         from django.conf import settings
-        from django.db.models.signals import post_save
+        from django.db.models.signals import post_delete, post_save
 
         from analytics.signals import (
             create_user_attribution,
+            invalidate_attribution_rollups,
+            invalidate_conversion_rollups,
             update_signup_path_for_social_signup,
         )
 
@@ -25,6 +27,21 @@ class AnalyticsConfig(AppConfig):
             dispatch_uid='analytics.create_user_attribution',
         )
 
+        # Late signups and conversion deletes change the totals of days
+        # that may already be in the UtmDailyRollup table.
+        for signal in (post_save, post_delete):
+            signal.connect(
+                invalidate_attribution_rollups,
+                sender='analytics.UserAttribution',
+                dispatch_uid='analytics.invalidate_attribution_rollups',
+            )
+            if apps.is_installed('payments'):
+                signal.connect(
+                    invalidate_conversion_rollups,
+                    sender='payments.ConversionAttribution',
+                    dispatch_uid='analytics.invalidate_conversion_rollups',
+                )
+
         # allauth user_signed_up — fires for both plain and social signups.
         try:
             from allauth.account.signals import user_signed_up
@@ -0,0 +1,35 @@
+"""Compute the ``UtmDailyRollup`` table behind the Studio UTM dashboard.
+
+The hourly ``compute-utm-rollups`` schedule keeps the last
+``ROLLUP_LOOKBACK_DAYS`` days current. Run this command to backfill a
+longer history (``--days``) or to rebuild every day from scratch
+(``--rebuild``, e.g. after changing how rollups are keyed). Days that
+already have a current ``UtmRollupDay`` marker are skipped otherwise.
+"""
+
+from django.core.management.base import BaseCommand
+
+from analytics.models import UtmRollupDay
+from analytics.services.utm_rollups import ROLLUP_LOOKBACK_DAYS, compute_utm_rollups
+
+
+class Command(BaseCommand):
+    help = 'Re-aggregate UTM daily rollups for days without a current marker.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=ROLLUP_LOOKBACK_DAYS,
+            help=f'How many settled days back to cover (default {ROLLUP_LOOKBACK_DAYS}).',
+        )
+        parser.add_argument(
+            '--rebuild', action='store_true',
+            help='Drop every rollup marker first so all days are recomputed.',
+        )
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            UtmRollupDay.objects.all().delete()
+        result = compute_utm_rollups(lookback_days=options['days'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Computed UTM rollups for {result['days']} days ({result['rows']} rows)."
+        ))
@@ -1,8 +1,9 @@
 """Middleware for capturing UTM campaign visits.
 
 Captures `utm_*` query params, persists first-touch in a long-lived cookie,
-last-touch in the session, assigns a stable anonymous_id cookie, and writes
-one CampaignVisit row per UTM-bearing request.
+last-touch in the session, assigns a stable anonymous_id cookie, and stages
+one CampaignVisit row per UTM-bearing request (flushed in bulk by
+``analytics.tasks.flush_staged_visits``).
 
 Also stashes the active request on a thread-local so downstream code that
 runs inside a request (e.g. signal handlers fired during ORM operations)
@@ -175,13 +176,18 @@ def _should_skip(request):
 
 
 def _enqueue_visit(**kwargs):
-    """Enqueue record_visit via jobs.async_task. Falls back to inline call.
+    """Stage a visit for the periodic flush. Falls back to an inline write.
+
+    Visits are appended to ``StagedCampaignVisit`` and moved into
+    ``CampaignVisit`` in bulk by ``analytics.tasks.flush_staged_visits``,
+    so a burst of campaign traffic costs one narrow insert per request
+    instead of a Django-Q task each.
 
     When `Q_CLUSTER['sync'] = True` (test mode, set via env `Q_SYNC=true`),
-    we call the task inline so the visit row exists before the response is
-    returned — assertions in TestCase can run immediately afterwards.
-    If for some reason the queue layer is unavailable, fall back to a direct
-    synchronous call so we never lose attribution data.
+    we call ``record_visit`` inline so the visit row exists before the
+    response is returned — assertions in TestCase can run immediately
+    afterwards. If staging fails, fall back to a direct synchronous write
+    so we never lose attribution data.
     """
     q_config = getattr(settings, 'Q_CLUSTER', {}) or {}
     if q_config.get('sync'):
@@ -193,18 +199,10 @@ def _enqueue_visit(**kwargs):
         return
 
     try:
-        from jobs.tasks import async_task, build_task_name
-        async_task(
-            'analytics.tasks.record_visit',
-            task_name=build_task_name(
-                'Record analytics visit',
-                'campaign attribution',
-                'analytics middleware',
-            ),
-            **kwargs,
-        )
+        from analytics.tasks import stage_visit
+        stage_visit(**kwargs)
     except Exception:  # pragma: no cover — defensive only
-        logger.exception('Failed to enqueue record_visit; running inline')
+        logger.exception('Failed to stage visit; recording inline')
         from analytics.tasks import record_visit
         record_visit(**kwargs)
 
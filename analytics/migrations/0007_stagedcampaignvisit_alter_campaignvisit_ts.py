@@ -0,0 +1,31 @@
+# Generated by Django 6.1.2 on 2026-10-17 09:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0006_alter_useractivity_event_type'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StagedCampaignVisit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('payload', models.JSONField()),
+                ('ts', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Staged Campaign Visit',
+                'verbose_name_plural': 'Staged Campaign Visits',
+            },
+        ),
+        migrations.AlterField(
+            model_name='campaignvisit',
+            name='ts',
+            field=models.DateTimeField(db_index=True, default=django.utils.timezone.now),
+        ),
+    ]
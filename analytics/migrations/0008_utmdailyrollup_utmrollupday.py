@@ -0,0 +1,48 @@
+# Generated by Django 6.1.2 on 2026-10-17 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0007_stagedcampaignvisit_alter_campaignvisit_ts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UtmDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('utm_campaign', models.CharField(blank=True, default='', max_length=255)),
+                ('utm_source', models.CharField(blank=True, default='', max_length=255)),
+                ('utm_medium', models.CharField(blank=True, default='', max_length=255)),
+                ('utm_content', models.CharField(blank=True, default='', max_length=255)),
+                ('visits', models.PositiveIntegerField(default=0)),
+                ('first_touch_signups', models.PositiveIntegerField(default=0)),
+                ('last_touch_signups', models.PositiveIntegerField(default=0)),
+                ('first_touch_conversions', models.PositiveIntegerField(default=0)),
+                ('last_touch_conversions', models.PositiveIntegerField(default=0)),
+                ('first_touch_mrr_eur', models.PositiveIntegerField(default=0)),
+                ('last_touch_mrr_eur', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'UTM Daily Rollup',
+                'verbose_name_plural': 'UTM Daily Rollups',
+                'indexes': [models.Index(fields=['utm_campaign', 'day'], name='analytics_rollup_utmc_day_idx')],
+                'constraints': [models.UniqueConstraint(fields=('day', 'utm_campaign', 'utm_source', 'utm_medium', 'utm_content'), name='analytics_utm_rollup_key_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='UtmRollupDay',
+            fields=[
+                ('day', models.DateField(primary_key=True, serialize=False)),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'UTM Rollup Day',
+                'verbose_name_plural': 'UTM Rollup Days',
+            },
+        ),
+    ]
@@ -1,3 +1,4 @@
 from .user_activity import *  # noqa: F401,F403
 from .user_attribution import *  # noqa: F401,F403
+from .utm_rollup import *  # noqa: F401,F403
 from .visit import *  # noqa: F401,F403
@@ -0,0 +1,72 @@
+"""Precomputed daily UTM rollups read by ``analytics.aggregations``."""
+
+from django.db import models
+
+
+class UtmDailyRollup(models.Model):
+    """Per-day totals for one (campaign, source, medium, content) tuple.
+
+    Written by ``analytics.services.utm_rollups.compute_rollup_day``, never
+    edited by hand. Visits are keyed by the visit's ``ts`` day. Signups are
+    keyed by the touch timestamp and UTM values of the attribution model
+    they count for (``first_touch_*`` or ``last_touch_*``). Conversions and
+    MRR are keyed by the conversion's ``created_at`` day. A tuple that only
+    has signups on a day still gets a row, with ``visits=0``.
+
+    Unique visitors are deliberately absent: distinct counts do not add up
+    across days, so the dashboard reads them from raw ``CampaignVisit``.
+    """
+
+    day = models.DateField()
+    utm_campaign = models.CharField(max_length=255, blank=True, default='')
+    utm_source = models.CharField(max_length=255, blank=True, default='')
+    utm_medium = models.CharField(max_length=255, blank=True, default='')
+    utm_content = models.CharField(max_length=255, blank=True, default='')
+
+    visits = models.PositiveIntegerField(default=0)
+    first_touch_signups = models.PositiveIntegerField(default=0)
+    last_touch_signups = models.PositiveIntegerField(default=0)
+    first_touch_conversions = models.PositiveIntegerField(default=0)
+    last_touch_conversions = models.PositiveIntegerField(default=0)
+    first_touch_mrr_eur = models.PositiveIntegerField(default=0)
+    last_touch_mrr_eur = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = 'UTM Daily Rollup'
+        verbose_name_plural = 'UTM Daily Rollups'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'utm_campaign', 'utm_source', 'utm_medium', 'utm_content'],
+                name='analytics_utm_rollup_key_uniq',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['utm_campaign', 'day'], name='analytics_rollup_utmc_day_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.day} {self.utm_source}/{self.utm_medium}/{self.utm_campaign}: {self.visits} visits'
+
+
+class UtmRollupDay(models.Model):
+    """Marks a day whose ``UtmDailyRollup`` rows are complete and current.
+
+    ``analytics.aggregations`` only reads rollups for days with a marker
+    and falls back to raw rows for every other day. Writers that change a
+    past day's totals (the staged-visit flush, attribution and conversion
+    saves/deletes) delete that day's marker. The next
+    ``compute_utm_rollups`` run re-aggregates only the unmarked days.
+    """
+
+    day = models.DateField(primary_key=True)
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = 'UTM Rollup Day'
+        verbose_name_plural = 'UTM Rollup Days'
+
+    def __str__(self):
+        return f'{self.day} (computed {self.computed_at:%Y-%m-%d %H:%M})'
+
+
+__all__ = ['UtmDailyRollup', 'UtmRollupDay']
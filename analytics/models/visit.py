@@ -2,6 +2,7 @@
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class CampaignVisit(models.Model):
@@ -48,7 +49,9 @@ class CampaignVisit(models.Model):
         on_delete=models.SET_NULL,
         related_name='campaign_visits',
     )
-    ts = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Not auto_now_add: visits flushed from StagedCampaignVisit keep the
+    # time of the pageview, not the time of the flush.
+    ts = models.DateTimeField(default=timezone.now, db_index=True)
 
     class Meta:
         verbose_name = 'Campaign Visit'
@@ -64,4 +67,25 @@ class CampaignVisit(models.Model):
         return f'{self.utm_source}/{self.utm_medium}/{self.utm_campaign} -> {self.path} @ {self.ts:%Y-%m-%d %H:%M}'
 
 
-__all__ = ['CampaignVisit']
+class StagedCampaignVisit(models.Model):
+    """A captured pageview waiting to be flushed into ``CampaignVisit``.
+
+    The middleware appends one row per UTM-bearing request: the raw
+    ``record_visit`` kwargs as JSON plus the capture time, with no foreign
+    keys or secondary indexes to maintain. ``analytics.tasks.
+    flush_staged_visits`` drains the table every minute with
+    ``bulk_create``, resolving ``UtmCampaign`` ids once per batch.
+    """
+
+    payload = models.JSONField()
+    ts = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = 'Staged Campaign Visit'
+        verbose_name_plural = 'Staged Campaign Visits'
+
+    def __str__(self):
+        return f'StagedCampaignVisit({self.pk} @ {self.ts:%Y-%m-%d %H:%M})'
+
+
+__all__ = ['CampaignVisit', 'StagedCampaignVisit']
@@ -0,0 +1,161 @@
+"""Maintain the precomputed daily UTM rollup table.
+
+``analytics.aggregations`` reads ``UtmDailyRollup`` for every whole day in
+a dashboard window that has a ``UtmRollupDay`` marker, and raw
+``CampaignVisit`` / ``UserAttribution`` / ``ConversionAttribution`` rows
+for the rest (today's partial day, the partial first day of a rolling
+window, and any day not rolled up yet).
+
+``compute_utm_rollups`` runs hourly via ``setup_schedules`` and re-aggregates
+only days without a marker. Markers are removed by
+``invalidate_rollup_days`` whenever a write lands on an already-rolled-up
+day: the staged-visit flush, and attribution or conversion saves and
+deletes (``analytics.signals``). Days are UTC calendar days, matching
+``DATE(ts)`` on the UTC database connection.
+"""
+
+import logging
+from datetime import datetime, time, timedelta
+from datetime import timezone as dt_timezone
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.utils import timezone
+
+from analytics.models import (
+    CampaignVisit,
+    UserAttribution,
+    UtmDailyRollup,
+    UtmRollupDay,
+)
+
+try:
+    from payments.models import ConversionAttribution as _ConversionAttribution
+except ImportError:  # pragma: no cover — payments is always installed today
+    _ConversionAttribution = None
+
+logger = logging.getLogger(__name__)
+
+UTM_KEYS = ('utm_campaign', 'utm_source', 'utm_medium', 'utm_content')
+TOUCHES = ('first_touch', 'last_touch')
+
+# How far back the scheduled run looks for unmarked days. Older days stay
+# on the raw-row path until someone runs ``compute_utm_rollups --days``.
+ROLLUP_LOOKBACK_DAYS = 400
+# A finished day is only rolled up once it has been over this long, so
+# visits still waiting in StagedCampaignVisit are flushed first.
+ROLLUP_SETTLE_DELAY = timedelta(minutes=15)
+
+
+def rollup_day_of(ts):
+    """Return the UTC calendar day a timestamp is rolled up under."""
+    return ts.astimezone(dt_timezone.utc).date()
+
+
+def day_bounds(day):
+    """Return the half-open ``[start, end)`` datetimes of a UTC day."""
+    start = datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+    return start, start + timedelta(days=1)
+
+
+def invalidate_rollup_days(timestamps):
+    """Drop the rollup markers of the days the given timestamps fall on.
+
+    Today is never rolled up, so timestamps on today (the common case for
+    a fresh visit, signup or conversion) cost no query.
+    """
+    today = rollup_day_of(timezone.now())
+    days = {rollup_day_of(ts) for ts in timestamps if ts is not None}
+    days = {day for day in days if day < today}
+    if days:
+        UtmRollupDay.objects.filter(day__in=days).delete()
+
+
+def _grouped_rows(model, ts_field, prefix, start, end, **aggregates):
+    """Rows of ``model`` in ``[start, end)`` grouped by their UTM key."""
+    qs = model.objects.filter(
+        **{f'{ts_field}__gte': start, f'{ts_field}__lt': end}
+    ).order_by()
+    if prefix:
+        qs = qs.values(**{key: F(prefix + key) for key in UTM_KEYS})
+    else:
+        qs = qs.values(*UTM_KEYS)
+    return qs.annotate(**aggregates)
+
+
+def compute_rollup_day(day, *, now=None):
+    """Rebuild the ``UtmDailyRollup`` rows of one day and mark it current.
+
+    Five grouped queries read the day (visits, then signups and
+    conversions for each touch model); the old rows are replaced in one
+    transaction. Returns the number of rollup rows written.
+    """
+    if now is None:
+        now = timezone.now()
+    start, end = day_bounds(day)
+    totals = {}
+
+    def add(row, **counts):
+        key = tuple(row[field] for field in UTM_KEYS)
+        entry = totals.setdefault(key, {})
+        for column, value in counts.items():
+            entry[column] = entry.get(column, 0) + (value or 0)
+
+    for row in _grouped_rows(CampaignVisit, 'ts', '', start, end, n=Count('id')):
+        add(row, visits=row['n'])
+
+    for touch in TOUCHES:
+        prefix = f'{touch}_'
+        for row in _grouped_rows(
+            UserAttribution, prefix + 'ts', prefix, start, end, n=Count('pk'),
+        ):
+            add(row, **{f'{touch}_signups': row['n']})
+        if _ConversionAttribution is None:
+            continue
+        for row in _grouped_rows(
+            _ConversionAttribution, 'created_at', prefix, start, end,
+            n=Count('pk'), mrr=Sum('mrr_eur'),
+        ):
+            add(row, **{
+                f'{touch}_conversions': row['n'],
+                f'{touch}_mrr_eur': row['mrr'],
+            })
+
+    with transaction.atomic():
+        UtmDailyRollup.objects.filter(day=day).delete()
+        UtmDailyRollup.objects.bulk_create([
+            UtmDailyRollup(day=day, **dict(zip(UTM_KEYS, key)), **counts)
+            for key, counts in totals.items()
+        ])
+        UtmRollupDay.objects.update_or_create(
+            day=day, defaults={'computed_at': now},
+        )
+    return len(totals)
+
+
+def compute_utm_rollups(*, lookback_days=ROLLUP_LOOKBACK_DAYS, now=None):
+    """Roll up every settled day in the lookback window that has no marker.
+
+    Returns ``{'days': <days computed>, 'rows': <rollup rows written>}``.
+    """
+    if now is None:
+        now = timezone.now()
+    last_day = rollup_day_of(now - ROLLUP_SETTLE_DELAY) - timedelta(days=1)
+    first_day = last_day - timedelta(days=lookback_days - 1)
+    marked = set(
+        UtmRollupDay.objects
+        .filter(day__gte=first_day, day__lte=last_day)
+        .values_list('day', flat=True)
+    )
+
+    days = 0
+    rows = 0
+    day = first_day
+    while day <= last_day:
+        if day not in marked:
+            rows += compute_rollup_day(day, now=now)
+            days += 1
+        day += timedelta(days=1)
+    if days:
+        logger.info('Computed UTM rollups for %d days (%d rows)', days, rows)
+    return {'days': days, 'rows': rows}
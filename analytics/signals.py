@@ -33,6 +33,12 @@ Backfill:
   "stealing" visits already linked to a different user (e.g. shared
   device).
 
+Rollup invalidation:
+- `invalidate_attribution_rollups` / `invalidate_conversion_rollups` run
+  on save and delete of `UserAttribution` and `ConversionAttribution` and
+  drop the `UtmRollupDay` marker of every past day the row counts on, so
+  `compute_utm_rollups` re-aggregates it.
+
 Cross-device limitation: a user who landed via UTM on phone but signed up
 on desktop will get an empty attribution row. This is an accepted v1
 limitation — we do not try to cross-device match.
@@ -58,6 +64,7 @@ from analytics.request_context import (
     consume_stripe_user_creation,
     get_current_request,
 )
+from analytics.services.utm_rollups import invalidate_rollup_days
 from integrations.models import UtmCampaign
 
 logger = logging.getLogger(__name__)
@@ -297,7 +304,19 @@ def update_signup_path_for_social_signup(sender, request, user, **kwargs):
         )
 
 
+def invalidate_attribution_rollups(sender, instance, **kwargs):
+    """Drop rollup markers for the days a signup is counted on."""
+    invalidate_rollup_days([instance.first_touch_ts, instance.last_touch_ts])
+
+
+def invalidate_conversion_rollups(sender, instance, **kwargs):
+    """Drop the rollup marker for the day a conversion is counted on."""
+    invalidate_rollup_days([instance.created_at])
+
+
 __all__ = [
     'create_user_attribution',
+    'invalidate_attribution_rollups',
+    'invalidate_conversion_rollups',
     'update_signup_path_for_social_signup',
 ]
@@ -2,11 +2,14 @@
 
 import logging
 
+from django.contrib.auth import get_user_model
 from django.core.cache import cache
+from django.db import transaction
 from django.utils import timezone
 
 from analytics.activity import get_user_activity_retention_days
-from analytics.models import CampaignVisit, UserActivity
+from analytics.models import CampaignVisit, StagedCampaignVisit, UserActivity
+from analytics.services import utm_rollups
 from integrations.models import UtmCampaign
 
 logger = logging.getLogger(__name__)
@@ -21,6 +24,13 @@ CAMPAIGN_CACHE_KEY = 'analytics:campaign:{slug}'
 # this string, then translate it back to None when reading.
 _CAMPAIGN_MISS_SENTINEL = '__campaign_miss__'
 
+# Staged visits are moved into CampaignVisit this many rows per
+# transaction. One run drains at most VISIT_FLUSH_MAX_BATCHES batches so a
+# backlog is worked off over several minute ticks instead of pinning a
+# worker past the Q_CLUSTER timeout.
+VISIT_FLUSH_BATCH_SIZE = 500
+VISIT_FLUSH_MAX_BATCHES = 200
+
 
 def _resolve_campaign_id(utm_campaign_slug):
     """Look up UtmCampaign.id by slug, with positive AND negative caching.
@@ -89,6 +99,104 @@ def record_visit(
     return visit.id
 
 
+def stage_visit(**kwargs):
+    """Append a visit to ``StagedCampaignVisit`` for the next flush.
+
+    Takes the same keyword arguments as :func:`record_visit`. This is the
+    middleware's hot path: one narrow insert, no cache lookup and no
+    Django-Q broker row.
+    """
+    StagedCampaignVisit.objects.create(payload=kwargs)
+
+
+def _flush_batch(batch_size):
+    """Move up to ``batch_size`` staged visits into ``CampaignVisit``.
+
+    Returns the number of visits flushed. Rows are claimed with
+    ``SKIP LOCKED`` (a no-op on SQLite), so an overlapping run takes the
+    next batch instead of double-inserting this one.
+    """
+    with transaction.atomic():
+        staged = list(
+            StagedCampaignVisit.objects
+            .select_for_update(skip_locked=True)
+            .order_by('pk')[:batch_size]
+        )
+        if not staged:
+            return 0
+
+        slugs = {row.payload.get('utm_campaign') for row in staged} - {'', None}
+        campaign_ids = dict(
+            UtmCampaign.objects
+            .filter(slug__in=slugs)
+            .values_list('slug', 'id')
+        )
+        # A visitor may have deleted their account since the pageview;
+        # mirror the FK's SET_NULL instead of failing the whole batch.
+        user_ids = {row.payload.get('user_id') for row in staged} - {None}
+        live_user_ids = set(
+            get_user_model().objects
+            .filter(pk__in=user_ids)
+            .values_list('pk', flat=True)
+        )
+
+        visits = []
+        for row in staged:
+            payload = dict(row.payload)
+            user_id = payload.pop('user_id', None)
+            visits.append(CampaignVisit(
+                campaign_id=campaign_ids.get(payload.get('utm_campaign')),
+                user_id=user_id if user_id in live_user_ids else None,
+                ts=row.ts,
+                **payload,
+            ))
+        CampaignVisit.objects.bulk_create(visits)
+        StagedCampaignVisit.objects.filter(
+            pk__in=[row.pk for row in staged],
+        ).delete()
+        # Visits staged just before midnight land on a day that may
+        # already be rolled up.
+        utm_rollups.invalidate_rollup_days(row.ts for row in staged)
+    return len(visits)
+
+
+def flush_staged_visits(
+    batch_size=VISIT_FLUSH_BATCH_SIZE,
+    max_batches=VISIT_FLUSH_MAX_BATCHES,
+):
+    """Drain ``StagedCampaignVisit`` into ``CampaignVisit`` in batches.
+
+    Scheduled every minute via ``setup_schedules``. Each batch is one
+    transaction: a ``bulk_create`` of the visits, one ``UtmCampaign``
+    slug lookup, one user-existence check and one delete of the staged
+    rows.
+    """
+    flushed = 0
+    batches = 0
+    while batches < max_batches:
+        count = _flush_batch(batch_size)
+        if not count:
+            break
+        flushed += count
+        batches += 1
+    if flushed:
+        logger.info(
+            'Flushed %d staged campaign visits in %d batches',
+            flushed, batches,
+        )
+    return {'flushed': flushed, 'batches': batches}
+
+
+def compute_utm_rollups():
+    """Roll up settled days that have no current ``UtmDailyRollup`` rows.
+
+    Scheduled hourly via ``setup_schedules``. Only days without a
+    ``UtmRollupDay`` marker are re-aggregated: new days, and days whose
+    marker a late write dropped.
+    """
+    return utm_rollups.compute_utm_rollups()
+
+
 def purge_old_user_activity():
     """Delete UserActivity rows older than the retention window (issue #853).
 
@@ -0,0 +1,281 @@
+"""Tests for the precomputed daily UTM rollups behind analytics.aggregations.
+
+``compute_utm_rollups`` writes ``UtmDailyRollup`` rows plus a
+``UtmRollupDay`` marker per settled day. The aggregation helpers read
+marked whole days from the rollup table and everything else from raw rows,
+so their results must not change when days get rolled up.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from analytics import aggregations
+from analytics.models import (
+    CampaignVisit,
+    StagedCampaignVisit,
+    UserAttribution,
+    UtmDailyRollup,
+    UtmRollupDay,
+)
+from analytics.services.utm_rollups import (
+    compute_rollup_day,
+    compute_utm_rollups,
+    day_bounds,
+    rollup_day_of,
+)
+from analytics.tasks import flush_staged_visits
+from payments.models import ConversionAttribution
+
+User = get_user_model()
+
+
+def _today():
+    return rollup_day_of(timezone.now())
+
+
+def _at(days_ago, hour=12):
+    """A timestamp ``hour`` o'clock UTC on the day ``days_ago`` days back."""
+    return day_bounds(_today() - timedelta(days=days_ago))[0] + timedelta(hours=hour)
+
+
+def _visit(slug, ts, *, content='', source='newsletter', medium='email',
+           anon='aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa'):
+    return CampaignVisit.objects.create(
+        utm_campaign=slug, utm_content=content,
+        utm_source=source, utm_medium=medium,
+        anonymous_id=anon, ts=ts,
+    )
+
+
+def _signup(email, *, slug, ts, content='', last_slug=None, last_ts=None):
+    user = User.objects.create_user(email=email)
+    UserAttribution.objects.filter(user=user).delete()
+    UserAttribution.objects.create(
+        user=user,
+        first_touch_utm_campaign=slug,
+        first_touch_utm_content=content,
+        first_touch_utm_source='newsletter',
+        first_touch_utm_medium='email',
+        first_touch_ts=ts,
+        last_touch_utm_campaign=last_slug or slug,
+        last_touch_utm_content=content,
+        last_touch_utm_source='newsletter',
+        last_touch_utm_medium='email',
+        last_touch_ts=last_ts or ts,
+        signup_path='email_password',
+    )
+    return user
+
+
+def _conversion(user, *, slug, created_at, mrr_eur, content=''):
+    conversion = ConversionAttribution.objects.create(
+        user=user,
+        stripe_session_id=f'cs_{user.pk}_{slug}',
+        billing_period='monthly',
+        amount_eur=mrr_eur,
+        mrr_eur=mrr_eur,
+        first_touch_utm_campaign=slug,
+        first_touch_utm_content=content,
+        first_touch_utm_source='newsletter',
+        first_touch_utm_medium='email',
+        last_touch_utm_campaign=slug,
+        last_touch_utm_content=content,
+        last_touch_utm_source='newsletter',
+        last_touch_utm_medium='email',
+    )
+    ConversionAttribution.objects.filter(pk=conversion.pk).update(
+        created_at=created_at,
+    )
+    return conversion
+
+
+class ComputeRollupDayTest(TestCase):
+    def test_groups_visits_signups_and_conversions_by_utm_key(self):
+        day_ts = _at(3)
+        _visit('launch', day_ts, content='hero', anon='a1')
+        _visit('launch', day_ts, content='hero', anon='a1')
+        _visit('launch', day_ts + timedelta(hours=2), content='maven', anon='a2')
+        _visit('launch', _at(2), content='hero', anon='a3')  # other day
+        user = _signup('hero@example.com', slug='launch', content='hero', ts=day_ts)
+        _conversion(user, slug='launch', content='hero', created_at=day_ts, mrr_eur=10)
+
+        written = compute_rollup_day(_today() - timedelta(days=3))
+
+        self.assertEqual(written, 2)
+        hero = UtmDailyRollup.objects.get(utm_content='hero')
+        self.assertEqual(hero.day, _today() - timedelta(days=3))
+        self.assertEqual(hero.visits, 2)
+        self.assertEqual(hero.first_touch_signups, 1)
+        self.assertEqual(hero.last_touch_signups, 1)
+        self.assertEqual(hero.first_touch_conversions, 1)
+        self.assertEqual(hero.first_touch_mrr_eur, 10)
+        maven = UtmDailyRollup.objects.get(utm_content='maven')
+        self.assertEqual(maven.visits, 1)
+        self.assertEqual(maven.first_touch_signups, 0)
+        self.assertTrue(
+            UtmRollupDay.objects.filter(day=_today() - timedelta(days=3)).exists()
+        )
+
+    def test_recompute_replaces_previous_rows(self):
+        day = _today() - timedelta(days=3)
+        _visit('launch', _at(3))
+        compute_rollup_day(day)
+        _visit('launch', _at(3))
+
+        compute_rollup_day(day)
+
+        self.assertEqual(UtmDailyRollup.objects.get(day=day).visits, 2)
+
+
+class ComputeUtmRollupsTest(TestCase):
+    def test_only_unmarked_days_are_computed(self):
+        self.assertEqual(compute_utm_rollups(lookback_days=5)['days'], 5)
+        self.assertEqual(compute_utm_rollups(lookback_days=5)['days'], 0)
+
+        UtmRollupDay.objects.filter(day=_today() - timedelta(days=2)).delete()
+
+        self.assertEqual(compute_utm_rollups(lookback_days=5)['days'], 1)
+
+    def test_today_is_never_rolled_up(self):
+        compute_utm_rollups(lookback_days=3)
+
+        self.assertFalse(UtmRollupDay.objects.filter(day=_today()).exists())
+
+    def test_management_command_rebuilds_every_day(self):
+        compute_utm_rollups(lookback_days=3)
+        out = StringIO()
+
+        call_command('compute_utm_rollups', '--days', '3', '--rebuild', stdout=out)
+
+        self.assertIn('Computed UTM rollups for 3 days', out.getvalue())
+
+
+class AggregationsReadRollupsTest(TestCase):
+    def setUp(self):
+        for days_ago, count in ((5, 2), (4, 3), (2, 1)):
+            for i in range(count):
+                _visit('launch', _at(days_ago, hour=10 + i), content='hero',
+                       anon=f'launch-{days_ago}-{i}')
+        _visit('launch', _at(3), content='maven', source='twitter',
+               medium='social', anon='maven-1')
+        _visit('older', _at(4), anon='older-1')
+        _visit('launch', timezone.now(), content='hero', anon='today-1')
+        alice = _signup('alice@example.com', slug='launch', content='hero', ts=_at(4))
+        _signup('bob@example.com', slug='launch', content='maven', ts=_at(3),
+                last_slug='older', last_ts=_at(2))
+        _conversion(alice, slug='launch', content='hero', created_at=_at(2), mrr_eur=10)
+        self.start = _at(6, hour=18)
+        self.end = timezone.now()
+
+    def _snapshot(self):
+        start, end = self.start, self.end
+        return {
+            'kpis': aggregations.kpi_strip(start, end),
+            'launch_kpis': aggregations.kpi_strip(
+                start, end, campaign_slug='launch', attribution='last_touch',
+            ),
+            'campaigns': aggregations.campaign_rollup(start, end),
+            'contents': aggregations.utm_content_rollup(
+                start, end, campaign_slug='launch',
+            ),
+            'visit_days': aggregations.daily_buckets(start, end),
+            'signup_days': aggregations.daily_buckets(
+                start, end, metric='signups', attribution='last_touch',
+            ),
+            'options': aggregations.filter_options(start, end),
+        }
+
+    def test_results_identical_before_and_after_rollup(self):
+        raw = self._snapshot()
+
+        compute_utm_rollups(lookback_days=10)
+
+        self.assertEqual(self._snapshot(), raw)
+        self.assertEqual(raw['kpis']['visits'], 9)
+        self.assertEqual(raw['kpis']['signups'], 2)
+        self.assertEqual(raw['kpis']['mrr'], Decimal(10))
+        self.assertEqual(raw['launch_kpis']['signups'], 1)
+
+    def test_whole_days_are_read_from_rollups(self):
+        compute_utm_rollups(lookback_days=10)
+        # Raw rows for rolled-up days are no longer consulted.
+        CampaignVisit.objects.filter(ts__lt=day_bounds(_today())[0]).delete()
+
+        self.assertEqual(aggregations.visit_count(self.start, self.end), 9)
+
+    def test_partial_first_day_and_today_are_read_from_raw(self):
+        compute_utm_rollups(lookback_days=10)
+        start = _at(5, hour=11)  # skips the 10:00 visit on that day
+
+        self.assertEqual(aggregations.visit_count(start, self.end), 8)
+        _visit('launch', timezone.now(), anon='today-2')
+        self.assertEqual(aggregations.visit_count(start, timezone.now()), 9)
+
+    def test_unmarked_day_falls_back_to_raw_rows(self):
+        compute_utm_rollups(lookback_days=10)
+        UtmRollupDay.objects.filter(day=_today() - timedelta(days=4)).delete()
+        CampaignVisit.objects.create(
+            utm_campaign='launch', anonymous_id='late-1', ts=_at(4),
+        )
+
+        self.assertEqual(aggregations.visit_count(self.start, self.end), 10)
+
+    def test_campaign_rollup_query_count_does_not_grow_with_campaigns(self):
+        compute_utm_rollups(lookback_days=10)
+        with CaptureQueriesContext(connection) as few:
+            aggregations.campaign_rollup(self.start, self.end)
+
+        for i in range(5):
+            _visit(f'extra_{i}', timezone.now(), anon=f'extra-{i}')
+        end = timezone.now()
+        with CaptureQueriesContext(connection) as many:
+            rows = aggregations.campaign_rollup(self.start, end)
+
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(len(many), len(few))
+
+
+class RollupInvalidationTest(TestCase):
+    def setUp(self):
+        compute_utm_rollups(lookback_days=5)
+        self.day = _today() - timedelta(days=3)
+
+    def test_flush_of_a_late_staged_visit_drops_the_days_marker(self):
+        StagedCampaignVisit.objects.create(
+            payload={'utm_campaign': 'launch', 'anonymous_id': 'late-1'},
+            ts=_at(3),
+        )
+
+        flush_staged_visits()
+
+        self.assertFalse(UtmRollupDay.objects.filter(day=self.day).exists())
+        self.assertEqual(UtmRollupDay.objects.count(), 4)
+
+    def test_signup_with_an_old_first_touch_drops_the_days_marker(self):
+        _signup('late@example.com', slug='launch', ts=_at(3))
+
+        self.assertFalse(UtmRollupDay.objects.filter(day=self.day).exists())
+
+    def test_deleted_conversion_drops_the_days_marker(self):
+        user = User.objects.create_user(email='paid@example.com')
+        conversion = _conversion(user, slug='launch', created_at=_at(3), mrr_eur=10)
+        compute_utm_rollups(lookback_days=5)
+        conversion.refresh_from_db()
+
+        conversion.delete()
+
+        self.assertFalse(UtmRollupDay.objects.filter(day=self.day).exists())
+
+    def test_todays_writes_keep_every_marker(self):
+        _visit('launch', timezone.now())
+        _signup('today@example.com', slug='launch', ts=timezone.now())
+
+        self.assertEqual(UtmRollupDay.objects.count(), 5)
@@ -0,0 +1,177 @@
+"""Tests for the buffered CampaignVisit ingestion path.
+
+Outside Django-Q sync mode the middleware appends each UTM pageview to
+``StagedCampaignVisit``; ``flush_staged_visits`` moves them into
+``CampaignVisit`` with ``bulk_create``.
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django_q.models import OrmQ
+
+from analytics.consent import ANALYTICS_CONSENT_COOKIE, ANALYTICS_CONSENT_GRANTED
+from analytics.middleware import CampaignTrackingMiddleware
+from analytics.models import CampaignVisit, StagedCampaignVisit
+from analytics.tasks import flush_staged_visits, stage_visit
+from integrations.models import UtmCampaign
+
+User = get_user_model()
+
+ASYNC_Q_CLUSTER = {'sync': False, 'orm': 'default', 'name': 'test', 'workers': 1}
+
+
+def _stage(**overrides):
+    kwargs = {
+        'utm_source': 'newsletter',
+        'utm_medium': 'email',
+        'utm_campaign': 'launch',
+        'utm_content': '',
+        'utm_term': '',
+        'path': '/blog',
+        'referrer': '',
+        'user_agent': 'Mozilla/5.0 (test browser)',
+        'ip_hash': '',
+        'anonymous_id': 'aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa',
+        'user_id': None,
+    }
+    kwargs.update(overrides)
+    stage_visit(**kwargs)
+
+
+class FlushStagedVisitsTest(TestCase):
+    def setUp(self):
+        self.campaign = UtmCampaign.objects.create(
+            name='Launch', slug='launch',
+            default_utm_source='newsletter', default_utm_medium='email',
+        )
+
+    def test_flush_moves_staged_rows_into_campaign_visits(self):
+        _stage()
+        _stage(utm_campaign='unknown_slug', path='/courses')
+
+        result = flush_staged_visits()
+
+        self.assertEqual(result, {'flushed': 2, 'batches': 1})
+        self.assertFalse(StagedCampaignVisit.objects.exists())
+        by_path = {v.path: v for v in CampaignVisit.objects.all()}
+        self.assertEqual(by_path['/blog'].campaign_id, self.campaign.id)
+        self.assertEqual(by_path['/blog'].utm_source, 'newsletter')
+        self.assertIsNone(by_path['/courses'].campaign_id)
+
+    def test_flush_keeps_pageview_time(self):
+        _stage()
+        captured_at = timezone.now() - timedelta(minutes=3)
+        StagedCampaignVisit.objects.update(ts=captured_at)
+
+        flush_staged_visits()
+
+        self.assertEqual(CampaignVisit.objects.get().ts, captured_at)
+
+    def test_flush_nulls_users_deleted_since_the_pageview(self):
+        user = User.objects.create_user(email='visitor@example.com')
+        _stage(user_id=user.pk)
+        _stage(user_id=user.pk + 1000)
+
+        flush_staged_visits()
+
+        self.assertCountEqual(
+            CampaignVisit.objects.values_list('user_id', flat=True),
+            [None, user.pk],
+        )
+
+    def test_flush_processes_in_batches(self):
+        for _ in range(5):
+            _stage()
+
+        result = flush_staged_visits(batch_size=2)
+
+        self.assertEqual(result, {'flushed': 5, 'batches': 3})
+        self.assertEqual(CampaignVisit.objects.count(), 5)
+
+    def test_flush_stops_after_max_batches(self):
+        for _ in range(5):
+            _stage()
+
+        result = flush_staged_visits(batch_size=2, max_batches=1)
+
+        self.assertEqual(result, {'flushed': 2, 'batches': 1})
+        self.assertEqual(StagedCampaignVisit.objects.count(), 3)
+
+    def test_flush_with_nothing_staged_is_a_noop(self):
+        self.assertEqual(
+            flush_staged_visits(), {'flushed': 0, 'batches': 0},
+        )
+
+
+@override_settings(IP_HASH_SALT='', Q_CLUSTER=ASYNC_Q_CLUSTER)
+class CampaignVisitBurstLoadTest(TestCase):
+    """Replay a 10k-hit UTM burst through the middleware and the flush."""
+
+    HITS = 10_000
+
+    def setUp(self):
+        self.campaigns = [
+            UtmCampaign.objects.create(
+                name=f'Burst {i}', slug=f'burst_{i}',
+                default_utm_source='newsletter', default_utm_medium='email',
+            )
+            for i in range(3)
+        ]
+        self.factory = RequestFactory(
+            HTTP_USER_AGENT='Mozilla/5.0 (test browser)',
+        )
+        self.middleware = CampaignTrackingMiddleware(
+            lambda request: HttpResponse('ok'),
+        )
+
+    def _hit(self, index):
+        request = self.factory.get(
+            '/blog',
+            {
+                'utm_source': 'newsletter',
+                'utm_medium': 'email',
+                'utm_campaign': f'burst_{index % 4}',
+            },
+        )
+        request.COOKIES[ANALYTICS_CONSENT_COOKIE] = ANALYTICS_CONSENT_GRANTED
+        request.session = {}
+        request.user = AnonymousUser()
+        self.middleware(request)
+
+    def test_burst_is_staged_then_flushed_in_bulk(self):
+        for index in range(self.HITS):
+            self._hit(index)
+
+        # The burst never touches the Django-Q broker.
+        self.assertEqual(OrmQ.objects.count(), 0)
+        self.assertEqual(StagedCampaignVisit.objects.count(), self.HITS)
+        self.assertEqual(CampaignVisit.objects.count(), 0)
+
+        with CaptureQueriesContext(connection) as queries:
+            result = flush_staged_visits()
+
+        self.assertEqual(result['flushed'], self.HITS)
+        self.assertEqual(CampaignVisit.objects.count(), self.HITS)
+        self.assertFalse(StagedCampaignVisit.objects.exists())
+        # A constant handful of statements per batch, not per visit.
+        self.assertLessEqual(len(queries), result['batches'] * 10)
+
+        counts = {
+            campaign.id: CampaignVisit.objects.filter(campaign=campaign).count()
+            for campaign in self.campaigns
+        }
+        self.assertEqual(
+            counts,
+            {campaign.id: self.HITS // 4 for campaign in self.campaigns},
+        )
+        self.assertEqual(
+            CampaignVisit.objects.filter(campaign__isnull=True).count(),
+            self.HITS // 4,
+        )
@@ -11,12 +11,13 @@ demoted-to-non-staff token live in ``setUpTestData``; auth is sent via
 """
 
 import datetime
+import json
 
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.utils import timezone
 
-from accounts.models import Token
+from accounts.models import Token, UserTag
 from content.models import Course
 from content.services.enrollment import ensure_enrollment
 from crm.models import CRMRecord
@@ -778,8 +779,9 @@ class CrmExportQueryBudgetTest(CrmExportTestBase):
         self.client.get(self.URL, **self._auth())
         # Ordered prefetch caches are consumed directly by the shared plan
         # serializer (#1304), removing per-plan child and plan-note queries
-        # while preserving the JSON payload.
-        with self.assertNumQueries(33):
+        # while preserving the JSON payload. The warm-up request above also
+        # bumped the token's ``last_used_at``, so this one skips that UPDATE.
+        with self.assertNumQueries(32):
             response = self.client.get(self.URL, **self._auth())
             self.assertEqual(response.status_code, 200)
             self.assertEqual(response.json()["count"], 3)
@@ -833,6 +835,147 @@ class CrmExportQueryBudgetTest(CrmExportTestBase):
         self.assertEqual(unbounded_user_selects, [])
 
 
+class CrmExportCursorTest(CrmExportTestBase):
+    """Keyset ``cursor`` mode and the ``format=ndjson`` stream."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        base = timezone.now() - datetime.timedelta(days=30)
+        cls.by_record = cls._make_member("c-record@test.com", joined=base)
+        cls._give_crm_record(cls.by_record)
+        # Same date_joined as by_record: the id tiebreak must keep both.
+        cls.by_note = cls._make_member("c-note@test.com", joined=base)
+        cls._give_note(cls.by_note)
+        cls.by_plan = cls._make_member(
+            "c-plan@test.com", joined=base + datetime.timedelta(days=1),
+        )
+        cls._give_plan(cls.by_plan)
+        cls.by_response = cls._make_member(
+            "c-response@test.com", joined=base + datetime.timedelta(days=2),
+        )
+        cls._give_onboarding_response(cls.by_response)
+        cls.by_tag = cls._make_member(
+            "c-tag@test.com", joined=base + datetime.timedelta(days=3),
+        )
+        cls.by_tag.tags = ["early-adopter"]
+        cls.by_tag.save(update_fields=["tags"])
+        cls.system_tag_only = cls._make_member("c-system@test.com")
+        cls.system_tag_only.tags = ["stripe:active"]
+        cls.system_tag_only.save(update_fields=["tags"])
+        cls.no_signal = cls._make_member("c-none@test.com")
+
+    def _get(self, **params):
+        response = self.client.get(self.URL, params, **self._auth())
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def _walk(self, **params):
+        emails = []
+        cursor = ""
+        while cursor is not None:
+            body = self._get(cursor=cursor, **params).json()
+            self.assertNotIn("total", body)
+            self.assertLessEqual(body["count"], params.get("limit", 200))
+            emails.extend(m["email"] for m in body["members"])
+            cursor = body["next_cursor"]
+        return emails
+
+    def _offset_emails(self, **params):
+        body = self._get(**params).json()
+        return {m["email"] for m in body["members"]}
+
+    def test_pages_cover_scope_in_join_order_without_overlap(self):
+        emails = self._walk(scope="all", limit=2)
+
+        expected = list(
+            User.objects.order_by("date_joined", "id")
+            .values_list("email", flat=True)
+        )
+        self.assertEqual(emails, expected)
+
+    def test_crm_scope_matches_offset_mode(self):
+        emails = self._walk(limit=2)
+
+        self.assertEqual(set(emails), self._offset_emails())
+        self.assertNotIn("c-system@test.com", emails)
+        self.assertNotIn("c-none@test.com", emails)
+
+    def test_q_and_tag_match_offset_mode(self):
+        self.assertEqual(
+            set(self._walk(scope="all", q="c-re")),
+            self._offset_emails(scope="all", q="c-re"),
+        )
+        self.assertEqual(
+            set(self._walk(scope="all", q="adopter")),
+            {"c-tag@test.com"},
+        )
+        self.assertEqual(
+            set(self._walk(scope="all", tag="stripe:active")),
+            {"c-system@test.com"},
+        )
+
+    def test_tag_filter_uses_the_tag_index_in_cursor_and_ndjson_modes(self):
+        # Only the UserTag index carries the tag: a JSON-text filter on
+        # ``User.tags`` would not find this member.
+        UserTag.objects.create(user=self.no_signal, tag="vip")
+
+        self.assertEqual(set(self._walk(scope="all", tag="VIP")), {"c-none@test.com"})
+        response = self._get(format="ndjson", scope="all", tag="vip")
+        body = b"".join(response.streaming_content).decode()
+        self.assertEqual(
+            {json.loads(line)["email"] for line in body.splitlines()},
+            {"c-none@test.com"},
+        )
+
+    def test_last_page_has_null_next_cursor(self):
+        body = self._get(cursor="", limit=200).json()
+
+        self.assertIsNone(body["next_cursor"])
+        self.assertEqual(body["count"], 5)
+
+    def test_invalid_cursor_returns_422(self):
+        response = self.client.get(
+            self.URL, {"cursor": "%%%not-base64"}, **self._auth(),
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["details"]["field"], "cursor")
+
+    def test_invalid_format_returns_422(self):
+        response = self.client.get(
+            self.URL, {"format": "csv"}, **self._auth(),
+        )
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["details"]["field"], "format")
+
+    def test_ndjson_streams_every_member_one_per_line(self):
+        response = self._get(format="ndjson", scope="all", limit=2)
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        body = b"".join(response.streaming_content).decode()
+        lines = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(
+            [m["email"] for m in lines],
+            self._walk(scope="all", limit=2),
+        )
+        self.assertIn("crm_record", lines[0])
+
+    def test_page_query_count_does_not_grow_with_unrelated_users(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        # Warm the config cache and the token's ``last_used_at``.
+        self._get(cursor="", limit=2)
+        with CaptureQueriesContext(connection) as before:
+            self._get(cursor="", limit=2)
+        for i in range(10):
+            self._make_member(f"c-filler-{i}@test.com")
+        with CaptureQueriesContext(connection) as after:
+            self._get(cursor="", limit=2)
+
+        self.assertEqual(len(after.captured_queries), len(before.captured_queries))
+
+
 class CrmExportOpenApiTest(CrmExportTestBase):
     def test_export_path_present_under_crm_tag(self):
         response = self.client.get("/api/openapi.json", **self._auth())
@@ -0,0 +1,91 @@
+"""Tests for ``GET /api/diagnostics/page-cache``.
+
+Auth and method boundaries mirror ``api/tests/test_boot_timing.py``; the
+payload merges every live worker snapshot from the shared ``django_q``
+cache into ``totals`` and ``processes``.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import TestCase
+
+from accounts.models import Token
+from api.openapi import build_spec
+from api.urls import urlpatterns
+from website import page_cache
+from website.page_cache import stats
+
+User = get_user_model()
+
+URL = "/api/diagnostics/page-cache"
+
+
+class PageCacheDiagnosticsTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user(
+            email="staff@test.com", password="pw", is_staff=True,
+        )
+        cls.member = User.objects.create_user(
+            email="member@test.com", password="pw",
+        )
+        cls.token = Token.objects.create(user=cls.staff, name="staff-tok")
+        cls.non_staff_token = Token(
+            key="non-staff-token-key", user=cls.member, name="legacy-non-staff",
+        )
+        Token.objects.bulk_create([cls.non_staff_token])
+
+    def setUp(self):
+        caches["django_q"].clear()
+        stats.reset()
+
+    def _get(self):
+        response = self.client.get(
+            URL, HTTP_AUTHORIZATION=f"Token {self.token.key}",
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_anonymous_and_non_staff_get_401(self):
+        self.assertEqual(self.client.get(URL).status_code, 401)
+        response = self.client.get(
+            URL, HTTP_AUTHORIZATION=f"Token {self.non_staff_token.key}",
+        )
+        self.assertEqual(response.status_code, 401)
+
+    def test_post_returns_405(self):
+        response = self.client.post(
+            URL, HTTP_AUTHORIZATION=f"Token {self.token.key}",
+        )
+        self.assertEqual(response.status_code, 405)
+
+    def test_merges_worker_snapshots(self):
+        stats.record_hit(0.0008)
+        stats.record_hit(0.003)
+        stats.record_miss(0.12, stored=True)
+        other = {**stats.snapshot(), "process": "web-2:7"}
+        caches["django_q"].set(f"{page_cache._STATS_KEY_PREFIX}web-2:7", other)
+        caches["django_q"].set(page_cache._STATS_PROCESSES_KEY, ["web-2:7"])
+
+        body = self._get()
+
+        self.assertEqual(len(body["processes"]), 2)
+        totals = body["totals"]
+        self.assertEqual((totals["hits"], totals["misses"]), (4, 2))
+        self.assertEqual(totals["hit_ratio"], 0.6667)
+        self.assertEqual(totals["serve_ms"]["p50"], 1)
+        self.assertEqual(totals["serve_ms"]["p95"], 5)
+        self.assertEqual(totals["miss_ms_avg"], 120.0)
+        self.assertIn("generated_at", body)
+
+    def test_no_lookups_yet_has_null_ratio(self):
+        body = self._get()
+
+        self.assertIsNone(body["totals"]["hit_ratio"])
+        self.assertIsNone(body["totals"]["serve_ms"]["p95"])
+
+    def test_documented_under_diagnostics(self):
+        operations = build_spec(urlpatterns)["paths"][URL]
+
+        self.assertEqual(set(operations), {"get"})
+        self.assertEqual(operations["get"]["tags"], ["Diagnostics"])
@@ -2,12 +2,15 @@
 ``staff_session_or_token_required`` composite helper (issue #736)."""
 
 import json
+from datetime import timedelta
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import check_password
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.http import HttpResponse
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from accounts.auth import staff_session_or_token_required
@@ -156,6 +159,56 @@ class TokenAuthTest(TestCase):
         self.assertEqual(fresh_token.key_hash, original_hash)
         self.assertEqual(fresh_token.lookup_prefix, original_prefix)
 
+    def test_fresh_last_used_at_is_not_rewritten(self):
+        """Within the granularity window the token row is not written."""
+        fresh_token = Token.objects.create(user=self.admin)
+        recent = timezone.now() - timedelta(seconds=5)
+        Token.objects.filter(pk=fresh_token.pk).update(last_used_at=recent)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(
+                "/api/contacts/export",
+                HTTP_AUTHORIZATION=f"Token {fresh_token.key}",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        fresh_token.refresh_from_db()
+        self.assertEqual(fresh_token.last_used_at, recent)
+        self.assertFalse(
+            any(
+                q["sql"].startswith("UPDATE") and "accounts_token" in q["sql"]
+                for q in ctx.captured_queries
+            )
+        )
+
+    def test_stale_last_used_at_is_rewritten(self):
+        fresh_token = Token.objects.create(user=self.admin)
+        stale = timezone.now() - timedelta(minutes=10)
+        Token.objects.filter(pk=fresh_token.pk).update(last_used_at=stale)
+
+        response = self.client.get(
+            "/api/contacts/export",
+            HTTP_AUTHORIZATION=f"Token {fresh_token.key}",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        fresh_token.refresh_from_db()
+        self.assertGreater(fresh_token.last_used_at, stale)
+
+    @override_settings(API_TOKEN_LAST_USED_GRANULARITY=0)
+    def test_zero_granularity_writes_every_call(self):
+        fresh_token = Token.objects.create(user=self.admin)
+        recent = timezone.now() - timedelta(seconds=1)
+        Token.objects.filter(pk=fresh_token.pk).update(last_used_at=recent)
+
+        self.client.get(
+            "/api/contacts/export",
+            HTTP_AUTHORIZATION=f"Token {fresh_token.key}",
+        )
+
+        fresh_token.refresh_from_db()
+        self.assertGreater(fresh_token.last_used_at, recent)
+
     def test_authorization_without_token_scheme_returns_401(self):
         """A bare key with no 'Token ' scheme is treated as missing.
 
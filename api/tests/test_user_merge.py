@@ -20,7 +20,7 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.utils import timezone
 
-from accounts.models import EmailAlias, TierOverride, Token
+from accounts.models import EmailAlias, TierOverride, Token, UserTag
 from analytics.models import UserAttribution
 from community.models import CommunityAuditLog
 from content.models import Course, Enrollment
@@ -262,6 +262,12 @@ class ScalarReconcileTest(UserMergeTestBase):
         canonical.refresh_from_db()
         self.assertEqual(canonical.tags, ["a", "b", "c"])
         self.assertEqual(response.json()["reconciled"]["tags"]["added"], ["c"])
+        # The tag index follows each side's own ``tags`` list.
+        for user, tags in ((canonical, ["a", "b", "c"]), (secondary, ["b", "c"])):
+            self.assertEqual(
+                sorted(UserTag.objects.filter(user=user).values_list("tag", flat=True)),
+                tags,
+            )
 
     def test_email_verified_is_ord(self):
         canonical, secondary = self._make_pair()
@@ -104,6 +104,7 @@ from api.views.onboarding import (
     onboarding_response_detail,
     onboarding_responses_collection,
 )
+from api.views.page_cache import page_cache_diagnostics
 from api.views.payment_mismatches import (
     payment_mismatch_detail,
     payment_mismatches_collection,
@@ -968,6 +969,15 @@ urlpatterns = [
         boot_timing_diagnostics,
         name="api_boot_timing_diagnostics",
     ),
+    # ---- Page cache diagnostics ---------------------------------------
+    # Staff-token read-only hit ratio and serve latency of the anonymous
+    # public page cache, merged from per-worker snapshots that
+    # ``website/page_cache.py`` flushes to the shared ``django_q`` cache.
+    path(
+        "diagnostics/page-cache",
+        page_cache_diagnostics,
+        name="api_page_cache_diagnostics",
+    ),
     # ---- Onboarding read API (issue #837) -----------------------------
     # Staff-token read-only feed over the questionnaires app: survey shape
     # (questionnaires/personas) + member responses for plan generation.
@@ -42,11 +42,28 @@ configurable ``CRM_EXPORT_MAX_LIMIT`` ceiling), ``offset``, ``since``, and
 case-insensitive targeted lookup path that constrains to one user before
 any aggregate prefetch / serialization work; when present it wins over
 ``q``.
+
+Cursor mode: passing ``cursor`` (empty for the first page) switches to
+keyset pagination on ``(date_joined, id)``. The scope, ``q`` and ``tag``
+filters are pushed into SQL as prefilters (``Exists`` subqueries and
+``icontains`` over the text columns / JSON ``tags``) and the precise
+Python checks only run over the rows SQL returns, so a page costs work
+proportional to ``limit`` instead of a scan of every user. Cursor pages
+carry ``next_cursor`` and no ``total``. ``format=ndjson`` streams every
+matching member from the cursor onwards as one JSON object per line, in
+``limit``-sized batches, so a whole-CRM pull runs in constant memory.
 """
 
+import base64
+import binascii
+import datetime
+import itertools
+import json
+
 from django.contrib.auth import get_user_model
-from django.db.models import F, Prefetch
-from django.http import HttpResponse, JsonResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Exists, F, OuterRef, Prefetch, Q
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.urls import reverse
 from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
@@ -94,10 +111,12 @@ from plans.models import (
     Deliverable,
     InterviewNote,
     NextStep,
+    Plan,
     Resource,
     Week,
     WeekNote,
 )
+from questionnaires.models import Response
 
 User = get_user_model()
 
@@ -109,6 +128,7 @@ EXPORT_MAX_LIMIT_KEY = "CRM_EXPORT_MAX_LIMIT"
 EXPORT_MAX_LIMIT_DEFAULT = 200
 
 _VALID_SCOPES = ["crm", "all"]
+_VALID_FORMATS = ["json", "ndjson"]
 
 
 def _isoformat_or_none(value):
@@ -314,6 +334,104 @@ def _has_crm_signal(user, crm_record):
     return False
 
 
+def _crm_signal_sql_q():
+    """SQL superset of ``_has_crm_signal`` for cursor mode.
+
+    Every relation check is an ``Exists`` subquery; the tag check can only
+    say "has any tag" in portable SQL, so members with nothing but system
+    tags still reach ``_has_crm_signal`` and are dropped there.
+    """
+    return (
+        Q(Exists(CRMRecord.objects.filter(user=OuterRef("pk"))))
+        | Q(Exists(InterviewNote.objects.filter(member=OuterRef("pk"))))
+        | Q(Exists(Plan.objects.filter(member=OuterRef("pk"))))
+        | Q(Exists(
+            Response.objects.filter(
+                respondent=OuterRef("pk"),
+                questionnaire__purpose="onboarding",
+            )
+        ))
+        | (Q(tags__isnull=False) & ~Q(tags=[]))
+    )
+
+
+def _q_sql_q(q, q_normalized):
+    """SQL superset of ``_q_matches``: ``icontains`` on the same columns.
+
+    The tag half matches against the JSON text of ``tags``, so it can
+    over-match across item boundaries; ``_q_matches`` makes it exact.
+    """
+    condition = (
+        Q(email__icontains=q)
+        | Q(first_name__icontains=q)
+        | Q(last_name__icontains=q)
+        | Q(stripe_customer_id__icontains=q)
+        | Q(slack_user_id__icontains=q)
+    )
+    if q_normalized:
+        condition |= Q(tags__icontains=q_normalized)
+    return condition
+
+
+def _encode_cursor(user):
+    raw = f"{user.date_joined.isoformat()}|{user.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _parse_cursor(raw):
+    """Decode a ``cursor`` into ``(date_joined, id)``.
+
+    Returns ``(position, error_response)``. An empty cursor means "first
+    page" and yields ``(None, None)``.
+    """
+    if raw == "":
+        return None, None
+    try:
+        padded = raw + "=" * (-len(raw) % 4)
+        decoded = base64.urlsafe_b64decode(padded.encode()).decode()
+        joined_raw, pk_raw = decoded.rsplit("|", 1)
+        joined = datetime.datetime.fromisoformat(joined_raw)
+        pk = int(pk_raw)
+    except (ValueError, UnicodeDecodeError, binascii.Error):
+        return None, error_response(
+            "Invalid cursor", "validation_error", status=422,
+            details={"field": "cursor", "value": raw},
+        )
+    return (joined, pk), None
+
+
+def _iter_cursor_matches(
+    qs, *, position, scope, q, q_normalized, q_lower, batch_size,
+):
+    """Yield matching users in ``(date_joined, id)`` order after ``position``.
+
+    ``qs`` already carries the SQL prefilters. Rows are pulled in keyset
+    batches of ``batch_size`` (each with its own bounded prefetch) and the
+    exact Python checks run per row, so memory stays flat however many
+    users the table holds.
+    """
+    qs = qs.order_by("date_joined", "id")
+    while True:
+        batch_qs = qs
+        if position is not None:
+            joined, pk = position
+            batch_qs = batch_qs.filter(
+                Q(date_joined__gt=joined) | Q(date_joined=joined, pk__gt=pk),
+            )
+        batch = list(batch_qs[:batch_size])
+        for user in batch:
+            if q and not _q_matches(user, q_normalized, q_lower):
+                continue
+            if scope == "crm":
+                crm_record = getattr(user, "crm_record", None)
+                if not _has_crm_signal(user, crm_record):
+                    continue
+            yield user
+        if len(batch) < batch_size:
+            return
+        position = (batch[-1].date_joined, batch[-1].pk)
+
+
 def _gated_notes_by_member(bearer, users):
     """Batch-fetch the bearer-visible notes for every page user at once.
 
@@ -681,6 +799,30 @@ def crm_record_markdown_export(request, email):
                     "required": False,
                     "description": "Exact normalized contact-tag filter.",
                 },
+                "cursor": {
+                    "type": "string",
+                    "required": False,
+                    "description": (
+                        "Opaque keyset cursor on ``(date_joined, id)``. Pass "
+                        "an empty value for the first page, then the "
+                        "previous page's ``next_cursor``. Cursor pages are "
+                        "ordered by ``date_joined, id``, ignore ``offset`` "
+                        "and omit ``total``; ``next_cursor`` is null on the "
+                        "last page. Ignored when ``email`` is supplied."
+                    ),
+                },
+                "format": {
+                    "type": "string",
+                    "enum": _VALID_FORMATS,
+                    "required": False,
+                    "description": (
+                        "``json`` (default) or ``ndjson``. ``ndjson`` "
+                        "streams every matching member from ``cursor`` "
+                        "onwards as one JSON object per line "
+                        "(``application/x-ndjson``), fetched ``limit`` "
+                        "members at a time."
+                    ),
+                },
             },
             "responses": {
                 200: {
@@ -690,7 +832,7 @@ def crm_record_markdown_export(request, email):
                 422: {
                     "description": (
                         "Invalid ``scope`` / ``limit`` / ``offset`` / "
-                        "``since``."
+                        "``since`` / ``cursor`` / ``format``."
                     ),
                     "example": {
                         "error": "Invalid scope: 'everyone'",
@@ -759,6 +901,28 @@ def crm_export(request):
             details={"field": "tag", "value": raw_tag},
         )
 
+    response_format = request.GET.get("format") or "json"
+    if response_format not in _VALID_FORMATS:
+        return error_response(
+            f"Invalid format: {response_format!r}",
+            "validation_error",
+            status=422,
+            details={
+                "field": "format",
+                "value": response_format,
+                "allowed": list(_VALID_FORMATS),
+            },
+        )
+    raw_cursor = request.GET.get("cursor")
+    cursor_mode = not email and (
+        raw_cursor is not None or response_format == "ndjson"
+    )
+    position = None
+    if cursor_mode:
+        position, err = _parse_cursor(raw_cursor or "")
+        if err is not None:
+            return err
+
     qs = _base_queryset()
     if tag:
         qs = qs.filter(pk__in=user_ids_with_exact_tag(tag))
@@ -806,6 +970,35 @@ def crm_export(request):
     if account_lifecycle:
         qs = qs.filter(account_lifecycle_q(account_lifecycle))
 
+    if cursor_mode:
+        if q:
+            qs = qs.filter(_q_sql_q(q, q_normalized))
+        if scope == "crm":
+            qs = qs.filter(_crm_signal_sql_q())
+        matches = _iter_cursor_matches(
+            qs,
+            position=position,
+            scope=scope,
+            q=q,
+            q_normalized=q_normalized,
+            q_lower=q_lower,
+            batch_size=limit,
+        )
+        if response_format == "ndjson":
+            return _ndjson_export_response(
+                matches,
+                batch_size=limit,
+                bearer=bearer,
+                persona_by_questionnaire=persona_by_questionnaire,
+            )
+        return _cursor_export_response(
+            matches,
+            limit=limit,
+            scope=scope,
+            bearer=bearer,
+            persona_by_questionnaire=persona_by_questionnaire,
+        )
+
     # Resolve the scope/filter match set once (the full ``total``), then
     # slice. ``_has_crm_signal`` and ``_q_matches`` read prefetched
     # relations so this loop stays inside the bounded query budget.
@@ -833,15 +1026,13 @@ def crm_export(request):
     )
 
 
-def _export_response(
-    *, page, total, limit, offset, scope, bearer, persona_by_questionnaire,
-):
+def _serialize_page(page, *, bearer, persona_by_questionnaire):
     # Batch the two gated reads once for the whole page so the gate stays
     # the unforgeable boundary without an N+1 across members.
     notes_by_member = _gated_notes_by_member(bearer, page)
     plans_by_member = _gated_plans_by_member(bearer, page)
 
-    members = [
+    return [
         _serialize_member(
             user,
             bearer,
@@ -852,6 +1043,57 @@ def _export_response(
         for user in page
     ]
 
+
+def _cursor_export_response(
+    matches, *, limit, scope, bearer, persona_by_questionnaire,
+):
+    """One keyset page. Peeks one extra match to decide ``next_cursor``."""
+    page = list(itertools.islice(matches, limit + 1))
+    has_more = len(page) > limit
+    page = page[:limit]
+    members = _serialize_page(
+        page, bearer=bearer, persona_by_questionnaire=persona_by_questionnaire,
+    )
+    return JsonResponse(
+        {
+            "members": members,
+            "count": len(members),
+            "limit": limit,
+            "scope": scope,
+            "next_cursor": _encode_cursor(page[-1]) if has_more else None,
+            "generated_at": timezone.now().isoformat(),
+        },
+        status=200,
+    )
+
+
+def _ndjson_export_response(
+    matches, *, batch_size, bearer, persona_by_questionnaire,
+):
+    """Stream every match as NDJSON, serializing ``batch_size`` at a time."""
+
+    def lines():
+        while True:
+            page = list(itertools.islice(matches, batch_size))
+            if not page:
+                return
+            for member in _serialize_page(
+                page,
+                bearer=bearer,
+                persona_by_questionnaire=persona_by_questionnaire,
+            ):
+                yield json.dumps(member, cls=DjangoJSONEncoder) + "\n"
+
+    return StreamingHttpResponse(lines(), content_type="application/x-ndjson")
+
+
+def _export_response(
+    *, page, total, limit, offset, scope, bearer, persona_by_questionnaire,
+):
+    members = _serialize_page(
+        page, bearer=bearer, persona_by_questionnaire=persona_by_questionnaire,
+    )
+
     return JsonResponse(
         {
             "members": members,
@@ -0,0 +1,82 @@
+"""Page cache diagnostics endpoint.
+
+``GET /api/diagnostics/page-cache`` -- read-only, staff-token only
+(``@token_required``; non-staff/invalid/missing -> 401) and ``GET`` only
+(any other method -> 405), like ``api/views/boot_timing.py``.
+
+Every gunicorn worker keeps its own page cache counters and writes a
+snapshot to the shared ``django_q`` cache at most every
+``PAGE_CACHE_STATS_FLUSH_INTERVAL`` seconds (see ``website/page_cache.py``).
+The response merges the live snapshots into ``totals`` and also lists each
+``processes`` entry, so a cold or misbehaving worker stands out. Counters
+restart when a worker is recycled.
+"""
+
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+
+from accounts.auth import token_required
+from api.openapi import openapi_spec
+from api.utils import require_methods
+from website.page_cache import page_cache_metrics
+
+_SUMMARY_EXAMPLE = {
+    "hits": 9120,
+    "misses": 48,
+    "stores": 45,
+    "bypasses": 310,
+    "hit_ratio": 0.9948,
+    "serve_ms": {"avg": 0.84, "p50": 1, "p95": 2, "max": 7.412},
+    "miss_ms_avg": 143.27,
+}
+
+_RESPONSE_EXAMPLE = {
+    "enabled": True,
+    "totals": _SUMMARY_EXAMPLE,
+    "processes": [
+        {
+            "process": "ip-10-0-1-189:41",
+            "recorded_at": "2026-07-08T10:04:40+00:00",
+            **_SUMMARY_EXAMPLE,
+        },
+    ],
+    "generated_at": "2026-07-08T10:05:00+00:00",
+}
+
+
+@token_required
+@csrf_exempt
+@require_methods("GET")
+@openapi_spec(
+    tag="Diagnostics",
+    summary="Read anonymous page cache metrics",
+    methods={
+        "GET": {
+            "summary": "Read the anonymous page cache hit ratio and serve latency",
+            "description": (
+                "Merges the per-worker page cache counters into ``totals`` "
+                "and lists each worker under ``processes``: ``hits``, "
+                "``misses``, ``stores``, ``bypasses`` (requests the cache "
+                "skipped, e.g. logged-in visitors), ``hit_ratio`` (hits over "
+                "hits + misses, ``null`` before the first lookup), "
+                "``serve_ms`` (serve-from-cache latency; ``p50``/``p95`` are "
+                "histogram bucket upper bounds, ``null`` above 250 ms) and "
+                "``miss_ms_avg``. Workers flush every "
+                "``PAGE_CACHE_STATS_FLUSH_INTERVAL`` seconds, so totals can "
+                "lag by that much. Staff-token only, read-only."
+            ),
+            "responses": {
+                200: {
+                    "description": "Merged page cache metrics.",
+                    "example": _RESPONSE_EXAMPLE,
+                },
+            },
+        },
+    },
+)
+def page_cache_diagnostics(request):
+    """``GET /api/diagnostics/page-cache`` -- read-only page cache metrics."""
+    body = page_cache_metrics()
+    body["generated_at"] = timezone.now().isoformat()
+    return JsonResponse(body, status=200)
@@ -9,7 +9,6 @@ from community.services.slack import SlackAPIError, SlackCommunityService
 from community.slack_config import slack_api_enabled
 from integrations.config import get_config, is_enabled
 
-SLACK_USERS_LIST_LIMIT = 200
 SLACK_CONFIGURATION_ERRORS = {
     "invalid_auth",
     "not_authed",
@@ -27,7 +26,7 @@ def slack_workspace_import_adapter():
     service = SlackCommunityService()
 
     try:
-        for member in _iter_slack_members(service):
+        for member in service.iter_workspace_members():
             row = _row_for_member(member, checked_at=checked_at)
             if row is not None:
                 yield row
@@ -51,22 +50,6 @@ def _validate_slack_configuration():
         raise CommandError("Slack import is not configured.")
 
 
-def _iter_slack_members(service):
-    cursor = ""
-    while True:
-        response = service._api_call(
-            "users.list",
-            limit=SLACK_USERS_LIST_LIMIT,
-            cursor=cursor,
-        )
-        yield from response.get("members") or []
-        cursor = (
-            response.get("response_metadata", {}).get("next_cursor") or ""
-        ).strip()
-        if not cursor:
-            break
-
-
 def _row_for_member(member, *, checked_at):
     if _skip_member(member):
         return None
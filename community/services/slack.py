@@ -4,6 +4,7 @@ Uses Slack Web API (channel-based approach - Approach B from spec 09):
 - conversations.invite to add users to private community channels
 - conversations.kick to remove users from community channels
 - users.lookupByEmail to find Slack users by email
+- users.list to snapshot the whole workspace roster
 
 Requires a Slack bot token with scopes:
 - users:read
@@ -34,6 +35,9 @@ logger = logging.getLogger(__name__)
 
 SLACK_API_BASE = "https://slack.com/api/"
 
+# Members per ``users.list`` page. Slack recommends no more than 200.
+SLACK_USERS_LIST_LIMIT = 200
+
 # Cap on how long a single bounded ``ratelimited`` retry will wait,
 # regardless of the ``Retry-After`` Slack advertises, so one throttled
 # call can't stall a whole chunk past the worker timeout (issue #918).
@@ -352,13 +356,58 @@ class SlackCommunityService(CommunityService):
         user = data.get("user", {}) or {}
         if not user.get("id"):
             return None
-        profile = user.get("profile", {}) or {}
-        return {
-            "id": user.get("id", ""),
-            "real_name": user.get("real_name", "") or profile.get("real_name", ""),
-            "first_name": profile.get("first_name", "") or "",
-            "last_name": profile.get("last_name", "") or "",
-        }
+        return member_profile(user)
+
+    def iter_workspace_members(self):
+        """Yield every ``users.list`` member, following the page cursor.
+
+        Raises ``SlackAPIError`` if any page fails.
+        """
+        cursor = ""
+        while True:
+            response = self._api_call(
+                "users.list", limit=SLACK_USERS_LIST_LIMIT, cursor=cursor,
+            )
+            yield from response.get("members") or []
+            cursor = (
+                response.get("response_metadata", {}).get("next_cursor") or ""
+            ).strip()
+            if not cursor:
+                break
+
+    def workspace_members_by_email(self):
+        """Snapshot the workspace roster as ``{lower-cased email: member}``.
+
+        One ``users.list`` page covers ``SLACK_USERS_LIST_LIMIT`` members,
+        so a roster of a few thousand costs a few dozen calls instead of
+        one ``users.lookupByEmail`` per local user. Deactivated accounts,
+        bots and app users are left out: they are not members anyone can
+        reach.
+
+        Returns:
+            dict or None: The index, or ``None`` when the integration is
+            not configured or no member's email is visible (the token
+            lacks ``users:read.email``). An empty index would otherwise
+            read as "nobody is a member".
+
+        Raises:
+            SlackAPIError: If a ``users.list`` page fails.
+        """
+        if not self.bot_token or not is_enabled('SLACK_ENABLED'):
+            return None
+        index = {}
+        for member in self.iter_workspace_members():
+            if (
+                member.get("deleted")
+                or member.get("is_bot")
+                or member.get("is_app_user")
+                or member.get("id") == "USLACKBOT"
+            ):
+                continue
+            email = ((member.get("profile") or {}).get("email") or "").strip()
+            if email:
+                index[email.lower()] = member
+        return index or None
 
     def check_workspace_membership(self, email):
         """Check whether an email is a member of the Slack workspace.
@@ -639,6 +688,21 @@ class SlackCommunityService(CommunityService):
             )
 
 
+def member_profile(member):
+    """Return the id and name fields of a Slack user object.
+
+    Accepts the ``user`` of a ``users.lookupByEmail`` response or a
+    ``users.list`` member.
+    """
+    profile = member.get("profile", {}) or {}
+    return {
+        "id": member.get("id", ""),
+        "real_name": member.get("real_name", "") or profile.get("real_name", ""),
+        "first_name": profile.get("first_name", "") or "",
+        "last_name": profile.get("last_name", "") or "",
+    }
+
+
 def get_community_service():
     """Factory function to get the configured CommunityService instance.
 
@@ -49,6 +49,21 @@ All-unknown guard: if every user in the chunk came back ``unknown``
 (Slack integration unconfigured or in a hard outage), we do NOT
 enqueue the follow-up. Without this guard, the same users would
 re-match the predicate on the next run and chain forever.
+
+Workspace snapshot
+------------------
+Pacing ``users.lookupByEmail`` at 3s per user turns a full refresh of a
+few thousand members into hours of chained worker time. Each run
+therefore first pages through ``users.list`` (200 members per call) and
+indexes the roster by email. When that works, every stale Main+
+candidate is reconciled against the index in one pass: users whose state
+is unchanged get one bulk ``slack_checked_at`` update, and only the
+transitions are saved one by one (they carry the audit row, the tag
+mirror and the join notification). Names for the backfill come from the
+roster profiles, with no extra calls. The chunked per-user lookup above
+stays as the fallback. It runs when the snapshot cannot be taken
+(unconfigured integration, ``users.list`` error, emails hidden from the
+token) or the service has no snapshot support.
 """
 
 import json
@@ -63,6 +78,7 @@ from accounts.tier_audience import effective_level_at_least_q
 from accounts.utils.names import set_name_from_external
 from community.models import CommunityAuditLog
 from community.services import get_community_service
+from community.services.slack import member_profile
 from community.services.staff_notifications import notify_slack_join
 from content.access import LEVEL_MAIN
 from jobs.tasks import async_task, build_task_name
@@ -159,6 +175,16 @@ def _log_check_transition(user, previous_member, new_member, *, source):
     )
 
 
+def _notify_slack_join(user):
+    try:
+        notify_slack_join(user)
+    except Exception:
+        logger.exception(
+            "Failed to send Slack-join staff notification for %s",
+            user.email,
+        )
+
+
 def check_user_slack_membership(
     user,
     *,
@@ -205,13 +231,7 @@ def check_user_slack_membership(
                 source=audit_source,
             )
         if previous_member is False and is_first_check is False:
-            try:
-                notify_slack_join(user)
-            except Exception:
-                logger.exception(
-                    "Failed to send Slack-join staff notification for %s",
-                    user.email,
-                )
+            _notify_slack_join(user)
     else:
         user.slack_member = False
         user.slack_checked_at = now
@@ -267,9 +287,15 @@ def refresh_slack_membership(
     NOT enqueue the follow-up — those users would just match again on
     the next run and chain forever.
 
+    Snapshot mode: when the service can index the whole workspace roster
+    (see the module docstring), every candidate is reconciled from that
+    index instead, ``batch_size`` and pacing do not apply, and no
+    follow-up is chained.
+
     Returns:
         dict: counts keyed by ``members``, ``not_members``, ``unknown``,
-        ``total_checked``, ``transitions``, ``enqueued_followup``.
+        ``total_checked``, ``transitions``, ``enqueued_followup``, plus
+        ``mode`` (``"snapshot"`` or ``"lookup"``).
     """
     batch_size = batch_size or SLACK_MEMBERSHIP_CHUNK_SIZE
     refresh_days = refresh_days or SLACK_MEMBERSHIP_REFRESH_DAYS
@@ -280,6 +306,13 @@ def refresh_slack_membership(
     cutoff = timezone.now() - timezone.timedelta(days=refresh_days)
     main_plus = main_plus_q()
 
+    snapshot = _workspace_snapshot(service)
+    if snapshot is not None:
+        return _refresh_from_snapshot(
+            snapshot,
+            User.objects.filter(main_plus & models_q_null_or_old(cutoff)).distinct(),
+        )
+
     # NULLs first so brand-new users are picked up before stale ones.
     # Scope to Main+ effective level (issue #918): a Free/Basic account
     # can never be in the Slack workspace, so checking it is wasteful and
@@ -348,6 +381,92 @@ def refresh_slack_membership(
         "unknown": unknown,
         "transitions": transitions,
         "enqueued_followup": enqueued_followup,
+        "mode": "lookup",
+    }
+    logger.info("Slack membership refresh complete: %s", summary)
+    return summary
+
+
+def _workspace_snapshot(service):
+    """Return the service's ``{email: member}`` roster index, or ``None``.
+
+    ``None`` sends the caller down the per-user lookup path: the service
+    has no snapshot support, the snapshot is unavailable, or listing the
+    roster failed.
+    """
+    snapshot = getattr(service, "workspace_members_by_email", None)
+    if not callable(snapshot):
+        return None
+    try:
+        index = snapshot()
+    except Exception:
+        logger.warning(
+            "Slack roster snapshot failed; falling back to per-user lookups",
+            exc_info=True,
+        )
+        return None
+    # Require a concrete dict, like the profile guard in
+    # ``_backfill_name_from_slack``.
+    return index if isinstance(index, dict) else None
+
+
+def _refresh_from_snapshot(snapshot, candidates):
+    """Reconcile every user in ``candidates`` against a roster snapshot."""
+    now = timezone.now()
+    unchanged_ids = []
+    members = 0
+    not_members = 0
+    transitions = 0
+
+    for user in list(candidates):
+        member = snapshot.get((user.email or "").strip().lower())
+        is_member = member is not None
+        is_first_check = user.slack_checked_at is None
+        previous_member = bool(user.slack_member)
+        if is_member:
+            members += 1
+        else:
+            not_members += 1
+
+        update_fields = []
+        if previous_member != is_member:
+            user.slack_member = is_member
+            update_fields.append("slack_member")
+        if is_member:
+            uid = member.get("id") or ""
+            if uid and not user.slack_user_id:
+                user.slack_user_id = uid
+                update_fields.append("slack_user_id")
+            if _name_from_profile(user, member_profile(member)):
+                update_fields.extend(["first_name", "last_name"])
+
+        if update_fields:
+            user.slack_checked_at = now
+            user.save(update_fields=[*update_fields, "slack_checked_at"])
+        else:
+            unchanged_ids.append(user.pk)
+        _set_slack_member_tag(user, is_member)
+        if not is_first_check and previous_member == is_member:
+            continue
+
+        transitions += 1
+        _log_check_transition(
+            user, previous_member, is_member, source="slack_membership_snapshot",
+        )
+        if is_member and previous_member is False and not is_first_check:
+            _notify_slack_join(user)
+
+    if unchanged_ids:
+        User.objects.filter(pk__in=unchanged_ids).update(slack_checked_at=now)
+
+    summary = {
+        "total_checked": members + not_members,
+        "members": members,
+        "not_members": not_members,
+        "unknown": 0,
+        "transitions": transitions,
+        "enqueued_followup": False,
+        "mode": "snapshot",
     }
     logger.info("Slack membership refresh complete: %s", summary)
     return summary
@@ -410,7 +529,15 @@ def _backfill_name_from_slack(service, user):
     # don't accidentally write garbage to first_name / last_name.
     if not isinstance(profile, dict):
         return False
+    return _name_from_profile(user, profile)
+
 
+def _name_from_profile(user, profile):
+    """Fill the user's empty name fields from a Slack profile dict.
+
+    Shared by the per-user lookup and the roster snapshot. Returns
+    ``True`` if the in-memory user was mutated.
+    """
     first = (profile.get("first_name") or "").strip()
     last = (profile.get("last_name") or "").strip()
     if first or last:
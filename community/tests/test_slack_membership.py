@@ -7,9 +7,12 @@ Covers:
 - Audit log writes only on state transitions.
 - Forward-compatibility with #354 (auto-tag mirror).
 - Fallback to ``unknown`` when integration unconfigured.
+- Roster snapshot mode against a fake Slack Web API server.
 """
 
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 
 import requests
@@ -797,6 +800,11 @@ class RateLimitRetryTest(TestCase):
         self.assertEqual(mock_post.call_count, 2)
         self.assertEqual(mock_sleep.call_count, 1)
 
+    @patch(
+        'community.services.slack.SlackCommunityService'
+        '.workspace_members_by_email',
+        return_value=None,
+    )
     @patch(
         'community.services.slack.SlackCommunityService'
         '.lookup_user_profile_by_email',
@@ -805,13 +813,13 @@ class RateLimitRetryTest(TestCase):
     @patch('community.services.slack.time.sleep')
     @patch('community.services.slack.requests.post')
     def test_one_throttle_does_not_poison_rest_of_batch(
-        self, mock_post, mock_sleep, mock_profile,
+        self, mock_post, mock_sleep, mock_profile, mock_snapshot,
     ):
         # Task-level: first user is throttled once then resolves; the
         # remaining users still resolve to concrete outcomes rather than
         # every subsequent call cascading to unknown. The name-backfill
-        # profile lookup is stubbed out so it doesn't consume the mocked
-        # membership responses below.
+        # profile lookup and the roster snapshot are stubbed out so they
+        # don't consume the mocked membership responses below.
         for email in ('m1@test.com', 'm2@test.com', 'm3@test.com'):
             User.objects.create_user(email=email, tier=_tier(20))
 
@@ -831,3 +839,178 @@ class RateLimitRetryTest(TestCase):
         self.assertEqual(result['members'], 2)
         self.assertEqual(result['not_members'], 1)
         self.assertEqual(result['unknown'], 0)
+
+
+class FakeSlackAPI:
+    """Local HTTP server answering ``users.list`` and ``users.lookupByEmail``.
+
+    ``roster`` is the workspace member list, served ``page_size`` at a time
+    with Slack's ``next_cursor`` paging. ``list_error`` makes every
+    ``users.list`` call fail with that Slack error code. Calls are recorded
+    in ``calls`` as method names.
+    """
+
+    def __init__(self, roster, *, page_size=2, list_error=None):
+        self.roster = roster
+        self.page_size = page_size
+        self.list_error = list_error
+        self.calls = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length) or b'{}')
+                method = self.path.rsplit('/', 1)[-1]
+                api.calls.append(method)
+                payload = json.dumps(api.respond(method, body)).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+
+    def respond(self, method, body):
+        if method == 'users.list':
+            if self.list_error:
+                return {'ok': False, 'error': self.list_error}
+            start = int(body.get('cursor') or 0)
+            end = start + self.page_size
+            return {
+                'ok': True,
+                'members': self.roster[start:end],
+                'response_metadata': {
+                    'next_cursor': str(end) if end < len(self.roster) else '',
+                },
+            }
+        if method == 'users.lookupByEmail':
+            for member in self.roster:
+                if member['profile'].get('email') == body.get('email'):
+                    return {'ok': True, 'user': member}
+            return {'ok': False, 'error': 'users_not_found'}
+        return {'ok': False, 'error': 'unknown_method'}
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host, port = self.server.server_address
+        self._base = patch(
+            'community.services.slack.SLACK_API_BASE', f'http://{host}:{port}/api/',
+        )
+        self._base.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._base.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _slack_member(uid, email, **extra):
+    return {
+        'id': uid,
+        'real_name': extra.pop('real_name', ''),
+        'profile': {'email': email, **extra.pop('profile', {})},
+        **extra,
+    }
+
+
+@override_settings(SLACK_ENABLED=True, SLACK_BOT_TOKEN='xoxb-test')
+class RefreshSlackMembershipSnapshotTest(TestCase):
+    """Snapshot mode reconciles every candidate from one paged roster read."""
+
+    ROSTER = [
+        _slack_member('USLACKBOT', 'bot@slack.test'),
+        _slack_member(
+            'U_ADA', 'Ada@Test.com',
+            profile={'first_name': 'Ada', 'last_name': 'Lovelace'},
+        ),
+        _slack_member('U_GONE', 'gone@test.com', deleted=True),
+        _slack_member('U_KEPT', 'kept@test.com'),
+        _slack_member('U_APP', 'app@test.com', is_bot=True),
+    ]
+
+    def _user(self, email, **extra):
+        return User.objects.create_user(email=email, tier=_tier(20), **extra)
+
+    def test_reconciles_all_candidates_without_per_user_lookups(self):
+        ada = self._user('ada@test.com')
+        gone = self._user('gone@test.com')
+        outsider = self._user('outsider@test.com')
+        for index in range(SLACK_MEMBERSHIP_CHUNK_SIZE):
+            self._user(f'extra-{index}@test.com')
+
+        with FakeSlackAPI(self.ROSTER) as api:
+            result = refresh_slack_membership()
+
+        self.assertEqual(api.calls, ['users.list'] * 3)
+        self.assertEqual(result['mode'], 'snapshot')
+        self.assertEqual(result['total_checked'], SLACK_MEMBERSHIP_CHUNK_SIZE + 3)
+        self.assertEqual((result['members'], result['unknown']), (1, 0))
+        self.assertFalse(result['enqueued_followup'])
+        ada.refresh_from_db()
+        self.assertTrue(ada.slack_member)
+        self.assertEqual(ada.slack_user_id, 'U_ADA')
+        self.assertEqual((ada.first_name, ada.last_name), ('Ada', 'Lovelace'))
+        self.assertIn('slack-member', ada.tags)
+        for user in (gone, outsider):
+            user.refresh_from_db()
+            self.assertFalse(user.slack_member)
+            self.assertIsNotNone(user.slack_checked_at)
+        self.assertFalse(
+            User.objects.filter(slack_checked_at__isnull=True).exists()
+        )
+
+    def test_unchanged_member_only_advances_timestamp(self):
+        stale = timezone.now() - timezone.timedelta(days=30)
+        kept = self._user(
+            'kept@test.com', slack_member=True, slack_user_id='U_KEPT',
+            slack_checked_at=stale, tags=['slack-member'],
+        )
+
+        with FakeSlackAPI(self.ROSTER):
+            result = refresh_slack_membership()
+
+        kept.refresh_from_db()
+        self.assertGreater(kept.slack_checked_at, stale)
+        self.assertEqual(result['transitions'], 0)
+        self.assertFalse(CommunityAuditLog.objects.filter(user=kept).exists())
+
+    @patch('community.tasks.slack_membership.notify_slack_join')
+    def test_join_since_last_check_is_a_transition(self, mock_notify):
+        user = self._user(
+            'kept@test.com', slack_member=False,
+            slack_checked_at=timezone.now() - timezone.timedelta(days=30),
+        )
+
+        with FakeSlackAPI(self.ROSTER):
+            result = refresh_slack_membership()
+
+        self.assertEqual(result['transitions'], 1)
+        mock_notify.assert_called_once_with(user)
+        log = CommunityAuditLog.objects.get(user=user)
+        self.assertEqual(json.loads(log.details)['new'], True)
+
+    def test_roster_error_falls_back_to_per_user_lookups(self):
+        user = self._user('kept@test.com')
+
+        with FakeSlackAPI(self.ROSTER, list_error='missing_scope') as api:
+            result = refresh_slack_membership(sleep_seconds=0)
+
+        self.assertEqual(result['mode'], 'lookup')
+        self.assertIn('users.lookupByEmail', api.calls)
+        user.refresh_from_db()
+        self.assertTrue(user.slack_member)
+
+    def test_hidden_emails_fall_back_to_per_user_lookups(self):
+        hidden = [_slack_member('U_KEPT', '')]
+        self._user('kept@test.com')
+
+        with FakeSlackAPI(hidden):
+            result = refresh_slack_membership(sleep_seconds=0)
+
+        self.assertEqual(result['mode'], 'lookup')
@@ -223,6 +223,29 @@ def can_access(user, content):
         True if the user's tier level is >= the content's required level,
         or if the user has individual CourseAccess for a Course (or a
         unit belonging to a course they have CourseAccess for).
+
+    Views checking many objects for one user should use
+    :func:`get_access_context` instead: each call here may query the
+    user's TierOverride and CourseAccess rows again.
+    """
+    def has_course_access(course_id):
+        from content.models import CourseAccess
+        return CourseAccess.objects.filter(
+            user=user, course_id=course_id,
+        ).exists()
+
+    return _check_access(
+        user, content,
+        get_level=lambda: get_user_level(user),
+        has_course_access=has_course_access,
+    )
+
+
+def _check_access(user, content, *, get_level, has_course_access):
+    """Shared rules behind :func:`can_access` and :class:`AccessContext`.
+
+    ``get_level`` and ``has_course_access(course_id)`` are only called
+    when the decision needs them, so open content never costs a query.
     """
     required = _resolve_required_level(content)
 
@@ -242,29 +265,104 @@ def can_access(user, content):
         # treated as already verified — same rule LEVEL_OPEN uses).
         if user is None or not user.is_authenticated:
             return False
-        if get_user_level(user) >= LEVEL_BASIC:
+        if get_level() >= LEVEL_BASIC:
             return True
         return bool(user.email_verified)
 
-    if get_user_level(user) >= required:
+    if get_level() >= required:
         return True
     # Check individual course access (CourseAccess model). Both the
     # course itself and any unit belonging to that course should bypass
     # the per-unit / course-level gating once a user holds CourseAccess.
     if user is not None and user.is_authenticated:
         if _is_course(content):
-            from content.models import CourseAccess
-            return CourseAccess.objects.filter(
-                user=user, course=content,
-            ).exists()
+            return has_course_access(content.pk)
         if _is_unit(content):
-            from content.models import CourseAccess
-            return CourseAccess.objects.filter(
-                user=user, course=content.module.course,
-            ).exists()
+            return has_course_access(content.module.course_id)
     return False
 
 
+class AccessContext:
+    """One user's access inputs, resolved once and reused for many objects.
+
+    Lazily holds the active TierOverride, the effective level derived from
+    it and the ids of every course the user holds CourseAccess for, so
+    :meth:`can_access_many` over a listing costs at most two queries
+    however long the list is (none when everything is open). Decisions
+    match :func:`can_access`.
+
+    Build one per request with :func:`get_access_context`. Pass
+    ``active_override`` when the caller already fetched it.
+    """
+
+    def __init__(self, user, active_override=_SENTINEL):
+        self.user = user
+        self._active_override = active_override
+        self._level = None
+        self._course_access_ids = None
+
+    @property
+    def active_override(self):
+        """The user's active TierOverride, or ``None``."""
+        if self._active_override is _SENTINEL:
+            self._active_override = get_active_override(self.user)
+        return self._active_override
+
+    @property
+    def level(self):
+        """Effective access level, as :func:`get_user_level` computes it."""
+        if self._level is None:
+            self._level = get_user_level(
+                self.user, active_override=self.active_override,
+            )
+        return self._level
+
+    @property
+    def course_access_ids(self):
+        """Ids of the courses the user holds an individual CourseAccess for."""
+        if self._course_access_ids is None:
+            if self.user is None or not self.user.is_authenticated:
+                self._course_access_ids = frozenset()
+            else:
+                from content.models import CourseAccess
+                self._course_access_ids = frozenset(
+                    CourseAccess.objects
+                    .filter(user=self.user)
+                    .values_list('course_id', flat=True)
+                )
+        return self._course_access_ids
+
+    def can_access(self, content):
+        return _check_access(
+            self.user, content,
+            get_level=lambda: self.level,
+            has_course_access=lambda course_id: (
+                course_id in self.course_access_ids
+            ),
+        )
+
+    def can_access_many(self, objects):
+        """Return one access decision per object, in input order.
+
+        Units should come with ``select_related('module__course')``;
+        otherwise resolving each unit's level and course costs queries.
+        """
+        return [self.can_access(obj) for obj in objects]
+
+
+def get_access_context(request):
+    """Return the request's :class:`AccessContext`, building it on first use.
+
+    Cached on the request and rebuilt if ``request.user`` is replaced
+    (the dashboard swaps in a ``select_related('tier')`` copy).
+    """
+    context = getattr(request, '_access_context', None)
+    if context is None or context.user is not request.user:
+        context = AccessContext(request.user)
+        request._access_context = context
+    return context
+
+
 def get_gated_reason(user, content):
     """Return why access is denied, or an empty string when access is allowed."""
     if can_access(user, content):
@@ -11,6 +11,7 @@ from content.models import (
     Unit,
     UserCourseProgress,
 )
+from content.services.tag_index import refresh_content_tags
 from notifications.services import notify_safely
 from studio.admin_links import studio_link
 
@@ -86,7 +87,9 @@ class CourseInstructorInline(admin.TabularInline):
 
 def publish_courses(modeladmin, request, queryset):
     """Publish selected courses and send notifications."""
+    course_ids = list(queryset.values_list('pk', flat=True))
     queryset.update(status='published')
+    refresh_content_tags(Course, course_ids)
     for course in queryset:
         notify_safely('course', course.pk)
 
@@ -96,7 +99,9 @@ publish_courses.short_description = 'Publish selected courses'
 
 def unpublish_courses(modeladmin, request, queryset):
     """Unpublish selected courses (set to draft)."""
+    course_ids = list(queryset.values_list('pk', flat=True))
     queryset.update(status='draft')
+    refresh_content_tags(Course, course_ids)
 
 
 unpublish_courses.short_description = 'Unpublish selected courses'
@@ -2,13 +2,16 @@ from django.contrib import admin
 
 from content.models import Download
 from content.nav_availability import refresh_published_downloads_nav_cache
+from content.services.tag_index import refresh_content_tags
 from notifications.services import notify_safely
 from studio.admin_links import studio_link
 
 
 def publish_downloads(modeladmin, request, queryset):
     """Publish selected downloads and send notifications."""
+    download_ids = list(queryset.values_list('pk', flat=True))
     queryset.update(published=True)
+    refresh_content_tags(Download, download_ids)
     refresh_published_downloads_nav_cache()
     for download in queryset:
         notify_safely('download', download.pk)
@@ -19,7 +22,9 @@ publish_downloads.short_description = 'Publish selected downloads'
 
 def unpublish_downloads(modeladmin, request, queryset):
     """Unpublish selected downloads."""
+    download_ids = list(queryset.values_list('pk', flat=True))
     queryset.update(published=False)
+    refresh_content_tags(Download, download_ids)
     refresh_published_downloads_nav_cache()
 
 
@@ -0,0 +1,17 @@
+"""Regenerate the ``ContentTag`` index from the content tables."""
+
+from django.core.management.base import BaseCommand
+
+from content.services.tag_index import rebuild_tag_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the content tag index used by /tags and the tag sitemap.'
+
+    def handle(self, *args, **options):
+        written = rebuild_tag_index()
+        for content_type, count in written.items():
+            self.stdout.write(f'{content_type}: {count}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {sum(written.values())} content tags.',
+        ))
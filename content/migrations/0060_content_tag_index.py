@@ -0,0 +1,58 @@
+# Generated by Django 6.1.2 on 2026-10-17 01:49
+
+from django.db import migrations, models
+
+# (content_type, app label, model, publication test) -- frozen copy of
+# ``content.services.tag_index._INDEXED_TYPES`` for the initial backfill.
+_INDEXED_TYPES = (
+    ('article', 'content', 'Article', lambda obj: obj.published),
+    ('project', 'content', 'Project', lambda obj: obj.published),
+    ('tutorial', 'content', 'Tutorial', lambda obj: obj.published),
+    ('course', 'content', 'Course', lambda obj: obj.status == 'published'),
+    ('download', 'content', 'Download', lambda obj: obj.published),
+    ('event', 'events', 'Event', lambda obj: True),
+)
+
+
+def backfill_content_tags(apps, schema_editor):
+    ContentTag = apps.get_model('content', 'ContentTag')
+    rows = []
+    for content_type, app_label, model_name, is_published in _INDEXED_TYPES:
+        model = apps.get_model(app_label, model_name)
+        for obj in model.objects.iterator(chunk_size=2000):
+            for tag in dict.fromkeys(obj.tags or []):
+                rows.append(ContentTag(
+                    tag=tag,
+                    content_type=content_type,
+                    object_id=obj.pk,
+                    required_level=obj.required_level,
+                    published=is_published(obj),
+                ))
+    ContentTag.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0059_instructor_email'),
+        ('events', '0043_alter_eventseries_cadence_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tag', models.CharField(max_length=200)),
+                ('content_type', models.CharField(choices=[('article', 'Article'), ('project', 'Project'), ('tutorial', 'Tutorial'), ('course', 'Course'), ('download', 'Download'), ('event', 'Event')], max_length=20)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('required_level', models.IntegerField(default=0)),
+                ('published', models.BooleanField(default=False)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['published', 'tag', 'content_type'], name='content_tag_published_tag_idx')],
+                'constraints': [models.UniqueConstraint(fields=('content_type', 'object_id', 'tag'), name='content_tag_unique_item_tag')],
+            },
+        ),
+        migrations.RunPython(backfill_content_tags, migrations.RunPython.noop),
+    ]
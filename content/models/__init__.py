@@ -1,6 +1,7 @@
 from .article import *
 from .cohort import *
 from .completion import *
+from .content_tag import *
 from .course import *
 from .curated_link import *
 from .download import *
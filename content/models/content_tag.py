@@ -0,0 +1,50 @@
+from django.db import models
+
+CONTENT_TAG_TYPE_CHOICES = [
+    ('article', 'Article'),
+    ('project', 'Project'),
+    ('tutorial', 'Tutorial'),
+    ('course', 'Course'),
+    ('download', 'Download'),
+    ('event', 'Event'),
+]
+
+
+class ContentTag(models.Model):
+    """One ``(tag, content item)`` pair from a content row's ``tags`` list.
+
+    A materialized index over the ``tags`` JSON arrays of public content so
+    tag counts and "content tagged X" are indexed queries instead of a scan
+    of every row. Rows are derived data: :mod:`content.services.tag_index`
+    rewrites an item's rows whenever it is saved or deleted, and
+    ``manage.py rebuild_tag_index`` regenerates the whole table.
+
+    ``published`` mirrors the public listing filter of the item's type
+    (``published`` flag, ``status == 'published'`` for courses, always true
+    for events).
+    """
+
+    tag = models.CharField(max_length=200)
+    content_type = models.CharField(
+        max_length=20, choices=CONTENT_TAG_TYPE_CHOICES,
+    )
+    object_id = models.PositiveBigIntegerField()
+    required_level = models.IntegerField(default=0)
+    published = models.BooleanField(default=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_type', 'object_id', 'tag'],
+                name='content_tag_unique_item_tag',
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=['published', 'tag', 'content_type'],
+                name='content_tag_published_tag_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return f'{self.tag} -> {self.content_type}:{self.object_id}'
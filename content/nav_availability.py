@@ -1,12 +1,17 @@
-"""Cached public navigation availability flags for content surfaces."""
+"""Cached public navigation availability flags for content surfaces.
+
+Values are shared through ``integrations.tiered_cache.shared_cache`` so
+public renders read them from a per-process L1 and writers propagate
+changes to every process via its generation stamp.
+"""
 
 from django.apps import apps
-from django.core.cache import caches
 from django.core.cache.backends.base import InvalidCacheBackendError
 from django.core.exceptions import ImproperlyConfigured
 from django.db import DatabaseError
 
-_CACHE_ALIAS = 'django_q'
+from integrations.tiered_cache import shared_cache
+
 _PUBLIC_DOWNLOADS_CACHE_KEY = 'content:public_downloads_available:v1'
 _MARKETING_NAV_CACHE_KEY = 'content:marketing_nav:v1'
 _MARKETING_NAV_SECTIONS = ('about', 'community', 'resources')
@@ -18,14 +23,14 @@ _marketing_nav = _UNSET
 
 def _read_shared_flag():
     try:
-        return caches[_CACHE_ALIAS].get(_PUBLIC_DOWNLOADS_CACHE_KEY, _UNSET)
+        return shared_cache.get(_PUBLIC_DOWNLOADS_CACHE_KEY, _UNSET)
     except (InvalidCacheBackendError, ImproperlyConfigured, DatabaseError):
         return _UNSET
 
 
 def _write_shared_flag(value):
     try:
-        caches[_CACHE_ALIAS].set(_PUBLIC_DOWNLOADS_CACHE_KEY, bool(value), None)
+        shared_cache.publish(_PUBLIC_DOWNLOADS_CACHE_KEY, bool(value), None)
     except (InvalidCacheBackendError, ImproperlyConfigured, DatabaseError):
         pass
 
@@ -43,14 +48,14 @@ def _normalize_marketing_nav(nav):
 
 def _read_shared_marketing_nav():
     try:
-        return caches[_CACHE_ALIAS].get(_MARKETING_NAV_CACHE_KEY, _UNSET)
+        return shared_cache.get(_MARKETING_NAV_CACHE_KEY, _UNSET)
     except (InvalidCacheBackendError, ImproperlyConfigured, DatabaseError):
         return _UNSET
 
 
 def _write_shared_marketing_nav(value):
     try:
-        caches[_CACHE_ALIAS].set(
+        shared_cache.publish(
             _MARKETING_NAV_CACHE_KEY,
             _normalize_marketing_nav(value),
             None,
@@ -0,0 +1,226 @@
+"""Maintain and query the ``ContentTag`` index of public content tags.
+
+The public ``/tags`` pages and the tag sitemap read tag counts and
+per-tag content from :class:`content.models.ContentTag` rather than from the
+``tags`` JSON array of every content row. This module owns both sides:
+
+- Writes. ``content.signals`` calls :func:`refresh_content_tags` when an
+  indexed row is saved or deleted. Sync dispatchers also call it after a
+  queryset ``update()`` (which sends no signal) unpublishes stale rows. A
+  content sync wraps its pipeline in :func:`deferred_tag_index`, so all the
+  row saves of a run are flushed in a few batched writes at the end.
+- Reads. :func:`tag_counts`, :func:`tag_names` and :func:`tagged_object_ids`
+  are single indexed queries.
+
+:func:`rebuild_tag_index` (``manage.py rebuild_tag_index``) regenerates the
+table from scratch, for the initial backfill and after raw SQL edits.
+"""
+
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from django.db import transaction
+from django.db.models import Count
+
+from content.models import (
+    Article,
+    ContentTag,
+    Course,
+    Download,
+    Project,
+    Tutorial,
+)
+from events.models import Event
+
+# Rows per ``pk__in`` lookup / ``bulk_create`` batch.
+_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class _IndexedType:
+    content_type: str
+    model: type
+    publish_fields: tuple[str, ...]
+
+    def is_published(self, obj):
+        if self.model is Course:
+            return obj.status == 'published'
+        if self.model is Event:
+            # The tag pages list events in every status (upcoming,
+            # completed, recordings), so the index does too.
+            return True
+        return obj.published
+
+    def load(self, **filters):
+        return (
+            self.model.objects
+            .filter(**filters)
+            .only('pk', 'tags', 'required_level', *self.publish_fields)
+        )
+
+
+_INDEXED_TYPES = (
+    _IndexedType('article', Article, ('published',)),
+    _IndexedType('project', Project, ('published',)),
+    _IndexedType('tutorial', Tutorial, ('published',)),
+    _IndexedType('course', Course, ('status',)),
+    _IndexedType('download', Download, ('published',)),
+    _IndexedType('event', Event, ()),
+)
+_BY_MODEL = {indexed.model: indexed for indexed in _INDEXED_TYPES}
+
+
+def indexed_models():
+    """Return the models whose rows have entries in the tag index."""
+    return tuple(_BY_MODEL)
+
+
+def _content_types(models):
+    return [_BY_MODEL[model].content_type for model in models]
+
+
+def _index_rows(indexed, objects):
+    rows = []
+    for obj in objects:
+        published = indexed.is_published(obj)
+        # ``dict.fromkeys`` drops duplicates left by ``update()`` writes,
+        # which bypass the model's tag normalization.
+        for tag in dict.fromkeys(obj.tags or []):
+            rows.append(ContentTag(
+                tag=tag,
+                content_type=indexed.content_type,
+                object_id=obj.pk,
+                required_level=obj.required_level,
+                published=published,
+            ))
+    return rows
+
+
+def _chunks(values):
+    values = list(values)
+    for start in range(0, len(values), _BATCH_SIZE):
+        yield values[start:start + _BATCH_SIZE]
+
+
+def _write(indexed, pks, objects):
+    with transaction.atomic():
+        ContentTag.objects.filter(
+            content_type=indexed.content_type, object_id__in=pks,
+        ).delete()
+        ContentTag.objects.bulk_create(
+            _index_rows(indexed, objects), batch_size=_BATCH_SIZE,
+        )
+
+
+def refresh_content_tags(model, pks, instance=None):
+    """Rewrite the index rows of the ``model`` rows with primary keys ``pks``.
+
+    Rows that no longer exist lose their entries. Pass the saved
+    ``instance`` (with ``pks=[instance.pk]``) to index it without reading it
+    back. Inside :func:`deferred_tag_index` the work is queued until the
+    block exits.
+    """
+    indexed = _BY_MODEL[model]
+    pks = set(pks)
+    if not pks:
+        return
+    if _deferred.depth:
+        _deferred.pending.setdefault(model, set()).update(pks)
+        return
+    if instance is not None:
+        _write(indexed, pks, [instance])
+        return
+    for chunk in _chunks(pks):
+        _write(indexed, chunk, indexed.load(pk__in=chunk))
+
+
+@contextmanager
+def deferred_tag_index():
+    """Batch the index writes of a block and apply them when it exits.
+
+    A content sync saves every changed row of a repository; indexing each
+    save on its own would cost a delete and an insert per row. Queued rows
+    are re-read on exit, so the index reflects their final state. The
+    deferral is per thread, like the page cache one.
+    """
+    _deferred.depth += 1
+    try:
+        yield
+    finally:
+        _deferred.depth -= 1
+        if not _deferred.depth and _deferred.pending:
+            pending, _deferred.pending = _deferred.pending, {}
+            for model, pks in pending.items():
+                refresh_content_tags(model, pks)
+
+
+class _DeferredIndex(threading.local):
+    depth = 0
+
+    def __init__(self):
+        self.pending = {}
+
+
+_deferred = _DeferredIndex()
+
+
+def rebuild_tag_index():
+    """Regenerate the whole tag index from the content tables.
+
+    Returns:
+        dict[str, int]: Index rows written per content type.
+    """
+    written = {}
+    with transaction.atomic():
+        ContentTag.objects.all().delete()
+        for indexed in _INDEXED_TYPES:
+            rows = _index_rows(
+                indexed, indexed.load().iterator(chunk_size=2000),
+            )
+            ContentTag.objects.bulk_create(rows, batch_size=_BATCH_SIZE)
+            written[indexed.content_type] = len(rows)
+    return written
+
+
+def _published(models):
+    return ContentTag.objects.filter(
+        published=True, content_type__in=_content_types(models),
+    )
+
+
+def tag_counts(models):
+    """Return ``(tag, count)`` pairs over published ``models`` content.
+
+    Sorted by count descending, then by tag.
+    """
+    return list(
+        _published(models)
+        .values('tag')
+        .annotate(count=Count('pk'))
+        .order_by('-count', 'tag')
+        .values_list('tag', 'count')
+    )
+
+
+def tag_names(models):
+    """Return the sorted unique tags of published ``models`` content."""
+    return list(
+        _published(models)
+        .order_by('tag')
+        .values_list('tag', flat=True)
+        .distinct()
+    )
+
+
+def tagged_object_ids(tag, models):
+    """Return ``{model: [pk, ...]}`` for published ``models`` content tagged ``tag``."""
+    by_type = {_BY_MODEL[model].content_type: model for model in models}
+    ids = {}
+    for content_type, object_id in (
+        _published(models)
+        .filter(tag=tag)
+        .values_list('content_type', 'object_id')
+    ):
+        ids.setdefault(by_type[content_type], []).append(object_id)
+    return ids
@@ -6,6 +6,38 @@ from content.nav_availability import (
     refresh_marketing_pages_nav_cache,
     refresh_published_downloads_nav_cache,
 )
+from content.services.tag_index import indexed_models, refresh_content_tags
+from website.page_cache import invalidate_page_cache
+
+# Rows rendered on the anonymously cached public pages. Member activity
+# (progress, enrollments, registrations) is deliberately absent: it would
+# flush every worker's page cache on each click.
+PAGE_CACHE_MODELS = frozenset({
+    'content.article',
+    'content.cohort',
+    'content.course',
+    'content.courseinstructor',
+    'content.curatedlink',
+    'content.download',
+    'content.instructor',
+    'content.interviewcategory',
+    'content.marketingpage',
+    'content.module',
+    'content.project',
+    'content.siteconfig',
+    'content.tagrule',
+    'content.tutorial',
+    'content.unit',
+    'content.workshop',
+    'content.workshopinstructor',
+    'content.workshoppage',
+    'events.event',
+    'events.eventhost',
+    'events.eventinstructor',
+    'events.eventseries',
+    'events.host',
+    'payments.tier',
+})
 
 
 @receiver(
@@ -36,6 +68,47 @@ def refresh_marketing_pages_nav(**kwargs):
     refresh_marketing_pages_nav_cache()
 
 
+def invalidate_page_cache_for_content(**kwargs):
+    invalidate_page_cache()
+
+
+# Connected per model: a receiver without ``sender`` would run for every
+# model in the project and turn off Django's fast-delete path everywhere.
+for _label in sorted(PAGE_CACHE_MODELS):
+    post_save.connect(
+        invalidate_page_cache_for_content,
+        sender=_label,
+        dispatch_uid='content.invalidate_page_cache_on_save',
+    )
+    post_delete.connect(
+        invalidate_page_cache_for_content,
+        sender=_label,
+        dispatch_uid='content.invalidate_page_cache_on_delete',
+    )
+
+
+def index_content_tags(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_content_tags(sender, [instance.pk], instance=instance)
+
+
+def unindex_content_tags(sender, instance, **kwargs):
+    refresh_content_tags(sender, [instance.pk])
+
+
+for _model in indexed_models():
+    post_save.connect(
+        index_content_tags,
+        sender=_model,
+        dispatch_uid='content.index_content_tags_on_save',
+    )
+    post_delete.connect(
+        unindex_content_tags,
+        sender=_model,
+        dispatch_uid='content.unindex_content_tags_on_delete',
+    )
+
+
 @receiver(post_migrate, dispatch_uid='content.warm_downloads_nav_availability')
 def warm_downloads_nav_availability(app_config, **kwargs):
     if getattr(app_config, 'label', None) == 'content':
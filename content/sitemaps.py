@@ -24,7 +24,7 @@ from content.models import (
     Workshop,
     WorkshopPage,
 )
-from content.utils.tags import collect_tag_names
+from content.services.tag_index import tag_names
 from events.models import Event
 
 
@@ -195,22 +195,16 @@ class StaticViewSitemap(Sitemap):
         return reverse(item)
 
 
-TAG_CONTENT_CONFIGS = (
-    (Article, {'published': True}),
-    (Project, {'published': True}),
-    (Tutorial, {'published': True}),
-    (Course, {'status': 'published'}),
-    (Download, {'published': True}),
-    (Event, {}),
-)
+TAG_CONTENT_MODELS = (Article, Project, Tutorial, Course, Download, Event)
 
 
 def _collect_all_tags():
     """Collect all unique tags from all published content types.
 
-    Returns a sorted list of unique tag strings.
+    Returns a sorted list of unique tag strings, read from the
+    ``ContentTag`` index in one query.
     """
-    return sorted(set(collect_tag_names(TAG_CONTENT_CONFIGS)))
+    return tag_names(TAG_CONTENT_MODELS)
 
 
 class TagSitemap(Sitemap):
@@ -3,7 +3,7 @@
 from datetime import date, timedelta
 
 from django.contrib.auth.models import AnonymousUser
-from django.test import Client, TestCase, tag
+from django.test import Client, RequestFactory, TestCase, tag
 from django.utils import timezone
 
 from accounts.models import TierOverride, User
@@ -14,8 +14,10 @@ from content.access import (
     LEVEL_OPEN,
     LEVEL_PREMIUM,
     LEVEL_REGISTERED,
+    AccessContext,
     build_gating_context,
     can_access,
+    get_access_context,
     get_required_tier_label,
     get_required_tier_name,
     get_teaser_text,
@@ -414,6 +416,101 @@ class OverrideGatingRegressionTest(TierSetupMixin, TestCase):
         self.assertFalse(ctx['is_gated'])
 
 
+@tag('core')
+class AccessContextTest(TierSetupMixin, TestCase):
+    """The request-scoped access context batches ``can_access``."""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.free_user = User.objects.create_user(
+            email='ctx-free@test.com', email_verified=True,
+        )
+        cls.free_user.tier = cls.free_tier
+        cls.free_user.save()
+        cls.override_user = User.objects.create_user(
+            email='ctx-override@test.com', email_verified=True,
+        )
+        cls.override_user.tier = cls.free_tier
+        cls.override_user.save()
+        TierOverride.objects.create(
+            user=cls.override_user,
+            original_tier=cls.free_tier,
+            override_tier=cls.main_tier,
+            expires_at=timezone.now() + timedelta(days=7),
+            is_active=True,
+        )
+        cls.unverified_user = User.objects.create_user(email='ctx-new@test.com')
+
+        cls.courses = [
+            Course.objects.create(
+                title=f'Ctx {i}', slug=f'ctx-{i}', status='published',
+                required_level=LEVEL_MAIN,
+            )
+            for i in range(4)
+        ]
+        CourseAccess.objects.create(
+            user=cls.free_user, course=cls.courses[1], access_type='granted',
+        )
+        module = Module.objects.create(
+            course=cls.courses[1], title='M', slug='m', sort_order=0,
+        )
+        cls.unit = Unit.objects.create(
+            module=module, title='U', slug='u', sort_order=0,
+        )
+        cls.registered_unit = Unit.objects.create(
+            module=module, title='R', slug='r', sort_order=1,
+            required_level=LEVEL_REGISTERED,
+        )
+        cls.articles = [
+            Article.objects.create(
+                title=f'Ctx {level}', slug=f'ctx-article-{level}',
+                date=date(2025, 1, 1), required_level=level,
+            )
+            for level in (LEVEL_OPEN, LEVEL_BASIC, LEVEL_MAIN)
+        ]
+
+    def test_matches_can_access(self):
+        objects = [*self.courses, self.unit, self.registered_unit, *self.articles]
+        for user in (AnonymousUser(), self.free_user, self.override_user,
+                     self.unverified_user):
+            with self.subTest(user=str(user)):
+                self.assertEqual(
+                    AccessContext(user).can_access_many(objects),
+                    [can_access(user, obj) for obj in objects],
+                )
+
+    def test_batch_costs_at_most_two_queries(self):
+        courses = list(
+            Course.objects.filter(slug__startswith='ctx-').order_by('slug'),
+        )
+        user = User.objects.select_related('tier').get(pk=self.free_user.pk)
+
+        with self.assertNumQueries(2):
+            access = AccessContext(user).can_access_many(courses)
+
+        self.assertEqual(access, [False, True, False, False])
+
+    def test_open_content_needs_no_queries(self):
+        open_article = self.articles[0]
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                AccessContext(self.free_user).can_access_many([open_article] * 3),
+                [True] * 3,
+            )
+
+    def test_context_is_reused_per_request(self):
+        request = RequestFactory().get('/')
+        request.user = self.free_user
+
+        context = get_access_context(request)
+
+        self.assertIs(get_access_context(request), context)
+        request.user = self.override_user
+        self.assertEqual(get_access_context(request).level, LEVEL_MAIN)
+
+
 @tag('core')
 class GetRequiredTierNameTest(TestCase):
     """Test tier name mapping."""
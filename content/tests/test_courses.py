@@ -24,6 +24,7 @@ from content.access import LEVEL_MAIN, LEVEL_OPEN, LEVEL_PREMIUM
 from content.models import (
     Cohort,
     Course,
+    CourseAccess,
     CourseInstructor,
     Instructor,
     Module,
@@ -962,6 +963,66 @@ class ApiCoursesListTest(TierSetupMixin, TestCase):
         self.assertFalse(courses_by_slug['main-api']['is_locked'])
 
 
+class ApiCoursesListQueryGuardTest(TierSetupMixin, TestCase):
+    """N+1 regression guard for ``GET /api/courses``.
+
+    Access decisions come from one request-scoped access context and
+    instructors from one prefetch, so the query count must not grow with
+    the number of published courses.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.user = User.objects.create_user(
+            email='list-guard@test.com', password='pw',
+        )
+        cls.user.tier = cls.basic_tier
+        cls.user.save()
+
+    def _add_courses(self, start, count):
+        for i in range(start, start + count):
+            course = Course.objects.create(
+                title=f'Guard {i}', slug=f'guard-{i}', status='published',
+                required_level=LEVEL_MAIN,
+            )
+            _attach_course_instructor(course, f'Guard Instructor {i}')
+            if i % 2:
+                CourseAccess.objects.create(
+                    user=self.user, course=course, access_type='granted',
+                )
+
+    def _get_courses(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get('/api/courses')
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)['courses'], len(ctx.captured_queries)
+
+    def test_query_count_does_not_scale_with_course_count(self):
+        self.client.login(email='list-guard@test.com', password='pw')
+        self._add_courses(0, 2)
+        small, small_queries = self._get_courses()
+
+        self._add_courses(2, 8)
+        large, large_queries = self._get_courses()
+
+        self.assertEqual((len(small), len(large)), (2, 10))
+        self.assertEqual(large_queries, small_queries)
+
+    def test_locks_follow_course_access_grants(self):
+        self.client.login(email='list-guard@test.com', password='pw')
+        self._add_courses(0, 4)
+
+        courses, _ = self._get_courses()
+
+        by_slug = {c['slug']: c for c in courses}
+        self.assertEqual(
+            {slug: c['is_locked'] for slug, c in by_slug.items()},
+            {'guard-0': True, 'guard-1': False, 'guard-2': True, 'guard-3': False},
+        )
+        self.assertEqual(by_slug['guard-2']['instructor_name'], 'Guard Instructor 2')
+
+
 class ApiCourseDetailTest(TierSetupMixin, TestCase):
     """Test GET /api/courses/{slug}."""
 
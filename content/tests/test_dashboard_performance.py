@@ -267,7 +267,7 @@ class DuplicateOverrideQueryTest(TierSetupMixin, TestCase):
         """Dashboard should call get_active_override at most once."""
         self.client.login(email='override@example.com', password='testpass')
 
-        with patch('content.views.home.get_active_override', wraps=get_active_override) as mock_override:
+        with patch('content.access.get_active_override', wraps=get_active_override) as mock_override:
             response = self.client.get('/')
             self.assertEqual(response.status_code, 200)
             self.assertEqual(mock_override.call_count, 1)
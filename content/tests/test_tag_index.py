@@ -0,0 +1,167 @@
+"""Tests for the ``ContentTag`` index (``content.services.tag_index``).
+
+Covers index maintenance from content saves and deletes, queryset updates
+in the sync dispatchers and admin actions, the deferred flush used by
+content syncs, and the ``rebuild_tag_index`` backfill command.
+"""
+
+from datetime import date
+from io import StringIO
+
+from django.contrib.admin.sites import site
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from content.admin.course import unpublish_courses
+from content.models import Article, ContentTag, Course, Project
+from content.services.tag_index import (
+    deferred_tag_index,
+    refresh_content_tags,
+    tag_counts,
+    tag_names,
+    tagged_object_ids,
+)
+from events.models import Event
+from integrations.services.github import sync_content_source
+from integrations.tests.sync_fixtures import make_sync_repo
+
+
+def _index(content_type=None):
+    rows = ContentTag.objects.all()
+    if content_type:
+        rows = rows.filter(content_type=content_type)
+    return sorted(
+        rows.values_list('tag', 'content_type', 'published', 'required_level'),
+    )
+
+
+class TagIndexMaintenanceTest(TestCase):
+    def _article(self, **kwargs):
+        fields = {
+            'title': 'Indexed', 'slug': 'indexed', 'date': date(2026, 1, 1),
+            'tags': ['python', 'ai'], 'published': True,
+        }
+        fields.update(kwargs)
+        return Article.objects.create(**fields)
+
+    def test_save_indexes_normalized_tags(self):
+        self._article(tags=['Machine Learning', 'python'], required_level=10)
+
+        self.assertEqual(_index(), [
+            ('machine-learning', 'article', True, 10),
+            ('python', 'article', True, 10),
+        ])
+
+    def test_resave_replaces_rows(self):
+        article = self._article()
+        article.tags = ['django']
+        article.published = False
+        article.save()
+
+        self.assertEqual(_index(), [('django', 'article', False, 0)])
+
+    def test_delete_removes_rows(self):
+        self._article().delete()
+
+        self.assertFalse(ContentTag.objects.exists())
+
+    def test_course_and_event_publication_rules(self):
+        Course.objects.create(
+            title='Draft', slug='draft', status='draft', tags=['python'],
+        )
+        Event.objects.create(
+            title='Cancelled', slug='cancelled', status='cancelled',
+            start_datetime=timezone.now(), tags=['python'],
+        )
+
+        self.assertEqual(_index(), [
+            ('python', 'course', False, 0),
+            ('python', 'event', True, 0),
+        ])
+
+    def test_queries_read_published_rows_only(self):
+        self._article()
+        self._article(slug='second', tags=['python'])
+        self._article(slug='draft', tags=['python', 'secret'], published=False)
+        project = Project.objects.create(
+            title='P', slug='p', date=date(2026, 1, 1), tags=['ai'],
+            published=True,
+        )
+
+        self.assertEqual(tag_counts([Article, Project]), [('ai', 2), ('python', 2)])
+        self.assertEqual(tag_names([Project]), ['ai'])
+        self.assertEqual(tagged_object_ids('ai', [Project]), {Project: [project.pk]})
+
+    def test_deferred_block_writes_on_exit(self):
+        with deferred_tag_index():
+            article = self._article()
+            article.tags = ['final']
+            article.save()
+            self.assertFalse(ContentTag.objects.exists())
+
+        self.assertEqual(_index(), [('final', 'article', True, 0)])
+
+    def test_refresh_picks_up_queryset_updates(self):
+        article = self._article()
+        Article.objects.filter(pk=article.pk).update(published=False)
+
+        refresh_content_tags(Article, [article.pk])
+
+        self.assertEqual(
+            {published for _tag, _type, published, _level in _index()},
+            {False},
+        )
+
+    def test_admin_unpublish_action_reindexes(self):
+        course = Course.objects.create(
+            title='C', slug='c', status='published', tags=['python'],
+        )
+
+        unpublish_courses(site._registry[Course], None, Course.objects.filter(status='published'))
+
+        self.assertEqual(_index(), [('python', 'course', False, 0)])
+        course.refresh_from_db()
+        self.assertEqual(course.status, 'draft')
+
+
+class TagIndexSyncTest(TestCase):
+    def test_stale_sync_cleanup_unpublishes_index_rows(self):
+        source, repo = make_sync_repo(
+            self, repo_name='AI-Shipping-Labs/tag-index', prefix='tag-index-',
+        )
+        for slug in ('keep', 'drop'):
+            repo.write_markdown(
+                f'blog/{slug}.md',
+                {
+                    'title': slug.title(), 'slug': slug, 'date': '2026-01-15',
+                    'tags': [f'{slug}-tag', 'shared'],
+                },
+                'Body.\n',
+            )
+        sync_content_source(source, repo_dir=str(repo.path))
+        self.assertEqual(tag_counts([Article])[0], ('shared', 2))
+
+        (repo.path / 'blog' / 'drop.md').unlink()
+        sync_content_source(source, repo_dir=str(repo.path))
+
+        self.assertEqual(tag_names([Article]), ['keep-tag', 'shared'])
+
+
+class RebuildTagIndexCommandTest(TestCase):
+    def test_rebuild_restores_missing_and_drops_stray_rows(self):
+        Article.objects.create(
+            title='A', slug='a', date=date(2026, 1, 1), tags=['python'],
+            published=True,
+        )
+        ContentTag.objects.all().delete()
+        ContentTag.objects.create(
+            tag='orphan', content_type='article', object_id=999_999,
+            published=True,
+        )
+        out = StringIO()
+
+        call_command('rebuild_tag_index', stdout=out)
+
+        self.assertEqual(_index(), [('python', 'article', True, 0)])
+        self.assertIn('Indexed 1 content tags.', out.getvalue())
@@ -403,31 +403,40 @@ class PublicTagQueryPerformanceTest(TestCase):
             )
         }
 
-    def test_tags_index_uses_five_tags_only_queries_at_any_row_count(self):
+    def test_tags_index_counts_with_one_index_query(self):
         from content.views.tags import _collect_all_tags
 
         with CaptureQueriesContext(connection) as queries:
             tag_counts = dict(_collect_all_tags())
 
-        self.assertEqual(len(queries), 5)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('content_contenttag', queries[0]['sql'])
         self.assertEqual(tag_counts['performance'], 5)
         self.assertEqual(tag_counts['volume'], 3)
         self.assertNotIn('tutorial-only', tag_counts)
-        for query in queries:
-            self.assertEqual(self._selected_columns(query['sql']), {'tags'})
 
-    def test_sitemap_uses_six_tags_only_queries_and_sorted_unique_names(self):
+    def test_sitemap_reads_sorted_unique_names_with_one_index_query(self):
         from content.sitemaps import _collect_all_tags
 
         with CaptureQueriesContext(connection) as queries:
             tags = _collect_all_tags()
 
-        self.assertEqual(len(queries), 6)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('content_contenttag', queries[0]['sql'])
         self.assertEqual(tags, sorted(set(tags)))
         self.assertIn('tutorial-only', tags)
         self.assertEqual(tags.count('shared'), 1)
-        for query in queries:
-            self.assertEqual(self._selected_columns(query['sql']), {'tags'})
+
+    def test_tag_detail_loads_only_types_with_matches(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/tags/volume')
+
+        self.assertEqual(response.context['result_count'], 3)
+        content_queries = [
+            q['sql'] for q in queries
+            if re.search(r'FROM "(content|events)_', q['sql'])
+        ]
+        self.assertEqual(len(content_queries), 2)
 
     def test_tag_detail_projects_exact_rendered_fields_without_followups(self):
         expected_columns = {
@@ -453,9 +462,11 @@ class PublicTagQueryPerformanceTest(TestCase):
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['result_count'], 5)
-        self.assertEqual(len(queries), 5)
+        # One tag index lookup, then one primary-key load per content type.
+        self.assertEqual(len(queries), 6)
+        self.assertIn('content_contenttag', queries[0]['sql'])
         queries_by_table = {}
-        for query in queries:
+        for query in queries[1:]:
             sql = query['sql']
             table = next(
                 table_name
@@ -2,6 +2,7 @@ from collections import Counter
 from urllib.parse import urlencode
 
 from django.contrib.auth.decorators import login_required
+from django.db.models import Prefetch
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.csrf import ensure_csrf_cookie
@@ -12,6 +13,7 @@ from content.access import (
     LEVEL_MAIN,
     build_gating_context,
     can_access,
+    get_access_context,
     get_required_tier_name,
     get_user_level,
 )
@@ -19,6 +21,7 @@ from content.models import (
     Cohort,
     CohortEnrollment,
     Course,
+    Instructor,
     Module,
     Unit,
     UserCourseProgress,
@@ -33,8 +36,10 @@ from content.services.enrollment import (
     unenroll as unenroll_user,
 )
 from content.views.pages import _filter_by_tags, _get_selected_tags
+from website.page_cache import anonymous_page_cache
 
 
+@anonymous_page_cache
 def courses_list(request):
     """Course catalog page: grid of all published courses."""
     courses = Course.objects.filter(status='published')
@@ -294,13 +299,25 @@ def unenroll_course(request, slug):
 
 def api_courses_list(request):
     """GET /api/courses - list all published courses with is_locked flag."""
-    courses = Course.objects.filter(status='published')
-    user = request.user
+    courses = list(
+        Course.objects
+        .filter(status='published')
+        .prefetch_related(
+            Prefetch(
+                'instructors',
+                queryset=Instructor.objects.order_by('courseinstructor__position'),
+                to_attr='api_instructors',
+            ),
+        )
+    )
+    # One TierOverride and one CourseAccess query for the whole list,
+    # however many courses are published.
+    access = get_access_context(request).can_access_many(courses)
 
     data = []
-    for course in courses:
-        is_locked = not can_access(user, course)
-        primary = course.primary_instructor
+    for course, has_access in zip(courses, access):
+        instructors = course.api_instructors
+        primary = instructors[0] if instructors else None
         data.append({
             'id': course.pk,
             'slug': course.slug,
@@ -310,12 +327,12 @@ def api_courses_list(request):
             'instructor_name': primary.name if primary else '',
             'instructors': [
                 {'id': i.instructor_id, 'name': i.name}
-                for i in course.ordered_instructors
+                for i in instructors
             ],
             'tags': course.tags,
             'is_free': course.is_free,
             'required_level': course.required_level,
-            'is_locked': is_locked,
+            'is_locked': not has_access,
         })
 
     return JsonResponse({'courses': data})
@@ -12,9 +12,8 @@ from accounts.oauth_context import get_oauth_provider_context
 from accounts.services.timezones import format_user_datetime
 from community.services.slack_links import build_slack_profile_url
 from content.access import (
-    get_active_override,
+    get_access_context,
     get_required_tier_name,
-    get_user_level,
 )
 from content.models import (
     Article,
@@ -42,6 +41,7 @@ from plans.dashboard import (
 )
 from plans.models import Sprint
 from questionnaires.onboarding import has_completed_onboarding
+from website.page_cache import anonymous_page_cache
 
 DASHBOARD_EVENT_DATETIME_FORMAT = '%a, %b %d, %Y, %H:%M'
 AI_HERO_COURSE_SLUG = 'aihero'
@@ -205,6 +205,7 @@ SECTION_NAV = [
 ]
 
 
+@anonymous_page_cache
 @ensure_csrf_cookie
 def home(request):
     """Homepage view.
@@ -292,10 +293,11 @@ def _dashboard(request):
     request.user = user
 
     # --- Welcome banner ---
-    # Fetch active tier override once; pass it to get_user_level to avoid a
-    # duplicate DB query (get_user_level internally queries for the override too).
-    active_override = get_active_override(user)
-    user_level = get_user_level(user, active_override=active_override)
+    # The request's access context fetches the active tier override once
+    # and derives the effective level from it; both are reused below.
+    access = get_access_context(request)
+    active_override = access.active_override
+    user_level = access.level
 
     tier_name = ''
     if user.tier_id:
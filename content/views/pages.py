@@ -28,6 +28,7 @@ from content.tier_config import get_curated_activities
 from events.models.event import PUBLIC_EVENT_STATUSES
 from events.services.time_windows import upcoming_events_queryset
 from plans.models import Plan, Sprint, SprintEnrollment
+from website.page_cache import anonymous_page_cache
 
 
 def _public_article_source_event(article):
@@ -349,6 +350,7 @@ def sprints_index(request):
     return render(request, 'content/sprints_index.html', context)
 
 
+@anonymous_page_cache
 @ensure_csrf_cookie
 def blog_list(request):
     """Blog listing page with optional tag filtering."""
@@ -375,6 +377,7 @@ def blog_list(request):
     return render(request, 'content/blog_list.html', context)
 
 
+@anonymous_page_cache
 def blog_detail(request, slug):
     """Blog post detail page with related articles."""
     article = get_object_or_404(
@@ -4,13 +4,12 @@
 /tags/{tag} - Lists all content with that tag across all content types.
 """
 
-from collections import Counter
-
 from django.shortcuts import render
 
 from content.models import Article, Course, Download, Project
-from content.utils.tags import collect_tag_names
+from content.services.tag_index import tag_counts, tagged_object_ids
 from events.models import Event
+from website.page_cache import anonymous_page_cache
 
 # Content type configuration: (model_class, published_filter, date_field, type_label, url_func)
 CONTENT_TYPES = [
@@ -75,14 +74,13 @@ CONTENT_TYPES = [
 def _collect_all_tags():
     """Collect all tags from all content types with counts.
 
-    Returns a list of (tag, count) tuples sorted by count descending.
+    Returns a list of (tag, count) tuples sorted by count descending. One
+    query against the ``ContentTag`` index.
     """
-    tag_counter = Counter(collect_tag_names(
-        (ct['model'], ct['filter']) for ct in CONTENT_TYPES
-    ))
-    return tag_counter.most_common()
+    return tag_counts(ct['model'] for ct in CONTENT_TYPES)
 
 
+@anonymous_page_cache
 def tags_index(request):
     """GET /tags - Show all tags with content count per tag."""
     tag_counts = _collect_all_tags()
@@ -94,28 +92,33 @@ def tags_index(request):
     return render(request, 'content/tags_index.html', context)
 
 
+@anonymous_page_cache
 def tags_detail(request, tag):
     """GET /tags/{tag} - Show all content with that tag across all types."""
-    # Collect all items with this tag
+    # The tag index names the tagged items; only types with a match are
+    # loaded, by primary key.
+    ids_by_model = tagged_object_ids(tag, [ct['model'] for ct in CONTENT_TYPES])
     results = []
     for ct in CONTENT_TYPES:
+        ids = ids_by_model.get(ct['model'])
+        if not ids:
+            continue
         queryset = (
             ct['model'].objects
-            .filter(**ct['filter'])
+            .filter(pk__in=ids, **ct['filter'])
             .only(*ct['only_fields'])
         )
         for obj in queryset:
-            if obj.tags and tag in obj.tags:
-                date_val = getattr(obj, ct['date_field'])
-                results.append({
-                    'title': obj.title,
-                    'description': getattr(obj, 'description', ''),
-                    'url': ct['url_func'](obj),
-                    'date': date_val,
-                    'type_label': ct['type_label'],
-                    'type_color': ct['type_color'],
-                    'tags': obj.tags,
-                })
+            date_val = getattr(obj, ct['date_field'])
+            results.append({
+                'title': obj.title,
+                'description': getattr(obj, 'description', ''),
+                'url': ct['url_func'](obj),
+                'date': date_val,
+                'type_label': ct['type_label'],
+                'type_color': ct['type_color'],
+                'tags': obj.tags,
+            })
 
     # Sort by date descending (normalize date/datetime for comparison)
     import datetime as dt
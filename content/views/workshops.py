@@ -74,6 +74,7 @@ from content.workshop_facets import (
     facet_for_tag,
 )
 from events.services.freestyle_evidence import build_freestyle_evidence
+from website.page_cache import anonymous_page_cache
 
 # Approximate word budget for the locked-page teaser body. Mirrors the
 # constant used by ``content.views.courses.TEASER_WORD_LIMIT`` so the
@@ -953,6 +954,7 @@ def _resolve_materials_for_render(workshop, can_access_pages,
     return materials, can_show
 
 
+@anonymous_page_cache
 @ensure_csrf_cookie
 def workshop_detail(request, slug):
     """Landing page: description, metadata, links to video and tutorial.
@@ -60,6 +60,8 @@ SYSTEM_PROMPT = (
 # Name of the structured-output tool the model is forced to call.
 _TOOL_NAME = 'plan_sprint_progress'
 
+CACHE_LABEL = 'plan_sprint_parse'
+
 # Valid plan-item kinds. Kept as plain constants (no Django import).
 ITEM_KIND_CHECKPOINT = 'checkpoint'
 ITEM_KIND_DELIVERABLE = 'deliverable'
@@ -252,6 +254,7 @@ def parse_plan_sprint_thread(data, *, trace=None):
             system=SYSTEM_PROMPT,
             tools=[tool],
             tool_choice={'type': 'tool', 'name': _TOOL_NAME},
+            cache=CACHE_LABEL,
         )
     except LLMError as error:
         sink.on_error(error=error)
@@ -261,6 +264,7 @@ def parse_plan_sprint_thread(data, *, trace=None):
 
     if result.tool_input is None:
         error = LLMError('LLM did not return structured progress output.')
+        llm.discard_cached(result)
         sink.on_error(error=error)
         raise error
 
@@ -268,6 +272,7 @@ def parse_plan_sprint_thread(data, *, trace=None):
         parsed = PlanSprintParseResult.model_validate(result.tool_input)
     except Exception as exc:
         error = LLMError(f'LLM returned invalid progress output: {exc}')
+        llm.discard_cached(result)
         sink.on_error(error=error)
         raise error from None
 
@@ -8,4 +8,5 @@ class EmailAppConfig(AppConfig):
         # Importing the checks module is enough to register the
         # ``@register``-decorated ``check_ses_enabled_in_production``
         # function with Django's system-check framework. Issue #521.
+        import email_app.signals  # noqa: F401
         from email_app import checks  # noqa: F401
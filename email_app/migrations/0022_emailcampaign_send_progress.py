@@ -0,0 +1,28 @@
+# Generated by Django 6.1.2 on 2026-10-16 23:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('email_app', '0021_reconcile_emaillog_subject_default'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailcampaign',
+            name='batch_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of send batches the campaign was split into.'),
+        ),
+        migrations.AddField(
+            model_name='emailcampaign',
+            name='batches_completed',
+            field=models.PositiveIntegerField(default=0, help_text='Send batch runs finished so far (retries count again).'),
+        ),
+        migrations.AddField(
+            model_name='emailcampaign',
+            name='expected_recipients',
+            field=models.PositiveIntegerField(default=0, help_text='Recipients resolved when the campaign was fanned out.'),
+        ),
+    ]
@@ -133,6 +133,21 @@ class EmailCampaign(models.Model):
         default=0,
         help_text='Number of recipients.',
     )
+    # Send progress, snapshotted by the fan-out task and advanced with
+    # atomic F() updates by each batch, so completion is a single-row
+    # comparison instead of a recount of the whole audience.
+    expected_recipients = models.PositiveIntegerField(
+        default=0,
+        help_text='Recipients resolved when the campaign was fanned out.',
+    )
+    batch_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Number of send batches the campaign was split into.',
+    )
+    batches_completed = models.PositiveIntegerField(
+        default=0,
+        help_text='Send batch runs finished so far (retries count again).',
+    )
     is_archived = models.BooleanField(
         default=False,
         db_index=True,
@@ -183,3 +198,15 @@ class EmailCampaign(models.Model):
     def get_recipient_count(self):
         """Return the estimated number of eligible recipients."""
         return self.get_eligible_recipients().count()
+
+    @property
+    def has_send_progress(self):
+        """True once fan-out has snapshotted the audience for this send."""
+        return self.batch_count > 0
+
+    @property
+    def progress_percent(self):
+        """Share of the snapshotted audience delivered so far (0-100)."""
+        if not self.expected_recipients:
+            return 100 if self.status == 'sent' else 0
+        return min(100, self.sent_count * 100 // self.expected_recipients)
@@ -2,6 +2,7 @@
 
 from django.contrib.auth import get_user_model
 
+from accounts.models import UserTag
 from accounts.tier_audience import effective_level_at_least_q
 
 
@@ -38,18 +39,15 @@ def eligible_campaign_recipients(
 
     include_set = set(target_tags_any or [])
     exclude_set = set(target_tags_none or [])
-    if not include_set and not exclude_set:
-        return base_qs
-
-    eligible_ids = []
-    for pk, tags in base_qs.values_list("pk", "tags"):
-        user_tags = set(tags or [])
-        if include_set and not (user_tags & include_set):
-            continue
-        if exclude_set and user_tags & exclude_set:
-            continue
-        eligible_ids.append(pk)
-    return User.objects.filter(pk__in=eligible_ids)
+    if include_set:
+        base_qs = base_qs.filter(
+            pk__in=UserTag.objects.filter(tag__in=include_set).values("user_id"),
+        )
+    if exclude_set:
+        base_qs = base_qs.exclude(
+            pk__in=UserTag.objects.filter(tag__in=exclude_set).values("user_id"),
+        )
+    return base_qs
 
 
 def campaign_recipient_count(**audience):
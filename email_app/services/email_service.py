@@ -11,6 +11,7 @@ Each template has YAML frontmatter with a subject line, and a markdown
 body that supports Django template variables.
 """
 
+import json
 import logging
 import re
 from datetime import datetime
@@ -20,7 +21,7 @@ import boto3
 import frontmatter
 from botocore.exceptions import BotoCoreError, ClientError
 from django.conf import settings
-from django.template import Context, Template
+from django.template import Context
 from django.template.loader import render_to_string
 
 from accounts.services.timezones import format_user_datetime
@@ -34,6 +35,7 @@ from email_app.services.email_classification import (
     classify_email_type,
     get_sender_for_email_type,
 )
+from email_app.services.template_cache import compiled_templates
 from integrations.config import (
     get_config,
     site_base_url,
@@ -74,6 +76,9 @@ VERIFY_FOOTER_TOKEN_EXPIRY_HOURS = 24 * 7
 WELCOME_REPLY_TO_KEY = "SES_WELCOME_REPLY_TO_EMAIL"
 DEFAULT_WELCOME_REPLY_TO_EMAIL = "welcome@aishippinglabs.com"
 
+# SES v2 SendBulkEmail accepts at most 50 BulkEmailEntries per call.
+SES_BULK_MAX_DESTINATIONS = 50
+
 
 def _normalize_cc(cc):
     """Normalize a ``cc`` argument into a list of non-empty email strings.
@@ -274,9 +279,7 @@ class EmailService:
         Raises:
             EmailServiceError: If no override or template file is found.
         """
-        subject_source, body_source, footer_note = self._load_template_source(
-            template_name,
-        )
+        compiled = self._get_compiled_template(template_name)
 
         # Build full context with defaults
         full_context = {
@@ -298,18 +301,51 @@ class EmailService:
                 full_context[key] = format_user_datetime(value, user)
 
         # Render subject as Django template
-        subject_template = Template(subject_source)
-        subject = subject_template.render(Context(full_context))
+        subject = compiled.subject.render(Context(full_context))
+
+        if compiled.static_body_html is not None:
+            # No variables in the body: the markdown HTML is the same for
+            # every recipient and was rendered when the template compiled.
+            body_html = compiled.static_body_html
+        else:
+            # Render body as Django template first (for variable
+            # substitution), then convert markdown to HTML through the
+            # canonical renderer (issue #989) so transactional email
+            # bodies parse identically to the website.
+            rendered_body = compiled.body.render(Context(full_context))
+            body_html = render_email_markdown(rendered_body)
+
+        return subject, body_html, compiled.footer_note
 
-        # Render body as Django template first (for variable substitution)
-        body_template = Template(body_source)
-        rendered_body = body_template.render(Context(full_context))
+    def _get_compiled_template(self, template_name):
+        """Return the cached ``CompiledEmailTemplate`` for ``template_name``.
 
-        # Convert markdown to HTML through the canonical renderer (issue #989)
-        # so transactional email bodies parse identically to the website.
-        body_html = render_email_markdown(rendered_body)
+        The version check costs one indexed ``updated_at`` lookup (or a
+        file ``stat``) per render; parsing, compiling and static markdown
+        only happen when the override or file has changed.
+        """
+        from email_app.models import EmailTemplateOverride
 
-        return subject, body_html, footer_note
+        updated_at = EmailTemplateOverride.objects.filter(
+            template_name=template_name,
+        ).values_list("updated_at", flat=True).first()
+        if updated_at is not None:
+            version = ("override", updated_at)
+        else:
+            template_path = TEMPLATES_DIR / f"{template_name}.md"
+            try:
+                version = ("file", template_path.stat().st_mtime_ns)
+            except FileNotFoundError:
+                raise EmailServiceError(
+                    f"Email template not found: {template_name} "
+                    f"(looked in {template_path})"
+                ) from None
+
+        return compiled_templates.get(
+            template_name,
+            version,
+            lambda: self._load_template_source(template_name),
+        )
 
     def _load_template_source(self, template_name):
         """Return ``(subject, body_markdown, footer_note)`` for a template."""
@@ -554,6 +590,17 @@ class EmailService:
             "Content": content,
         }
 
+        self._apply_send_options(send_kwargs, email_type)
+
+        try:
+            response = self.ses_client.send_email(**send_kwargs)
+            return response.get("MessageId", "")
+        except (BotoCoreError, ClientError) as e:
+            logger.exception("Failed to send email via SES to %s", to_email)
+            raise EmailServiceError(f"SES send failed for {to_email}: {e}") from e
+
+    def _apply_send_options(self, send_kwargs, email_type):
+        """Add the Reply-To and configuration set shared by every send API."""
         # Issue #950: route replies to welcome emails to a monitored inbox.
         # Only welcome types get a Reply-To; an empty or malformed configured
         # value omits the optional header so it cannot make SES reject the
@@ -573,9 +620,101 @@ class EmailService:
         if configuration_set_name:
             send_kwargs["ConfigurationSetName"] = configuration_set_name
 
+    def _send_ses_bulk(self, subject, html_template, entries, *, email_type=None):
+        """Send one templated message to many recipients via SendBulkEmail.
+
+        ``html_template`` is the fully rendered email with SES template
+        placeholders (``{{unsubscribe_url}}``, ...) where per-recipient
+        values go. Each entry supplies those values, so the page chrome
+        and markdown body are rendered once for the whole call instead of
+        once per recipient.
+
+        Args:
+            subject: Email subject line (no placeholders).
+            html_template: Full HTML email body with SES placeholders.
+            entries: Up to ``SES_BULK_MAX_DESTINATIONS`` dicts with
+                ``to_email``, ``template_data`` (placeholder -> value) and
+                an optional ``unsubscribe_url`` for the one-click
+                ``List-Unsubscribe`` headers.
+            email_type: Email template name, used to resolve the sender
+                exactly like ``_send_ses``.
+
+        Returns:
+            list of ``(message_id, error)`` tuples in ``entries`` order.
+            ``message_id`` is ``None`` when SES rejected that destination
+            and ``error`` carries the SES status and message.
+
+        Raises:
+            EmailServiceError: If the SES API call itself fails (nothing
+                was sent to any entry).
+        """
+        if len(entries) > SES_BULK_MAX_DESTINATIONS:
+            raise ValueError(
+                f"SendBulkEmail accepts at most {SES_BULK_MAX_DESTINATIONS} "
+                f"destinations, got {len(entries)}"
+            )
+
+        # Issue #509: same kill-switch as ``_send_ses``.
+        if not getattr(settings, "SES_ENABLED", False):
+            logger.info(
+                "SES disabled - skipping bulk send to %d recipients (subject=%s)",
+                len(entries),
+                subject,
+            )
+            return [("ses-disabled-noop", None) for _ in entries]
+
+        bulk_entries = []
+        for entry in entries:
+            bulk_entry = {
+                "Destination": {"ToAddresses": [entry["to_email"]]},
+                "ReplacementEmailContent": {
+                    "ReplacementTemplate": {
+                        "ReplacementTemplateData": json.dumps(
+                            entry.get("template_data", {}),
+                        ),
+                    },
+                },
+            }
+            headers = self._build_unsubscribe_headers(entry.get("unsubscribe_url"))
+            if headers:
+                bulk_entry["ReplacementHeaders"] = headers
+            bulk_entries.append(bulk_entry)
+
+        send_kwargs = {
+            "FromEmailAddress": get_sender_for_email_type(email_type),
+            "DefaultContent": {
+                "Template": {
+                    "TemplateContent": {
+                        "Subject": subject,
+                        "Html": html_template,
+                    },
+                    "TemplateData": "{}",
+                },
+            },
+            "BulkEmailEntries": bulk_entries,
+        }
+        self._apply_send_options(send_kwargs, email_type)
+
         try:
-            response = self.ses_client.send_email(**send_kwargs)
-            return response.get("MessageId", "")
+            response = self.ses_client.send_bulk_email(**send_kwargs)
         except (BotoCoreError, ClientError) as e:
-            logger.exception("Failed to send email via SES to %s", to_email)
-            raise EmailServiceError(f"SES send failed for {to_email}: {e}") from e
+            logger.exception("Failed bulk SES send to %d recipients", len(entries))
+            raise EmailServiceError(f"SES bulk send failed: {e}") from e
+
+        results = []
+        for entry, result in zip(
+            entries, response.get("BulkEmailEntryResults", []),
+        ):
+            if result.get("Status") == "SUCCESS":
+                results.append((result.get("MessageId", ""), None))
+            else:
+                results.append((
+                    None,
+                    f"{result.get('Status')}: {result.get('Error', '')}",
+                ))
+        # SES returns one result per entry; treat anything missing as
+        # not sent so the recipient stays eligible for a retry.
+        results.extend(
+            (None, "MISSING_RESULT") for _ in entries[len(results):]
+        )
+        return results
@@ -0,0 +1,136 @@
+"""Token-bucket pacing for outbound SES sends.
+
+SES enforces a per-account ``MaxSendRate`` (messages per second, counted
+per destination). Campaign batches used to pace themselves with a fixed
+``time.sleep`` after every message, which wastes the quota on the
+rendering and API round-trip time and cannot adapt to the account's
+actual limit.
+
+:func:`get_send_rate_limiter` returns one :class:`TokenBucket` per
+process, shared by every batch that process runs. Its rate is
+re-resolved at the start of each batch (so a Studio change applies to
+the next batch) from, in order:
+
+1. ``SES_MAX_SEND_RATE`` (Studio override / env / settings), then
+2. ``SendQuota.MaxSendRate`` from the SES ``GetAccount`` API, then
+3. ``DEFAULT_MAX_SEND_RATE`` (the SES production default of 14/s).
+
+The account rate is divided across the django-q worker processes
+(``Q_CLUSTER['workers']``), so even when every worker is sending a
+campaign batch at once the combined rate stays under the SES limit.
+"""
+
+import logging
+import threading
+import time
+
+from botocore.exceptions import BotoCoreError, ClientError
+from django.conf import settings
+
+from integrations.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# SES production accounts start at 14 messages/second.
+DEFAULT_MAX_SEND_RATE = 14.0
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second.
+
+    ``acquire(n)`` takes ``n`` tokens, sleeping first when the bucket
+    would go into debt. ``n`` may exceed ``capacity`` (a 50-destination
+    bulk call against a 14/s bucket): the caller then waits for the whole
+    deficit, which keeps the long-run rate at ``rate``.
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def set_rate(self, rate):
+        """Change the refill rate (and capacity) in place."""
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        with self._lock:
+            self.rate = float(rate)
+            self.capacity = float(rate)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def acquire(self, n=1):
+        """Take ``n`` tokens; return the number of seconds slept."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+            self._updated_at = now
+            self._tokens -= n
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def _coerce_rate(raw):
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+def _account_send_rate(service):
+    """Return ``MaxSendRate`` from SES, or ``None`` when unavailable."""
+    if not getattr(settings, 'SES_ENABLED', False):
+        return None
+    try:
+        account = service.ses_client.get_account()
+    except (BotoCoreError, ClientError):
+        logger.warning('Could not read SES send quota; using default rate')
+        return None
+    return _coerce_rate(account.get('SendQuota', {}).get('MaxSendRate'))
+
+
+def resolve_send_rate(service):
+    """Return this process's share of the SES send rate (messages/sec)."""
+    rate = (
+        _coerce_rate(get_config('SES_MAX_SEND_RATE', ''))
+        or _account_send_rate(service)
+        or DEFAULT_MAX_SEND_RATE
+    )
+    workers = max(int(settings.Q_CLUSTER.get('workers', 1) or 1), 1)
+    return rate / workers
+
+
+def get_send_rate_limiter(service):
+    """Return the process-wide SES token bucket at the current rate."""
+    global _limiter
+    rate = resolve_send_rate(service)
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = TokenBucket(rate)
+        elif _limiter.rate != rate:
+            _limiter.set_rate(rate)
+        limiter = _limiter
+    logger.info('SES send pacing at %.2f messages/second', rate)
+    return limiter
+
+
+def reset_send_rate_limiter():
+    """Forget the shared bucket so the next send re-resolves the rate."""
+    global _limiter
+    with _limiter_lock:
+        _limiter = None
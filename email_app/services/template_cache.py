@@ -0,0 +1,89 @@
+"""Per-process cache of compiled email templates.
+
+``EmailService`` used to query ``EmailTemplateOverride`` (falling back to
+``frontmatter.load`` on the ``.md`` file), build fresh ``Template`` objects
+for the subject and body, and run the markdown renderer on every send. In a
+notification fan-out or an event reminder batch that is the same work
+repeated once per recipient.
+
+``CompiledTemplateCache`` keeps one ``CompiledEmailTemplate`` per template
+name together with the version it was built from: the override row's
+``updated_at``, or the file's mtime when no override exists. The caller
+passes the current version on every lookup, so an override saved, edited or
+deleted in another process is picked up on the next send. The
+``EmailTemplateOverride`` save/delete signals also drop the entry in the
+saving process (``email_app.signals``).
+
+When the body contains no template variables or tags, its markdown HTML is
+the same for every recipient and is rendered once, at compile time.
+"""
+
+import threading
+from dataclasses import dataclass
+
+from django.template import Template
+from django.template.base import TextNode
+
+from content.utils.markdown import render_email_markdown
+
+
+@dataclass(frozen=True)
+class CompiledEmailTemplate:
+    """Parsed template source plus its compiled Django templates."""
+
+    subject: Template
+    body: Template
+    footer_note: str
+    # Rendered markdown for bodies without per-recipient variables,
+    # otherwise ``None``.
+    static_body_html: str | None
+
+
+def compile_email_template(subject_source, body_source, footer_note):
+    """Compile template source into a ``CompiledEmailTemplate``."""
+    body = Template(body_source)
+    static_body_html = None
+    if all(isinstance(node, TextNode) for node in body.nodelist):
+        static_body_html = render_email_markdown(body_source)
+    return CompiledEmailTemplate(
+        subject=Template(subject_source),
+        body=body,
+        footer_note=footer_note,
+        static_body_html=static_body_html,
+    )
+
+
+class CompiledTemplateCache:
+    """Map of template name -> ``(version, CompiledEmailTemplate)``."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, template_name, version, load_source):
+        """Return the compiled template for ``template_name`` at ``version``.
+
+        ``load_source()`` returns ``(subject, body_markdown, footer_note)``
+        and is only called when the cached entry is missing or was built
+        from a different version.
+        """
+        with self._lock:
+            entry = self._entries.get(template_name)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        compiled = compile_email_template(*load_source())
+        with self._lock:
+            self._entries[template_name] = (version, compiled)
+        return compiled
+
+    def discard(self, template_name):
+        with self._lock:
+            self._entries.pop(template_name, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+compiled_templates = CompiledTemplateCache()
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from email_app.models import EmailTemplateOverride
+from email_app.services.template_cache import compiled_templates
+
+
+@receiver(
+    post_save,
+    sender=EmailTemplateOverride,
+    dispatch_uid='email_app.discard_compiled_template_on_save',
+)
+@receiver(
+    post_delete,
+    sender=EmailTemplateOverride,
+    dispatch_uid='email_app.discard_compiled_template_on_delete',
+)
+def discard_compiled_template(instance, **kwargs):
+    compiled_templates.discard(instance.template_name)
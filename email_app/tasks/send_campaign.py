@@ -7,6 +7,13 @@ django-q ``Q_CLUSTER['timeout']`` (300s) ceiling, lets multiple workers
 send in parallel, and isolates failures: if one chunk dies, the rest
 finish independently and only the failed chunk needs retry.
 
+Each batch sends through SES ``SendBulkEmail``: the email chrome and
+markdown body are rendered once, and up to 50 recipients share one API
+call with their unsubscribe / verify-email URLs substituted by SES.
+Calls are paced by a per-process token bucket sized from the account's
+SES send rate, and the EmailLog rows for each call are written with one
+``bulk_create``.
+
 Per-recipient idempotency is enforced two ways:
 - A partial unique constraint on EmailLog(campaign, user) where
   campaign IS NOT NULL makes accidental double-sends a database error.
@@ -14,42 +21,61 @@ Per-recipient idempotency is enforced two ways:
   so a retried chunk does not even attempt to send to recipients that
   earlier attempts already reached.
 
+Progress is persisted on the campaign row: fan-out snapshots
+``expected_recipients`` and ``batch_count``, and each batch bumps
+``sent_count`` / ``batches_completed`` atomically. Completion is a
+conditional single-row UPDATE; the audience is only re-checked when
+every batch has reported and the count is still short of the snapshot.
+The Studio campaign page reads the same counters for its progress
+display.
+
 Usage:
     from jobs.tasks import async_task
     async_task('email_app.tasks.send_campaign.send_campaign', campaign_id=42)
 """
 
 import logging
-import time
 from datetime import timedelta
 
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError, transaction
+from django.db.models import F
 from django.template.loader import render_to_string
 from django.utils import timezone
 
 from content.utils.markdown import render_email_markdown
 from email_app.models import EmailCampaign, EmailLog
-from email_app.services.email_service import EmailService, EmailServiceError
+from email_app.services.email_service import (
+    SES_BULK_MAX_DESTINATIONS,
+    EmailService,
+    EmailServiceError,
+)
+from email_app.services.send_rate import get_send_rate_limiter
 from integrations.config import get_config
 
 logger = logging.getLogger(__name__)
 
-# Delay between emails in seconds to respect SES sending rate limits.
-DEFAULT_SEND_DELAY = 0.05  # 50ms
+# SES template variables filled per recipient in bulk sends.
+UNSUBSCRIBE_PLACEHOLDER = 'unsubscribe_url'
+VERIFY_PLACEHOLDER = 'verify_email_url'
 
 # Default chunk size if EMAIL_BATCH_SIZE is not configured at runtime.
 DEFAULT_BATCH_SIZE = 200
 
-# Default spacing between fan-out batches in seconds. Batches are
-# scheduled at now + index * interval so they do not all fire at once
-# and burst past the SES send-rate limit (issue #922). Tunable in
-# Studio settings via CAMPAIGN_BATCH_INTERVAL_SECONDS.
-DEFAULT_BATCH_INTERVAL_SECONDS = 60
+# Default spacing between fan-out batches in seconds. The per-process
+# token bucket already holds every worker under its share of the SES
+# send rate, so batches are enqueued together by default; a fixed
+# stagger only stretched large campaigns (25 batches of 200 took ~24
+# minutes at 60s). CAMPAIGN_BATCH_INTERVAL_SECONDS in Studio settings
+# still spreads batch i to now + index * interval when set (issue #922).
+DEFAULT_BATCH_INTERVAL_SECONDS = 0
+
 
+def get_batch_size():
+    """Return a positive runtime batch size, falling back safely.
 
-def _get_batch_size():
-    """Return a positive runtime batch size, falling back safely."""
+    Also sizes the content-email fan-out
+    (``notifications.tasks.content_email``).
+    """
     raw = get_config('EMAIL_BATCH_SIZE', DEFAULT_BATCH_SIZE)
     try:
         value = int(raw)
@@ -68,10 +94,10 @@ def _get_batch_interval_seconds():
 
     Resolves CAMPAIGN_BATCH_INTERVAL_SECONDS through ``get_config`` (DB
     override -> env -> Django settings -> default), so an operator can
-    tune the SES burst protection from Studio without a redeploy. The
-    value arrives as a string from env / DB overrides, so we coerce
-    defensively. A negative value is clamped to 0 (all batches fire
-    immediately); 0 is a valid value meaning "no stagger".
+    add a stagger from Studio without a redeploy. The value arrives as a
+    string from env / DB overrides, so we coerce defensively. A negative
+    value is clamped to 0; 0 (the default) means "no stagger": every
+    batch fires immediately and the token bucket paces the sends.
     """
     raw = get_config(
         'CAMPAIGN_BATCH_INTERVAL_SECONDS', DEFAULT_BATCH_INTERVAL_SECONDS,
@@ -127,7 +153,7 @@ def send_campaign(campaign_id, batch_size=None):
         )
 
     if batch_size is None:
-        batch_size = _get_batch_size()
+        batch_size = get_batch_size()
 
     # Materialize the recipient ID list so chunks have a stable view of
     # the audience even if users are added/changed mid-send.
@@ -136,13 +162,26 @@ def send_campaign(campaign_id, batch_size=None):
     )
     total = len(user_ids)
 
+    chunks = list(_chunk(user_ids, batch_size))
+
     # Transition to sending before enqueuing chunks. This is the
-    # single place where status moves from draft -> sending.
+    # single place where status moves from draft -> sending. The
+    # progress snapshot taken here is what batches advance and what
+    # completion is checked against. sent_count starts from the
+    # recipients a previous attempt already logged: batches skip them,
+    # so they would otherwise never be counted.
     campaign.status = 'sending'
-    # Reset sent_count so a retried draft starts from a clean baseline
-    # (idempotency on EmailLog still prevents double-sends).
-    campaign.sent_count = 0
-    campaign.save(update_fields=['status', 'sent_count'])
+    campaign.sent_count = EmailLog.objects.filter(
+        campaign=campaign,
+        user__in=campaign.get_eligible_recipients(),
+    ).count()
+    campaign.expected_recipients = total
+    campaign.batch_count = len(chunks)
+    campaign.batches_completed = 0
+    campaign.save(update_fields=[
+        'status', 'sent_count', 'expected_recipients', 'batch_count',
+        'batches_completed',
+    ])
 
     if total == 0:
         # No recipients: mark sent immediately and bail.
@@ -160,18 +199,17 @@ def send_campaign(campaign_id, batch_size=None):
             'status': 'sent',
         }
 
-    chunks = list(_chunk(user_ids, batch_size))
     # Imported lazily: jobs.tasks pulls in django-q, which has heavy
     # side-effects at import time, and tests patch by path.
     from django_q.models import Schedule
 
     from jobs.tasks import build_task_name
 
-    # Stagger the batches so they do not all fire at once and burst past
-    # the SES send-rate limit (issue #922). Batch i is scheduled to run
-    # at now + i * interval; the first batch (i=0) runs immediately. Each
-    # batch is a one-off (Schedule.ONCE) future-dated Schedule row, which
-    # shows up as a pending future task in Studio. We mirror
+    # Batch i is scheduled to run at now + i * interval (issue #922); with
+    # the default interval of 0 every batch runs immediately and the SES
+    # token bucket paces the sends. Each batch is a one-off
+    # (Schedule.ONCE) Schedule row, which shows up as a pending task in
+    # Studio. We mirror
     # jobs.tasks.helpers.schedule() / queue_imported_welcome_emails() by
     # injecting q_options.task_name so each fired Task lands a descriptive
     # name (relates to #920) instead of a Django-Q random codename.
@@ -213,19 +251,166 @@ def send_campaign(campaign_id, batch_size=None):
     }
 
 
-def send_campaign_batch(campaign_id, user_ids, send_delay=None):
+def _render_bulk_template(campaign, body_html, with_verify_footer):
+    """Render the campaign chrome once with SES template placeholders.
+
+    Returns ``None`` when the campaign's own subject or body contains
+    ``{{`` / ``}}``: SES would treat those as template syntax, so such a
+    campaign is sent per recipient instead.
+    """
+    html = render_to_string('email_app/base_email.html', {
+        'subject': campaign.subject,
+        'body_html': body_html,
+        'unsubscribe_url': '{{%s}}' % UNSUBSCRIBE_PLACEHOLDER,
+        'verify_email_url': (
+            '{{%s}}' % VERIFY_PLACEHOLDER if with_verify_footer else None
+        ),
+    })
+    stripped = html.replace('{{%s}}' % UNSUBSCRIBE_PLACEHOLDER, '').replace(
+        '{{%s}}' % VERIFY_PLACEHOLDER, '',
+    )
+    if any(marker in text for text in (stripped, campaign.subject)
+           for marker in ('{{', '}}')):
+        return None
+    return html
+
+
+def _log_rows(campaign, sent):
+    """Build unsaved EmailLog rows for ``(user, ses_message_id)`` pairs."""
+    return [
+        EmailLog(
+            campaign=campaign,
+            user=user,
+            recipient_email=user.email,
+            email_type='campaign',
+            subject=campaign.subject,
+            ses_message_id=ses_message_id,
+        )
+        for user, ses_message_id in sent
+    ]
+
+
+def _save_logs(campaign, sent):
+    """Persist one EmailLog per delivered recipient in a single INSERT.
+
+    Called after every SES call, so a worker that dies mid-batch keeps
+    the logs for recipients SES already accepted and a retry skips them.
+    ``ignore_conflicts`` turns a concurrent task's duplicate (campaign,
+    user) row into a no-op instead of failing the whole insert.
+
+    Returns the number of rows this call inserted. A duplicate batch
+    running alongside may have logged some of the same users first, so
+    a recipient only counts when its stored row carries the ``sent_at``
+    this call stamped on it. SES message ids can't tell the rows apart:
+    with SES disabled every send returns the same placeholder id.
+    """
+    if not sent:
+        return 0
+    rows = EmailLog.objects.bulk_create(
+        _log_rows(campaign, sent), ignore_conflicts=True,
+    )
+    ours = {(row.user_id, row.sent_at) for row in rows}
+    logged = EmailLog.objects.filter(
+        campaign=campaign, user_id__in=[user.pk for user, _ in sent],
+    ).values_list('user_id', 'sent_at')
+    return sum(1 for row in logged if row in ours)
+
+
+def _send_bulk(service, limiter, campaign, recipients, html_template):
+    """Send to ``recipients`` in SendBulkEmail calls of up to 50 each.
+
+    ``recipients`` is a list of ``(user, unsubscribe_url,
+    verify_email_url)``. Returns the number of recipients SES accepted.
+    """
+    sent_count = 0
+    for chunk in _chunk(recipients, SES_BULK_MAX_DESTINATIONS):
+        entries = []
+        for user, unsubscribe_url, verify_email_url in chunk:
+            template_data = {UNSUBSCRIBE_PLACEHOLDER: unsubscribe_url}
+            if verify_email_url:
+                template_data[VERIFY_PLACEHOLDER] = verify_email_url
+            entries.append({
+                'to_email': user.email,
+                'template_data': template_data,
+                'unsubscribe_url': unsubscribe_url,
+            })
+
+        limiter.acquire(len(entries))
+        try:
+            results = service._send_ses_bulk(
+                campaign.subject,
+                html_template,
+                entries,
+                email_type='campaign',
+            )
+        except EmailServiceError:
+            logger.exception(
+                "Failed bulk send of campaign %s to %d recipients",
+                campaign.pk, len(entries),
+            )
+            # Continue with the remaining chunks in this batch.
+            continue
+
+        sent = []
+        for (user, _unsub, _verify), (ses_message_id, error) in zip(
+            chunk, results,
+        ):
+            if ses_message_id is None:
+                logger.error(
+                    "Failed to send campaign %s to %s: %s",
+                    campaign.pk, user.email, error,
+                )
+                continue
+            sent.append((user, ses_message_id))
+        sent_count += _save_logs(campaign, sent)
+    return sent_count
+
+
+def _send_individually(service, limiter, campaign, recipients, body_html):
+    """Per-recipient fallback for campaigns that cannot be templated."""
+    sent = []
+    for user, unsubscribe_url, verify_email_url in recipients:
+        full_html = render_to_string('email_app/base_email.html', {
+            'subject': campaign.subject,
+            'body_html': body_html,
+            'unsubscribe_url': unsubscribe_url,
+            'verify_email_url': verify_email_url,
+        })
+        limiter.acquire(1)
+        try:
+            ses_message_id = service._send_ses(
+                user.email,
+                campaign.subject,
+                full_html,
+                email_type='campaign',
+                unsubscribe_url=unsubscribe_url,
+            )
+        except EmailServiceError:
+            logger.exception(
+                "Failed to send campaign %s to %s",
+                campaign.pk, user.email,
+            )
+            # Continue sending to remaining recipients in this batch.
+            continue
+        sent.append((user, ses_message_id))
+    return _save_logs(campaign, sent)
+
+
+def send_campaign_batch(campaign_id, user_ids):
     """Send a single chunk of a campaign to the given user IDs.
 
     Skips users that already have an EmailLog for this campaign
-    (idempotency for retries). After processing, checks whether the
-    campaign's total successful sends covers the entire eligible
-    audience and, if so, transitions the campaign to 'sent'.
+    (idempotency for retries). Recipients go out through SES
+    ``SendBulkEmail`` in calls of up to 50 destinations, with the
+    unsubscribe and verify-email URLs filled in per recipient, paced by
+    the process-wide SES token bucket (``email_app.services.send_rate``).
+    After processing, adds this batch's new sends to the campaign's
+    progress counters and transitions the campaign to 'sent' once every
+    recipient snapshotted at fan-out is logged or no longer eligible.
 
     Args:
         campaign_id: Primary key of the EmailCampaign to send.
         user_ids: List of user PKs to attempt to send to in this batch.
-        send_delay: Delay in seconds between sends. Defaults to
-            ``DEFAULT_SEND_DELAY`` (0.05s). Set to 0 in tests for speed.
 
     Returns:
         dict with campaign_id, batch_size, sent_count, skipped_count.
@@ -233,9 +418,6 @@ def send_campaign_batch(campaign_id, user_ids, send_delay=None):
     Raises:
         ValueError: If campaign not found.
     """
-    if send_delay is None:
-        send_delay = DEFAULT_SEND_DELAY
-
     try:
         campaign = EmailCampaign.objects.get(pk=campaign_id)
     except EmailCampaign.DoesNotExist:
@@ -255,7 +437,7 @@ def send_campaign_batch(campaign_id, user_ids, send_delay=None):
     pending_ids = [uid for uid in user_ids if uid not in already_sent_ids]
     skipped = len(already_sent_ids)
 
-    users = list(User.objects.filter(pk__in=pending_ids))
+    users = list(User.objects.filter(pk__in=pending_ids).order_by('pk'))
 
     logger.info(
         "Campaign %s batch starting: %d to send, %d skipped (already sent)",
@@ -263,78 +445,51 @@ def send_campaign_batch(campaign_id, user_ids, send_delay=None):
     )
 
     service = EmailService()
-    sent_count = 0
+    limiter = get_send_rate_limiter(service)
     # Pre-render markdown body once per batch — it does not change
     # across recipients within a campaign.
     body_html = render_email_markdown(campaign.body)
 
+    # Issue #450: per-recipient verify-email footer CTA. The ``users``
+    # list is freshly fetched from the DB above so the ``email_verified``
+    # flag reflects the SEND-time value, not whatever it was when the
+    # campaign was enqueued. This mirrors how ``unsubscribed`` is handled
+    # — the latest DB state wins, even if the user verified after enqueue.
+    # Recipients are grouped by whether the footer renders, because the
+    # footer block is part of the shared template.
+    groups = {False: [], True: []}
     for user in users:
-        try:
-            unsubscribe_url = service._build_unsubscribe_url(user)
-
-            # Issue #450: per-recipient verify-email footer CTA. The
-            # ``users`` list is freshly fetched from the DB above
-            # (``User.objects.filter(pk__in=pending_ids)``) so the
-            # ``email_verified`` flag reflects the SEND-time value, not
-            # whatever it was when the campaign was enqueued. This
-            # mirrors how ``unsubscribed`` is handled — the latest DB
-            # state wins, even if the user verified after enqueue.
-            verify_email_url = None
-            if service._should_include_verify_footer(user, 'campaign'):
-                verify_email_url = service._build_verify_email_url(user)
-
-            full_html = render_to_string('email_app/base_email.html', {
-                'subject': campaign.subject,
-                'body_html': body_html,
-                'unsubscribe_url': unsubscribe_url,
-                'verify_email_url': verify_email_url,
-            })
+        verify_email_url = None
+        if service._should_include_verify_footer(user, 'campaign'):
+            verify_email_url = service._build_verify_email_url(user)
+        groups[verify_email_url is not None].append(
+            (user, service._build_unsubscribe_url(user), verify_email_url),
+        )
 
-            ses_message_id = service._send_ses(
-                user.email,
-                campaign.subject,
-                full_html,
-                email_type='campaign',
-                unsubscribe_url=unsubscribe_url,
+    sent_count = 0
+    for with_verify_footer, recipients in groups.items():
+        if not recipients:
+            continue
+        html_template = _render_bulk_template(
+            campaign, body_html, with_verify_footer,
+        )
+        if html_template is None:
+            sent_count += _send_individually(
+                service, limiter, campaign, recipients, body_html,
             )
-
-            try:
-                with transaction.atomic():
-                    EmailLog.objects.create(
-                        campaign=campaign,
-                        user=user,
-                        recipient_email=user.email,
-                        email_type='campaign',
-                        subject=campaign.subject,
-                        ses_message_id=ses_message_id,
-                    )
-            except IntegrityError:
-                # A concurrent task already created the log for this
-                # (campaign, user). Treat as a no-op rather than a
-                # failure so the chunk continues cleanly.
-                logger.warning(
-                    "Duplicate EmailLog for campaign %s user %s; skipping",
-                    campaign_id, user.pk,
-                )
-                continue
-
-            sent_count += 1
-
-        except EmailServiceError:
-            logger.exception(
-                "Failed to send campaign %s to %s",
-                campaign_id, user.email,
+        else:
+            sent_count += _send_bulk(
+                service, limiter, campaign, recipients, html_template,
             )
-            # Continue sending to remaining recipients in this batch.
-            continue
 
-        if send_delay > 0:
-            time.sleep(send_delay)
-
-    # Update aggregate sent_count and check for completion. We
-    # recompute from EmailLog (the source of truth) instead of
-    # incrementing a counter, so concurrent batches converge correctly.
-    _refresh_campaign_status(campaign)
+    if campaign.has_send_progress:
+        # sent_count is the EmailLog rows this batch inserted (see
+        # _save_logs), not the SES acceptances.
+        _record_batch_progress(campaign, sent_count)
+    else:
+        # Fanned out before progress tracking existed: fall back to the
+        # full recount.
+        _refresh_campaign_status(campaign)
 
     logger.info(
         "Campaign %s batch complete: %d sent, %d skipped",
@@ -349,13 +504,63 @@ def send_campaign_batch(campaign_id, user_ids, send_delay=None):
     }
 
 
+def _record_batch_progress(campaign, newly_logged):
+    """Advance the campaign's progress counters and detect completion.
+
+    The counters move with F() expressions so concurrent batches never
+    lose an increment. The campaign is done once ``sent_count`` reaches
+    the audience snapshotted at fan-out. A recipient deleted after
+    fan-out is never logged, so once every batch has reported and the
+    count is still short, the audience is checked instead: the campaign
+    is done when no eligible recipient is left without an EmailLog.
+    Recipients whose send failed stay eligible and unlogged, leaving the
+    campaign in 'sending' until a retried batch reaches them, as before.
+    The status flip is conditional on ``status='sending'``, so exactly
+    one batch marks the campaign sent.
+    """
+    EmailCampaign.objects.filter(pk=campaign.pk).update(
+        sent_count=F('sent_count') + newly_logged,
+        batches_completed=F('batches_completed') + 1,
+    )
+    progress = EmailCampaign.objects.filter(
+        pk=campaign.pk, status='sending',
+    ).values(
+        'sent_count', 'expected_recipients', 'batches_completed',
+        'batch_count',
+    ).first()
+    if progress is None:
+        return
+    if progress['sent_count'] < progress['expected_recipients']:
+        if progress['batches_completed'] < progress['batch_count']:
+            return
+        if _has_unlogged_recipients(campaign):
+            return
+    completed = EmailCampaign.objects.filter(
+        pk=campaign.pk, status='sending',
+    ).update(status='sent', sent_at=timezone.now())
+    if completed:
+        logger.info(
+            "Campaign %s complete: %d/%d recipients sent",
+            campaign.pk, progress['sent_count'],
+            progress['expected_recipients'],
+        )
+
+
+def _has_unlogged_recipients(campaign):
+    """Return True iff an eligible recipient has no EmailLog yet."""
+    return campaign.get_eligible_recipients().exclude(
+        pk__in=EmailLog.objects.filter(campaign=campaign).values('user_id'),
+    ).exists()
+
+
 def _refresh_campaign_status(campaign):
     """Recompute aggregate sent_count and flip status to 'sent' when
     every eligible recipient has an EmailLog (or, more precisely, when
     no eligible recipient is still pending).
 
-    Called after each chunk finishes; the last chunk to finish is the
-    one that flips the status. Safe to call concurrently — the
+    Only used for campaigns fanned out before progress tracking
+    (``batch_count == 0``); it re-evaluates the whole audience, which
+    ``_record_batch_progress`` avoids. Safe to call concurrently — the
     eligible-but-unlogged check is monotonic.
     """
     eligible_ids = set(
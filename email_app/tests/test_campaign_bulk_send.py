@@ -0,0 +1,328 @@
+"""Tests for the SES bulk campaign send engine.
+
+``FakeSESClient`` stands in for the boto3 ``sesv2`` client: it records
+every ``send_bulk_email`` / ``send_email`` call, renders the inline
+template for each destination the way SES does, and can be told to
+reject particular addresses or fail whole calls.
+"""
+
+import json
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from email_app.models import EmailCampaign, EmailLog
+from email_app.services import send_rate
+from email_app.services.send_rate import TokenBucket, resolve_send_rate
+from email_app.tasks.send_campaign import send_campaign_batch
+from integrations.config import clear_config_cache
+from tests.fixtures import TierSetupMixin
+
+User = get_user_model()
+
+
+class FakeSESClient:
+    """In-memory SES v2 stub recording sends and rendered messages."""
+
+    def __init__(self, max_send_rate=14.0, reject=(), fail_calls=()):
+        self.max_send_rate = max_send_rate
+        self.reject = set(reject)
+        self.fail_calls = set(fail_calls)
+        self.bulk_calls = []
+        self.single_calls = []
+        self.delivered = {}
+        self._next_id = 0
+
+    def _message_id(self):
+        self._next_id += 1
+        return f'fake-ses-{self._next_id}'
+
+    def get_account(self):
+        return {'SendQuota': {'MaxSendRate': self.max_send_rate}}
+
+    def send_bulk_email(self, **kwargs):
+        call_index = len(self.bulk_calls)
+        self.bulk_calls.append(kwargs)
+        if call_index in self.fail_calls:
+            raise ClientError(
+                {'Error': {'Code': 'Throttling', 'Message': 'Rate exceeded'}},
+                'SendBulkEmail',
+            )
+        template = kwargs['DefaultContent']['Template']['TemplateContent']
+        results = []
+        for entry in kwargs['BulkEmailEntries']:
+            (to_email,) = entry['Destination']['ToAddresses']
+            if to_email in self.reject:
+                results.append({
+                    'Status': 'MESSAGE_REJECTED',
+                    'Error': 'Email address is not verified.',
+                })
+                continue
+            data = json.loads(
+                entry['ReplacementEmailContent']['ReplacementTemplate'][
+                    'ReplacementTemplateData'
+                ],
+            )
+            html = template['Html']
+            for name, value in data.items():
+                html = html.replace('{{%s}}' % name, value)
+            self.delivered[to_email] = {
+                'subject': template['Subject'],
+                'html': html,
+                'headers': entry.get('ReplacementHeaders', []),
+            }
+            results.append({'Status': 'SUCCESS', 'MessageId': self._message_id()})
+        return {'BulkEmailEntryResults': results}
+
+    def send_email(self, **kwargs):
+        self.single_calls.append(kwargs)
+        (to_email,) = kwargs['Destination']['ToAddresses']
+        self.delivered[to_email] = {
+            'subject': kwargs['Content']['Simple']['Subject']['Data'],
+            'html': kwargs['Content']['Simple']['Body']['Html']['Data'],
+            'headers': kwargs['Content']['Simple'].get('Headers', []),
+        }
+        return {'MessageId': self._message_id()}
+
+
+class RecordingBucket(TokenBucket):
+    """Token bucket on a fake clock that records sleeps instead of sleeping."""
+
+    def __init__(self, rate):
+        self.now = 0.0
+        self.slept = []
+        self.acquired = []
+        super().__init__(rate, clock=lambda: self.now, sleep=self._sleep_for)
+
+    def _sleep_for(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+    def acquire(self, n=1):
+        self.acquired.append(n)
+        return super().acquire(n)
+
+
+class TokenBucketTest(TestCase):
+    def test_burst_within_capacity_does_not_sleep(self):
+        bucket = RecordingBucket(rate=10)
+
+        bucket.acquire(10)
+
+        self.assertEqual(bucket.slept, [])
+
+    def test_request_larger_than_capacity_waits_for_deficit(self):
+        bucket = RecordingBucket(rate=10)
+
+        bucket.acquire(50)
+
+        self.assertEqual(bucket.slept, [4.0])
+
+    def test_long_run_rate_matches_configured_rate(self):
+        bucket = RecordingBucket(rate=14)
+
+        for _ in range(10):
+            bucket.acquire(50)
+
+        # 500 messages at 14/s with a 14-token initial burst.
+        self.assertAlmostEqual(bucket.now, (500 - 14) / 14)
+
+    def test_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+
+class ResolveSendRateTest(TestCase):
+    def setUp(self):
+        clear_config_cache()
+        self.addCleanup(clear_config_cache)
+        self.addCleanup(send_rate.reset_send_rate_limiter)
+
+    @override_settings(SES_MAX_SEND_RATE='40', Q_CLUSTER={'workers': 4})
+    def test_configured_rate_is_split_across_workers(self):
+        self.assertEqual(resolve_send_rate(None), 10)
+
+    @override_settings(SES_ENABLED=True, Q_CLUSTER={'workers': 2})
+    def test_account_quota_used_when_not_configured(self):
+        with patch('email_app.services.email_service.boto3') as mock_boto3:
+            mock_boto3.client.return_value = FakeSESClient(max_send_rate=50)
+            from email_app.services.email_service import EmailService
+
+            self.assertEqual(resolve_send_rate(EmailService()), 25)
+
+    @override_settings(SES_MAX_SEND_RATE='nonsense', Q_CLUSTER={'workers': 1})
+    def test_invalid_override_falls_back_to_default(self):
+        self.assertEqual(resolve_send_rate(None), send_rate.DEFAULT_MAX_SEND_RATE)
+
+
+@override_settings(SES_ENABLED=True)
+class BulkCampaignSendTest(TierSetupMixin, TestCase):
+    def setUp(self):
+        clear_config_cache()
+        self.addCleanup(clear_config_cache)
+        self.campaign = EmailCampaign.objects.create(
+            subject='Launch week',
+            body='# Hello\n\nWe shipped.',
+            target_min_level=0,
+            status='sending',
+        )
+        self.fake_ses = FakeSESClient()
+        boto_patch = patch('email_app.services.email_service.boto3')
+        mock_boto3 = boto_patch.start()
+        mock_boto3.client.return_value = self.fake_ses
+        self.addCleanup(boto_patch.stop)
+        self.bucket = RecordingBucket(rate=14)
+        limiter_patch = patch(
+            'email_app.tasks.send_campaign.get_send_rate_limiter',
+            return_value=self.bucket,
+        )
+        limiter_patch.start()
+        self.addCleanup(limiter_patch.stop)
+
+    def _users(self, count, **kwargs):
+        kwargs.setdefault('email_verified', True)
+        return [
+            User.objects.create_user(
+                email=f'bulk{i}@test.com', tier=self.free_tier,
+                unsubscribed=False, **kwargs,
+            )
+            for i in range(count)
+        ]
+
+    def test_recipients_sent_in_calls_of_fifty(self):
+        users = self._users(120)
+
+        result = send_campaign_batch(
+            self.campaign.pk, user_ids=[u.pk for u in users],
+        )
+
+        self.assertEqual(result['sent_count'], 120)
+        self.assertEqual(
+            [len(c['BulkEmailEntries']) for c in self.fake_ses.bulk_calls],
+            [50, 50, 20],
+        )
+        self.assertEqual(self.fake_ses.single_calls, [])
+        self.assertEqual(self.bucket.acquired, [50, 50, 20])
+        self.assertEqual(
+            EmailLog.objects.filter(
+                campaign=self.campaign, email_type='campaign',
+            ).count(),
+            120,
+        )
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.sent_count, 120)
+
+    def test_email_logs_written_with_one_insert_per_call(self):
+        users = self._users(3)
+
+        with patch.object(
+            EmailLog.objects, 'bulk_create', wraps=EmailLog.objects.bulk_create,
+        ) as bulk_create:
+            send_campaign_batch(self.campaign.pk, user_ids=[u.pk for u in users])
+
+        self.assertEqual(bulk_create.call_count, 1)
+        log = EmailLog.objects.get(campaign=self.campaign, user=users[0])
+        self.assertEqual(log.recipient_email, users[0].email)
+        self.assertEqual(log.subject, 'Launch week')
+        self.assertTrue(log.ses_message_id.startswith('fake-ses-'))
+
+    def test_each_recipient_gets_own_unsubscribe_link_and_headers(self):
+        users = self._users(2)
+
+        send_campaign_batch(self.campaign.pk, user_ids=[u.pk for u in users])
+
+        first = self.fake_ses.delivered['bulk0@test.com']
+        second = self.fake_ses.delivered['bulk1@test.com']
+        self.assertIn('<p>We shipped.</p>', first['html'])
+        self.assertIn('/api/unsubscribe?token=', first['html'])
+        self.assertNotIn('{{', first['html'])
+        self.assertNotEqual(first['html'], second['html'])
+        header_names = {h['Name'] for h in first['headers']}
+        self.assertEqual(
+            header_names, {'List-Unsubscribe', 'List-Unsubscribe-Post'},
+        )
+
+    def test_unverified_recipients_get_verify_footer(self):
+        verified = self._users(1)[0]
+        unverified = User.objects.create_user(
+            email='unverified@test.com', tier=self.free_tier,
+            email_verified=False, unsubscribed=False,
+        )
+
+        send_campaign_batch(
+            self.campaign.pk, user_ids=[verified.pk, unverified.pk],
+        )
+
+        self.assertEqual(len(self.fake_ses.bulk_calls), 2)
+        self.assertIn(
+            '/api/verify-email?token=',
+            self.fake_ses.delivered['unverified@test.com']['html'],
+        )
+        self.assertNotIn(
+            '/api/verify-email',
+            self.fake_ses.delivered['bulk0@test.com']['html'],
+        )
+
+    def test_rejected_destination_not_logged(self):
+        users = self._users(3)
+        self.fake_ses.reject = {'bulk1@test.com'}
+
+        with self.assertLogs('email_app.tasks.send_campaign', 'ERROR') as logs:
+            result = send_campaign_batch(
+                self.campaign.pk, user_ids=[u.pk for u in users],
+            )
+
+        self.assertEqual(result['sent_count'], 2)
+        self.assertIn('bulk1@test.com', logs.output[0])
+        self.assertFalse(
+            EmailLog.objects.filter(campaign=self.campaign, user=users[1]).exists(),
+        )
+
+    def test_failed_call_skips_only_that_chunk(self):
+        users = self._users(60)
+        self.fake_ses.fail_calls = {0}
+
+        with self.assertLogs('email_app.tasks.send_campaign', 'ERROR'):
+            result = send_campaign_batch(
+                self.campaign.pk, user_ids=[u.pk for u in users],
+            )
+
+        self.assertEqual(result['sent_count'], 10)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, 'sending')
+
+    def test_retry_after_partial_failure_sends_only_missing(self):
+        users = self._users(60)
+        user_ids = [u.pk for u in users]
+        self.fake_ses.fail_calls = {0}
+        with self.assertLogs('email_app.tasks.send_campaign', 'ERROR'):
+            send_campaign_batch(self.campaign.pk, user_ids=user_ids)
+
+        self.fake_ses.fail_calls = set()
+        result = send_campaign_batch(self.campaign.pk, user_ids=user_ids)
+
+        self.assertEqual(result['sent_count'], 50)
+        self.assertEqual(result['skipped_count'], 10)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, 'sent')
+        self.assertEqual(self.campaign.sent_count, 60)
+
+    def test_body_with_template_syntax_falls_back_to_single_sends(self):
+        self.campaign.body = 'Use `{{ variable }}` in your prompt.'
+        self.campaign.save(update_fields=['body'])
+        users = self._users(2)
+
+        result = send_campaign_batch(
+            self.campaign.pk, user_ids=[u.pk for u in users],
+        )
+
+        self.assertEqual(result['sent_count'], 2)
+        self.assertEqual(self.fake_ses.bulk_calls, [])
+        self.assertEqual(len(self.fake_ses.single_calls), 2)
+        self.assertEqual(self.bucket.acquired, [1, 1])
+        self.assertIn(
+            '{{ variable }}',
+            self.fake_ses.delivered['bulk0@test.com']['html'],
+        )
@@ -2,7 +2,7 @@
 
 Covers:
 - EmailCampaign model: TARGET_LEVEL_CHOICES, get_eligible_recipients, get_recipient_count
-- Campaign send task: status transitions, EmailLog creation, rate limiting, error handling
+- Campaign send task: status transitions, EmailLog creation, bulk SES sends, error handling
 - Admin views: list campaigns, send test email, send campaign, recipient count
 - Campaign status transitions: draft -> sending -> sent
 """
@@ -17,6 +17,7 @@ from django.utils import timezone
 
 from accounts.models import TierOverride
 from email_app.models import EmailCampaign, EmailLog
+from email_app.tests.test_campaign_bulk_send import FakeSESClient, RecordingBucket
 from email_app.tests.test_email_service import assert_no_internal_footer_text
 from integrations.config import clear_config_cache
 from integrations.models import IntegrationSetting
@@ -499,7 +500,7 @@ class SendCampaignFanOutTest(TierSetupMixin, TestCase):
 
     send_campaign queries recipients, transitions the campaign to
     'sending', and schedules one send_campaign_batch per chunk as a
-    one-off (Schedule.ONCE) future-dated Schedule row staggered by
+    one-off (Schedule.ONCE) Schedule row, optionally staggered by
     CAMPAIGN_BATCH_INTERVAL_SECONDS (issue #922). It does not send any
     emails itself, and the Schedule rows are inert in tests (the
     django-q scheduler daemon is not running), so no email goes out.
@@ -580,8 +581,8 @@ class SendCampaignFanOutTest(TierSetupMixin, TestCase):
         self.assertEqual(len(all_chunked_ids), 7)
         self.assertEqual(len(set(all_chunked_ids)), 7)
 
-    def test_send_campaign_staggers_batches_by_interval(self):
-        """Batch i is scheduled at now + i * interval; batch 0 immediate."""
+    def test_send_campaign_does_not_stagger_batches_by_default(self):
+        """Every batch is due at once; the SES token bucket paces sends."""
         for i in range(5):
             User.objects.create_user(
                 email=f'extra{i}@test.com', tier=self.free_tier,
@@ -590,7 +591,7 @@ class SendCampaignFanOutTest(TierSetupMixin, TestCase):
 
         before = timezone.now()
         from email_app.tasks.send_campaign import send_campaign
-        # Default interval is 60s; force 4 batches at batch_size=2.
+        # Force 4 batches at batch_size=2.
         send_campaign(self.campaign.pk, batch_size=2)
         after = timezone.now()
 
@@ -598,18 +599,12 @@ class SendCampaignFanOutTest(TierSetupMixin, TestCase):
         # 7 eligible users, batch_size=2 => 4 batches.
         self.assertEqual(len(schedules), 4)
 
-        # Batch 0 (earliest next_run) fires immediately: next_run is at
-        # ~now, i.e. within the window the fan-out ran.
-        first_run = schedules[0].next_run
-        self.assertGreaterEqual(first_run, before)
-        self.assertLessEqual(first_run, after)
-
-        # Each subsequent batch is offset by index * 60s from batch 0.
-        base = schedules[0].next_run
-        for index, sched in enumerate(schedules):
-            offset = (sched.next_run - base).total_seconds()
-            # Allow a small slack for the per-row creation wall-clock drift.
-            self.assertAlmostEqual(offset, index * 60, delta=2)
+        # The spread of next_run values stays within the fan-out window
+        # instead of growing by a fixed interval per batch.
+        runs = [sched.next_run for sched in schedules]
+        self.assertGreaterEqual(min(runs), before)
+        self.assertLessEqual(max(runs), after)
+        self.assertLess((max(runs) - min(runs)).total_seconds(), 2)
 
     def test_send_campaign_interval_read_from_config(self):
         """The stagger reads CAMPAIGN_BATCH_INTERVAL_SECONDS from config."""
@@ -656,7 +651,7 @@ class SendCampaignFanOutTest(TierSetupMixin, TestCase):
             self.assertLessEqual(sched.next_run, after)
 
     def test_send_campaign_unparseable_interval_falls_back_to_default(self):
-        """A non-numeric config value falls back to the 60s default."""
+        """A non-numeric config value falls back to the no-stagger default."""
         for i in range(5):
             User.objects.create_user(
                 email=f'extra{i}@test.com', tier=self.free_tier,
@@ -669,10 +664,8 @@ class SendCampaignFanOutTest(TierSetupMixin, TestCase):
 
         schedules = self._batch_schedules()
         self.assertEqual(len(schedules), 4)
-        base = schedules[0].next_run
-        for index, sched in enumerate(schedules):
-            offset = (sched.next_run - base).total_seconds()
-            self.assertAlmostEqual(offset, index * 60, delta=2)
+        runs = [sched.next_run for sched in schedules]
+        self.assertLess((max(runs) - min(runs)).total_seconds(), 2)
 
     def test_send_campaign_batch_schedule_name_is_descriptive(self):
         """Scheduled batches carry a descriptive name (relates to #920)."""
@@ -702,6 +695,33 @@ class SendCampaignFanOutTest(TierSetupMixin, TestCase):
         # sent_at is not set yet — only set when last batch finishes
         self.assertIsNone(self.campaign.sent_at)
 
+    def test_send_campaign_snapshots_send_progress(self):
+        """Fan-out records the audience size and batch count to track."""
+        from email_app.tasks.send_campaign import send_campaign
+        send_campaign(self.campaign.pk, batch_size=1)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.expected_recipients, 2)
+        self.assertEqual(self.campaign.batch_count, 2)
+        self.assertEqual(self.campaign.batches_completed, 0)
+        self.assertEqual(self.campaign.sent_count, 0)
+
+    def test_send_campaign_counts_recipients_logged_by_earlier_attempt(self):
+        """A re-sent draft starts sent_count from the existing EmailLogs."""
+        EmailLog.objects.create(
+            campaign=self.campaign,
+            user=self.user1,
+            email_type='campaign',
+            ses_message_id='earlier-attempt',
+        )
+
+        from email_app.tasks.send_campaign import send_campaign
+        send_campaign(self.campaign.pk)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.expected_recipients, 2)
+        self.assertEqual(self.campaign.sent_count, 1)
+
     def test_send_campaign_excludes_ineligible_recipients_from_chunks(self):
         """Unsubscribed/unverified users are excluded from chunked user_ids."""
         from email_app.tasks.send_campaign import send_campaign
@@ -781,7 +801,7 @@ class SendCampaignFanOutTest(TierSetupMixin, TestCase):
         self.assertEqual(result['batch_count'], 2)
 
     def test_invalid_runtime_batch_sizes_fall_back_to_200(self):
-        from email_app.tasks.send_campaign import _get_batch_size
+        from email_app.tasks.send_campaign import get_batch_size
 
         for value in ('0', '-2', 'not-a-number'):
             with self.subTest(value=value):
@@ -794,13 +814,14 @@ class SendCampaignFanOutTest(TierSetupMixin, TestCase):
                 with self.assertLogs(
                     'email_app.tasks.send_campaign', 'WARNING',
                 ):
-                    self.assertEqual(_get_batch_size(), 200)
+                    self.assertEqual(get_batch_size(), 200)
         self.addCleanup(clear_config_cache)
 
 
 @tag('core')
+@override_settings(SES_ENABLED=True)
 class SendCampaignBatchTest(TierSetupMixin, TestCase):
-    """Test the chunked send_campaign_batch task."""
+    """Test the chunked send_campaign_batch task against a fake SES."""
 
     def setUp(self):
         self.user1 = User.objects.create_user(
@@ -821,19 +842,30 @@ class SendCampaignBatchTest(TierSetupMixin, TestCase):
             target_min_level=0,
             status='sending',  # Already in sending state when batch runs
         )
+        self.fake_ses = FakeSESClient()
+        boto_patch = patch('email_app.services.email_service.boto3')
+        boto_patch.start().client.return_value = self.fake_ses
+        self.addCleanup(boto_patch.stop)
+        limiter_patch = patch(
+            'email_app.tasks.send_campaign.get_send_rate_limiter',
+            return_value=RecordingBucket(rate=14),
+        )
+        limiter_patch.start()
+        self.addCleanup(limiter_patch.stop)
+
+    def _sent_emails(self):
+        return [
+            entry['Destination']['ToAddresses'][0]
+            for call in self.fake_ses.bulk_calls
+            for entry in call['BulkEmailEntries']
+        ]
 
-    @patch('email_app.tasks.send_campaign.EmailService')
-    def test_batch_sends_to_specified_users(self, MockService):
+    def test_batch_sends_to_specified_users(self):
         """send_campaign_batch sends emails only to the given user_ids."""
-        mock_service = MockService.return_value
-        mock_service._send_ses.return_value = 'ses-msg-001'
-        mock_service._build_unsubscribe_url.return_value = 'http://example.com/unsub'
-
         from email_app.tasks.send_campaign import send_campaign_batch
         result = send_campaign_batch(
             self.campaign.pk,
             user_ids=[self.user1.pk, self.user2.pk],
-            send_delay=0,
         )
 
         self.assertEqual(result['sent_count'], 2)
@@ -843,70 +875,50 @@ class SendCampaignBatchTest(TierSetupMixin, TestCase):
         log_emails = set(logs.values_list('user__email', flat=True))
         self.assertEqual(log_emails, {'user1@test.com', 'user2@test.com'})
 
-    @patch('email_app.tasks.send_campaign.EmailService')
-    def test_batch_creates_email_logs_with_correct_fields(self, MockService):
+    def test_batch_creates_email_logs_with_correct_fields(self):
         """Each EmailLog has campaign FK, type=campaign, and SES id set."""
-        mock_service = MockService.return_value
-        mock_service._send_ses.return_value = 'ses-123'
-        mock_service._build_unsubscribe_url.return_value = 'http://example.com/unsub'
-
         from email_app.tasks.send_campaign import send_campaign_batch
         send_campaign_batch(
             self.campaign.pk,
             user_ids=[self.user1.pk, self.user2.pk],
-            send_delay=0,
         )
 
         logs = EmailLog.objects.filter(campaign=self.campaign)
         for log in logs:
             self.assertEqual(log.email_type, 'campaign')
-            self.assertEqual(log.ses_message_id, 'ses-123')
+            self.assertTrue(log.ses_message_id.startswith('fake-ses-'))
             self.assertEqual(log.campaign, self.campaign)
             self.assertEqual(log.recipient_email, log.user.email)
             self.assertEqual(log.subject, self.campaign.subject)
 
-    @patch('email_app.tasks.send_campaign.EmailService')
-    def test_batch_calls_ses_per_recipient(self, MockService):
-        """SES send is called once per user_id."""
-        mock_service = MockService.return_value
-        mock_service._send_ses.return_value = 'ses-123'
-        mock_service._build_unsubscribe_url.return_value = 'http://example.com/unsub'
-
+    def test_batch_sends_one_bulk_call_for_small_batch(self):
+        """Recipients share one SendBulkEmail call with per-recipient data."""
         from email_app.tasks.send_campaign import send_campaign_batch
         send_campaign_batch(
             self.campaign.pk,
             user_ids=[self.user1.pk, self.user2.pk],
-            send_delay=0,
         )
 
-        self.assertEqual(mock_service._send_ses.call_count, 2)
-        sent_emails = {c[0][0] for c in mock_service._send_ses.call_args_list}
-        self.assertEqual(sent_emails, {'user1@test.com', 'user2@test.com'})
-        for call in mock_service._send_ses.call_args_list:
-            self.assertEqual(call.kwargs['email_type'], 'campaign')
-            self.assertEqual(
-                call.kwargs['unsubscribe_url'],
-                'http://example.com/unsub',
+        self.assertEqual(len(self.fake_ses.bulk_calls), 1)
+        self.assertEqual(
+            set(self._sent_emails()), {'user1@test.com', 'user2@test.com'},
+        )
+        for email in ('user1@test.com', 'user2@test.com'):
+            delivered = self.fake_ses.delivered[email]
+            self.assertIn('/api/unsubscribe?token=', delivered['html'])
+            self.assertIn(
+                'List-Unsubscribe', {h['Name'] for h in delivered['headers']},
             )
 
-    @patch('email_app.tasks.send_campaign.EmailService')
-    def test_batch_continues_on_individual_failure(self, MockService):
-        """If one email fails, the rest of the batch continues."""
-        from email_app.services.email_service import EmailServiceError
-
-        mock_service = MockService.return_value
-        mock_service._build_unsubscribe_url.return_value = 'http://example.com/unsub'
-        mock_service._send_ses.side_effect = [
-            EmailServiceError('SES error'),
-            'ses-msg-002',
-        ]
+    def test_batch_continues_on_individual_failure(self):
+        """If one recipient is rejected, the rest of the batch continues."""
+        self.fake_ses.reject = {'user2@test.com'}
 
         from email_app.tasks.send_campaign import send_campaign_batch
         with self.assertLogs('email_app.tasks.send_campaign', level='ERROR') as logs:
             result = send_campaign_batch(
                 self.campaign.pk,
                 user_ids=[self.user1.pk, self.user2.pk],
-                send_delay=0,
             )
 
         self.assertEqual(result['sent_count'], 1)
@@ -918,13 +930,8 @@ class SendCampaignBatchTest(TierSetupMixin, TestCase):
             EmailLog.objects.filter(campaign=self.campaign).count(), 1,
         )
 
-    @patch('email_app.tasks.send_campaign.EmailService')
-    def test_batch_skips_users_with_existing_log(self, MockService):
+    def test_batch_skips_users_with_existing_log(self):
         """Idempotency: a retried batch skips users already logged."""
-        mock_service = MockService.return_value
-        mock_service._send_ses.return_value = 'ses-retry'
-        mock_service._build_unsubscribe_url.return_value = 'http://example.com/unsub'
-
         # Pretend user1 already received this campaign.
         EmailLog.objects.create(
             campaign=self.campaign,
@@ -937,7 +944,6 @@ class SendCampaignBatchTest(TierSetupMixin, TestCase):
         result = send_campaign_batch(
             self.campaign.pk,
             user_ids=[self.user1.pk, self.user2.pk],
-            send_delay=0,
         )
 
         # user1 skipped; user2 sent
@@ -945,9 +951,7 @@ class SendCampaignBatchTest(TierSetupMixin, TestCase):
         self.assertEqual(result['skipped_count'], 1)
 
         # SES called only for user2.
-        self.assertEqual(mock_service._send_ses.call_count, 1)
-        called_emails = {c[0][0] for c in mock_service._send_ses.call_args_list}
-        self.assertEqual(called_emails, {'user2@test.com'})
+        self.assertEqual(self._sent_emails(), ['user2@test.com'])
 
         # No duplicate EmailLog for user1.
         user1_logs = EmailLog.objects.filter(
@@ -956,36 +960,167 @@ class SendCampaignBatchTest(TierSetupMixin, TestCase):
         self.assertEqual(user1_logs.count(), 1)
         self.assertEqual(user1_logs.first().ses_message_id, 'earlier-attempt')
 
-    @patch('email_app.tasks.send_campaign.EmailService')
-    def test_last_batch_transitions_campaign_to_sent(self, MockService):
+    def test_last_batch_transitions_campaign_to_sent(self):
         """When the final batch finishes, campaign moves to 'sent'."""
-        mock_service = MockService.return_value
-        mock_service._send_ses.return_value = 'ses-final'
-        mock_service._build_unsubscribe_url.return_value = 'http://example.com/unsub'
-
         # Two batches: first one leaves user2 pending; second completes.
         from email_app.tasks.send_campaign import send_campaign_batch
-        send_campaign_batch(
-            self.campaign.pk, user_ids=[self.user1.pk], send_delay=0,
-        )
+        send_campaign_batch(self.campaign.pk, user_ids=[self.user1.pk])
         self.campaign.refresh_from_db()
         # Still sending — user2 is eligible but not yet logged.
         self.assertEqual(self.campaign.status, 'sending')
 
-        send_campaign_batch(
-            self.campaign.pk, user_ids=[self.user2.pk], send_delay=0,
+        send_campaign_batch(self.campaign.pk, user_ids=[self.user2.pk])
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, 'sent')
+        self.assertIsNotNone(self.campaign.sent_at)
+        self.assertEqual(self.campaign.sent_count, 2)
+
+    def _start_tracked_send(self, expected_recipients, batch_count):
+        EmailCampaign.objects.filter(pk=self.campaign.pk).update(
+            expected_recipients=expected_recipients,
+            batch_count=batch_count,
         )
+
+    def test_tracked_batches_advance_progress_and_complete(self):
+        """Batches bump the counters; the last one flips status to 'sent'."""
+        self._start_tracked_send(expected_recipients=2, batch_count=2)
+
+        from email_app.tasks.send_campaign import send_campaign_batch
+        send_campaign_batch(self.campaign.pk, user_ids=[self.user1.pk])
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, 'sending')
+        self.assertEqual(self.campaign.sent_count, 1)
+        self.assertEqual(self.campaign.batches_completed, 1)
+        self.assertEqual(self.campaign.progress_percent, 50)
+
+        send_campaign_batch(self.campaign.pk, user_ids=[self.user2.pk])
         self.campaign.refresh_from_db()
         self.assertEqual(self.campaign.status, 'sent')
         self.assertIsNotNone(self.campaign.sent_at)
         self.assertEqual(self.campaign.sent_count, 2)
+        self.assertEqual(self.campaign.batches_completed, 2)
+        self.assertEqual(self.campaign.progress_percent, 100)
+
+    def test_tracked_batch_does_not_re_evaluate_audience(self):
+        """Completion is checked against the snapshot, not the audience."""
+        self._start_tracked_send(expected_recipients=1, batch_count=1)
+
+        from email_app.tasks.send_campaign import send_campaign_batch
+        with patch.object(
+            EmailCampaign, 'get_eligible_recipients',
+        ) as mock_recipients:
+            send_campaign_batch(self.campaign.pk, user_ids=[self.user1.pk])
+
+        mock_recipients.assert_not_called()
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, 'sent')
+
+    def test_tracked_batch_failure_leaves_campaign_sending(self):
+        """A rejected recipient keeps sent_count short of the snapshot."""
+        self._start_tracked_send(expected_recipients=2, batch_count=1)
+        self.fake_ses.reject = {'user2@test.com'}
+
+        from email_app.tasks.send_campaign import send_campaign_batch
+        with self.assertLogs('email_app.tasks.send_campaign', level='ERROR'):
+            send_campaign_batch(
+                self.campaign.pk,
+                user_ids=[self.user1.pk, self.user2.pk],
+            )
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, 'sending')
+        self.assertEqual(self.campaign.sent_count, 1)
+
+        # Retrying the batch reaches user2 without recounting user1.
+        self.fake_ses.reject = set()
+        send_campaign_batch(
+            self.campaign.pk,
+            user_ids=[self.user1.pk, self.user2.pk],
+        )
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, 'sent')
+        self.assertEqual(self.campaign.sent_count, 2)
+        self.assertEqual(self.campaign.batches_completed, 2)
+
+    def test_recipient_deleted_after_fan_out_does_not_block_completion(self):
+        """The last batch finishes once no eligible recipient is unlogged."""
+        self._start_tracked_send(expected_recipients=2, batch_count=1)
+        user_ids = [self.user1.pk, self.user2.pk]
+        self.user2.delete()
+
+        from email_app.tasks.send_campaign import send_campaign_batch
+        send_campaign_batch(self.campaign.pk, user_ids=user_ids)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, 'sent')
+        self.assertEqual(self.campaign.sent_count, 1)
+
+    def test_overlapping_duplicate_batch_is_not_counted_twice(self):
+        """Only the rows this batch inserted advance ``sent_count``."""
+        self._start_tracked_send(expected_recipients=2, batch_count=1)
+        bulk_create = EmailLog.objects.bulk_create
+
+        def duplicate_logs_user1_first(rows, **kwargs):
+            # A duplicate of this batch logs user1 between our skip check
+            # and our insert.
+            EmailLog.objects.create(
+                campaign=self.campaign, user=self.user1,
+                recipient_email=self.user1.email, email_type='campaign',
+                subject=self.campaign.subject, ses_message_id='duplicate-batch',
+            )
+            return bulk_create(rows, **kwargs)
+
+        from email_app.tasks.send_campaign import send_campaign_batch
+        with patch.object(
+            EmailLog.objects, 'bulk_create',
+            side_effect=duplicate_logs_user1_first,
+        ):
+            result = send_campaign_batch(
+                self.campaign.pk, user_ids=[self.user1.pk, self.user2.pk],
+            )
+
+        self.assertEqual(result['sent_count'], 1)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.sent_count, 1)
+        self.assertEqual(self.campaign.status, 'sent')
+
+    @override_settings(SES_ENABLED=False)
+    def test_overlapping_duplicate_batch_with_ses_disabled(self):
+        """Shared no-op message ids do not make the duplicate's row ours."""
+        self._start_tracked_send(expected_recipients=2, batch_count=1)
+        bulk_create = EmailLog.objects.bulk_create
+
+        def duplicate_logs_user1_first(rows, **kwargs):
+            EmailLog.objects.create(
+                campaign=self.campaign, user=self.user1,
+                recipient_email=self.user1.email, email_type='campaign',
+                subject=self.campaign.subject,
+                ses_message_id=rows[0].ses_message_id,
+            )
+            return bulk_create(rows, **kwargs)
+
+        from email_app.tasks.send_campaign import send_campaign_batch
+        with patch.object(
+            EmailLog.objects, 'bulk_create',
+            side_effect=duplicate_logs_user1_first,
+        ):
+            result = send_campaign_batch(
+                self.campaign.pk, user_ids=[self.user1.pk, self.user2.pk],
+            )
+
+        self.assertEqual(
+            set(EmailLog.objects.values_list('ses_message_id', flat=True)),
+            {'ses-disabled-noop'},
+        )
+        self.assertEqual(result['sent_count'], 1)
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.sent_count, 1)
 
     def test_batch_not_found_raises_error(self):
         """Batch on a missing campaign raises ValueError."""
         from email_app.tasks.send_campaign import send_campaign_batch
 
         with self.assertRaises(ValueError) as ctx:
-            send_campaign_batch(99999, user_ids=[1], send_delay=0)
+            send_campaign_batch(99999, user_ids=[1])
         self.assertIn('not found', str(ctx.exception))
 
 
@@ -1035,13 +1170,14 @@ class EmailLogUniquenessTest(TierSetupMixin, TestCase):
 class SendCampaignEndToEndTest(TierSetupMixin, TestCase):
     """End-to-end: fan-out + batch execution with chunking."""
 
-    @patch('email_app.tasks.send_campaign.EmailService')
-    def test_full_pipeline_chunks_and_completes(self, MockService):
+    @override_settings(SES_ENABLED=True)
+    @patch('email_app.tasks.send_campaign.get_send_rate_limiter')
+    @patch('email_app.services.email_service.boto3')
+    def test_full_pipeline_chunks_and_completes(self, mock_boto3, mock_limiter):
         """7 recipients with batch_size=3 produce 3 chunks; running each
         chunk results in all 7 receiving the campaign and status=sent."""
-        mock_service = MockService.return_value
-        mock_service._send_ses.return_value = 'ses-id'
-        mock_service._build_unsubscribe_url.return_value = 'http://example.com/u'
+        mock_boto3.client.return_value = FakeSESClient()
+        mock_limiter.return_value = RecordingBucket(rate=14)
 
         users = [
             User.objects.create_user(
@@ -1079,7 +1215,6 @@ class SendCampaignEndToEndTest(TierSetupMixin, TestCase):
             send_campaign_batch(
                 chunk_kwargs['campaign_id'],
                 user_ids=chunk_kwargs['user_ids'],
-                send_delay=0,
             )
 
         campaign.refresh_from_db()
@@ -1363,6 +1498,7 @@ class CampaignAdminUnauthenticatedTest(TestCase):
 
 
 @tag('core')
+@override_settings(SES_ENABLED=True)
 class CampaignVerifyEmailFooterTest(TierSetupMixin, TestCase):
     """Issue #450: per-recipient verify-email footer CTA on campaigns.
 
@@ -1387,11 +1523,18 @@ class CampaignVerifyEmailFooterTest(TierSetupMixin, TestCase):
             target_min_level=0,
             status='sending',
         )
+        self.fake_ses = FakeSESClient()
+        boto_patch = patch('email_app.services.email_service.boto3')
+        boto_patch.start().client.return_value = self.fake_ses
+        self.addCleanup(boto_patch.stop)
+        limiter_patch = patch(
+            'email_app.tasks.send_campaign.get_send_rate_limiter',
+            return_value=RecordingBucket(rate=14),
+        )
+        limiter_patch.start()
+        self.addCleanup(limiter_patch.stop)
 
-    @patch('email_app.tasks.send_campaign.EmailService._send_ses', return_value='ses-450-c1')
-    def test_campaign_recipient_unverified_at_send_time_sees_cta(
-        self, mock_ses,
-    ):
+    def test_campaign_recipient_unverified_at_send_time_sees_cta(self):
         unverified = User.objects.create_user(
             email='unv@test.com', tier=self.free_tier,
             email_verified=False, unsubscribed=False,
@@ -1401,11 +1544,9 @@ class CampaignVerifyEmailFooterTest(TierSetupMixin, TestCase):
         send_campaign_batch(
             self.campaign.pk,
             user_ids=[unverified.pk],
-            send_delay=0,
         )
 
-        # Captured HTML is the third positional arg to _send_ses.
-        html = mock_ses.call_args[0][2]
+        html = self.fake_ses.delivered['unv@test.com']['html']
         self.assertIn('<p class="verify-email-cta">', html)
         self.assertIn('Your email is not verified on our platform.', html)
         self.assertIn('click here', html)
@@ -1413,10 +1554,7 @@ class CampaignVerifyEmailFooterTest(TierSetupMixin, TestCase):
         self.assertIn('/api/unsubscribe?token=', html)
         assert_no_internal_footer_text(self, html)
 
-    @patch('email_app.tasks.send_campaign.EmailService._send_ses', return_value='ses-450-c2')
-    def test_campaign_recipient_verified_at_send_time_omits_cta(
-        self, mock_ses,
-    ):
+    def test_campaign_recipient_verified_at_send_time_omits_cta(self):
         verified = User.objects.create_user(
             email='ver@test.com', tier=self.free_tier,
             email_verified=True, unsubscribed=False,
@@ -1426,19 +1564,15 @@ class CampaignVerifyEmailFooterTest(TierSetupMixin, TestCase):
         send_campaign_batch(
             self.campaign.pk,
             user_ids=[verified.pk],
-            send_delay=0,
         )
 
-        html = mock_ses.call_args[0][2]
+        html = self.fake_ses.delivered['ver@test.com']['html']
         self.assertNotIn('<p class="verify-email-cta">', html)
         self.assertNotIn('/api/verify-email?token=', html)
         self.assertIn('/api/unsubscribe?token=', html)
         assert_no_internal_footer_text(self, html)
 
-    @patch('email_app.tasks.send_campaign.EmailService._send_ses', return_value='ses-450-c3')
-    def test_campaign_recipient_verified_after_enqueue_omits_cta(
-        self, mock_ses,
-    ):
+    def test_campaign_recipient_verified_after_enqueue_omits_cta(self):
         """The check happens at SEND time, not enqueue time.
 
         Verifies the spec decision: if a recipient flips
@@ -1459,10 +1593,9 @@ class CampaignVerifyEmailFooterTest(TierSetupMixin, TestCase):
         send_campaign_batch(
             self.campaign.pk,
             user_ids=[recipient.pk],
-            send_delay=0,
         )
 
-        html = mock_ses.call_args[0][2]
+        html = self.fake_ses.delivered['flip@test.com']['html']
         self.assertNotIn('<p class="verify-email-cta">', html)
         self.assertNotIn('/api/verify-email?token=', html)
         assert_no_internal_footer_text(self, html)
@@ -1475,9 +1608,11 @@ class CampaignEligibilityCriteriaTest(TierSetupMixin, TestCase):
     Moved from playwright_tests/test_email_campaigns.py Scenario 8.
     """
 
-    @patch('email_app.tasks.send_campaign.EmailService')
+    @override_settings(SES_ENABLED=True)
+    @patch('email_app.tasks.send_campaign.get_send_rate_limiter')
+    @patch('email_app.services.email_service.boto3')
     def test_campaign_send_respects_tier_verification_and_subscription(
-        self, MockService
+        self, mock_boto3, mock_limiter,
     ):
         """Main+ campaign sends only to verified, subscribed Main/Premium users.
 
@@ -1485,9 +1620,8 @@ class CampaignEligibilityCriteriaTest(TierSetupMixin, TestCase):
         1 unverified Main, 3 Free users.
         Then: sent_count is 3 (2 Main + 1 Premium).
         """
-        mock_service = MockService.return_value
-        mock_service._send_ses.return_value = 'ses-msg-id'
-        mock_service._build_unsubscribe_url.return_value = 'http://example.com/unsub'
+        mock_boto3.client.return_value = FakeSESClient()
+        mock_limiter.return_value = RecordingBucket(rate=14)
 
         # 2 verified Main members (eligible)
         User.objects.create_user(
@@ -1555,7 +1689,6 @@ class CampaignEligibilityCriteriaTest(TierSetupMixin, TestCase):
             send_campaign_batch(
                 chunk['campaign_id'],
                 user_ids=chunk['user_ids'],
-                send_delay=0,
             )
 
         campaign.refresh_from_db()
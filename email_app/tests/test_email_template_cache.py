@@ -0,0 +1,135 @@
+"""Compiled email template cache in ``EmailService``.
+
+Repeat renders of the same template reuse the parsed frontmatter and the
+compiled subject/body ``Template`` objects. Saving, editing or deleting an
+``EmailTemplateOverride`` changes the version the cache is keyed by, so the
+next render picks up the change.
+"""
+
+from unittest.mock import patch
+
+import frontmatter
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from email_app.models import EmailTemplateOverride
+from email_app.services import email_service as email_service_module
+from email_app.services.email_service import EmailService, EmailServiceError
+from email_app.services.template_cache import compiled_templates
+
+User = get_user_model()
+
+
+class CompiledTemplateCacheTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create_user(
+            email='alice@example.com', first_name='Alice',
+        )
+        cls.bob = User.objects.create_user(
+            email='bob@example.com', first_name='Bob',
+        )
+
+    def setUp(self):
+        compiled_templates.clear()
+        self.addCleanup(compiled_templates.clear)
+        self.service = EmailService()
+
+    def test_file_template_parsed_once_across_recipients(self):
+        with patch.object(
+            email_service_module.frontmatter, 'load', wraps=frontmatter.load,
+        ) as mock_load:
+            _, alice_html = self.service._render_template(
+                'welcome', self.alice, {'tier_name': 'Main'},
+            )
+            _, bob_html = self.service._render_template(
+                'welcome', self.bob, {'tier_name': 'Main'},
+            )
+
+        self.assertEqual(mock_load.call_count, 1)
+        self.assertIn('Alice', alice_html)
+        self.assertIn('Bob', bob_html)
+
+    def test_saved_override_replaces_cached_file_template(self):
+        self.service._render_template('welcome', self.alice, {})
+
+        EmailTemplateOverride.objects.create(
+            template_name='welcome',
+            subject='Hi {{ user_name }}',
+            body_markdown='OVERRIDE for {{ user_name }}',
+        )
+        subject, body_html = self.service._render_template(
+            'welcome', self.alice, {},
+        )
+
+        self.assertEqual(subject, 'Hi Alice')
+        self.assertIn('OVERRIDE for Alice', body_html)
+
+    def test_edited_override_is_picked_up_by_other_processes(self):
+        override = EmailTemplateOverride.objects.create(
+            template_name='welcome',
+            subject='First',
+            body_markdown='First body',
+        )
+        self.service._render_template('welcome', self.alice, {})
+
+        # A queryset update skips the save signal, like an edit made in
+        # another process: only the updated_at version catches it.
+        EmailTemplateOverride.objects.filter(pk=override.pk).update(
+            subject='Second',
+            body_markdown='Second body',
+            updated_at=override.updated_at.replace(year=2099),
+        )
+        subject, body_html = self.service._render_template(
+            'welcome', self.alice, {},
+        )
+
+        self.assertEqual(subject, 'Second')
+        self.assertIn('Second body', body_html)
+
+    def test_deleted_override_falls_back_to_file(self):
+        override = EmailTemplateOverride.objects.create(
+            template_name='welcome',
+            subject='Override subject',
+            body_markdown='Override body',
+        )
+        self.service._render_template('welcome', self.alice, {})
+
+        override.delete()
+        subject, body_html = self.service._render_template(
+            'welcome', self.alice, {'tier_name': 'Main'},
+        )
+
+        self.assertNotEqual(subject, 'Override subject')
+        self.assertNotIn('Override body', body_html)
+
+    def test_static_body_markdown_rendered_once(self):
+        EmailTemplateOverride.objects.create(
+            template_name='welcome',
+            subject='Hello {{ user_name }}',
+            body_markdown='# Same for everyone\n\nNo variables here.',
+        )
+
+        with patch(
+            'email_app.services.template_cache.render_email_markdown',
+            wraps=email_service_module.render_email_markdown,
+        ) as mock_static, patch.object(
+            email_service_module, 'render_email_markdown',
+        ) as mock_per_recipient:
+            alice_subject, alice_html = self.service._render_template(
+                'welcome', self.alice, {},
+            )
+            bob_subject, bob_html = self.service._render_template(
+                'welcome', self.bob, {},
+            )
+
+        self.assertEqual(mock_static.call_count, 1)
+        mock_per_recipient.assert_not_called()
+        self.assertEqual(alice_html, bob_html)
+        self.assertIn('Same for everyone', alice_html)
+        self.assertEqual(alice_subject, 'Hello Alice')
+        self.assertEqual(bob_subject, 'Hello Bob')
+
+    def test_missing_template_still_raises(self):
+        with self.assertRaises(EmailServiceError):
+            self.service._render_template('no_such_template', self.alice, {})
@@ -19,6 +19,7 @@ from accounts.services.timezones import format_user_datetime
 from content.access import (
     build_gating_context,
     can_access,
+    get_access_context,
     get_required_tier_name,
 )
 from content.services.related_content import build_related_content_rail
@@ -52,6 +53,7 @@ from events.services.time_windows import (
     past_recording_events_queryset,
     upcoming_events_queryset,
 )
+from website.page_cache import anonymous_page_cache
 
 VALID_EVENTS_FILTERS = {'all', 'upcoming', 'past'}
 PUBLIC_EVENTS_PER_PAGE = 20
@@ -322,6 +324,7 @@ def events_calendar(request, year=None, month=None):
     return render(request, 'events/events_calendar.html', context)
 
 
+@anonymous_page_cache
 def events_list(request):
     """Events list page with Upcoming and Past sections.
 
@@ -1008,13 +1011,15 @@ def event_series_public(request, series_id, slug):
         )
 
     # Annotate each occurrence with the state the template renders:
-    # ``registered`` / ``register`` / ``past`` / ``no_access``.
+    # ``registered`` / ``register`` / ``past`` / ``no_access``. The access
+    # context resolves the user's level once for every occurrence.
+    access = get_access_context(request)
     for event in events:
         if event.is_past:
             event.user_reg_state = 'past'
         elif user.is_authenticated and event.id in registered_event_ids:
             event.user_reg_state = 'registered'
-        elif user.is_authenticated and not can_access(user, event):
+        elif user.is_authenticated and not access.can_access(event):
             event.user_reg_state = 'no_access'
         else:
             event.user_reg_state = 'register'
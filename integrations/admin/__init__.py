@@ -1,5 +1,6 @@
 from .announcement_banner import *
 from .content_source import *
+from .llm_response import *
 from .redirect import *
 from .utm_campaign import *
 from .webhook import *
@@ -0,0 +1,14 @@
+from django.contrib import admin
+
+from integrations.models import LLMResponse
+
+
+@admin.register(LLMResponse)
+class LLMResponseAdmin(admin.ModelAdmin):
+    list_display = ('caller', 'model', 'hit_count', 'created_at', 'last_used_at', 'expires_at')
+    list_filter = ('caller', 'model')
+    readonly_fields = (
+        'key', 'caller', 'model', 'result', 'created_at', 'expires_at',
+        'last_used_at', 'hit_count',
+    )
+    search_fields = ('key',)
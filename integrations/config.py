@@ -21,6 +21,23 @@ shared stamp and, if it changed, repopulate the in-process cache from
 the DB. That costs one cache GET per ``get_config()`` call and zero
 extra DB queries when nothing has changed.
 
+Request-scoped snapshot
+=======================
+
+A rendered page makes many ``get_config()`` calls (``site_context``
+alone makes about seven), and each stamp GET is a SELECT against the
+``django_q_cache`` table. ``IntegrationConfigSnapshotMiddleware`` opens
+a request scope with :func:`begin_request_snapshot`; inside it the stamp
+is compared once and every later lookup is served from ``_cache``. A
+``clear_config_cache()`` in the same request still empties ``_cache``,
+so the next lookup repopulates. Outside a scope (management commands,
+shell) the per-call check is unchanged. :func:`stamp_read_count` lets
+tests assert the number of stamp reads.
+
+The stamp itself is read through ``integrations.tiered_cache.shared_cache``,
+so a warm process serves it from memory and only goes to the
+``django_q_cache`` table once per ``TIERED_CACHE_CHECK_INTERVAL``.
+
 The stamp is intentionally opaque (a random uuid hex). We never compare
 the value, only "is it the same string we recorded last time".
 """
@@ -28,6 +45,7 @@ the value, only "is it the same string we recorded last time".
 import logging
 import os
 import sys
+import threading
 import uuid
 
 from django.apps.registry import AppRegistryNotReady
@@ -38,7 +56,6 @@ from django.db import DatabaseError
 from django.test.testcases import DatabaseOperationForbidden
 
 _STAMP_CACHE_KEY = 'integration_settings_stamp'
-_STAMP_CACHE_ALIAS = 'django_q'
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +70,10 @@ _CACHE_STAMP_EXCEPTIONS = (
 _cache = {}
 _cache_populated = False
 _cache_stamp = None
+_stamp_reads = 0
+# ``checked`` is only set while a request scope is open; see
+# ``begin_request_snapshot``.
+_request_state = threading.local()
 
 
 def get_config(key, default='', *, use_settings=True):
@@ -71,14 +92,16 @@ def get_config(key, default='', *, use_settings=True):
 
     if not _cache_populated:
         _populate_cache()
-    else:
+    elif not getattr(_request_state, 'checked', False):
         # The in-process cache thinks it's fresh — but another process
         # may have written via clear_config_cache() since we last read.
         # Compare the published stamp with the one we recorded during
-        # _populate_cache() and repopulate if they differ.
+        # _populate_cache() and repopulate if they differ. Inside a
+        # request scope this happens once per request.
         current_stamp = _read_stamp()
         if current_stamp is not None and current_stamp != _cache_stamp:
             _populate_cache()
+        _mark_stamp_checked()
     if key in _cache and _cache[key]:
         return _cache[key]
     # Check Django settings first (supports @override_settings in tests).
@@ -275,6 +298,36 @@ def is_enabled(key):
     return str(val).strip().lower() in ('true', '1', 'yes')
 
 
+def begin_request_snapshot():
+    """Open a request scope: the stamp is checked at most once inside it.
+
+    Called by ``IntegrationConfigSnapshotMiddleware`` at the start of
+    each request. Always pair with :func:`end_request_snapshot`.
+    """
+    _request_state.checked = False
+
+
+def end_request_snapshot():
+    """Close the request scope opened by :func:`begin_request_snapshot`."""
+    if hasattr(_request_state, 'checked'):
+        del _request_state.checked
+
+
+def stamp_read_count():
+    """Return how many times this process has read the shared stamp.
+
+    Monotonic per process; tests diff it around a request to assert the
+    number of ``django_q`` cache round trips made by ``get_config()``.
+    """
+    return _stamp_reads
+
+
+def _mark_stamp_checked():
+    """Record that this request scope has already checked the stamp."""
+    if hasattr(_request_state, 'checked'):
+        _request_state.checked = True
+
+
 def _read_stamp():
     """Return the published cross-process stamp, or None if unavailable.
 
@@ -282,9 +335,11 @@ def _read_stamp():
     boot/tests does not crash callers — when the stamp can't be read we
     treat it as "no change" and let the in-process cache stand.
     """
+    global _stamp_reads
+    _stamp_reads += 1
     try:
-        from django.core.cache import caches  # noqa: PLC0415
-        return caches[_STAMP_CACHE_ALIAS].get(_STAMP_CACHE_KEY)
+        from integrations.tiered_cache import shared_cache  # noqa: PLC0415
+        return shared_cache.get(_STAMP_CACHE_KEY)
     except _CACHE_STAMP_EXCEPTIONS:
         logger.debug(
             'Unable to read integration settings cache stamp',
@@ -307,6 +362,7 @@ def _populate_cache():
         _cache = dict(IntegrationSetting.objects.values_list('key', 'value'))
         _cache_populated = True
         _cache_stamp = stamp_at_read
+        _mark_stamp_checked()
     except _DB_TEST_ISOLATION_EXCEPTIONS:
         _cache_populated = False
     except _DB_CONFIG_EXCEPTIONS:
@@ -332,8 +388,8 @@ def clear_config_cache():
     _cache_populated = False
     _cache_stamp = None
     try:
-        from django.core.cache import caches  # noqa: PLC0415
-        caches[_STAMP_CACHE_ALIAS].set(_STAMP_CACHE_KEY, uuid.uuid4().hex)
+        from integrations.tiered_cache import shared_cache  # noqa: PLC0415
+        shared_cache.publish(_STAMP_CACHE_KEY, uuid.uuid4().hex)
     except _CACHE_STAMP_EXCEPTIONS:
         # If the shared cache is unreachable we still cleared in-process
         # state, so the calling process at least sees fresh values.
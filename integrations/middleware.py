@@ -1,10 +1,32 @@
-"""Middleware for URL redirects and trailing slash removal."""
+"""Middleware for URL redirects, trailing slash removal and config snapshots."""
 
 from django.conf import settings
-from django.core.cache import caches
 from django.http import HttpResponsePermanentRedirect, HttpResponseRedirect
 from django.urls import is_valid_path
 
+from integrations.config import begin_request_snapshot, end_request_snapshot
+from integrations.tiered_cache import shared_cache
+
+
+class IntegrationConfigSnapshotMiddleware:
+    """Check the integration settings stamp at most once per request.
+
+    Opens the request scope described in ``integrations.config`` so the
+    many ``get_config()`` calls made while rendering a page (context
+    processors, templates, views) share one read of the cross-process
+    stamp instead of one ``django_q`` cache round trip each.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        begin_request_snapshot()
+        try:
+            return self.get_response(request)
+        finally:
+            end_request_snapshot()
+
 
 class RemoveTrailingSlashMiddleware:
     """Redirect URLs with trailing slashes to the version without.
@@ -58,6 +80,8 @@ class RemoveTrailingSlashMiddleware:
 # is per-process, so any save in Studio or the Django admin only invalidates
 # the worker that handled the POST — every other gunicorn / django-q worker
 # would keep serving the stale value until restart. See issue #288.
+# Reads go through ``integrations.tiered_cache.shared_cache`` so steady-state
+# page views are served from a per-process L1 without a cache-table query.
 _BANNER_CACHE_KEY = 'announcement_banner:v1'
 _BANNER_CACHE_TTL = 300  # 5 minutes — matches REDIRECT_CACHE_TIMEOUT below.
 # Sentinel for "no row exists". ``cache.get`` returns ``None`` for both
@@ -69,17 +93,18 @@ _BANNER_CACHE_MISSING = '__missing__'
 def get_announcement_banner():
     """Return the AnnouncementBanner singleton or None if no row exists.
 
-    The result is cached in the cross-process ``django_q`` cache. Call
-    ``clear_announcement_banner_cache`` after saving the banner to invalidate.
+    The result is cached in the cross-process ``django_q`` cache behind a
+    per-process L1. Call ``clear_announcement_banner_cache`` after saving
+    the banner to invalidate.
     """
-    cached = caches['django_q'].get(_BANNER_CACHE_KEY)
+    cached = shared_cache.get(_BANNER_CACHE_KEY)
     if cached == _BANNER_CACHE_MISSING:
         return None
     if cached is not None:
         return cached
     from integrations.models import AnnouncementBanner
     banner = AnnouncementBanner.objects.filter(pk=1).first()
-    caches['django_q'].set(
+    shared_cache.set(
         _BANNER_CACHE_KEY,
         banner if banner is not None else _BANNER_CACHE_MISSING,
         _BANNER_CACHE_TTL,
@@ -89,7 +114,7 @@ def get_announcement_banner():
 
 def clear_announcement_banner_cache():
     """Clear the cross-process announcement banner cache."""
-    caches['django_q'].delete(_BANNER_CACHE_KEY)
+    shared_cache.invalidate(_BANNER_CACHE_KEY)
 
 
 REDIRECT_CACHE_KEY = 'active_redirects'
@@ -106,15 +131,20 @@ def get_active_redirects():
     from Studio would only invalidate the worker that handled the POST.
     Using a cross-process backend ensures any toggle / delete in Studio
     propagates to every worker on the next request. See issue #695.
+
+    Reads are served from the per-process L1 in
+    ``integrations.tiered_cache``, so the dict is not re-fetched and
+    unpickled on every request; invalidations reach other workers within
+    ``TIERED_CACHE_CHECK_INTERVAL`` seconds.
     """
-    redirects = caches['django_q'].get(REDIRECT_CACHE_KEY)
+    redirects = shared_cache.get(REDIRECT_CACHE_KEY)
     if redirects is None:
         from integrations.models import Redirect
         redirects = {
             r.source_path: (r.target_path, r.redirect_type)
             for r in Redirect.objects.filter(is_active=True)
         }
-        caches['django_q'].set(REDIRECT_CACHE_KEY, redirects, REDIRECT_CACHE_TIMEOUT)
+        shared_cache.set(REDIRECT_CACHE_KEY, redirects, REDIRECT_CACHE_TIMEOUT)
     return redirects
 
 
@@ -124,7 +154,7 @@ def clear_redirect_cache():
     Call after any redirect model change so every worker refetches on
     the next request.
     """
-    caches['django_q'].delete(REDIRECT_CACHE_KEY)
+    shared_cache.invalidate(REDIRECT_CACHE_KEY)
 
 
 class RedirectMiddleware:
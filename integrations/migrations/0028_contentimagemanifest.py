@@ -0,0 +1,25 @@
+# Generated by Django 6.1.2 on 2026-10-17 11:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0027_reconcile_synclog_observability_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ContentImageManifest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.CharField(max_length=255)),
+                ('prefix', models.CharField(max_length=300)),
+                ('entries', models.JSONField(blank=True, default=dict)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('source', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='image_manifest', to='integrations.contentsource')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.1.2 on 2026-10-17 12:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('integrations', '0028_contentimagemanifest'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='synclog',
+            name='timings',
+            field=models.JSONField(blank=True, default=dict, help_text='Per-phase wall-clock seconds: {prepare_seconds, images_seconds, write_wait_seconds, write_seconds, total_seconds}. Syncs run by sync_content_sources also carry batch: {workers, sources, started_at, wall_seconds} for the worker task that ran them.'),
+        ),
+    ]
@@ -124,6 +124,30 @@ class ContentSource(models.Model):
         return f'https://github.com/{self.repo_name}/commit/{self.last_synced_commit}'
 
 
+class ContentImageManifest(models.Model):
+    """What the S3 image uploader last uploaded or verified for a source.
+
+    ``entries`` maps each repo-relative image path to
+    ``{'size', 'mtime_ns', 'md5', 'etag'}``. On the next sync
+    ``upload_images_to_s3`` skips a file whose size and mtime still match
+    without hashing it, and skips a file whose MD5 matches without touching
+    S3. The whole prefix is only listed when no manifest exists yet.
+    A manifest written for another bucket or prefix is ignored; delete the
+    row to force a full re-check against S3.
+    """
+
+    source = models.OneToOneField(
+        ContentSource, on_delete=models.CASCADE, related_name='image_manifest',
+    )
+    bucket = models.CharField(max_length=255)
+    prefix = models.CharField(max_length=300)
+    entries = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'{self.source.repo_name} image manifest ({len(self.entries)} files)'
+
+
 class SyncLog(models.Model):
     """Log entry for a content sync operation."""
 
@@ -173,6 +197,15 @@ class SyncLog(models.Model):
         default=list, blank=True,
         help_text="List of error objects: [{file, error}, ...]",
     )
+    timings = models.JSONField(
+        default=dict, blank=True,
+        help_text=(
+            "Per-phase wall-clock seconds: {prepare_seconds, images_seconds, "
+            "write_wait_seconds, write_seconds, total_seconds}. Syncs run by "
+            "sync_content_sources also carry batch: {workers, sources, "
+            "started_at, wall_seconds} for the worker task that ran them."
+        ),
+    )
 
     class Meta:
         ordering = ['-started_at']
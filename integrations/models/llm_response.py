@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class LLMResponse(models.Model):
+    """A stored LLM completion, keyed by a hash of the request that produced it.
+
+    Written and read by :mod:`integrations.services.llm.cache` for callers
+    that opt in to response caching. ``result`` holds the provider-neutral
+    ``LLMResult`` fields, including the token usage of the original call,
+    so a cache hit can report what it saved.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    caller = models.CharField(max_length=100, db_index=True)
+    model = models.CharField(max_length=200, blank=True, default='')
+    result = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+    last_used_at = models.DateTimeField(db_index=True)
+    hit_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f'{self.caller} {self.key[:12]} ({self.hit_count} hits)'
@@ -18,8 +18,8 @@ of any Logfire import (#813):
   reported separately, plus per-scenario disagreement rows).
 
 The judge's usage/cost is read defensively off the ``LLMResult`` exactly
-like :class:`FileTraceSink` does (today usage is ``None``; recorded as such
-rather than crashing).
+like :class:`FileTraceSink` does (``None`` when the provider reported no
+usage, recorded as such rather than crashing).
 """
 
 from datetime import datetime, timezone
@@ -41,8 +41,8 @@ def _extract_usage(result):
     """Read token usage off an ``LLMResult`` defensively (None if absent).
 
     Mirrors :meth:`FileTraceSink._extract_token_usage` so the judge cost is
-    captured the moment the #799 ``LLMResult`` grows a ``usage`` attribute,
-    and stays ``None`` (never raising) until then.
+    captured the same way as the callable's, and stays ``None`` (never
+    raising) when the result carries no usage.
     """
     return FileTraceSink._extract_token_usage(result)
 
@@ -160,6 +160,7 @@ def run_eval(callable_name, dataset_dir, *, provider, model, live):
             'callable_latency_seconds': sink.latency_seconds,
             'judge_latency_seconds': judge_latency,
             'callable_token_usage': sink.token_usage,
+            'callable_cache_hit': bool((sink.raw_result or {}).get('cache_hit')),
             'judge_token_usage': judge_usage,
         })
         outputs[meta['id']] = {
@@ -286,7 +286,8 @@ def aggregate_report(*, callable_name, scenarios, run_metadata):
     ``id``, ``category``, ``judge_label`` (``pass``/``fail``/``None``),
     ``checks`` (the deterministic-check dict), ``callable_latency_seconds``,
     ``judge_latency_seconds``, ``callable_token_usage``,
-    ``judge_token_usage``, and ``status`` (``ok``/``error``).
+    ``callable_cache_hit``, ``judge_token_usage``, and ``status``
+    (``ok``/``error``).
 
     Produces ``% good`` overall + per category, the deterministic
     per-feature rates, callable-vs-judge cost + latency tracked separately,
@@ -339,10 +340,11 @@ def aggregate_report(*, callable_name, scenarios, run_metadata):
 def _sum_usage(scenarios, key):
     """Sum a token-usage field across scenarios, defensively.
 
-    Usage is recorded only when the #799 ``LLMResult`` exposes it; today it
-    is ``None`` everywhere, so this returns ``None`` (surfaced as "usage
-    unavailable") rather than a misleading zero when no scenario reported
-    usage. Mirrors :class:`FileTraceSink`'s defensive behavior.
+    Usage is recorded only when the provider reported it (mock runs report
+    none), so this returns ``None`` (surfaced as "usage unavailable")
+    rather than a misleading zero when no scenario reported usage. Tokens
+    served from the LLM response cache arrive as separate ``saved_*``
+    keys. Mirrors :class:`FileTraceSink`'s defensive behavior.
     """
     available = [s.get(key) for s in scenarios if s.get(key) is not None]
     if not available:
@@ -363,9 +365,12 @@ def _cost_summary(scenarios):
     return {
         'callable_token_usage': callable_usage,
         'judge_token_usage': judge_usage,
+        'callable_cache_hits': sum(
+            1 for s in scenarios if s.get('callable_cache_hit')
+        ),
         'note': (
-            'usage unavailable: the LLMResult exposes no token usage today; '
-            'totals are null until it does.'
+            'totals are null when no call reported token usage (mock runs); '
+            'saved_* tokens were served from the LLM response cache.'
         ),
     }
 
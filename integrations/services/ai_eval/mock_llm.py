@@ -93,6 +93,7 @@ def mock_complete(
     timeout_seconds=None,
     max_retries=None,
     cancellation=None,
+    cache=None,
 ):
     """Stub ``complete`` returning a fixed, schema-valid structured result.
 
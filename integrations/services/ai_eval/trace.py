@@ -7,11 +7,12 @@ callables' trace contracts -- ``synthesize_feedback`` (#805) and
 sink with no callable-specific branching captures either run.
 
 The sink accumulates the hook calls and serializes one ``trace.json`` per
-run via :meth:`to_dict` / :meth:`write`. The #799 ``LLMResult`` exposes
-``.text`` / ``.tool_input`` / ``.tool_name`` only -- token usage and the
-raw vendor response are not on it today, so the sink reads usage
-defensively (``getattr``) and records ``null`` when absent rather than
-crashing.
+run via :meth:`to_dict` / :meth:`write`. Token usage is read defensively
+(``getattr``) from the ``LLMResult`` token counts and recorded as ``null``
+when the provider reported none (mock runs). A result served from the LLM
+response cache is flagged ``cache_hit`` in ``raw_result`` and its counts
+are recorded as ``saved_*`` tokens, so eval reruns show what the cache
+saved instead of double-counting spend.
 
 The API key never appears in any captured field: the sink only stores the
 rendered request (system/messages/tool), the parsed result, latency, and a
@@ -20,6 +21,13 @@ type + safe message for errors -- none of which carry credentials.
 
 import json
 
+_TOKEN_FIELDS = (
+    'input_tokens',
+    'output_tokens',
+    'cache_read_tokens',
+    'cache_write_tokens',
+)
+
 
 class FileTraceSink:
     """Concrete ``TraceSink`` capturing one run to ``trace.json``.
@@ -56,6 +64,7 @@ class FileTraceSink:
             'text': getattr(result, 'text', None),
             'tool_name': getattr(result, 'tool_name', None),
             'tool_input': getattr(result, 'tool_input', None),
+            'cache_hit': bool(getattr(result, 'cache_hit', False)),
         }
         self.token_usage = self._extract_token_usage(result)
         self.latency_seconds = latency_seconds
@@ -76,14 +85,26 @@ class FileTraceSink:
     def _extract_token_usage(result):
         """Read token usage off the result if present, else ``None``.
 
-        The #799 ``LLMResult`` does not carry usage today; this stays
-        ``None`` rather than raising so the sink never crashes on its
-        absence. If a future ``LLMResult`` grows a ``usage`` attribute it
-        is captured automatically.
+        Prefers a ``usage`` attribute when the result carries one, then the
+        ``LLMResult`` token counts. Counts on a response-cache hit are
+        reported with a ``saved_`` prefix, since no tokens were spent.
+        Stays ``None`` rather than raising when no usage is available, so
+        the sink never crashes on its absence.
         """
         usage = getattr(result, 'usage', None)
         if usage is None:
-            return None
+            counts = {
+                name: getattr(result, name, None) for name in _TOKEN_FIELDS
+            }
+            counts = {
+                name: value for name, value in counts.items()
+                if isinstance(value, int)
+            }
+            if not counts:
+                return None
+            if getattr(result, 'cache_hit', False):
+                return {f'saved_{name}': value for name, value in counts.items()}
+            return counts
         # Normalise common shapes to a plain dict where possible.
         if isinstance(usage, dict):
             return usage
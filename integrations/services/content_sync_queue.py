@@ -3,10 +3,11 @@
 from dataclasses import dataclass
 
 from integrations.models import SyncLog
-from integrations.services.github import sync_content_source
+from integrations.services.github import content_sync_parallelism, sync_content_source
 from jobs.tasks.names import build_task_name
 
 SYNC_TASK_PATH = 'integrations.services.github.sync_content_source'
+BATCH_SYNC_TASK_PATH = 'integrations.services.github.sync_content_sources'
 
 
 @dataclass(frozen=True)
@@ -90,39 +91,51 @@ def enqueue_content_sync(
     except ImportError:
         if queued_marker is not None:
             _clear_queued_state(source, *queued_marker)
-        try:
-            sync_content_source(source, batch_id=batch_id, force=force)
-        except Exception as exc:
-            return ContentSyncQueueResult(
-                ok=False,
-                queued=False,
-                ran_inline=True,
-                source=source,
-                batch_id=batch_id,
-                message=f'Sync failed for {source.repo_name}: {exc}',
-                error=str(exc),
-            )
-        return ContentSyncQueueResult(
-            ok=True,
-            queued=False,
-            ran_inline=True,
-            source=source,
-            batch_id=batch_id,
-            message=f'Sync completed for {source.repo_name}',
-        )
+        return _sync_inline(source, batch_id=batch_id, force=force)
     except Exception as exc:
         if queued_marker is not None:
             _clear_queued_state(source, *queued_marker)
+        return _enqueue_failed(source, batch_id, exc)
+
+    return _queued(source, batch_id, task_id)
+
+
+def _sync_inline(source, batch_id=None, force=False):
+    try:
+        sync_content_source(source, batch_id=batch_id, force=force)
+    except Exception as exc:
         return ContentSyncQueueResult(
             ok=False,
             queued=False,
-            ran_inline=False,
+            ran_inline=True,
             source=source,
             batch_id=batch_id,
             message=f'Sync failed for {source.repo_name}: {exc}',
             error=str(exc),
         )
+    return ContentSyncQueueResult(
+        ok=True,
+        queued=False,
+        ran_inline=True,
+        source=source,
+        batch_id=batch_id,
+        message=f'Sync completed for {source.repo_name}',
+    )
+
+
+def _enqueue_failed(source, batch_id, exc):
+    return ContentSyncQueueResult(
+        ok=False,
+        queued=False,
+        ran_inline=False,
+        source=source,
+        batch_id=batch_id,
+        message=f'Sync failed for {source.repo_name}: {exc}',
+        error=str(exc),
+    )
 
+
+def _queued(source, batch_id, task_id):
     return ContentSyncQueueResult(
         ok=True,
         queued=True,
@@ -134,6 +147,57 @@ def enqueue_content_sync(
     )
 
 
+def _enqueue_async_batch_task(sources, batch_id=None, force=False, task_name=None):
+    from django_q.tasks import async_task
+
+    kwargs = {'force': force, 'task_name': task_name}
+    if batch_id is not None:
+        kwargs['batch_id'] = batch_id
+    return async_task(BATCH_SYNC_TASK_PATH, sources, **kwargs)
+
+
+def _enqueue_content_sync_chunk(
+    sources,
+    batch_id=None,
+    force=False,
+    mark_queued=True,
+    task_source='content sync queue',
+):
+    """Queue one worker task that syncs ``sources`` concurrently."""
+    queued_markers = [
+        _mark_source_queued(source, batch_id=batch_id) if mark_queued else None
+        for source in sources
+    ]
+
+    def _clear_all():
+        for source, marker in zip(sources, queued_markers):
+            if marker is not None:
+                _clear_queued_state(source, *marker)
+
+    try:
+        task_id = _enqueue_async_batch_task(
+            sources,
+            batch_id=batch_id,
+            force=force,
+            task_name=build_task_name(
+                'Sync content sources',
+                ', '.join(source.repo_name for source in sources),
+                task_source,
+            ),
+        )
+    except ImportError:
+        _clear_all()
+        return [
+            _sync_inline(source, batch_id=batch_id, force=force)
+            for source in sources
+        ]
+    except Exception as exc:
+        _clear_all()
+        return [_enqueue_failed(source, batch_id, exc) for source in sources]
+
+    return [_queued(source, batch_id, task_id) for source in sources]
+
+
 def enqueue_content_syncs(
     sources,
     batch_id=None,
@@ -141,14 +205,34 @@ def enqueue_content_syncs(
     mark_queued=True,
     task_source='content sync queue',
 ):
-    """Queue multiple content sources, returning one result per source."""
-    return [
-        enqueue_content_sync(
-            source,
+    """Queue multiple content sources, returning one result per source.
+
+    Sources are grouped into chunks of ``CONTENT_SYNC_PARALLELISM``; each
+    chunk becomes one ``sync_content_sources`` task that overlaps the
+    clone and S3 upload of its sources. Chunking keeps a task's runtime
+    close to its slowest source rather than the sum of all of them, well
+    inside ``Q_CLUSTER['timeout']``. A chunk of one uses the plain
+    per-source task. Without django-q every source syncs inline, in order.
+    """
+    sources = list(sources)
+    chunk_size = content_sync_parallelism()
+    results = []
+    for offset in range(0, len(sources), chunk_size):
+        chunk = sources[offset:offset + chunk_size]
+        if len(chunk) == 1:
+            results.append(enqueue_content_sync(
+                chunk[0],
+                batch_id=batch_id,
+                force=force,
+                mark_queued=mark_queued,
+                task_source=task_source,
+            ))
+            continue
+        results.extend(_enqueue_content_sync_chunk(
+            chunk,
             batch_id=batch_id,
             force=force,
             mark_queued=mark_queued,
             task_source=task_source,
-        )
-        for source in sources
-    ]
+        ))
+    return results
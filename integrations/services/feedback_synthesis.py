@@ -56,6 +56,8 @@ SYSTEM_PROMPT = (
 # Name of the structured-output tool the model is forced to call.
 _TOOL_NAME = 'sprint_feedback_synthesis'
 
+CACHE_LABEL = 'feedback_synthesis'
+
 
 class FeedbackTheme(BaseModel):
     """A recurring topic raised across responses."""
@@ -263,6 +265,7 @@ def synthesize_feedback(feedback, *, trace=None):
             system=SYSTEM_PROMPT,
             tools=[tool],
             tool_choice={'type': 'tool', 'name': _TOOL_NAME},
+            cache=CACHE_LABEL,
         )
     except LLMError as error:
         sink.on_error(error=error)
@@ -274,6 +277,7 @@ def synthesize_feedback(feedback, *, trace=None):
         error = LLMError(
             'LLM did not return structured feedback synthesis output.'
         )
+        llm.discard_cached(result)
         sink.on_error(error=error)
         raise error
 
@@ -283,6 +287,7 @@ def synthesize_feedback(feedback, *, trace=None):
         error = LLMError(
             f'LLM returned invalid synthesis output: {exc}'
         )
+        llm.discard_cached(result)
         sink.on_error(error=error)
         raise error from None
 
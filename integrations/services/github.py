@@ -107,3 +107,7 @@ from integrations.services.github_sync.repo import (
     extract_sort_order,
     fetch_remote_head_sha,
 )
+from integrations.services.github_sync.scheduler import (
+    content_sync_parallelism,
+    sync_content_sources,
+)
@@ -0,0 +1,133 @@
+"""Persistent per-source git checkouts reused across content syncs.
+
+Each ContentSource gets ``<GITHUB_SYNC_CACHE_DIR>/<source.pk>``, a
+shallow checkout that :func:`clone_or_pull_repo` brings up to date with a
+depth-1 fetch instead of a fresh clone. The previous commit stays in the
+object store, which is what incremental syncs diff against, and unchanged
+files keep their mtimes for the image manifest. The cache is bounded by
+``GITHUB_SYNC_CACHE_MAX_MB``; the least recently used checkouts are
+dropped first, never one whose source is mid-sync.
+"""
+
+import os
+import shutil
+import time
+import uuid
+
+from django.conf import settings
+
+from integrations.models import ContentSource
+from integrations.services.github_sync.common import logger
+
+DEFAULT_CACHE_MAX_MB = 2048
+
+# Touched after every sync that used a checkout; its mtime is the LRU key.
+_LAST_USED_MARKER = 'sync-cache-last-used'
+
+
+def clone_cache_root():
+    """Return the cache directory, or ``None`` when the cache is disabled."""
+    root = getattr(settings, 'GITHUB_SYNC_CACHE_DIR', '')
+    return os.path.abspath(os.fspath(root)) if root else None
+
+
+def cached_checkout_dir(source):
+    """Return the cache entry for ``source``, or ``None`` if caching is off."""
+    root = clone_cache_root()
+    if root is None:
+        return None
+    os.makedirs(root, exist_ok=True)
+    return os.path.join(root, str(source.pk))
+
+
+def discard_checkout(checkout_dir):
+    shutil.rmtree(checkout_dir, ignore_errors=True)
+
+
+def mark_checkout_used(checkout_dir):
+    git_dir = os.path.join(checkout_dir, '.git')
+    if not os.path.isdir(git_dir):
+        return
+    marker = os.path.join(git_dir, _LAST_USED_MARKER)
+    with open(marker, 'a'):
+        pass
+    os.utime(marker)
+
+
+def evict_clone_cache(keep=None, max_bytes=None):
+    """Drop least recently used checkouts until the cache fits its budget.
+
+    Args:
+        keep: A checkout directory that must survive (the one just used).
+        max_bytes: Budget override; defaults to ``GITHUB_SYNC_CACHE_MAX_MB``.
+
+    Returns:
+        list[str]: The evicted checkout directories, oldest first.
+    """
+    root = clone_cache_root()
+    if root is None or not os.path.isdir(root):
+        return []
+    if max_bytes is None:
+        max_mb = getattr(settings, 'GITHUB_SYNC_CACHE_MAX_MB', DEFAULT_CACHE_MAX_MB)
+        max_bytes = int(max_mb) * 1024 * 1024
+    keep = os.path.abspath(keep) if keep else None
+
+    entries = []
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if os.path.isdir(path):
+            entries.append((_last_used(path), name, path, _tree_size(path)))
+    total = sum(size for *_rest, size in entries)
+    if total <= max_bytes:
+        return []
+
+    busy = _checkouts_in_use(name for _used, name, _path, _size in entries)
+    evicted = []
+    for _used, name, path, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        if path == keep or name in busy:
+            continue
+        discard_checkout(path)
+        total -= size
+        evicted.append(path)
+        logger.info('Evicted cached checkout %s (%d bytes).', path, size)
+    return evicted
+
+
+def _last_used(path):
+    for candidate in (os.path.join(path, '.git', _LAST_USED_MARKER), path):
+        try:
+            return os.stat(candidate).st_mtime
+        except OSError:
+            continue
+    return time.time()
+
+
+def _tree_size(path):
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += os.lstat(os.path.join(dirpath, filename)).st_size
+            except OSError:
+                continue
+    return total
+
+
+def _checkouts_in_use(names):
+    """Return the entry names whose ContentSource currently holds its sync lock.
+
+    Checked against the DB rather than in-process state so a checkout in
+    use by another worker process is never evicted under it.
+    """
+    pks = []
+    for name in names:
+        try:
+            pks.append(uuid.UUID(name))
+        except ValueError:
+            continue
+    locked = ContentSource.objects.filter(
+        pk__in=pks, sync_locked_at__isnull=False,
+    ).values_list('pk', flat=True)
+    return {str(pk) for pk in locked}
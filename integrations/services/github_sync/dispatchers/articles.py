@@ -94,7 +94,7 @@ def _resolve_article_source_event(metadata, rel_path):
 
 
 def _dispatch_articles(source, repo_dir, file_list, commit_sha, stats,
-                       known_images=None):
+                       known_images=None, cleanup_paths=None):
     """Walker dispatch handler: process article markdown files.
 
     Iterates ``file_list`` (repo-relative paths) and upserts an ``Article``
@@ -102,8 +102,12 @@ def _dispatch_articles(source, repo_dir, file_list, commit_sha, stats,
     stale-content soft-delete sweep at the end. Mirrors the body of the
     legacy ``_sync_articles`` orchestrator but takes its file list from
     the walker rather than walking the tree itself.
+
+    ``cleanup_paths`` is set by incremental syncs: only rows whose
+    ``source_path`` is in it are candidates for the stale sweep.
     """
     from content.models import Article
+    from content.services.tag_index import refresh_content_tags
 
     seen_slugs = set()
     failed_slugs = set()
@@ -327,6 +331,8 @@ def _dispatch_articles(source, repo_dir, file_list, commit_sha, stats,
         source_repo=source.repo_name,
         published=True,
     ).exclude(slug__in=seen_slugs).exclude(slug__in=failed_slugs)
+    if cleanup_paths is not None:
+        stale_articles = stale_articles.filter(source_path__in=cleanup_paths)
 
     for article in stale_articles:
         stats['items_detail'].append({
@@ -336,5 +342,8 @@ def _dispatch_articles(source, repo_dir, file_list, commit_sha, stats,
             'content_type': 'article',
         })
     deleted_count = stale_articles.count()
+    stale_ids = [article.pk for article in stale_articles]
     stale_articles.update(published=False, status='draft')
+    # ``update()`` sends no post_save, so reindex the unpublished rows.
+    refresh_content_tags(Article, stale_ids)
     stats['deleted'] += deleted_count
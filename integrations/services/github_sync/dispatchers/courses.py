@@ -90,7 +90,7 @@ def _parse_access_value(raw, *, field_name, rel_path):
 
 
 def _dispatch_courses(source, repo_dir, course_dirs, commit_sha, stats,
-                      known_images=None):
+                      known_images=None, cleanup_paths=None):
     """Walker dispatch handler: process course directories.
 
     Iterates ``course_dirs`` (absolute paths to dirs containing
@@ -105,6 +105,10 @@ def _dispatch_courses(source, repo_dir, course_dirs, commit_sha, stats,
       orphan is deleted (issue #366).
     - Otherwise the row is soft-deleted to ``status='draft'`` so any
       historical FKs are preserved (legacy behavior, unchanged).
+
+    Incremental syncs pass only the course dirs that contain a changed
+    file; ``cleanup_paths`` then holds their repo-relative dirs so the
+    sweep leaves untouched courses alone.
     """
 
     seen_course_slugs = set()
@@ -119,18 +123,23 @@ def _dispatch_courses(source, repo_dir, course_dirs, commit_sha, stats,
 
     _cleanup_stale_courses_for_source(
         source, seen_course_slugs, failed_course_slugs, stats,
+        cleanup_paths=cleanup_paths,
     )
 
 
 def _cleanup_stale_courses_for_source(
     source, seen_course_slugs, failed_course_slugs, stats,
+    cleanup_paths=None,
 ):
     from content.models import Course
 
-    stale_courses = list(Course.objects.filter(
+    stale_courses = Course.objects.filter(
         source_repo=source.repo_name,
         status='published',
-    ).exclude(slug__in=seen_course_slugs).exclude(slug__in=failed_course_slugs))
+    ).exclude(slug__in=seen_course_slugs).exclude(slug__in=failed_course_slugs)
+    if cleanup_paths is not None:
+        stale_courses = stale_courses.filter(source_path__in=cleanup_paths)
+    stale_courses = list(stale_courses)
     cleanup_stale_synced_objects(
         stale_courses,
         stats=stats,
@@ -20,11 +20,14 @@ def _clean_curated_link_text(value):
     return text.replace('\\"', '"').replace("\\'", "'").strip()
 
 
-def _dispatch_curated_links(source, repo_dir, file_list, commit_sha, stats):
+def _dispatch_curated_links(source, repo_dir, file_list, commit_sha, stats,
+                            cleanup_paths=None):
     """Walker dispatch handler: process curated link markdown/YAML files.
 
     ``file_list`` is the set of repo-relative ``.md`` paths under any
     ``curated-links/`` subtree, classified by ``_classify_repo_files``.
+    On incremental syncs only links whose ``source_path`` is in
+    ``cleanup_paths`` can be soft-deleted.
     """
     from content.models import CuratedLink
 
@@ -64,6 +67,8 @@ def _dispatch_curated_links(source, repo_dir, file_list, commit_sha, stats):
         source_repo=source.repo_name,
         published=True,
     ).exclude(item_id__in=seen_item_ids).exclude(item_id__in=failed_item_ids)
+    if cleanup_paths is not None:
+        stale = stale.filter(source_path__in=cleanup_paths)
     for link in stale:
         stats['items_detail'].append({
             'title': link.title,
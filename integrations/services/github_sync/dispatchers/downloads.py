@@ -14,7 +14,7 @@ from integrations.services.github_sync.parsing import (
 
 
 def _dispatch_downloads(source, repo_dir, file_list, commit_sha, stats,
-                        known_images=None):
+                        known_images=None, cleanup_paths=None):
     """Walker dispatch handler: process download YAML files.
 
     ``file_list`` is the set of repo-relative ``.yaml``/``.yml`` paths
@@ -26,9 +26,13 @@ def _dispatch_downloads(source, repo_dir, file_list, commit_sha, stats,
     ``rewrite_cover_image_url`` so a missing ``cover_image`` reference
     surfaces in ``stats['errors']`` instead of producing a CDN URL
     pointing at nothing.
+
+    ``cleanup_paths`` (incremental syncs) limits the stale sweep to rows
+    whose ``source_path`` was touched since the last sync.
     """
     from content.models import Download
     from content.nav_availability import refresh_published_downloads_nav_cache
+    from content.services.tag_index import refresh_content_tags
 
     seen_slugs = set()
     failed_slugs = set()
@@ -150,21 +154,26 @@ def _dispatch_downloads(source, repo_dir, file_list, commit_sha, stats,
             # A previously valid row must fail closed when its source becomes
             # invalid or its private object disappears. Preserve metadata for
             # operator diagnosis and permit a later valid sync to recover it.
-            Download.objects.filter(
+            failed_downloads = Download.objects.filter(
                 slug=failed_slug,
                 source_repo=source.repo_name,
-            ).update(
+            )
+            failed_ids = list(failed_downloads.values_list('pk', flat=True))
+            failed_downloads.update(
                 published=False,
                 delivery_blocked_reason=(
                     'Source validation failed; correct the source and re-sync.'
                 ),
             )
+            refresh_content_tags(Download, failed_ids)
 
     # Soft-delete stale downloads, excluding failed slugs
     stale = Download.objects.filter(
         source_repo=source.repo_name,
         published=True,
     ).exclude(slug__in=seen_slugs).exclude(slug__in=failed_slugs)
+    if cleanup_paths is not None:
+        stale = stale.filter(source_path__in=cleanup_paths)
     for dl in stale:
         stats['items_detail'].append({
             'title': dl.title,
@@ -173,6 +182,9 @@ def _dispatch_downloads(source, repo_dir, file_list, commit_sha, stats,
             'content_type': 'resource',
         })
     deleted_count = stale.count()
+    stale_ids = [dl.pk for dl in stale]
     stale.update(published=False)
+    # ``update()`` sends no post_save, so reindex the unpublished rows.
+    refresh_content_tags(Download, stale_ids)
     stats['deleted'] += deleted_count
     refresh_published_downloads_nav_cache()
@@ -374,7 +374,7 @@ def _maybe_create_zoom_meeting_for_synced_event(event, data):
 
 
 def _dispatch_events(source, repo_dir, file_list, commit_sha, stats,
-                     known_images=None):
+                     known_images=None, cleanup_paths=None):
     """Walker dispatch handler: process event YAML files.
 
     ``file_list`` is the set of repo-relative paths classified by
@@ -383,6 +383,10 @@ def _dispatch_events(source, repo_dir, file_list, commit_sha, stats,
     Upserts into the Event model. Only updates content fields; operational
     fields (start_datetime, zoom_join_url, status, etc.) are never
     overwritten by sync if the event already exists.
+
+    Incremental syncs pass the changed event files together with their
+    directory siblings (so a ``recap_file`` edit re-renders the event that
+    references it) and set ``cleanup_paths`` to the touched paths.
     """
     import datetime as dt
 
@@ -729,6 +733,8 @@ def _dispatch_events(source, repo_dir, file_list, commit_sha, stats,
     ).exclude(slug__in=seen_slugs).exclude(slug__in=failed_slugs).exclude(
         kind='workshop',
     )
+    if cleanup_paths is not None:
+        stale = stale.filter(source_path__in=cleanup_paths)
     cleanup_stale_synced_objects(
         stale,
         stats=stats,
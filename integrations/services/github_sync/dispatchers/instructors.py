@@ -10,7 +10,8 @@ from integrations.services.github_sync.parsing import (
 )
 
 
-def _dispatch_instructors(source, repo_dir, file_list, commit_sha, stats):
+def _dispatch_instructors(source, repo_dir, file_list, commit_sha, stats,
+                          cleanup_paths=None):
     """Walker dispatch handler: process instructor YAML files.
 
     ``file_list`` is the set of repo-relative ``.yaml``/``.yml`` paths
@@ -26,7 +27,8 @@ def _dispatch_instructors(source, repo_dir, file_list, commit_sha, stats):
     - Yaml deleted from the repo between syncs: the corresponding
       Instructor row is soft-deleted (``status='draft'``). Through-table
       relationships on Course/Workshop/Event are preserved (FK uses
-      ``on_delete=PROTECT``; we only flip the status field).
+      ``on_delete=PROTECT``; we only flip the status field). Incremental
+      syncs pass ``cleanup_paths`` so only touched yaml files are swept.
     """
     from content.models import Instructor
 
@@ -176,6 +178,8 @@ def _dispatch_instructors(source, repo_dir, file_list, commit_sha, stats):
         source_repo=source.repo_name,
         status='published',
     ).exclude(instructor_id__in=seen_ids).exclude(instructor_id__in=failed_ids)
+    if cleanup_paths is not None:
+        stale = stale.filter(source_path__in=cleanup_paths)
     for s in stale:
         stats['items_detail'].append({
             'title': s.name,
@@ -10,12 +10,14 @@ from integrations.services.github_sync.parsing import (
 
 
 def _dispatch_interview_questions(source, repo_dir, file_list, commit_sha,
-                                  stats, known_images=None):
+                                  stats, known_images=None,
+                                  cleanup_paths=None):
     """Walker dispatch handler: process interview-question markdown files.
 
     ``file_list`` is the set of repo-relative ``.md`` paths classified by
     ``_classify_repo_files`` as root-level lowercase-kebab-case files
-    that don't qualify as articles or projects.
+    that don't qualify as articles or projects. ``cleanup_paths`` restricts
+    stale-category deletion to those source paths (incremental syncs).
     """
     from content.models import InterviewCategory
 
@@ -86,6 +88,8 @@ def _dispatch_interview_questions(source, repo_dir, file_list, commit_sha,
     stale = InterviewCategory.objects.filter(
         source_repo=source.repo_name,
     ).exclude(slug__in=seen_slugs)
+    if cleanup_paths is not None:
+        stale = stale.filter(source_path__in=cleanup_paths)
     for cat in stale:
         stats['items_detail'].append({
             'title': cat.title,
@@ -123,6 +123,7 @@ def _dispatch_marketing_pages(
     commit_sha,
     stats,
     known_images=None,
+    cleanup_paths=None,
 ):
     """Process markdown files marked ``content_type: marketing_page``."""
     seen_content_ids = set()
@@ -268,6 +269,8 @@ def _dispatch_marketing_pages(
         stale = stale.exclude(content_id__in=failed_content_ids)
     if failed_source_paths:
         stale = stale.exclude(source_path__in=failed_source_paths)
+    if cleanup_paths is not None:
+        stale = stale.filter(source_path__in=cleanup_paths)
 
     stale_pages = list(stale)
     for page in stale_pages:
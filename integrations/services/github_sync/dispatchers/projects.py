@@ -20,16 +20,18 @@ from integrations.services.github_sync.parsing import (
 
 
 def _dispatch_projects(source, repo_dir, file_list, commit_sha, stats,
-                       known_images=None):
+                       known_images=None, cleanup_paths=None):
     """Walker dispatch handler: process project markdown files.
 
     ``file_list`` is the set of repo-relative ``.md`` paths classified by
     ``_classify_repo_files`` as having both ``difficulty`` and ``author``
-    frontmatter fields.
+    frontmatter fields. ``cleanup_paths`` narrows the stale sweep to those
+    ``source_path`` values (incremental syncs).
     """
     from datetime import date as date_type
 
     from content.models import Project
+    from content.services.tag_index import refresh_content_tags
 
     seen_slugs = set()
     failed_slugs = set()
@@ -199,6 +201,8 @@ def _dispatch_projects(source, repo_dir, file_list, commit_sha, stats,
         source_repo=source.repo_name,
         published=True,
     ).exclude(slug__in=seen_slugs).exclude(slug__in=failed_slugs)
+    if cleanup_paths is not None:
+        stale = stale.filter(source_path__in=cleanup_paths)
     for proj in stale:
         stats['items_detail'].append({
             'title': proj.title,
@@ -207,7 +211,10 @@ def _dispatch_projects(source, repo_dir, file_list, commit_sha, stats,
             'content_type': 'project',
         })
     deleted_count = stale.count()
+    stale_ids = [proj.pk for proj in stale]
     stale.update(published=False, status='pending_review')
+    # ``update()`` sends no post_save, so reindex the unpublished rows.
+    refresh_content_tags(Project, stale_ids)
     stats['deleted'] += deleted_count
 
 
@@ -166,7 +166,7 @@ def _validate_workshop_core_tools(raw, yaml_rel_path):
 
 def _dispatch_workshops(source, repo_dir, workshop_dirs, commit_sha, stats,
                         known_images=None, cross_workshop_lookup=None,
-                        workshops_repo_name=None):
+                        workshops_repo_name=None, cleanup_paths=None):
     """Walker dispatch handler: process workshop directories.
 
     ``workshop_dirs`` is the list of absolute paths to dirs containing
@@ -182,6 +182,9 @@ def _dispatch_workshops(source, repo_dir, workshop_dirs, commit_sha, stats,
     body can resolve cross-workshop ``..``-style and absolute-GitHub URL
     links to native ``/workshops/<slug>`` URLs. ``workshops_repo_name``
     pairs with it so the GitHub-URL detector matches the right host.
+
+    ``cleanup_paths`` is set on incremental syncs to the repo-relative dirs
+    of the workshops being re-synced; other workshops are not swept.
     """
     seen_slugs = set()
     failed_slugs = set()
@@ -196,16 +199,20 @@ def _dispatch_workshops(source, repo_dir, workshop_dirs, commit_sha, stats,
 
     _cleanup_stale_workshops_for_source(
         source, seen_slugs, failed_slugs, stats,
+        cleanup_paths=cleanup_paths,
     )
 
 
-def _cleanup_stale_workshops_for_source(source, seen_slugs, failed_slugs, stats):
+def _cleanup_stale_workshops_for_source(source, seen_slugs, failed_slugs, stats,
+                                        cleanup_paths=None):
     from content.models import Workshop
 
     stale = Workshop.objects.filter(
         source_repo=source.repo_name,
         status='published',
     ).exclude(slug__in=seen_slugs).exclude(slug__in=failed_slugs)
+    if cleanup_paths is not None:
+        stale = stale.filter(source_path__in=cleanup_paths)
     cleanup_stale_synced_objects(
         stale,
         stats=stats,
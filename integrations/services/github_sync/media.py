@@ -4,14 +4,25 @@ import hashlib
 import mimetypes
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 
 import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 from django.conf import settings
 
 from integrations.config import get_config, s3_content_upload_enabled
+from integrations.models import ContentImageManifest
 from integrations.services.github_sync.common import IMAGE_EXTENSIONS, logger
 
+# Image uploads run on a bounded thread pool that shares the one boto3
+# client of the run (clients are thread-safe). Per-request S3 latency, not
+# bandwidth, dominates a course repo's image step.
+S3_UPLOAD_WORKERS = 8
+
+# boto3's default ``TransferConfig.multipart_threshold``. Below it
+# ``upload_file`` does a single PUT whose ETag is the body's MD5.
+_SINGLE_PART_LIMIT = 8 * 1024 * 1024
+
 
 def _image_base_url(repo_name):
     """Return the public base URL and whether it expects a repo prefix."""
@@ -152,8 +163,13 @@ def _md5_file(filepath, chunk_size=8192):
 def upload_images_to_s3(content_dir, source):
     """Upload image files from a content directory to S3.
 
-    Walks the content directory for image files and uploads them to S3,
-    skipping files whose MD5 matches the existing S3 ETag.
+    Walks the content directory for image files and uploads new or changed
+    ones to S3 on a ``S3_UPLOAD_WORKERS`` thread pool. The source's
+    ``ContentImageManifest`` decides what changed: a file whose size and
+    mtime match its manifest entry is skipped without hashing, and a file
+    whose MD5 matches is skipped without an S3 request. Only when there is
+    no manifest yet is the S3 prefix listed, skipping files whose MD5
+    matches the existing S3 ETag.
 
     Args:
         content_dir: Local directory containing content files and images.
@@ -227,59 +243,74 @@ def upload_images_to_s3(content_dir, source):
             'errors': [{'file': '', 'error': str(e), 'step': 's3_client'}],
         }
 
-    # Build index of existing S3 ETags (MD5 for single-part uploads)
     s3_prefix = f'{repo_short}/'
+    manifest = _load_image_manifest(source, bucket, s3_prefix)
+
+    # Build index of existing S3 ETags (MD5 for single-part uploads). Only
+    # needed to seed a missing manifest; afterwards the manifest is the
+    # record of what is in S3.
     existing_etags = {}
-    try:
-        paginator = s3.get_paginator('list_objects_v2')
-        for page in paginator.paginate(Bucket=bucket, Prefix=s3_prefix):
-            for obj in page.get('Contents', []):
-                # ETag is quoted, e.g. '"d41d8cd98f00b204e9800998ecf8427e"'
-                existing_etags[obj['Key']] = obj['ETag'].strip('"')
-    except (BotoCoreError, ClientError) as e:
-        # Issue #797: surface listing failures into stats['errors'] tagged
-        # with step='s3_list' so the SyncLog "partial" pill lights up
-        # instead of the failure being WARN-only. Continue with an empty
-        # ``existing_etags`` so the upload pass still runs.
-        logger.warning('Failed to list S3 objects: %s', e)
-        stats['errors'].append({
-            'file': '', 'error': str(e), 'step': 's3_list',
-        })
+    if not manifest:
+        try:
+            paginator = s3.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=bucket, Prefix=s3_prefix):
+                for obj in page.get('Contents', []):
+                    # ETag is quoted, e.g. '"d41d8cd98f00b204e9800998ecf8427e"'
+                    existing_etags[obj['Key']] = obj['ETag'].strip('"')
+        except (BotoCoreError, ClientError) as e:
+            # Issue #797: surface listing failures into stats['errors'] tagged
+            # with step='s3_list' so the SyncLog "partial" pill lights up
+            # instead of the failure being WARN-only. Continue with an empty
+            # ``existing_etags`` so the upload pass still runs.
+            logger.warning('Failed to list S3 objects: %s', e)
+            stats['errors'].append({
+                'file': '', 'error': str(e), 'step': 's3_list',
+            })
 
-    for root, dirs, files in os.walk(content_dir):
-        # Skip .git directory
-        if '.git' in root:
+    new_manifest = {}
+    pending = []
+    for rel_path, filepath in _iter_image_files(content_dir):
+        stat = os.stat(filepath)
+        previous = manifest.get(rel_path)
+        if (
+            previous
+            and previous['size'] == stat.st_size
+            and previous['mtime_ns'] == stat.st_mtime_ns
+        ):
+            stats['skipped'] += 1
+            new_manifest[rel_path] = previous
             continue
-        for filename in files:
-            ext = os.path.splitext(filename)[1].lower()
-            if ext not in IMAGE_EXTENSIONS:
-                continue
-
-            filepath = os.path.join(root, filename)
-            rel_path = os.path.relpath(filepath, content_dir)
-            s3_key = f'{repo_short}/{rel_path}'
-
-            # Compute local MD5 and compare against S3 ETag
-            local_md5 = _md5_file(filepath)
-            if s3_key in existing_etags and existing_etags[s3_key] == local_md5:
-                stats['skipped'] += 1
-                continue
-
-            try:
-                content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
-                s3.upload_file(
-                    filepath, bucket, s3_key,
-                    ExtraArgs={
-                        'ContentType': content_type,
-                        'CacheControl': 'public, max-age=86400',
-                    },
+        pending.append((rel_path, filepath, stat, previous))
+
+    if pending:
+        with ThreadPoolExecutor(
+            max_workers=min(S3_UPLOAD_WORKERS, len(pending)),
+            thread_name_prefix='s3-image-upload',
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _sync_image, s3, bucket, f'{repo_short}/{rel_path}',
+                    filepath, stat, previous, existing_etags,
                 )
-                stats['uploaded'] += 1
-            except (BotoCoreError, ClientError, boto3.exceptions.S3UploadFailedError) as e:
-                stats['errors'].append({
-                    'file': rel_path, 'error': str(e), 'step': 's3_upload',
-                })
-                logger.warning('Failed to upload %s to S3: %s', rel_path, e)
+                for rel_path, filepath, stat, previous in pending
+            ]
+            for (rel_path, _filepath, _stat, _previous), future in zip(pending, futures):
+                try:
+                    action, entry = future.result()
+                except (BotoCoreError, ClientError, boto3.exceptions.S3UploadFailedError) as e:
+                    stats['errors'].append({
+                        'file': rel_path, 'error': str(e), 'step': 's3_upload',
+                    })
+                    logger.warning('Failed to upload %s to S3: %s', rel_path, e)
+                    continue
+                stats[action] += 1
+                new_manifest[rel_path] = entry
+
+    if new_manifest != manifest:
+        ContentImageManifest.objects.update_or_create(
+            source=source,
+            defaults={'bucket': bucket, 'prefix': s3_prefix, 'entries': new_manifest},
+        )
 
     logger.info(
         'S3 image upload for %s: %d uploaded, %d skipped, %d errors',
@@ -287,19 +318,65 @@ def upload_images_to_s3(content_dir, source):
     )
     return stats
 
-def _collect_image_paths(content_dir):
-    """Return a set of all image file paths relative to content_dir."""
-    image_paths = set()
+
+def _load_image_manifest(source, bucket, prefix):
+    """Return the source's manifest entries for this bucket/prefix, or {}."""
+    manifest = ContentImageManifest.objects.filter(source=source).first()
+    if manifest is None or manifest.bucket != bucket or manifest.prefix != prefix:
+        return {}
+    return manifest.entries
+
+
+def _sync_image(s3, bucket, s3_key, filepath, stat, previous, existing_etags):
+    """Hash one image and upload it unless S3 already has this content.
+
+    Runs on the upload pool. Returns ``('uploaded' | 'skipped', entry)``
+    where ``entry`` is the file's new manifest entry.
+    """
+    local_md5 = _md5_file(filepath)
+    entry = {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'md5': local_md5,
+        'etag': '',
+    }
+    if previous and previous['md5'] == local_md5:
+        # Same bytes, new mtime (e.g. a fresh checkout).
+        entry['etag'] = previous['etag']
+        return 'skipped', entry
+    if existing_etags.get(s3_key) == local_md5:
+        entry['etag'] = local_md5
+        return 'skipped', entry
+
+    content_type = mimetypes.guess_type(filepath)[0] or 'application/octet-stream'
+    s3.upload_file(
+        filepath, bucket, s3_key,
+        ExtraArgs={
+            'ContentType': content_type,
+            'CacheControl': 'public, max-age=86400',
+        },
+    )
+    if stat.st_size < _SINGLE_PART_LIMIT:
+        entry['etag'] = local_md5
+    return 'uploaded', entry
+
+
+def _iter_image_files(content_dir):
+    """Yield ``(rel_path, filepath)`` for every image under content_dir."""
     for root, dirs, files in os.walk(content_dir):
+        # Skip .git directory
         if '.git' in root:
             continue
         for filename in files:
             ext = os.path.splitext(filename)[1].lower()
             if ext in IMAGE_EXTENSIONS:
                 filepath = os.path.join(root, filename)
-                rel_path = os.path.relpath(filepath, content_dir)
-                image_paths.add(rel_path)
-    return image_paths
+                yield os.path.relpath(filepath, content_dir), filepath
+
+
+def _collect_image_paths(content_dir):
+    """Return a set of all image file paths relative to content_dir."""
+    return {rel_path for rel_path, _filepath in _iter_image_files(content_dir)}
 
 def _check_broken_image_refs(body, rel_path, repo_name, base_dir, known_images, errors):
     """Check for broken image references in markdown content.
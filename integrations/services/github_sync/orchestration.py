@@ -3,12 +3,22 @@
 import os
 import shutil
 import tempfile
-from dataclasses import dataclass
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, replace
 
-from django.db import DatabaseError, IntegrityError
+from django.db import DatabaseError, IntegrityError, connection
 from django.utils import timezone
 
+from content.services.tag_index import deferred_tag_index
 from integrations.models import ContentSource, SyncLog
+from integrations.services.github_sync.clone_cache import (
+    cached_checkout_dir,
+    discard_checkout,
+    evict_clone_cache,
+    mark_checkout_used,
+)
 from integrations.services.github_sync.common import (
     CONTENT_EXTENSIONS,
     IMAGE_EXTENSIONS,
@@ -34,14 +44,35 @@ from integrations.services.github_sync.repo import (
     _resolve_local_repo_sha,
     clone_or_pull_repo,
     fetch_remote_head_sha,
+    list_changed_paths,
+)
+from website.page_cache import (
+    deferred_page_cache_invalidation,
+    invalidate_page_cache,
 )
 
+# Files whose addition or removal re-draws the course/workshop subtree
+# claims in ``RepoFileClassifier``; incremental syncs can't scope those.
+_CLAIM_MARKER_FILES = ('course.yaml', 'workshop.yaml')
+
+# ``sync_content_sources`` runs several sources on threads of one worker.
+# SQLite has a single writer, so their dispatcher phases take turns on this
+# lock instead of piling up on ``busy_timeout``; clone and S3 upload still
+# overlap. Other backends write concurrently.
+_SQLITE_WRITE_PHASE_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True)
 class PreparedRepo:
     repo_dir: str
     temp_dir: str | None
     commit_sha: str
+    cached: bool = False
+
+    @property
+    def managed(self):
+        """Whether the sync owns this checkout (a temp clone or the cache)."""
+        return self.cached or self.temp_dir is not None
 
 
 @dataclass(frozen=True)
@@ -51,6 +82,24 @@ class SyncPipelineResult:
     tiers_result: dict
 
 
+@dataclass(frozen=True)
+class RepoChanges:
+    """Repo-relative paths that changed since the last successful sync."""
+
+    base_sha: str
+    added: frozenset
+    modified: frozenset
+    deleted: frozenset
+
+    @property
+    def changed(self):
+        return self.added | self.modified
+
+    @property
+    def touched(self):
+        return self.added | self.modified | self.deleted
+
+
 @dataclass(frozen=True)
 class RepoClassification:
     course_dirs: list
@@ -114,12 +163,15 @@ def sync_content_source(source, repo_dir=None, batch_id=None, force=False):
         repo_dir: Optional pre-cloned repo directory (for testing /
             ``--from-disk`` syncs). When provided, the cheap HEAD-SHA
             skip optimisation (issue #235) is bypassed because there's
-            no remote to compare against.
+            no remote to compare against, and the whole checkout is
+            walked: it may hold uncommitted edits.
         batch_id: Optional UUID to group logs from the same "Sync All" action.
         force: If True, bypass the HEAD-SHA skip check and force a full
             sync even when the upstream HEAD hasn't changed (issue #235).
-            Used by the Studio "Force resync" button and the webhook
-            handler (which already knows a new commit landed).
+            Used by the Studio "Force resync" button. Without it, a cloned
+            repo that synced successfully before is synced incrementally: only
+            content touched by ``git diff <last synced commit> HEAD`` is
+            dispatched (see :func:`_resolve_repo_changes`).
 
     Returns:
         SyncLog or None: The sync log entry.
@@ -137,12 +189,18 @@ def sync_content_source(source, repo_dir=None, batch_id=None, force=False):
         return head_skip_log
 
     sync_log = _start_sync_log(source, batch_id)
+    timings = sync_log.timings = {}
+    sync_started = time.monotonic()
     prepared = None
     try:
-        prepared = _prepare_repo(source, repo_dir)
+        with _timed(timings, 'prepare'):
+            prepared = _prepare_repo(source, repo_dir)
+            changes = _resolve_repo_changes(source, prepared, force=force)
         pipeline_result = _run_content_pipeline(
             source, prepared.repo_dir, prepared.commit_sha, sync_log,
+            changes=changes, timings=timings,
         )
+        timings['total_seconds'] = _seconds_since(sync_started)
         _finish_successful_sync(source, sync_log, prepared, pipeline_result)
     except Exception as e:
         # Intentional broad catch: this is the worker-task boundary for a
@@ -150,6 +208,7 @@ def sync_content_source(source, repo_dir=None, batch_id=None, force=False):
         # dispatcher bug, DB hiccup) must be turned into a "failed"
         # SyncLog row rather than crashing the Django-Q worker, otherwise
         # the lock + queue state drift and on-call has no audit row.
+        timings['total_seconds'] = _seconds_since(sync_started)
         _mark_sync_failed(source, sync_log, e, prepared)
     finally:
         _cleanup_prepared_repo(prepared)
@@ -265,6 +324,13 @@ def _start_sync_log(source, batch_id):
 
 def _prepare_repo(source, repo_dir):
     if repo_dir is None:
+        checkout_dir = cached_checkout_dir(source)
+        if checkout_dir is not None:
+            commit_sha = _update_cached_checkout(source, checkout_dir)
+            return PreparedRepo(
+                repo_dir=checkout_dir, temp_dir=None, commit_sha=commit_sha,
+                cached=True,
+            )
         temp_dir = tempfile.mkdtemp(prefix='github-sync-')
         commit_sha = clone_or_pull_repo(
             source.repo_name, temp_dir, source.is_private,
@@ -279,9 +345,196 @@ def _prepare_repo(source, repo_dir):
     return PreparedRepo(repo_dir=repo_dir, temp_dir=None, commit_sha=commit_sha)
 
 
-def _run_content_pipeline(source, repo_dir, commit_sha, sync_log):
+def _update_cached_checkout(source, checkout_dir):
+    """Fetch the source's cached checkout, re-cloning it if it is unusable.
+
+    A directory without ``.git`` is the leftover of an interrupted clone and
+    is cleared first. If updating an existing checkout fails for any reason
+    (a corrupted object store, a broken ref, a rewritten remote), the entry
+    is thrown away and cloned fresh once; a failing fresh clone raises.
+    """
+    is_checkout = os.path.isdir(os.path.join(checkout_dir, '.git'))
+    if not is_checkout and os.path.exists(checkout_dir):
+        discard_checkout(checkout_dir)
+    try:
+        return clone_or_pull_repo(
+            source.repo_name, checkout_dir, source.is_private,
+        )
+    except GitHubSyncError as e:
+        if not is_checkout:
+            raise
+        logger.warning(
+            'Cached checkout for %s could not be updated (%s); re-cloning.',
+            source.repo_name, e,
+        )
+        discard_checkout(checkout_dir)
+        return clone_or_pull_repo(
+            source.repo_name, checkout_dir, source.is_private,
+        )
+
+
+def _last_successful_commit(source):
+    """Return the commit SHA of the source's latest ``success`` SyncLog."""
+    return (
+        SyncLog.objects.filter(source=source, status='success')
+        .exclude(commit_sha__in=['', 'test-commit-sha'])
+        .order_by('-started_at')
+        .values_list('commit_sha', flat=True)
+        .first()
+    ) or ''
+
+
+def _resolve_repo_changes(source, prepared, *, force):
+    """Return the :class:`RepoChanges` for an incremental sync, or ``None``.
+
+    ``None`` means "run a full sync": ``force`` was requested, the checkout
+    was supplied by the caller, the checkout has no real commit SHA, there
+    is no successful sync to diff against, git could not produce the diff,
+    or the diff touches something the incremental walker can't scope (see
+    :func:`_full_sync_reason`).
+
+    Caller-supplied directories (``--from-disk``, ``watch_content``) are
+    always walked in full: their uncommitted edits don't move HEAD, and
+    ``list_changed_paths`` may fetch into the checkout.
+    """
+    if force or not prepared.managed:
+        return None
+    if prepared.commit_sha in ('', 'test-commit-sha'):
+        return None
+    base_sha = _last_successful_commit(source)
+    if not base_sha:
+        return None
+    diff = list_changed_paths(prepared.repo_dir, base_sha, prepared.commit_sha)
+    if diff is None:
+        return None
+
+    by_status = {'A': set(), 'M': set(), 'D': set()}
+    for status, path in diff:
+        # Type changes (``T``) and anything exotic count as modifications.
+        by_status.get(status, by_status['M']).add(path)
+    changes = RepoChanges(
+        base_sha=base_sha,
+        added=frozenset(by_status['A']),
+        modified=frozenset(by_status['M']),
+        deleted=frozenset(by_status['D']),
+    )
+
+    reason = _full_sync_reason(prepared.repo_dir, changes)
+    if reason:
+        logger.info('Running a full sync for %s: %s', source.repo_name, reason)
+        return None
+    logger.info(
+        'Incremental sync for %s: %d path(s) changed since %s.',
+        source.repo_name, len(changes.touched), base_sha[:7],
+    )
+    return changes
+
+
+def _full_sync_reason(repo_dir, changes):
+    """Explain why ``changes`` can't be synced incrementally, or return ``''``.
+
+    - Adding or removing a ``course.yaml`` / ``workshop.yaml`` moves the
+      subtree claims, so files elsewhere may change content type.
+    - Any other non-content, non-image file outside a course/workshop
+      subtree may be an HTML include target (``widgets/`` etc.) of content
+      that did not change itself.
+    """
+    for path in sorted(changes.touched):
+        if _is_git_metadata_path(path):
+            continue
+        filename = path.rsplit('/', 1)[-1]
+        if filename in _CLAIM_MARKER_FILES and path not in changes.modified:
+            return f'{path} was added or removed'
+        ext = os.path.splitext(filename)[1].lower()
+        if ext in CONTENT_EXTENSIONS or ext in IMAGE_EXTENSIONS:
+            continue
+        if _claim_root(repo_dir, path) is None:
+            return f'{path} is not a content file'
+    return ''
+
+
+def _is_git_metadata_path(rel_path):
+    """True for ``.git*`` files and dirs, which the classifier never walks."""
+    return any(part.startswith('.git') for part in rel_path.split('/'))
+
+
+def _claim_root(repo_dir, rel_path):
+    """Return the course/workshop dir that claims ``rel_path``, or ``None``.
+
+    Mirrors :meth:`RepoFileClassifier._claim_structured_subtrees`: the
+    outermost ancestor directory holding a ``course.yaml`` or
+    ``workshop.yaml`` wins. The returned path is absolute and normalised.
+    """
+    parts = rel_path.split('/')[:-1]
+    for depth in range(len(parts) + 1):
+        candidate = os.path.normpath(os.path.join(repo_dir, *parts[:depth]))
+        if any(
+            os.path.isfile(os.path.join(candidate, marker))
+            for marker in _CLAIM_MARKER_FILES
+        ):
+            return candidate
+    return None
+
+
+def _incremental_leaf_paths(repo_dir, changes):
+    """Return the repo-relative content files to classify incrementally.
+
+    Changed content files outside ``.git*`` are classified as usual (files
+    inside course/workshop subtrees are dropped by the classifier). Event
+    files are widened to every content file in the same directory, so an
+    edit to a ``recap_file`` re-renders the event YAML that references it.
+    """
+    paths = set()
+    event_dirs = set()
+    for path in changes.touched:
+        if _is_git_metadata_path(path):
+            continue
+        if os.path.splitext(path)[1].lower() not in CONTENT_EXTENSIONS:
+            continue
+        if path in changes.changed:
+            paths.add(path)
+        if {'events', 'recordings'} & set(path.split('/')[:-1]):
+            event_dirs.add(path.rsplit('/', 1)[0])
+
+    for rel_dir in event_dirs:
+        abs_dir = os.path.join(repo_dir, rel_dir)
+        if not os.path.isdir(abs_dir):
+            continue
+        for filename in os.listdir(abs_dir):
+            if (
+                os.path.splitext(filename)[1].lower() in CONTENT_EXTENSIONS
+                and os.path.isfile(os.path.join(abs_dir, filename))
+            ):
+                paths.add(f'{rel_dir}/{filename}')
+    return paths
+
+
+def _seconds_since(started):
+    return round(time.monotonic() - started, 3)
+
+
+@contextmanager
+def _timed(timings, phase):
+    """Record the wall-clock seconds of a block as ``<phase>_seconds``."""
+    started = time.monotonic()
+    try:
+        yield
+    finally:
+        timings[f'{phase}_seconds'] = _seconds_since(started)
+
+
+def _write_phase_lock():
+    if connection.vendor == 'sqlite':
+        return _SQLITE_WRITE_PHASE_LOCK
+    return nullcontext()
+
+
+def _run_content_pipeline(source, repo_dir, commit_sha, sync_log, changes=None,
+                          timings=None):
+    timings = {} if timings is None else timings
     _enforce_max_content_files(source, repo_dir)
-    s3_stats = upload_images_to_s3(repo_dir, source)
+    with _timed(timings, 'images'):
+        s3_stats = upload_images_to_s3(repo_dir, source)
     s3_errors = s3_stats.get('errors', [])
     if s3_errors:
         logger.warning(
@@ -293,11 +546,26 @@ def _run_content_pipeline(source, repo_dir, commit_sha, sync_log):
         source.repo_name, s3_stats['uploaded'], s3_stats['skipped'],
     )
 
-    tiers_result = _sync_tiers_yaml(repo_dir)
     known_images = _collect_image_paths(repo_dir)
-    stats = _sync_repo(
-        source, repo_dir, commit_sha, sync_log, known_images=known_images,
-    )
+    waiting_since = time.monotonic()
+    with _write_phase_lock():
+        timings['write_wait_seconds'] = _seconds_since(waiting_since)
+        # Content row saves retire the public page cache and update the tag
+        # index once, when the write phase finishes (or fails part-way), not
+        # once per row. Both flushes write to the database, so they run
+        # before the SQLite write lock is released.
+        with _timed(timings, 'write'):
+            with deferred_page_cache_invalidation(), deferred_tag_index():
+                try:
+                    tiers_result = _sync_tiers_yaml(repo_dir)
+                    stats = _sync_repo(
+                        source, repo_dir, commit_sha, sync_log,
+                        known_images=known_images, changes=changes,
+                    )
+                finally:
+                    # Stale sweeps unpublish rows with queryset ``.update()``,
+                    # which sends no signal, so retire the cache on every run.
+                    invalidate_page_cache()
     return SyncPipelineResult(
         stats=stats, s3_errors=s3_errors, tiers_result=tiers_result,
     )
@@ -358,6 +626,13 @@ def _mark_sync_failed(source, sync_log, error, prepared):
 
 
 def _cleanup_prepared_repo(prepared):
+    if prepared and prepared.cached:
+        try:
+            mark_checkout_used(prepared.repo_dir)
+            evict_clone_cache(keep=prepared.repo_dir)
+        except (OSError, DatabaseError):
+            logger.exception('Clone cache eviction failed')
+        return
     if prepared and prepared.temp_dir and os.path.exists(prepared.temp_dir):
         shutil.rmtree(prepared.temp_dir, ignore_errors=True)
 
@@ -388,7 +663,7 @@ def _release_lock_and_enqueue_follow_up(source):
         sync_content_source(source)
 
 
-def _classify_repo_files(repo_dir, classify_errors=None):
+def _classify_repo_files(repo_dir, classify_errors=None, paths=None):
     """First-pass walk: classify every file in the repo for dispatch.
 
     Returns a :class:`RepoClassification` with per-type lists of
@@ -423,16 +698,21 @@ def _classify_repo_files(repo_dir, classify_errors=None):
           ``interview_files`` — list of root-level ``.md`` files matching
               the interview-question convention (lowercase kebab-case,
               not README) AND having no special frontmatter.
+
+    ``paths`` (incremental syncs) limits the per-file pass to those
+    repo-relative files; the course/workshop dirs are still discovered
+    from the whole tree.
     """
-    return RepoFileClassifier(repo_dir, classify_errors).classify()
+    return RepoFileClassifier(repo_dir, classify_errors, paths=paths).classify()
 
 
 class RepoFileClassifier:
     """Two-pass repo classifier returning a :class:`RepoClassification`."""
 
-    def __init__(self, repo_dir, classify_errors=None):
+    def __init__(self, repo_dir, classify_errors=None, paths=None):
         self.repo_dir = repo_dir
         self.classify_errors = classify_errors
+        self.paths = paths
         self.course_dirs = []
         self.workshop_dirs = []
         self.claimed_prefixes = []
@@ -485,6 +765,14 @@ class RepoFileClassifier:
         return False
 
     def _classify_unclaimed_files(self):
+        if self.paths is not None:
+            for rel_path in sorted(self.paths):
+                root, filename = os.path.split(
+                    os.path.join(self.repo_dir, rel_path),
+                )
+                if os.path.isfile(os.path.join(root, filename)):
+                    self._classify_file(root, filename)
+            return
         for root, dirs, files in os.walk(self.repo_dir, topdown=True):
             self._prune_git_dirs(dirs)
             for filename in files:
@@ -732,7 +1020,8 @@ def _build_cross_workshop_lookup(workshop_dirs, repo_dir, errors=None):
     return lookup
 
 
-def _sync_repo(source, repo_dir, commit_sha, sync_log, known_images=None):
+def _sync_repo(source, repo_dir, commit_sha, sync_log, known_images=None,
+               changes=None):
     """Walk a cloned repo and dispatch each content file to its parser.
 
     Issue #310. Replaces the per-content-type orchestrators
@@ -755,6 +1044,12 @@ def _sync_repo(source, repo_dir, commit_sha, sync_log, known_images=None):
     - Per-type dispatch handlers process their assigned files, then
       perform stale-content cleanup against the union of seen + failed
       slugs/ids for that type.
+
+    With ``changes`` (a :class:`RepoChanges`), only the touched leaf files
+    and the course/workshop dirs containing a touched path are dispatched,
+    and each handler's stale sweep is limited to rows whose ``source_path``
+    was touched — so deletions are still retired while unchanged content
+    is never re-read.
     """
     stats = {
         'created': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0,
@@ -765,15 +1060,27 @@ def _sync_repo(source, repo_dir, commit_sha, sync_log, known_images=None):
     # SyncLog the same way the legacy per-type orchestrators did.
     classified = _classify_repo_files(
         repo_dir, classify_errors=stats['errors'],
+        paths=None if changes is None else _incremental_leaf_paths(
+            repo_dir, changes,
+        ),
     )
+    all_workshop_dirs = classified.workshop_dirs
+    cleanup_paths = None
+    if changes is not None:
+        classified, cleanup_paths = _scope_classification_to_changes(
+            source, repo_dir, classified, changes,
+        )
 
     # Issue #526: build the sync-wide cross-workshop lookup once, before
     # any workshop body is rewritten, so `rewrite_cross_workshop_md_links`
     # can resolve `../<folder>/...` and full-GitHub-URL references to
-    # native `/workshops/<slug>` URLs across the whole sync run.
-    cross_workshop_lookup = _build_cross_workshop_lookup(
-        classified.workshop_dirs, repo_dir, errors=stats['errors'],
-    )
+    # native `/workshops/<slug>` URLs across the whole sync run. It always
+    # covers every workshop in the repo, even when only some are dispatched.
+    cross_workshop_lookup = {}
+    if classified.workshop_dirs:
+        cross_workshop_lookup = _build_cross_workshop_lookup(
+            all_workshop_dirs, repo_dir, errors=stats['errors'],
+        )
     workshops_repo_name = _resolve_workshops_repo_name(source)
 
     # Each dispatch helper runs even when its file list is empty so the
@@ -783,48 +1090,134 @@ def _sync_repo(source, repo_dir, commit_sha, sync_log, known_images=None):
     _dispatch_courses(
         source, repo_dir, classified.course_dirs,
         commit_sha, stats, known_images=known_images,
+        cleanup_paths=cleanup_paths,
     )
     _dispatch_workshops(
         source, repo_dir, classified.workshop_dirs,
         commit_sha, stats, known_images=known_images,
         cross_workshop_lookup=cross_workshop_lookup,
         workshops_repo_name=workshops_repo_name,
+        cleanup_paths=cleanup_paths,
     )
     _dispatch_articles(
         source, repo_dir, classified.article_files,
         commit_sha, stats, known_images=known_images,
+        cleanup_paths=cleanup_paths,
     )
     _dispatch_projects(
         source, repo_dir, classified.project_files,
         commit_sha, stats, known_images=known_images,
+        cleanup_paths=cleanup_paths,
     )
     _dispatch_events(
         source, repo_dir, classified.event_files,
         commit_sha, stats, known_images=known_images,
+        cleanup_paths=cleanup_paths,
     )
     _dispatch_instructors(
         source, repo_dir, classified.instructor_files,
         commit_sha, stats,
+        cleanup_paths=cleanup_paths,
     )
     _dispatch_curated_links(
         source, repo_dir, classified.curated_link_files,
         commit_sha, stats,
+        cleanup_paths=cleanup_paths,
     )
     _dispatch_downloads(
         source, repo_dir, classified.download_files,
         commit_sha, stats, known_images=known_images,
+        cleanup_paths=cleanup_paths,
     )
     _dispatch_marketing_pages(
         source, repo_dir, classified.marketing_page_files,
         commit_sha, stats, known_images=known_images,
+        cleanup_paths=cleanup_paths,
     )
     _dispatch_interview_questions(
         source, repo_dir, classified.interview_files,
         commit_sha, stats, known_images=known_images,
+        cleanup_paths=cleanup_paths,
     )
 
     return stats
 
+
+def _scope_classification_to_changes(source, repo_dir, classified, changes):
+    """Narrow a classification to the course/workshop dirs ``changes`` touch.
+
+    Leaf files were already limited by :func:`_incremental_leaf_paths`.
+    Returns ``(classification, cleanup_paths)`` where ``cleanup_paths`` is
+    every touched path plus the repo-relative dir of each dispatched
+    course/workshop (the ``source_path`` those rows are stored under).
+    """
+    touched_roots = {
+        root for root in (
+            _claim_root(repo_dir, path) for path in changes.touched
+        )
+        if root is not None
+    }
+    course_dirs = [
+        d for d in classified.course_dirs
+        if os.path.normpath(d) in touched_roots
+    ]
+    workshop_dirs = [
+        d for d in classified.workshop_dirs
+        if os.path.normpath(d) in touched_roots
+    ]
+    if any(
+        _workshop_link_targets_moved(source, repo_dir, d, changes)
+        for d in workshop_dirs
+    ):
+        workshop_dirs = list(classified.workshop_dirs)
+
+    cleanup_paths = set(changes.touched)
+    cleanup_paths.update(
+        os.path.relpath(d, repo_dir) for d in course_dirs + workshop_dirs
+    )
+    classified = replace(
+        classified, course_dirs=course_dirs, workshop_dirs=workshop_dirs,
+    )
+    return classified, cleanup_paths
+
+
+def _workshop_link_targets_moved(source, repo_dir, workshop_dir, changes):
+    """True when a change may alter how other workshops link to this one.
+
+    Cross-workshop links (issue #526) are rewritten with the target's
+    workshop slug and page slugs. If those differ from what the last sync
+    stored — a renamed slug, an added or removed page — every workshop is
+    re-dispatched so links into this workshop are rewritten too.
+    """
+    from content.models import Workshop, WorkshopPage
+
+    rel_dir = os.path.relpath(workshop_dir, repo_dir)
+    folder_name = os.path.basename(workshop_dir.rstrip(os.sep))
+    meta = _build_cross_workshop_lookup(
+        [workshop_dir], repo_dir,
+    ).get(folder_name)
+    workshop = Workshop.objects.filter(
+        source_repo=source.repo_name, source_path=rel_dir,
+    ).first()
+    if meta is None or workshop is None or workshop.slug != meta['slug']:
+        return True
+
+    stored_page_slugs = dict(
+        WorkshopPage.objects.filter(workshop=workshop)
+        .values_list('source_path', 'slug')
+    )
+    prefix = '' if rel_dir == '.' else rel_dir + '/'
+    for path in changes.touched:
+        filename = path[len(prefix):]
+        if not path.startswith(prefix) or '/' in filename:
+            continue
+        if not filename.endswith('.md'):
+            continue
+        page = meta['pages'].get(filename)
+        if (page['slug'] if page else None) != stored_page_slugs.get(path):
+            return True
+    return False
+
 def _count_content_files(content_dir):
     """Count content files (.md, .yaml, .yml) in a directory tree."""
     count = 0
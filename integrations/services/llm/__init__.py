@@ -34,6 +34,15 @@ Callers build a tool spec from a Pydantic model and pass it through::
 
 The wrapper itself does not import Pydantic — callers own their schemas.
 
+Response cache
+==============
+
+Deterministic callers pass ``cache='<caller label>'`` to ``complete``.
+Labels listed in ``LLM_RESPONSE_CACHE_CALLERS`` get identical requests
+answered from :mod:`integrations.services.llm.cache`, with
+``result.cache_hit`` set. A caller that rejects a result calls
+``discard_cached(result)`` so the next attempt reaches the provider.
+
 Security
 ========
 
@@ -50,7 +59,7 @@ from .backends import (
     LLMTimeoutError,
     StreamEvent,
 )
-from .service import complete, is_enabled, stream
+from .service import complete, discard_cached, is_enabled, stream
 
 __all__ = [
     'STREAM_DONE',
@@ -61,6 +70,7 @@ __all__ = [
     'LLMResult',
     'StreamEvent',
     'complete',
+    'discard_cached',
     'is_enabled',
     'stream',
 ]
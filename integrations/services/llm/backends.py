@@ -17,9 +17,11 @@ and structured output via SDK tools + ``tool_choice``.
 """
 
 import logging
+import os
 import random
 import threading
 import time
+from collections import OrderedDict
 
 from integrations.config import get_config
 
@@ -35,6 +37,9 @@ DEFAULT_MAX_TOKENS = 4096
 _BACKOFF_BASE_SECONDS = 1.0
 _BACKOFF_CAP_SECONDS = 30.0
 
+# Idle provider clients kept per process, across all connection settings.
+_POOL_MAX_IDLE = 8
+
 
 class LLMError(Exception):
     """Raised on any LLM service failure.
@@ -95,6 +100,11 @@ class LLMResult:
     read ``result.text`` for plain completions or
     ``MyModel.model_validate(result.tool_input)`` for structured output
     without re-parsing the vendor SDK's response shape.
+
+    ``cache_hit`` is True when the result was served from the response
+    cache (:mod:`integrations.services.llm.cache`) instead of the provider;
+    the token counts are then those of the call that filled the entry.
+    ``cache_key`` is set on results stored in or served from that cache.
     """
 
     def __init__(
@@ -107,6 +117,8 @@ class LLMResult:
         output_tokens=None,
         cache_read_tokens=None,
         cache_write_tokens=None,
+        cache_hit=False,
+        cache_key=None,
     ):
         self.text = text
         self.tool_input = tool_input
@@ -115,6 +127,8 @@ class LLMResult:
         self.output_tokens = output_tokens
         self.cache_read_tokens = cache_read_tokens
         self.cache_write_tokens = cache_write_tokens
+        self.cache_hit = cache_hit
+        self.cache_key = cache_key
 
     def __repr__(self):
         return (
@@ -164,6 +178,137 @@ class StreamEvent:
         return f'StreamEvent(text_delta, text={self.text!r})'
 
 
+class _ClientLease:
+    """One request's exclusive use of a pooled provider client.
+
+    Cancelling the lease closes the client, aborting the in-flight request
+    exactly as a per-call client would. Releasing it hands the client back
+    to the pool, unless it was cancelled first; a cancel that arrives after
+    the release is a no-op, so a late cancellation never closes a client
+    another request has since picked up.
+    """
+
+    def __init__(self, pool, key, client, *, reused):
+        self._pool = pool
+        self._key = key
+        self._lock = threading.Lock()
+        self._released = False
+        self._cancelled = False
+        self.client = client
+        self.reused = reused
+
+    def cancel(self):
+        with self._lock:
+            if self._released or self._cancelled:
+                return
+            self._cancelled = True
+        self.client.close()
+
+    def release(self):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+            cancelled = self._cancelled
+        if not cancelled:
+            self._pool.checkin(self._key, self.client)
+
+
+class _ClientPool:
+    """Per-process pool of provider clients keyed by connection settings.
+
+    Each client owns an HTTP connection pool, so handing the same client to
+    the next request with the same ``(api_key, base_url, timeout,
+    max_retries)`` skips a fresh TCP/TLS handshake. Clients are leased to
+    one request at a time (see :class:`_ClientLease`); concurrent requests
+    get their own clients and all of them are reused afterwards, up to
+    ``max_idle`` idle clients in total.
+
+    The key is rebuilt from :func:`get_config` on every call. When the API
+    key or base URL changes, idle clients built from the old values are
+    closed on the next lease. A forked worker starts with an empty pool:
+    connections inherited from the parent are never reused.
+    """
+
+    def __init__(self, max_idle=_POOL_MAX_IDLE):
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._idle = OrderedDict()
+        self.created = 0
+        self.reused = 0
+
+    def lease(self, factory, key):
+        stale = []
+        with self._lock:
+            if self._pid != os.getpid():
+                self._reset()
+            for other in list(self._idle):
+                if other[:3] != key[:3]:
+                    stale.extend(self._idle.pop(other))
+            clients = self._idle.get(key)
+            client = clients.pop() if clients else None
+            if clients == []:
+                del self._idle[key]
+            if client is None:
+                self.created += 1
+            else:
+                self.reused += 1
+        for old in stale:
+            old.close()
+        reused = client is not None
+        if client is None:
+            client = factory()
+        return _ClientLease(self, key, client, reused=reused)
+
+    def checkin(self, key, client):
+        evicted = []
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            self._idle.setdefault(key, []).append(client)
+            self._idle.move_to_end(key)
+            while sum(len(clients) for clients in self._idle.values()) > self.max_idle:
+                oldest_key, oldest = next(iter(self._idle.items()))
+                evicted.append(oldest.pop(0))
+                if not oldest:
+                    del self._idle[oldest_key]
+        for old in evicted:
+            old.close()
+
+    def clear(self):
+        """Close every idle client and reset the counters."""
+        with self._lock:
+            idle = [client for clients in self._idle.values() for client in clients]
+            self._reset()
+        for client in idle:
+            client.close()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'created': self.created,
+                'reused': self.reused,
+                'idle': sum(len(clients) for clients in self._idle.values()),
+            }
+
+
+_client_pool = _ClientPool()
+
+
+def client_pool_stats():
+    """Return ``{'created', 'reused', 'idle'}`` counts for this process."""
+    return _client_pool.stats()
+
+
+def clear_client_pool():
+    """Close idle pooled clients and reset the counters (tests)."""
+    _client_pool.clear()
+
+
 def _retry_delay(attempt, *, base, cap):
     """Exponential backoff with small jitter (mirrors the reference)."""
     return min(cap, base * (2 ** attempt)) + random.uniform(0, 1)
@@ -185,10 +330,11 @@ class AnthropicBackend:
     """Anthropic-compatible backend using the official ``anthropic`` SDK.
 
     The same client talks to Anthropic or any Anthropic-compatible
-    gateway (e.g. Z.ai) by pointing ``base_url`` at the gateway. The
-    client is constructed per call from :func:`get_config` — never cached
-    at import — so Studio overrides and worker processes read fresh
-    values.
+    gateway (e.g. Z.ai) by pointing ``base_url`` at the gateway. Settings
+    are read from :func:`get_config` on every call, so Studio overrides and
+    worker processes see fresh values. Clients are leased from a
+    per-process pool keyed by those settings (see :class:`_ClientPool`) so
+    back-to-back calls reuse open connections.
     """
 
     name = 'anthropic'
@@ -229,16 +375,15 @@ class AnthropicBackend:
             else max(0, int(max_retries))
         )
 
-        client_kwargs = dict(
+        lease = _lease_client(
+            Anthropic,
             api_key=api_key,
             base_url=base_url,
+            timeout_seconds=timeout_seconds,
             max_retries=max_retries,
+            cancellation=cancellation,
         )
-        if timeout_seconds is not None:
-            client_kwargs['timeout'] = float(timeout_seconds)
-        client = Anthropic(**client_kwargs)
-        if cancellation is not None:
-            cancellation.register(client.close)
+        client = lease.client
 
         request_kwargs = {
             'model': resolved_model,
@@ -264,6 +409,23 @@ class AnthropicBackend:
         # ``max_retries`` is the number of RETRIES, so total attempts is
         # one initial call plus that many retries.
         total_attempts = max_retries + 1
+        started = time.monotonic()
+        try:
+            result = self._complete_with_retries(
+                client, request_kwargs, api_key, total_attempts, transient_errors,
+            )
+        finally:
+            lease.release()
+        logger.debug(
+            'LLM completion took %.0f ms on a %s client',
+            (time.monotonic() - started) * 1000,
+            'reused' if lease.reused else 'new',
+        )
+        return result
+
+    def _complete_with_retries(
+        self, client, request_kwargs, api_key, total_attempts, transient_errors,
+    ):
         last_exc = None
         for attempt in range(total_attempts):
             try:
@@ -373,16 +535,15 @@ class AnthropicBackend:
             else max(0, int(max_retries))
         )
 
-        client_kwargs = dict(
+        lease = _lease_client(
+            Anthropic,
             api_key=api_key,
             base_url=base_url,
+            timeout_seconds=timeout_seconds,
             max_retries=max_retries,
+            cancellation=cancellation,
         )
-        if timeout_seconds is not None:
-            client_kwargs['timeout'] = float(timeout_seconds)
-        client = Anthropic(**client_kwargs)
-        if cancellation is not None:
-            cancellation.register(client.close)
+        client = lease.client
 
         request_kwargs = {
             'model': resolved_model,
@@ -411,6 +572,7 @@ class AnthropicBackend:
             stream_cm = client.messages.stream(**request_kwargs)
             manager = stream_cm.__enter__()
         except open_errors as exc:
+            lease.release()
             error_class = (
                 LLMTimeoutError
                 if type(exc).__name__ == 'APITimeoutError'
@@ -421,6 +583,7 @@ class AnthropicBackend:
                 + _safe_error_message(type(exc).__name__, api_key)
             ) from None
         except Exception as exc:
+            lease.release()
             error_class = (
                 LLMTimeoutError
                 if type(exc).__name__ == 'APITimeoutError'
@@ -433,14 +596,15 @@ class AnthropicBackend:
                 )
             ) from None
 
-        return self._iter_stream(stream_cm, manager, api_key)
+        return self._iter_stream(stream_cm, manager, api_key, lease)
 
-    def _iter_stream(self, stream_cm, manager, api_key):
+    def _iter_stream(self, stream_cm, manager, api_key, lease):
         """Generator that yields deltas then the assembled terminal event.
 
         Separated from :meth:`stream` so that an open failure raises
         eagerly (before the caller starts iterating) while delta iteration
-        and the terminal assembly happen lazily.
+        and the terminal assembly happen lazily. The pooled client goes
+        back to the pool once the stream is closed.
         """
         text_parts = []
         try:
@@ -466,6 +630,7 @@ class AnthropicBackend:
             ) from None
         finally:
             stream_cm.__exit__(None, None, None)
+            lease.release()
 
         result = _parse_response(final_message, api_key)
         # Defensively prefer the streamed text when the final message did
@@ -477,6 +642,32 @@ class AnthropicBackend:
         yield StreamEvent(kind=STREAM_DONE, result=result)
 
 
+def _lease_client(
+    client_class, *, api_key, base_url, timeout_seconds, max_retries, cancellation,
+):
+    """Lease a pooled client for one request, wired to ``cancellation``."""
+    timeout = float(timeout_seconds) if timeout_seconds is not None else None
+
+    def build():
+        client_kwargs = dict(
+            api_key=api_key,
+            base_url=base_url,
+            max_retries=max_retries,
+        )
+        if timeout is not None:
+            client_kwargs['timeout'] = timeout
+        return client_class(**client_kwargs)
+
+    # The client class leads the key so a patched SDK class in tests never
+    # receives a client built by the real one (or by an earlier patch).
+    lease = _client_pool.lease(
+        build, (client_class, api_key, base_url, timeout, max_retries),
+    )
+    if cancellation is not None:
+        cancellation.register(lease.cancel)
+    return lease
+
+
 def _parse_response(response, api_key):
     """Turn an Anthropic Messages response into an :class:`LLMResult`.
 
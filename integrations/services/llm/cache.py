@@ -0,0 +1,164 @@
+"""Content-addressed response cache for deterministic LLM callers.
+
+Some callers send byte-identical requests again and again: a plan re-parse
+over unchanged threads, a retried task, an eval rerun over the same
+fixture. :func:`integrations.services.llm.complete` takes a ``cache``
+label naming the caller. When the label is listed in
+``LLM_RESPONSE_CACHE_CALLERS``, the result is looked up in, and stored to,
+:class:`integrations.models.LLMResponse` before the provider is called.
+
+The key is a SHA-256 of the canonical JSON of everything that shapes the
+reply: provider, base URL, resolved model, system prompt, messages,
+tools, tool choice, temperature and max tokens. Entries expire after
+``LLM_RESPONSE_CACHE_TTL_HOURS``. Each write also trims the table back to
+``LLM_RESPONSE_CACHE_MAX_ENTRIES``, dropping expired rows first and then
+the least recently used.
+
+Each opted-in caller module defines its label as a ``CACHE_LABEL``
+constant and passes it as ``cache=``. Only callers whose output may be
+replayed for the same input opt in; the Studio plan drafts, which staff
+regenerate on purpose, do not.
+
+A hit comes back as an :class:`LLMResult` with ``cache_hit=True`` and the
+token counts of the call that filled it, so trace sinks can report what
+the hit saved. A caller that rejects a result (schema validation, a wrong
+week count) calls :func:`discard` so the bad reply is not served again.
+
+The cache never breaks a completion: each read and write runs in its own
+savepoint, and a database error is logged and the call goes to the
+provider as if the cache were off.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import timedelta
+
+from django.db import DatabaseError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from integrations.config import get_config
+from integrations.models import LLMResponse
+
+from .backends import LLMResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_HOURS = 168
+DEFAULT_MAX_ENTRIES = 2000
+
+# ``LLMResult`` attributes persisted per entry.
+_RESULT_FIELDS = (
+    'text',
+    'tool_input',
+    'tool_name',
+    'input_tokens',
+    'output_tokens',
+    'cache_read_tokens',
+    'cache_write_tokens',
+)
+
+
+def _int_config(key, default):
+    try:
+        value = int(get_config(key, default))
+    except (TypeError, ValueError):
+        return default
+    return value if value > 0 else default
+
+
+def enabled_callers():
+    """Return the caller labels opted in via ``LLM_RESPONSE_CACHE_CALLERS``."""
+    raw = get_config('LLM_RESPONSE_CACHE_CALLERS', '') or ''
+    return {label.strip() for label in str(raw).split(',') if label.strip()}
+
+
+def is_enabled_for(caller):
+    """Return True iff ``caller`` is a label the operator has opted in."""
+    return bool(caller) and caller in enabled_callers()
+
+
+def request_key(**request):
+    """Return the hex SHA-256 of the canonical JSON of ``request``."""
+    payload = json.dumps(
+        request, sort_keys=True, separators=(',', ':'), ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def lookup(key):
+    """Return the cached :class:`LLMResult` for ``key``, or ``None``."""
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            entry = (
+                LLMResponse.objects
+                .filter(key=key, expires_at__gt=now)
+                .only('pk', 'result')
+                .first()
+            )
+            if entry is None:
+                return None
+            LLMResponse.objects.filter(pk=entry.pk).update(
+                hit_count=F('hit_count') + 1, last_used_at=now,
+            )
+    except DatabaseError:
+        logger.warning('LLM response cache lookup failed', exc_info=True)
+        return None
+    fields = {name: entry.result.get(name) for name in _RESULT_FIELDS}
+    fields['text'] = fields['text'] or ''
+    return LLMResult(**fields, cache_hit=True, cache_key=key)
+
+
+def store(key, result, *, caller, model):
+    """Persist ``result`` under ``key`` and trim the table to its bound."""
+    now = timezone.now()
+    ttl = timedelta(hours=_int_config('LLM_RESPONSE_CACHE_TTL_HOURS', DEFAULT_TTL_HOURS))
+    try:
+        with transaction.atomic():
+            LLMResponse.objects.update_or_create(
+                key=key,
+                defaults={
+                    'caller': caller,
+                    'model': model or '',
+                    'result': {name: getattr(result, name) for name in _RESULT_FIELDS},
+                    'expires_at': now + ttl,
+                    'last_used_at': now,
+                    'hit_count': 0,
+                },
+            )
+            _evict(now)
+    except DatabaseError:
+        logger.warning('LLM response cache write failed', exc_info=True)
+        return
+    result.cache_key = key
+
+
+def _evict(now):
+    LLMResponse.objects.filter(expires_at__lte=now).delete()
+    max_entries = _int_config('LLM_RESPONSE_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES)
+    overflow = LLMResponse.objects.count() - max_entries
+    if overflow <= 0:
+        return
+    stale = (
+        LLMResponse.objects
+        .order_by('last_used_at', 'pk')
+        .values_list('pk', flat=True)[:overflow]
+    )
+    LLMResponse.objects.filter(pk__in=list(stale)).delete()
+
+
+def discard(result):
+    """Drop the entry ``result`` was stored under or served from.
+
+    A no-op for results that did not pass through the cache.
+    """
+    key = getattr(result, 'cache_key', None)
+    if not key:
+        return
+    try:
+        LLMResponse.objects.filter(key=key).delete()
+    except DatabaseError:
+        logger.warning('LLM response cache discard failed', exc_info=True)
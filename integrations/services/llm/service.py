@@ -9,6 +9,7 @@ root (``integrations.services.llm``).
 
 from integrations.config import get_config
 
+from . import cache as response_cache
 from .backends import (
     DEFAULT_MAX_TOKENS,
     LLMError,
@@ -48,6 +49,7 @@ def complete(
     timeout_seconds=None,
     max_retries=None,
     cancellation=None,
+    cache=None,
 ):
     """Run a single completion against the configured provider.
 
@@ -62,10 +64,17 @@ def complete(
             a Pydantic ``model_json_schema()``).
         tool_choice: Optional tool-choice directive
             (e.g. ``{'type': 'tool', 'name': ...}``).
+        cache: Optional caller label (e.g. ``'feedback_synthesis'``). When
+            the label is listed in ``LLM_RESPONSE_CACHE_CALLERS``, an
+            identical earlier request is answered from the response cache
+            (:mod:`integrations.services.llm.cache`) and a fresh result is
+            stored there. Only pass it from callers whose output may be
+            reused for the same input.
 
     Returns:
         LLMResult: exposes ``.text`` and, when a tool was used,
-        ``.tool_input``.
+        ``.tool_input``. ``.cache_hit`` is True when it came from the
+        response cache.
 
     Raises:
         LLMError: on not-configured, unsupported provider, transport
@@ -76,7 +85,26 @@ def complete(
     # Select the backend first so an unimplemented provider raises before
     # any client construction or network call.
     backend = get_backend(provider)
-    return backend.complete(
+
+    cache_key = None
+    if response_cache.is_enabled_for(cache):
+        model = model or get_config('LLM_MODEL', 'claude-sonnet-4-5')
+        cache_key = response_cache.request_key(
+            provider=provider,
+            base_url=(get_config('LLM_BASE_URL', '') or '').strip(),
+            model=model,
+            system=system,
+            messages=messages,
+            tools=tools,
+            tool_choice=tool_choice,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        cached = response_cache.lookup(cache_key)
+        if cached is not None:
+            return cached
+
+    result = backend.complete(
         messages,
         model=model,
         system=system,
@@ -88,6 +116,19 @@ def complete(
         max_retries=max_retries,
         cancellation=cancellation,
     )
+    if cache_key is not None:
+        response_cache.store(cache_key, result, caller=cache, model=model)
+    return result
+
+
+def discard_cached(result):
+    """Drop ``result`` from the response cache so it is not served again.
+
+    Callers that reject a completion after :func:`complete` returns (the
+    tool input fails validation, say) call this so a retry reaches the
+    provider. A no-op for results that never went through the cache.
+    """
+    response_cache.discard(result)
 
 
 def stream(
@@ -153,4 +194,4 @@ def stream(
     )
 
 
-__all__ = ['LLMError', 'complete', 'is_enabled', 'stream']
+__all__ = ['LLMError', 'complete', 'discard_cached', 'is_enabled', 'stream']
@@ -256,14 +256,26 @@ INTEGRATION_GROUPS = [
                 'is_secret': False,
                 'optional': True,
                 'description': (
-                    'Seconds to stagger campaign send batches apart so the '
-                    'fan-out does not burst past the SES send-rate limit '
+                    'Optional seconds to stagger campaign send batches apart '
                     '(issue #922). Batch i is scheduled at now + i * this '
-                    'interval; the first batch fires immediately. Default 60. '
-                    'Set to 0 to send all batches at once (no stagger).'
+                    'interval; the first batch fires immediately. Default 0: '
+                    'all batches start at once and the SES send-rate token '
+                    'bucket paces them.'
                 ),
                 'docs_url': '_docs/integrations/ses.md#campaign_batch_interval_seconds',
             },
+            {
+                'key': 'SES_MAX_SEND_RATE',
+                'is_secret': False,
+                'optional': True,
+                'description': (
+                    'Messages per second campaign sends may use, shared '
+                    'across all background workers. Leave blank to use the '
+                    'MaxSendRate reported by the SES account; set lower to '
+                    'keep headroom for transactional mail.'
+                ),
+                'docs_url': '_docs/integrations/ses.md#ses_max_send_rate',
+            },
             {
                 'key': 'CAMPAIGN_TEST_RECIPIENTS',
                 'is_secret': False,
@@ -971,6 +983,44 @@ INTEGRATION_GROUPS = [
                 ),
                 'docs_url': '_docs/integrations/llm.md#llm_max_retries',
             },
+            {
+                'key': 'LLM_RESPONSE_CACHE_CALLERS',
+                'is_secret': False,
+                'optional': True,
+                'default': '',
+                'description': (
+                    'Comma-separated caller labels whose identical LLM '
+                    'requests are answered from the stored response cache '
+                    'instead of the provider: plan_sprint_parse, '
+                    'feedback_synthesis. Empty (the default) disables the '
+                    'cache for every caller.'
+                ),
+                'docs_url': '_docs/integrations/llm.md#llm_response_cache_callers',
+            },
+            {
+                'key': 'LLM_RESPONSE_CACHE_TTL_HOURS',
+                'is_secret': False,
+                'optional': True,
+                'default': '168',
+                'description': (
+                    'Hours a cached LLM response stays valid. Default 168 '
+                    '(one week); invalid or non-positive input falls back '
+                    'to the default.'
+                ),
+                'docs_url': '_docs/integrations/llm.md#llm_response_cache_ttl_hours',
+            },
+            {
+                'key': 'LLM_RESPONSE_CACHE_MAX_ENTRIES',
+                'is_secret': False,
+                'optional': True,
+                'default': '2000',
+                'description': (
+                    'Upper bound on stored LLM responses. Each write drops '
+                    'expired entries, then the least recently used ones '
+                    'past this bound.'
+                ),
+                'docs_url': '_docs/integrations/llm.md#llm_response_cache_max_entries',
+            },
             {
                 'key': 'ONBOARDING_AI_ENABLED',
                 'is_secret': False,
@@ -1208,6 +1258,8 @@ SETTING_VALUE_TYPES = {
     'BANNER_GENERATOR_TIMEOUT_SECONDS': 'integer',
     'BANNER_UPLOAD_MAX_MB': 'integer',
     'LLM_MAX_RETRIES': 'integer',
+    'LLM_RESPONSE_CACHE_TTL_HOURS': 'integer',
+    'LLM_RESPONSE_CACHE_MAX_ENTRIES': 'integer',
     'ONBOARDING_AI_DEADLINE_SECONDS': 'integer',
     'ONBOARDING_AI_MAX_ATTEMPTS': 'integer',
     'MAVEN_OVERRIDE_DURATION_DAYS': 'integer',
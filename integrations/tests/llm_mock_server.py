@@ -0,0 +1,81 @@
+"""Local stand-in for the Anthropic Messages API.
+
+Used by the client-pool tests to observe connection reuse without a
+provider or an API key. The server answers
+``POST /v1/messages`` with a fixed text reply over HTTP/1.1 keep-alive and
+counts the TCP connections it accepts. A client that reuses its connection
+pool shows up as one connection for many requests.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockMessagesServer:
+    """Threaded Messages API server on an ephemeral localhost port.
+
+    Use as a context manager; ``base_url`` is what ``LLM_BASE_URL`` should
+    point at.
+    """
+
+    def __init__(self, *, reply='ok'):
+        self.reply = reply
+        self.connections = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out as separate writes; without this,
+            # Nagle plus delayed ACKs add ~40 ms to every reused request.
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length) or b'{}')
+                with server._lock:
+                    server.requests += 1
+                payload = json.dumps(server.message(body)).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._httpd.daemon_threads = True
+
+    def message(self, body):
+        return {
+            'id': f'msg_mock_{self.requests}',
+            'type': 'message',
+            'role': 'assistant',
+            'model': body.get('model', ''),
+            'content': [{'type': 'text', 'text': self.reply}],
+            'stop_reason': 'end_turn',
+            'stop_sequence': None,
+            'usage': {'input_tokens': 1, 'output_tokens': 1},
+        }
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address
+        return f'http://{host}:{port}'
+
+    def __enter__(self):
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,62 @@
+"""In-process S3 stand-in for the content image uploader tests."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import Counter
+
+
+class LocalS3StandIn:
+    """Minimal in-memory S3 client for ``upload_images_to_s3``.
+
+    Implements the two calls the uploader makes (``list_objects_v2``
+    pagination and ``upload_file``) against a dict of key -> object. Keys
+    and ETags behave like S3 for single-part uploads: the ETag is the
+    quoted MD5 of the body. ``latency`` seconds are slept per request to
+    model the S3 round-trip. ``calls`` counts requests by operation.
+    """
+
+    page_size = 1000
+
+    def __init__(self, *, latency=0.0):
+        self.latency = latency
+        self.objects = {}
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def _request(self, operation):
+        with self._lock:
+            self.calls[operation] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def get_paginator(self, operation):
+        assert operation == 'list_objects_v2', operation
+        return self
+
+    def paginate(self, Bucket, Prefix=''):
+        keys = sorted(
+            key for (bucket, key) in self.objects
+            if bucket == Bucket and key.startswith(Prefix)
+        )
+        for offset in range(0, max(len(keys), 1), self.page_size):
+            self._request('list_objects_v2')
+            yield {
+                'Contents': [
+                    {'Key': key, 'ETag': self.objects[(Bucket, key)]['ETag']}
+                    for key in keys[offset:offset + self.page_size]
+                ],
+            }
+
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs=None):
+        self._request('upload_file')
+        with open(Filename, 'rb') as f:
+            body = f.read()
+        with self._lock:
+            self.objects[(Bucket, Key)] = {
+                'Body': body,
+                'ETag': f'"{hashlib.md5(body).hexdigest()}"',
+                'ExtraArgs': dict(ExtraArgs or {}),
+            }
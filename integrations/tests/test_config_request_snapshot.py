@@ -0,0 +1,93 @@
+"""Request-scoped snapshot of the integration settings stamp.
+
+``get_config()`` re-reads the cross-process stamp from
+``caches['django_q']`` on every call, which in production is one SELECT
+against the ``django_q_cache`` table per lookup. Inside a request,
+``IntegrationConfigSnapshotMiddleware`` limits that to one read; these
+tests lock the read count and make sure a save in another process is
+still picked up by the next request.
+"""
+
+from django.core.cache import caches
+from django.test import TestCase
+
+from integrations import config as config_module
+from integrations.config import (
+    begin_request_snapshot,
+    clear_config_cache,
+    end_request_snapshot,
+    get_config,
+    stamp_read_count,
+)
+from integrations.models import IntegrationSetting
+
+
+class RequestSnapshotTest(TestCase):
+    def setUp(self):
+        clear_config_cache()
+        caches['django_q'].delete('integration_settings_stamp')
+
+    def tearDown(self):
+        end_request_snapshot()
+        clear_config_cache()
+        caches['django_q'].delete('integration_settings_stamp')
+
+    def test_rendered_page_reads_stamp_once(self):
+        # Warm the in-process cache so the request takes the
+        # "compare stamps" path rather than the initial populate.
+        get_config('SITE_BASE_URL', '')
+
+        reads_before = stamp_read_count()
+        response = self.client.get('/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(stamp_read_count() - reads_before, 1)
+
+    def test_calls_outside_request_scope_read_stamp_every_time(self):
+        get_config('SITE_BASE_URL', '')
+
+        reads_before = stamp_read_count()
+        get_config('SITE_BASE_URL', '')
+        get_config('GOOGLE_ANALYTICS_ID', '')
+        get_config('STRIPE_CUSTOMER_PORTAL_URL', '')
+
+        self.assertEqual(stamp_read_count() - reads_before, 3)
+
+    def test_scope_serves_later_lookups_from_snapshot(self):
+        get_config('SITE_BASE_URL', '')
+        begin_request_snapshot()
+
+        reads_before = stamp_read_count()
+        for _ in range(7):
+            get_config('SITE_BASE_URL', '')
+
+        self.assertEqual(stamp_read_count() - reads_before, 1)
+
+    def test_cross_process_save_visible_on_next_request(self):
+        get_config('SITE_BASE_URL', '')
+        stamp_seen = config_module._cache_stamp
+
+        # Another process saves and publishes a new stamp.
+        IntegrationSetting.objects.create(
+            key='SITE_BASE_URL', value='https://prod.example.com', group='site',
+        )
+        clear_config_cache()
+        config_module._cache = {}
+        config_module._cache_populated = True
+        config_module._cache_stamp = stamp_seen
+
+        begin_request_snapshot()
+        self.assertEqual(get_config('SITE_BASE_URL', ''), 'https://prod.example.com')
+        end_request_snapshot()
+
+    def test_clear_inside_scope_repopulates(self):
+        begin_request_snapshot()
+        get_config('SITE_BASE_URL', '')
+
+        # The save view writes the row and clears within the same request.
+        IntegrationSetting.objects.create(
+            key='SITE_BASE_URL', value='https://saved.example.com', group='site',
+        )
+        clear_config_cache()
+
+        self.assertEqual(get_config('SITE_BASE_URL', ''), 'https://saved.example.com')
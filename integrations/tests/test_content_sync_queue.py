@@ -3,10 +3,11 @@
 import uuid
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from integrations.models import ContentSource, SyncLog
 from integrations.services.content_sync_queue import (
+    BATCH_SYNC_TASK_PATH,
     SYNC_TASK_PATH,
     enqueue_content_sync,
     enqueue_content_syncs,
@@ -201,8 +202,48 @@ class ContentSyncQueueBulkServiceTest(TestCase):
 
         self.assertEqual(len(results), 2)
         self.assertTrue(all(result.ok for result in results))
-        self.assertEqual(mock_async.call_count, 2)
+        mock_async.assert_called_once()
+        self.assertEqual(mock_async.call_args.args[0], BATCH_SYNC_TASK_PATH)
+        self.assertEqual(mock_async.call_args.args[1], [source_a, source_b])
+        self.assertEqual(mock_async.call_args.kwargs['batch_id'], batch_id)
         self.assertEqual(
             SyncLog.objects.filter(batch_id=batch_id, status='queued').count(),
             2,
         )
+
+    @override_settings(CONTENT_SYNC_PARALLELISM=2)
+    @patch('django_q.tasks.async_task', side_effect=['task-1', 'task-2'])
+    def test_bulk_enqueue_chunks_sources_by_parallelism(self, mock_async):
+        sources = [
+            ContentSource.objects.create(repo_name=f'Org/{name}')
+            for name in ('a', 'b', 'c')
+        ]
+
+        results = enqueue_content_syncs(sources)
+
+        self.assertEqual(
+            [(call.args[0], call.args[1]) for call in mock_async.call_args_list],
+            [
+                (BATCH_SYNC_TASK_PATH, sources[:2]),
+                (SYNC_TASK_PATH, sources[2]),
+            ],
+        )
+        self.assertEqual(
+            [result.task_id for result in results],
+            ['task-1', 'task-1', 'task-2'],
+        )
+
+    @patch(
+        'integrations.services.content_sync_queue._enqueue_async_batch_task',
+        side_effect=RuntimeError('broker down'),
+    )
+    def test_failed_batch_enqueue_clears_every_queued_marker(self, _mock):
+        source_a = ContentSource.objects.create(repo_name='Org/a')
+        source_b = ContentSource.objects.create(repo_name='Org/b')
+
+        results = enqueue_content_syncs([source_a, source_b])
+
+        self.assertEqual([result.ok for result in results], [False, False])
+        self.assertFalse(SyncLog.objects.exists())
+        source_a.refresh_from_db()
+        self.assertIsNone(source_a.last_sync_status)
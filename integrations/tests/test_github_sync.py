@@ -524,7 +524,7 @@ class GitHubWebhookEndpointTest(TestCase):
             'integrations.services.github.sync_content_source',
         )
         self.assertEqual(mock_async.call_args.args[1].pk, self.source.pk)
-        self.assertTrue(mock_async.call_args.kwargs['force'])
+        self.assertFalse(mock_async.call_args.kwargs.get('force'))
         mock_sync.assert_not_called()
 
     def test_valid_push_webhook_to_master_queues_sync(self):
@@ -0,0 +1,198 @@
+"""Tests for the per-process LLM client pool (``backends._ClientPool``).
+
+The reuse tests drive the real ``anthropic`` SDK against
+:class:`MockMessagesServer` on localhost, so connection reuse is observed
+on the wire rather than inferred from mocks. The rest patch the SDK class
+to inspect client construction and cancellation.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, override_settings
+
+from integrations.config import clear_config_cache
+from integrations.services import llm
+from integrations.services.llm import CancellationToken, backends
+from integrations.services.llm.backends import clear_client_pool, client_pool_stats
+from integrations.tests.llm_mock_server import MockMessagesServer
+
+FAKE_KEY = 'sk-test-fake-pool-secret'
+ANTHROPIC_PATCH = 'anthropic.Anthropic'
+MESSAGES = [{'role': 'user', 'content': 'hi'}]
+
+LLM_ON = override_settings(
+    LLM_PROVIDER='anthropic',
+    LLM_API_KEY=FAKE_KEY,
+    LLM_BASE_URL='https://api.anthropic.com',
+    LLM_MODEL='claude-sonnet-4-5',
+    LLM_MAX_RETRIES=0,
+)
+
+
+def _text_response(text='ok'):
+    block = MagicMock()
+    block.type = 'text'
+    block.text = text
+    response = MagicMock()
+    response.content = [block]
+    response.usage = None
+    return response
+
+
+def _client():
+    client = MagicMock()
+    client.messages.create.return_value = _text_response()
+    return client
+
+
+class _PoolMixin:
+    def setUp(self):
+        super().setUp()
+        clear_config_cache()
+        clear_client_pool()
+        self.addCleanup(clear_config_cache)
+        self.addCleanup(clear_client_pool)
+
+
+@LLM_ON
+class ClientReuseOnTheWireTest(_PoolMixin, TestCase):
+    def test_sequential_completions_share_one_connection(self):
+        with MockMessagesServer(reply='pong') as server, override_settings(
+            LLM_BASE_URL=server.base_url,
+        ), self.assertLogs('integrations.services.llm.backends', level='DEBUG') as logs:
+            clear_config_cache()
+            texts = [llm.complete(MESSAGES).text for _ in range(3)]
+
+        self.assertEqual(texts, ['pong'] * 3)
+        self.assertEqual((server.requests, server.connections), (3, 1))
+        self.assertEqual(
+            client_pool_stats(), {'created': 1, 'reused': 2, 'idle': 1},
+        )
+        timings = [line for line in logs.output if 'LLM completion took' in line]
+        self.assertIn('on a new client', timings[0])
+        self.assertTrue(all('on a reused client' in line for line in timings[1:]))
+
+    def test_cleared_pool_reconnects(self):
+        with MockMessagesServer() as server, override_settings(
+            LLM_BASE_URL=server.base_url,
+        ):
+            clear_config_cache()
+            llm.complete(MESSAGES)
+            clear_client_pool()
+            llm.complete(MESSAGES)
+
+        self.assertEqual(server.connections, 2)
+
+
+@LLM_ON
+class ClientPoolTest(_PoolMixin, TestCase):
+    def test_config_change_builds_a_new_client_and_closes_the_stale_one(self):
+        with patch(ANTHROPIC_PATCH, side_effect=lambda **kwargs: _client()) as mock_cls:
+            llm.complete(MESSAGES)
+            with override_settings(LLM_BASE_URL='https://gateway.example/v1'):
+                clear_config_cache()
+                llm.complete(MESSAGES)
+
+        self.assertEqual(
+            [call.kwargs['base_url'] for call in mock_cls.call_args_list],
+            ['https://api.anthropic.com', 'https://gateway.example/v1'],
+        )
+        self.assertEqual(client_pool_stats()['idle'], 1)
+
+    def test_stale_idle_client_is_closed_on_the_next_lease(self):
+        built = []
+
+        def build(**kwargs):
+            built.append(_client())
+            return built[-1]
+
+        with patch(ANTHROPIC_PATCH, side_effect=build):
+            llm.complete(MESSAGES)
+            with override_settings(LLM_API_KEY='sk-test-fake-rotated'):
+                clear_config_cache()
+                llm.complete(MESSAGES)
+
+        built[0].close.assert_called_once_with()
+        built[1].close.assert_not_called()
+
+    def test_timeout_and_retry_overrides_get_their_own_clients(self):
+        with patch(ANTHROPIC_PATCH, side_effect=lambda **kwargs: _client()) as mock_cls:
+            llm.complete(MESSAGES)
+            llm.complete(MESSAGES, timeout_seconds=5)
+            llm.complete(MESSAGES, max_retries=2)
+            llm.complete(MESSAGES, timeout_seconds=5)
+
+        self.assertEqual(mock_cls.call_count, 3)
+        self.assertEqual(client_pool_stats()['reused'], 1)
+
+    def test_concurrent_requests_never_share_a_client(self):
+        both_in_flight = threading.Barrier(2, timeout=5)
+        clients = []
+
+        def build(**kwargs):
+            client = _client()
+
+            def create(**request):
+                both_in_flight.wait()
+                return _text_response()
+
+            client.messages.create.side_effect = create
+            clients.append(client)
+            return client
+
+        with patch(ANTHROPIC_PATCH, side_effect=build):
+            threads = [
+                threading.Thread(target=llm.complete, args=(MESSAGES,))
+                for _ in range(2)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        self.assertEqual(len(clients), 2)
+        self.assertEqual(client_pool_stats()['idle'], 2)
+
+    def test_cancel_mid_request_closes_and_discards_the_client(self):
+        token = CancellationToken()
+        client = _client()
+
+        def create(**request):
+            token.cancel()
+            return _text_response()
+
+        client.messages.create.side_effect = create
+        with patch(ANTHROPIC_PATCH, return_value=client):
+            llm.complete(MESSAGES, cancellation=token)
+
+        client.close.assert_called_once_with()
+        self.assertEqual(client_pool_stats()['idle'], 0)
+
+    def test_cancel_after_completion_leaves_the_pooled_client_open(self):
+        token = CancellationToken()
+        client = _client()
+        with patch(ANTHROPIC_PATCH, return_value=client) as mock_cls:
+            llm.complete(MESSAGES, cancellation=token)
+            token.cancel()
+            llm.complete(MESSAGES)
+
+        client.close.assert_not_called()
+        self.assertEqual(mock_cls.call_count, 1)
+
+    def test_forked_worker_does_not_reuse_parent_clients(self):
+        with patch(ANTHROPIC_PATCH, side_effect=lambda **kwargs: _client()) as mock_cls:
+            llm.complete(MESSAGES)
+            with patch.object(backends.os, 'getpid', return_value=-1):
+                llm.complete(MESSAGES)
+
+        self.assertEqual(mock_cls.call_count, 2)
+
+    def test_idle_clients_are_bounded(self):
+        with patch(ANTHROPIC_PATCH, side_effect=lambda **kwargs: _client()), patch.object(
+            backends._client_pool, 'max_idle', 2,
+        ):
+            for timeout in (1, 2, 3):
+                llm.complete(MESSAGES, timeout_seconds=timeout)
+
+            self.assertEqual(client_pool_stats()['idle'], 2)
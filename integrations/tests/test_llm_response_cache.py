@@ -0,0 +1,236 @@
+"""Tests for the opt-in LLM response cache (``integrations.services.llm.cache``).
+
+The provider is mocked at the SDK class, as in ``test_llm_service``; the
+cache itself runs against the test database.
+"""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.db import DatabaseError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from integrations.config import clear_config_cache
+from integrations.models import LLMResponse
+from integrations.services import feedback_synthesis, llm
+from integrations.services.ai_eval.trace import FileTraceSink
+from integrations.services.llm import LLMError
+from integrations.services.llm.backends import clear_client_pool
+
+FAKE_KEY = 'sk-test-fake-cache-secret'
+ANTHROPIC_PATCH = 'anthropic.Anthropic'
+MESSAGES = [{'role': 'user', 'content': 'summarise this'}]
+
+LLM_ON = override_settings(
+    LLM_PROVIDER='anthropic',
+    LLM_API_KEY=FAKE_KEY,
+    LLM_BASE_URL='https://api.anthropic.com',
+    LLM_MODEL='claude-sonnet-4-5',
+    LLM_MAX_RETRIES=0,
+    LLM_RESPONSE_CACHE_CALLERS='feedback_synthesis, test_caller',
+)
+
+
+def _response(*, text='cached reply', tool_input=None):
+    content = []
+    if text:
+        block = MagicMock()
+        block.type = 'text'
+        block.text = text
+        content.append(block)
+    if tool_input is not None:
+        block = MagicMock()
+        block.type = 'tool_use'
+        block.name = feedback_synthesis._TOOL_NAME
+        block.input = tool_input
+        content.append(block)
+    response = MagicMock()
+    response.content = content
+    response.usage.input_tokens = 120
+    response.usage.output_tokens = 30
+    response.usage.cache_read_input_tokens = None
+    response.usage.cache_creation_input_tokens = None
+    return response
+
+
+class _CacheMixin:
+    def setUp(self):
+        super().setUp()
+        clear_config_cache()
+        clear_client_pool()
+        self.addCleanup(clear_config_cache)
+        self.addCleanup(clear_client_pool)
+        patcher = patch(ANTHROPIC_PATCH)
+        self.create = patcher.start().return_value.messages.create
+        self.create.return_value = _response()
+        self.addCleanup(patcher.stop)
+
+
+@LLM_ON
+class ResponseCacheTest(_CacheMixin, TestCase):
+    def test_identical_request_is_served_from_the_cache(self):
+        first = llm.complete(MESSAGES, system='be brief', cache='test_caller')
+        second = llm.complete(MESSAGES, system='be brief', cache='test_caller')
+
+        self.assertEqual(self.create.call_count, 1)
+        self.assertFalse(first.cache_hit)
+        self.assertTrue(second.cache_hit)
+        self.assertEqual(second.text, 'cached reply')
+        self.assertEqual((second.input_tokens, second.output_tokens), (120, 30))
+        entry = LLMResponse.objects.get()
+        self.assertEqual(
+            (entry.caller, entry.model, entry.hit_count),
+            ('test_caller', 'claude-sonnet-4-5', 1),
+        )
+
+    def test_callers_without_a_listed_label_always_reach_the_provider(self):
+        for cache in (None, 'unlisted_caller', None, 'unlisted_caller'):
+            self.assertFalse(llm.complete(MESSAGES, cache=cache).cache_hit)
+
+        self.assertEqual(self.create.call_count, 4)
+        self.assertFalse(LLMResponse.objects.exists())
+
+    @override_settings(LLM_RESPONSE_CACHE_CALLERS='')
+    def test_cache_is_off_by_default(self):
+        llm.complete(MESSAGES, cache='test_caller')
+        llm.complete(MESSAGES, cache='test_caller')
+
+        self.assertEqual(self.create.call_count, 2)
+
+    def test_any_change_to_the_request_misses(self):
+        base = {'system': 'be brief', 'max_tokens': 512}
+        variants = [
+            base,
+            {**base, 'system': 'be thorough'},
+            {**base, 'max_tokens': 1024},
+            {**base, 'temperature': 0},
+            {**base, 'model': 'claude-opus-4-1'},
+            {**base, 'tools': [{'name': 't', 'input_schema': {}}]},
+        ]
+        for kwargs in variants:
+            llm.complete(MESSAGES, cache='test_caller', **kwargs)
+        llm.complete(
+            [{'role': 'user', 'content': 'something else'}],
+            cache='test_caller', **base,
+        )
+
+        self.assertEqual(self.create.call_count, len(variants) + 1)
+
+    def test_explicit_default_model_shares_the_entry(self):
+        llm.complete(MESSAGES, cache='test_caller')
+        hit = llm.complete(MESSAGES, model='claude-sonnet-4-5', cache='test_caller')
+
+        self.assertTrue(hit.cache_hit)
+
+    def test_expired_entries_are_refreshed(self):
+        llm.complete(MESSAGES, cache='test_caller')
+        LLMResponse.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        result = llm.complete(MESSAGES, cache='test_caller')
+
+        self.assertFalse(result.cache_hit)
+        self.assertEqual(self.create.call_count, 2)
+        self.assertGreater(LLMResponse.objects.get().expires_at, timezone.now())
+
+    @override_settings(LLM_RESPONSE_CACHE_TTL_HOURS='2')
+    def test_ttl_comes_from_config(self):
+        llm.complete(MESSAGES, cache='test_caller')
+
+        remaining = LLMResponse.objects.get().expires_at - timezone.now()
+        self.assertLessEqual(remaining, timedelta(hours=2))
+        self.assertGreater(remaining, timedelta(hours=1))
+
+    @override_settings(LLM_RESPONSE_CACHE_MAX_ENTRIES='2')
+    def test_least_recently_used_entries_are_evicted_past_the_bound(self):
+        llm.complete([{'role': 'user', 'content': 'one'}], cache='test_caller')
+        llm.complete([{'role': 'user', 'content': 'two'}], cache='test_caller')
+        # Touch "one" so "two" becomes the least recently used.
+        llm.complete([{'role': 'user', 'content': 'one'}], cache='test_caller')
+        llm.complete([{'role': 'user', 'content': 'three'}], cache='test_caller')
+
+        self.assertEqual(LLMResponse.objects.count(), 2)
+        hits = [
+            llm.complete([{'role': 'user', 'content': p}], cache='test_caller').cache_hit
+            for p in ('three', 'one', 'two')
+        ]
+        self.assertEqual(hits, [True, True, False])
+
+    def test_discard_cached_drops_the_entry(self):
+        result = llm.complete(MESSAGES, cache='test_caller')
+
+        llm.discard_cached(result)
+
+        self.assertFalse(LLMResponse.objects.exists())
+        self.assertFalse(llm.complete(MESSAGES, cache='test_caller').cache_hit)
+
+    def test_provider_errors_are_not_cached(self):
+        self.create.return_value = _response(text='')
+
+        with self.assertRaises(LLMError):
+            llm.complete(MESSAGES, cache='test_caller')
+
+        self.assertFalse(LLMResponse.objects.exists())
+
+    def test_database_errors_fall_back_to_the_provider(self):
+        with patch.object(
+            LLMResponse.objects, 'filter', side_effect=DatabaseError('down'),
+        ), patch.object(
+            LLMResponse.objects, 'update_or_create', side_effect=DatabaseError('down'),
+        ), self.assertLogs('integrations.services.llm.cache', level='WARNING'):
+            result = llm.complete(MESSAGES, cache='test_caller')
+
+        self.assertEqual(result.text, 'cached reply')
+        self.assertIsNone(result.cache_key)
+
+
+@LLM_ON
+class FeedbackSynthesisCacheTest(_CacheMixin, TestCase):
+    def _input(self):
+        return feedback_synthesis.SprintFeedbackInput(
+            sprint_name='May Cohort',
+            response_count=1,
+            responses=[{'answers': [('How was it?', 'long_text', 'Great')]}],
+        )
+
+    def _valid_tool_input(self):
+        return {
+            'themes': [],
+            'what_went_well': ['Office hours.'],
+            'what_to_improve': [],
+            'recommendations': [],
+            'next_sprint_signal': '',
+            'response_count': 1,
+        }
+
+    def test_rerun_is_a_hit_recorded_in_the_trace(self):
+        self.create.return_value = _response(text='', tool_input=self._valid_tool_input())
+        traces = []
+        for _ in range(2):
+            sink = FileTraceSink(
+                callable_name='feedback', provider='anthropic',
+                model='claude-sonnet-4-5', timestamp_utc='t',
+            )
+            feedback_synthesis.synthesize_feedback(self._input(), trace=sink)
+            traces.append(sink.to_dict())
+
+        self.assertEqual(self.create.call_count, 1)
+        self.assertFalse(traces[0]['raw_result']['cache_hit'])
+        self.assertEqual(
+            traces[0]['token_usage'], {'input_tokens': 120, 'output_tokens': 30},
+        )
+        self.assertTrue(traces[1]['raw_result']['cache_hit'])
+        self.assertEqual(
+            traces[1]['token_usage'],
+            {'saved_input_tokens': 120, 'saved_output_tokens': 30},
+        )
+
+    def test_rejected_output_is_discarded_so_a_retry_reaches_the_provider(self):
+        self.create.return_value = _response(text='', tool_input={'themes': 'bad'})
+
+        for _ in range(2):
+            with self.assertRaises(LLMError):
+                feedback_synthesis.synthesize_feedback(self._input())
+
+        self.assertEqual(self.create.call_count, 2)
+        self.assertFalse(LLMResponse.objects.exists())
@@ -27,6 +27,7 @@ from integrations.config import clear_config_cache, get_config
 from integrations.models import IntegrationSetting
 from integrations.services import llm
 from integrations.services.llm import CancellationToken, LLMError, LLMResult
+from integrations.services.llm.backends import clear_client_pool, client_pool_stats
 
 FAKE_KEY = 'sk-test-fake-secret123'
 
@@ -91,12 +92,14 @@ def _make_auth_error():
 
 
 class _LLMCacheCleanupMixin:
-    """Clear the module-level config cache around each test."""
+    """Clear the module-level config cache and client pool around each test."""
 
     def setUp(self):
         super().setUp()
         clear_config_cache()
+        clear_client_pool()
         self.addCleanup(clear_config_cache)
+        self.addCleanup(clear_client_pool)
 
 
 @override_settings(
@@ -173,14 +176,20 @@ class CompleteTextTest(_LLMCacheCleanupMixin, TestCase):
 
     def test_cancellation_token_closes_provider_client(self):
         token = CancellationToken()
+
+        def cancel_mid_request(**kwargs):
+            token.cancel()
+            return _text_response('done')
+
         with patch(ANTHROPIC_PATCH) as mock_cls:
             client = mock_cls.return_value
-            client.messages.create.return_value = _text_response('done')
+            client.messages.create.side_effect = cancel_mid_request
             llm.complete(
                 [{'role': 'user', 'content': 'hi'}], cancellation=token,
             )
-            token.cancel()
         client.close.assert_called_once_with()
+        # A cancelled client is closed, not returned to the pool.
+        self.assertEqual(client_pool_stats()['idle'], 0)
 
     def test_returns_text_result(self):
         with patch(ANTHROPIC_PATCH) as mock_cls:
@@ -276,8 +285,8 @@ class CompleteBaseUrlTest(_LLMCacheCleanupMixin, TestCase):
         LLM_MAX_RETRIES=6,
     )
     def test_client_rebuilt_from_config_each_call(self):
-        # No module-level client: changing the DB base URL between calls
-        # changes the constructed client config.
+        # Pooled clients are keyed by their config: changing the DB base
+        # URL between calls builds a new client.
         with patch(ANTHROPIC_PATCH) as mock_cls:
             mock_client = mock_cls.return_value
             mock_client.messages.create.return_value = _text_response()
@@ -26,6 +26,7 @@ from integrations.services.llm import (
     LLMError,
     LLMResult,
 )
+from integrations.services.llm.backends import clear_client_pool, client_pool_stats
 
 FAKE_KEY = 'sk-test-fake-stream-secret123'
 ANTHROPIC_PATCH = 'anthropic.Anthropic'
@@ -106,7 +107,9 @@ class _Mixin:
     def setUp(self):
         super().setUp()
         clear_config_cache()
+        clear_client_pool()
         self.addCleanup(clear_config_cache)
+        self.addCleanup(clear_client_pool)
 
 
 @LLM_ON
@@ -114,16 +117,20 @@ class StreamAssemblyTest(_Mixin, TestCase):
 
     def test_cancellation_token_closes_stream_provider_client(self):
         token = CancellationToken()
+        stream_cm = _stream_cm(['done'], _final_text_message('done'))
+
+        def cancel_mid_stream(**kwargs):
+            token.cancel()
+            return stream_cm
+
         with patch(ANTHROPIC_PATCH) as mock_cls:
             client = mock_cls.return_value
-            client.messages.stream.return_value = _stream_cm(
-                ['done'], _final_text_message('done'),
-            )
+            client.messages.stream.side_effect = cancel_mid_stream
             list(llm.stream(
                 [{'role': 'user', 'content': 'hi'}], cancellation=token,
             ))
-            token.cancel()
         client.close.assert_called_once_with()
+        self.assertEqual(client_pool_stats()['idle'], 0)
 
     def test_yields_deltas_then_terminal_done(self):
         with patch(ANTHROPIC_PATCH) as mock_cls:
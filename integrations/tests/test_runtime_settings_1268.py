@@ -8,7 +8,7 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase
 
 from accounts.models import Token
-from email_app.tasks.send_campaign import _get_batch_size
+from email_app.tasks.send_campaign import get_batch_size
 from integrations.config import clear_config_cache
 from integrations.models import IntegrationSetting
 from integrations.services.llm.backends import _resolve_max_retries
@@ -135,7 +135,7 @@ class RuntimeSettingsStudioTest(TestCase):
                 if key == 'STRIPE_PAYMENT_LINKS':
                     self.assertEqual(get_stripe_payment_links(), LINKS)
                 elif key == 'EMAIL_BATCH_SIZE':
-                    self.assertEqual(_get_batch_size(), 17)
+                    self.assertEqual(get_batch_size(), 17)
                 else:
                     self.assertEqual(_resolve_max_retries(), 2)
 
@@ -195,7 +195,7 @@ class RuntimeSettingsApiTest(TestCase):
         self.assertEqual(response.json(), {'status': 'ok', 'updated': 3})
         self.assertNotIn('runtime.test', response.content.decode())
         self.assertEqual(get_stripe_payment_links(), LINKS)
-        self.assertEqual(_get_batch_size(), 19)
+        self.assertEqual(get_batch_size(), 19)
         self.assertEqual(_resolve_max_retries(), 3)
 
         response = self.client.post(
@@ -0,0 +1,212 @@
+"""Manifest-driven, parallel S3 image upload for content sync.
+
+``upload_images_to_s3`` keeps a ``ContentImageManifest`` per source. Files
+whose size and mtime match the manifest are skipped without hashing;
+files whose MD5 matches are skipped without an S3 request; the S3 prefix
+is only listed to seed a missing manifest. These tests drive the uploader
+against ``LocalS3StandIn`` instead of AWS.
+"""
+
+import os
+import tempfile
+import time
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings, tag
+
+from integrations.config import clear_config_cache
+from integrations.models import ContentImageManifest, ContentSource
+from integrations.services.github_sync import media
+from integrations.services.github_sync.media import upload_images_to_s3
+from integrations.tests.s3_stand_in import LocalS3StandIn
+
+S3_SETTINGS = dict(
+    TESTING=False,
+    S3_ENABLED=True,
+    AWS_S3_CONTENT_BUCKET='test-bucket',
+    AWS_S3_CONTENT_REGION='us-east-1',
+    AWS_ACCESS_KEY_ID='fake',
+    AWS_SECRET_ACCESS_KEY='fake',
+)
+
+
+class _StandInTestCase(TestCase):
+    def setUp(self):
+        clear_config_cache()
+        self.source = ContentSource.objects.create(repo_name='test-org/content')
+        self._tempdir = tempfile.TemporaryDirectory(prefix='s3-manifest-')
+        self.addCleanup(self._tempdir.cleanup)
+        self.repo_dir = self._tempdir.name
+        self.s3 = LocalS3StandIn()
+        client_patch = patch(
+            'integrations.services.github_sync.media.boto3.client',
+            side_effect=lambda *args, **kwargs: self.s3,
+        )
+        client_patch.start()
+        self.addCleanup(client_patch.stop)
+
+    def write_image(self, rel_path, data):
+        path = os.path.join(self.repo_dir, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def upload(self):
+        return upload_images_to_s3(self.repo_dir, self.source)
+
+    def manifest_entries(self):
+        return ContentImageManifest.objects.get(source=self.source).entries
+
+
+@override_settings(**S3_SETTINGS)
+class ImageManifestTest(_StandInTestCase):
+    def setUp(self):
+        super().setUp()
+        self.write_image('hero.png', b'\x89PNG hero')
+        self.write_image('course/module/diagram.svg', b'<svg/>')
+
+    def test_first_sync_uploads_and_records_manifest(self):
+        result = self.upload()
+
+        self.assertEqual(result, {'uploaded': 2, 'skipped': 0, 'errors': []})
+        self.assertIn(('test-bucket', 'content/hero.png'), self.s3.objects)
+        self.assertEqual(
+            self.s3.objects[('test-bucket', 'content/course/module/diagram.svg')]
+            ['ExtraArgs']['ContentType'],
+            'image/svg+xml',
+        )
+        entries = self.manifest_entries()
+        self.assertEqual(set(entries), {'hero.png', 'course/module/diagram.svg'})
+        self.assertEqual(entries['hero.png']['size'], len(b'\x89PNG hero'))
+        self.assertEqual(
+            f'"{entries["hero.png"]["etag"]}"',
+            self.s3.objects[('test-bucket', 'content/hero.png')]['ETag'],
+        )
+
+    def test_unchanged_files_skip_hashing_listing_and_upload(self):
+        self.upload()
+        self.s3.calls.clear()
+
+        with patch.object(media, '_md5_file', wraps=media._md5_file) as md5:
+            result = self.upload()
+
+        self.assertEqual(result, {'uploaded': 0, 'skipped': 2, 'errors': []})
+        md5.assert_not_called()
+        self.assertEqual(sum(self.s3.calls.values()), 0)
+
+    def test_touched_file_with_same_bytes_is_hashed_but_not_uploaded(self):
+        self.upload()
+        self.s3.calls.clear()
+        path = os.path.join(self.repo_dir, 'hero.png')
+        os.utime(path, ns=(0, 1_000_000_000))
+
+        result = self.upload()
+
+        self.assertEqual(result, {'uploaded': 0, 'skipped': 2, 'errors': []})
+        self.assertEqual(sum(self.s3.calls.values()), 0)
+        self.assertEqual(self.manifest_entries()['hero.png']['mtime_ns'], 1_000_000_000)
+
+    def test_changed_file_is_uploaded_without_listing(self):
+        self.upload()
+        self.s3.calls.clear()
+        self.write_image('hero.png', b'\x89PNG hero v2, a different size')
+
+        result = self.upload()
+
+        self.assertEqual(result, {'uploaded': 1, 'skipped': 1, 'errors': []})
+        self.assertEqual(self.s3.calls, {'upload_file': 1})
+        self.assertEqual(
+            self.s3.objects[('test-bucket', 'content/hero.png')]['Body'],
+            b'\x89PNG hero v2, a different size',
+        )
+
+    def test_deleted_file_is_dropped_from_manifest(self):
+        self.upload()
+        os.remove(os.path.join(self.repo_dir, 'hero.png'))
+
+        self.upload()
+
+        self.assertEqual(set(self.manifest_entries()), {'course/module/diagram.svg'})
+
+    def test_missing_manifest_is_seeded_from_s3_listing(self):
+        self.upload()
+        ContentImageManifest.objects.all().delete()
+        self.s3.calls.clear()
+
+        result = self.upload()
+
+        self.assertEqual(result, {'uploaded': 0, 'skipped': 2, 'errors': []})
+        self.assertEqual(self.s3.calls, {'list_objects_v2': 1})
+        self.assertEqual(len(self.manifest_entries()), 2)
+
+    def test_manifest_for_another_bucket_is_ignored(self):
+        self.upload()
+        ContentImageManifest.objects.update(bucket='old-bucket')
+        self.s3.calls.clear()
+
+        self.upload()
+
+        self.assertEqual(self.s3.calls['list_objects_v2'], 1)
+        self.assertEqual(
+            ContentImageManifest.objects.get(source=self.source).bucket,
+            'test-bucket',
+        )
+
+    def test_failed_upload_is_retried_next_sync(self):
+        from boto3.exceptions import S3UploadFailedError
+
+        original = self.s3.upload_file
+
+        def fail_hero(Filename, Bucket, Key, ExtraArgs=None):
+            if Key == 'content/hero.png':
+                raise S3UploadFailedError('Access Denied')
+            return original(Filename, Bucket, Key, ExtraArgs=ExtraArgs)
+
+        with patch.object(self.s3, 'upload_file', side_effect=fail_hero):
+            result = self.upload()
+
+        self.assertEqual(result['uploaded'], 1)
+        self.assertEqual(result['errors'][0]['file'], 'hero.png')
+        self.assertEqual(result['errors'][0]['step'], 's3_upload')
+        self.assertNotIn('hero.png', self.manifest_entries())
+
+        self.assertEqual(self.upload(), {'uploaded': 1, 'skipped': 1, 'errors': []})
+
+
+@tag('slow_platform')
+@override_settings(**S3_SETTINGS)
+class ImageUploadBenchmarkTest(_StandInTestCase):
+    """Synthetic 2,000-image repo against a stand-in with per-request latency."""
+
+    IMAGES = 2000
+    LATENCY = 0.002
+
+    def setUp(self):
+        super().setUp()
+        for i in range(self.IMAGES):
+            self.write_image(f'course-{i // 100}/images/img-{i}.png', b'\x89PNG %d' % i)
+
+    def _first_sync_seconds(self):
+        ContentImageManifest.objects.all().delete()
+        self.s3 = LocalS3StandIn(latency=self.LATENCY)
+        started = time.perf_counter()
+        result = self.upload()
+        elapsed = time.perf_counter() - started
+        self.assertEqual(result['uploaded'], self.IMAGES)
+        return elapsed
+
+    def test_parallel_upload_and_manifest_resync(self):
+        with patch.object(media, 'S3_UPLOAD_WORKERS', 1):
+            serial = self._first_sync_seconds()
+        parallel = self._first_sync_seconds()
+
+        self.assertLess(parallel, serial / 2)
+
+        self.s3.calls.clear()
+        with patch.object(media, '_md5_file') as md5:
+            result = self.upload()
+
+        self.assertEqual(result, {'uploaded': 0, 'skipped': self.IMAGES, 'errors': []})
+        md5.assert_not_called()
+        self.assertEqual(sum(self.s3.calls.values()), 0)
@@ -0,0 +1,218 @@
+"""Persistent per-source clone cache for content sync.
+
+With ``GITHUB_SYNC_CACHE_DIR`` set, ``sync_content_source`` keeps each
+source's checkout between runs and updates it with a depth-1 fetch rather
+than a fresh clone. Broken entries are re-cloned and the cache is kept
+under ``GITHUB_SYNC_CACHE_MAX_MB`` by LRU eviction. The "remote" here is a
+local repository reached over ``file://``.
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from content.models import Article
+from integrations.models import ContentSource
+from integrations.services.github import sync_content_source
+from integrations.services.github_sync import repo as repo_module
+from integrations.services.github_sync.clone_cache import (
+    evict_clone_cache,
+    mark_checkout_used,
+)
+from integrations.tests.sync_fixtures import SyncTestRepo
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ['git', '-c', 'user.email=test@example.com', '-c', 'user.name=Test', *args],
+        cwd=cwd, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+class _CacheTestCase(TestCase):
+    def setUp(self):
+        cache = tempfile.TemporaryDirectory(prefix='clone-cache-')
+        self.addCleanup(cache.cleanup)
+        self.cache_root = cache.name
+        settings_override = override_settings(GITHUB_SYNC_CACHE_DIR=self.cache_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+
+class CachedCheckoutSyncTest(_CacheTestCase):
+    def setUp(self):
+        super().setUp()
+        self.upstream = SyncTestRepo(self, prefix='clone-cache-upstream-')
+        _git(self.upstream.path, 'init', '-q')
+        self.write_article('alpha', 'First.\n')
+        self.write_article('beta', 'Beta.\n')
+        self.commit()
+        remote = patch.object(
+            repo_module, '_repo_remote_url',
+            return_value=self.upstream.path.as_uri(),
+        )
+        remote.start()
+        self.addCleanup(remote.stop)
+        self.source = ContentSource.objects.create(repo_name='AI-Shipping-Labs/cached')
+        self.checkout = os.path.join(self.cache_root, str(self.source.pk))
+
+    def write_article(self, slug, body):
+        self.upstream.write_markdown(
+            f'blog/{slug}.md',
+            {'title': slug.title(), 'slug': slug, 'date': '2026-01-15'},
+            body,
+        )
+
+    def commit(self):
+        _git(self.upstream.path, 'add', '-A')
+        _git(self.upstream.path, 'commit', '-q', '-m', 'update')
+        return _git(self.upstream.path, 'rev-parse', 'HEAD')
+
+    def sync(self):
+        log = sync_content_source(self.source)
+        self.source.refresh_from_db()
+        return log
+
+    def git_commands(self):
+        """Record the git subcommand of every git call the sync makes."""
+        commands = []
+        real_run = subprocess.run
+
+        def record(cmd, *args, **kwargs):
+            commands.append(next(arg for arg in cmd[1:] if not arg.startswith('-')))
+            return real_run(cmd, *args, **kwargs)
+
+        patcher = patch.object(repo_module.subprocess, 'run', side_effect=record)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return commands
+
+    def test_first_sync_clones_into_the_cache_and_keeps_it(self):
+        log = self.sync()
+
+        self.assertEqual(log.status, 'success')
+        self.assertTrue(os.path.isdir(os.path.join(self.checkout, '.git')))
+        self.assertTrue(Article.objects.filter(slug='alpha').exists())
+
+    def test_moved_head_is_fetched_not_recloned(self):
+        self.sync()
+        beta = os.path.join(self.checkout, 'blog', 'beta.md')
+        os.utime(beta, ns=(0, 1_000_000_000))
+        self.write_article('alpha', 'Second.\n')
+        head = self.commit()
+        commands = self.git_commands()
+
+        log = self.sync()
+
+        self.assertNotIn('clone', commands)
+        self.assertIn('fetch', commands)
+        self.assertEqual(log.commit_sha, head)
+        self.assertIn('Second.', Article.objects.get(slug='alpha').content_markdown)
+        # Untouched files are not rewritten, so their mtimes survive.
+        self.assertEqual(os.stat(beta).st_mtime_ns, 1_000_000_000)
+
+    def test_force_push_is_followed(self):
+        self.sync()
+        _git(self.upstream.path, 'commit', '-q', '--amend', '-m', 'rewritten')
+        head = _git(self.upstream.path, 'rev-parse', 'HEAD')
+
+        log = self.sync()
+
+        self.assertEqual(log.status, 'success')
+        self.assertEqual(log.commit_sha, head)
+
+    def test_stray_files_in_the_checkout_are_cleaned(self):
+        self.sync()
+        stray = os.path.join(self.checkout, 'blog', 'stray.md')
+        with open(stray, 'w') as f:
+            f.write('---\ntitle: Stray\n---\n')
+        self.write_article('alpha', 'Second.\n')
+        self.commit()
+
+        self.sync()
+
+        self.assertFalse(os.path.exists(stray))
+
+    def test_corrupted_checkout_is_recloned(self):
+        self.sync()
+        shutil.rmtree(os.path.join(self.checkout, '.git', 'objects'))
+        self.write_article('alpha', 'Second.\n')
+        head = self.commit()
+
+        with self.assertLogs('integrations.services.github', level='WARNING') as logs:
+            log = self.sync()
+
+        self.assertEqual(log.status, 'success')
+        self.assertEqual(log.commit_sha, head)
+        self.assertIn('re-cloning', '\n'.join(logs.output))
+
+    def test_interrupted_clone_leftovers_are_cleared(self):
+        os.makedirs(self.checkout)
+        with open(os.path.join(self.checkout, 'partial'), 'w') as f:
+            f.write('x')
+
+        log = self.sync()
+
+        self.assertEqual(log.status, 'success')
+        self.assertFalse(os.path.exists(os.path.join(self.checkout, 'partial')))
+
+    def test_fetch_leaves_no_remote_url_behind(self):
+        # The fetch URL carries the GitHub App token for private repos.
+        self.sync()
+        self.write_article('alpha', 'Second.\n')
+        self.commit()
+
+        self.sync()
+
+        self.assertFalse(os.path.exists(os.path.join(self.checkout, '.git', 'FETCH_HEAD')))
+
+
+class CloneCacheEvictionTest(_CacheTestCase):
+    def make_entry(self, name, size, used_at):
+        path = os.path.join(self.cache_root, name)
+        os.makedirs(os.path.join(path, '.git'))
+        with open(os.path.join(path, 'blob'), 'wb') as f:
+            f.write(b'x' * size)
+        mark_checkout_used(path)
+        marker = os.path.join(path, '.git', 'sync-cache-last-used')
+        os.utime(marker, (used_at, used_at))
+        return path
+
+    def test_least_recently_used_entries_are_evicted_first(self):
+        oldest = self.make_entry('a', 400, 100)
+        middle = self.make_entry('b', 400, 200)
+        newest = self.make_entry('c', 400, 300)
+
+        evicted = evict_clone_cache(max_bytes=900)
+
+        self.assertEqual(evicted, [oldest])
+        self.assertTrue(os.path.isdir(middle))
+        self.assertTrue(os.path.isdir(newest))
+
+    def test_nothing_is_evicted_within_budget(self):
+        self.make_entry('a', 400, 100)
+
+        self.assertEqual(evict_clone_cache(max_bytes=1000), [])
+
+    def test_kept_and_in_use_entries_survive(self):
+        locked = ContentSource.objects.create(
+            repo_name='Org/locked', sync_locked_at=timezone.now(),
+        )
+        busy = self.make_entry(str(locked.pk), 400, 100)
+        kept = self.make_entry('kept', 400, 200)
+        idle = self.make_entry('idle', 400, 300)
+
+        evicted = evict_clone_cache(keep=kept, max_bytes=0)
+
+        self.assertEqual(evicted, [idle])
+        self.assertTrue(os.path.isdir(busy))
+        self.assertTrue(os.path.isdir(kept))
+
+    @override_settings(GITHUB_SYNC_CACHE_DIR='')
+    def test_disabled_cache_evicts_nothing(self):
+        self.assertEqual(evict_clone_cache(max_bytes=0), [])
@@ -465,15 +465,16 @@ class SyncFromDiskWithoutGitTest(TestCase):
 
 
 # ---------------------------------------------------------------------------
-# Webhook always runs (force=True) — see issue #235 acceptance criterion.
+# Webhook syncs incrementally (no force) — ``force`` means a full resync.
 # ---------------------------------------------------------------------------
 
 
-class WebhookForcesSyncTest(TestCase):
-    """GitHub webhook handler must pass ``force=True`` to the sync.
+class WebhookSyncsIncrementallyTest(TestCase):
+    """GitHub webhook handler must not pass ``force=True`` to the sync.
 
-    The webhook payload tells us a new commit just landed, so we skip
-    the redundant ls-remote check.
+    ``force`` bypasses incremental sync. A push for a new commit is never
+    skipped by the HEAD check, so the webhook lets the sync diff against
+    the last successful commit instead.
     """
 
     def setUp(self):
@@ -499,7 +500,7 @@ class WebhookForcesSyncTest(TestCase):
         return f'sha256={digest}'
 
     @mock.patch('integrations.views.github_webhook.sync_content_source')
-    def test_webhook_passes_force_true(self, mock_sync):
+    def test_webhook_does_not_force_a_full_resync(self, mock_sync):
         # ImportError path: django_q absent, runs sync inline. We patch
         # sync_content_source itself so we can inspect the kwargs.
         body = json.dumps(self._push_payload())
@@ -515,8 +516,9 @@ class WebhookForcesSyncTest(TestCase):
             )
         self.assertEqual(response.status_code, 200)
         mock_sync.assert_called_once()
+        # ``force`` now means a full resync; pushes sync incrementally.
         kwargs = mock_sync.call_args.kwargs
-        self.assertTrue(kwargs.get('force'))
+        self.assertFalse(kwargs.get('force'))
 
 
 # ---------------------------------------------------------------------------
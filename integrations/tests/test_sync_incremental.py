@@ -0,0 +1,322 @@
+"""Git-diff-driven incremental content sync.
+
+Once a source has a ``success`` SyncLog with a commit SHA, the next sync
+asks git which paths changed since that commit and dispatches only the
+touched articles, course/workshop dirs and events. Stale-content cleanup
+still runs, limited to the touched paths. ``force=True`` and changes that
+move course/workshop subtree claims fall back to a full sync, and so do
+caller-supplied directories (``--from-disk``, ``watch_content``). These
+tests drive ``sync_content_source`` against a real local git checkout that
+stands in for the source's cached clone.
+"""
+
+import os
+import subprocess
+import uuid
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from content.models import Article, Unit, Workshop
+from integrations.models import SyncLog
+from integrations.services.github import sync_content_source
+from integrations.services.github_sync import orchestration
+from integrations.services.github_sync.dispatchers import courses as course_dispatch
+from integrations.services.github_sync.repo import list_changed_paths
+from integrations.tests.sync_fixtures import make_sync_repo
+
+
+class _GitSyncRepoTestCase(TestCase):
+    """A ``SyncTestRepo`` that is also a git checkout."""
+
+    def setUp(self):
+        self.source, self.repo = make_sync_repo(
+            self, repo_name='AI-Shipping-Labs/incremental', prefix='incremental-',
+        )
+        self.git('init', '-q')
+        self.git('config', 'user.email', 'test@example.com')
+        self.git('config', 'user.name', 'Test')
+
+    def git(self, *args):
+        return subprocess.run(
+            ['git', *args], cwd=self.repo.path,
+            check=True, capture_output=True, text=True,
+        ).stdout.strip()
+
+    def commit(self, message='update'):
+        self.git('add', '-A')
+        self.git('commit', '-q', '--allow-empty', '-m', message)
+        return self.git('rev-parse', 'HEAD')
+
+    def sync(self, **kwargs):
+        """Sync the checkout as if it were the source's cached clone."""
+        with patch.object(
+            orchestration, 'cached_checkout_dir', return_value=str(self.repo.path),
+        ), patch.object(
+            orchestration, '_update_cached_checkout',
+            side_effect=lambda source, checkout_dir: self.git('rev-parse', 'HEAD'),
+        ), patch.object(
+            orchestration, 'fetch_remote_head_sha', return_value=None,
+        ), patch.object(orchestration, 'evict_clone_cache', return_value=[]):
+            return sync_content_source(self.source, **kwargs)
+
+    def sync_from_disk(self, **kwargs):
+        return sync_content_source(
+            self.source, repo_dir=str(self.repo.path), **kwargs,
+        )
+
+    def write_article(self, rel_path, slug, body='Body.\n'):
+        self.repo.write_markdown(
+            rel_path,
+            {'title': slug.title(), 'slug': slug, 'date': '2026-01-15',
+             'content_id': str(uuid.uuid5(uuid.NAMESPACE_URL, slug))},
+            body,
+        )
+
+    def write_course(self, slug, unit_body='Lesson.\n'):
+        self.repo.write_yaml(
+            f'{slug}/course.yaml',
+            {'title': slug, 'slug': slug, 'required_level': 0,
+             'content_id': str(uuid.uuid5(uuid.NAMESPACE_URL, slug))},
+        )
+        self.repo.write_yaml(
+            f'{slug}/01-module/module.yaml', {'title': 'Module', 'sort_order': 1},
+        )
+        self.repo.write_markdown(
+            f'{slug}/01-module/01-lesson.md',
+            {'title': 'Lesson', 'sort_order': 1,
+             'content_id': str(uuid.uuid5(uuid.NAMESPACE_URL, f'{slug}-lesson'))},
+            unit_body,
+        )
+
+    def dispatched(self, dispatcher_name):
+        """Patch an orchestration dispatcher and record its file lists."""
+        original = getattr(orchestration, dispatcher_name)
+        calls = []
+
+        def record(source, repo_dir, file_list, *args, **kwargs):
+            calls.append(sorted(file_list))
+            return original(source, repo_dir, file_list, *args, **kwargs)
+
+        patcher = patch.object(orchestration, dispatcher_name, side_effect=record)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return calls
+
+
+class IncrementalSyncTest(_GitSyncRepoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.write_article('blog/alpha.md', 'alpha')
+        self.write_article('blog/beta.md', 'beta')
+        self.write_course('course-a')
+        self.write_course('course-b')
+        self.first_sha = self.commit('initial')
+        log = self.sync()
+        self.assertEqual(log.status, 'success')
+        self.assertEqual(log.commit_sha, self.first_sha)
+
+    def test_typo_fix_dispatches_only_the_changed_article(self):
+        self.write_article('blog/alpha.md', 'alpha', body='Fixed typo.\n')
+        self.commit('typo')
+        articles = self.dispatched('_dispatch_articles')
+
+        log = self.sync()
+
+        self.assertEqual(articles, [['blog/alpha.md']])
+        self.assertEqual((log.items_updated, log.items_unchanged), (1, 0))
+        self.assertIn('Fixed typo.', Article.objects.get(slug='alpha').content_markdown)
+        self.assertTrue(Article.objects.get(slug='beta').published)
+
+    def test_lesson_edit_resyncs_only_its_course(self):
+        self.write_course('course-a', unit_body='Edited lesson.\n')
+        head = self.commit('lesson')
+
+        with patch.object(
+            course_dispatch, '_sync_single_course',
+            wraps=course_dispatch._sync_single_course,
+        ) as sync_course:
+            self.sync()
+
+        self.assertEqual(
+            [os.path.basename(c.args[0]) for c in sync_course.call_args_list],
+            ['course-a'],
+        )
+        edited = Unit.objects.get(source_path='course-a/01-module/01-lesson.md')
+        untouched = Unit.objects.get(source_path='course-b/01-module/01-lesson.md')
+        self.assertIn('Edited lesson.', edited.body)
+        self.assertEqual(edited.source_commit, head)
+        self.assertEqual(untouched.source_commit, self.first_sha)
+
+    def test_deleted_article_is_still_retired(self):
+        self.repo.remove('blog/beta.md')
+        self.commit('remove beta')
+
+        log = self.sync()
+
+        self.assertEqual(log.items_deleted, 1)
+        self.assertFalse(Article.objects.get(slug='beta').published)
+        self.assertTrue(Article.objects.get(slug='alpha').published)
+
+    def test_renamed_article_keeps_its_row(self):
+        self.git('mv', 'blog/beta.md', 'blog/beta-renamed.md')
+        self.commit('rename')
+
+        log = self.sync()
+
+        self.assertEqual(log.items_deleted, 0)
+        article = Article.objects.get(slug='beta')
+        self.assertEqual(article.source_path, 'blog/beta-renamed.md')
+        self.assertTrue(article.published)
+
+    def test_force_runs_a_full_sync(self):
+        self.write_article('blog/alpha.md', 'alpha', body='Fixed typo.\n')
+        self.commit('typo')
+        articles = self.dispatched('_dispatch_articles')
+
+        self.sync(force=True)
+
+        self.assertEqual(articles, [['blog/alpha.md', 'blog/beta.md']])
+
+    def test_caller_supplied_checkout_walks_uncommitted_edits(self):
+        # ``watch_content`` / ``--from-disk`` point at a working tree whose
+        # HEAD is still the synced commit while the files are being edited.
+        self.write_article('blog/alpha.md', 'alpha', body='Unsaved draft.\n')
+        articles = self.dispatched('_dispatch_articles')
+
+        log = self.sync_from_disk()
+
+        self.assertEqual(articles, [['blog/alpha.md', 'blog/beta.md']])
+        self.assertEqual(log.items_updated, 1)
+        self.assertIn(
+            'Unsaved draft.', Article.objects.get(slug='alpha').content_markdown,
+        )
+        self.assertEqual(self.git('rev-parse', '--is-shallow-repository'), 'false')
+
+    def test_new_course_yaml_falls_back_to_a_full_sync(self):
+        self.write_course('course-c')
+        self.commit('new course')
+        articles = self.dispatched('_dispatch_articles')
+
+        self.sync()
+
+        self.assertEqual(articles, [['blog/alpha.md', 'blog/beta.md']])
+
+    def test_possible_include_target_falls_back_to_a_full_sync(self):
+        self.repo.write_text('widgets/cta.html', '<div>cta</div>')
+        self.commit('widget')
+        articles = self.dispatched('_dispatch_articles')
+
+        self.sync()
+
+        self.assertEqual(len(articles[0]), 2)
+
+    def test_diff_base_is_the_last_successful_sync(self):
+        self.write_article('blog/alpha.md', 'alpha', body='Fixed typo.\n')
+        self.commit('typo')
+        SyncLog.objects.filter(source=self.source).update(status='partial')
+        articles = self.dispatched('_dispatch_articles')
+
+        self.sync()
+
+        self.assertEqual(len(articles[0]), 2)
+
+
+class IncrementalEventSyncTest(_GitSyncRepoTestCase):
+    def test_recap_edit_redispatches_the_event_yaml_next_to_it(self):
+        self.repo.write_yaml(
+            'events/2026/launch.yaml',
+            {'title': 'Launch', 'slug': 'launch',
+             'start_datetime': '2026-03-01T17:00:00Z',
+             'recap_file': 'launch-recap.md'},
+            ensure_content_id=True,
+        )
+        self.repo.write_text('events/2026/launch-recap.md', 'First recap.\n')
+        self.commit('initial')
+        self.assertEqual(self.sync().status, 'success')
+        self.repo.write_text('events/2026/launch-recap.md', 'Second recap.\n')
+        self.commit('recap')
+        events = self.dispatched('_dispatch_events')
+
+        self.sync()
+
+        self.assertEqual(
+            events,
+            [['events/2026/launch-recap.md', 'events/2026/launch.yaml']],
+        )
+
+
+class IncrementalWorkshopSyncTest(_GitSyncRepoTestCase):
+    def setUp(self):
+        super().setUp()
+        self.write_workshop('2026/2026-04-21-alpha', 'alpha')
+        self.write_workshop('2026/2026-05-12-beta', 'beta')
+        self.commit('initial')
+        self.sync()
+        self.assertEqual(Workshop.objects.count(), 2)
+
+    def write_workshop(self, folder, slug, *, page_body='Setup.\n'):
+        self.repo.write_yaml(
+            f'{folder}/workshop.yaml',
+            {'content_id': str(uuid.uuid5(uuid.NAMESPACE_URL, folder)),
+             'slug': slug, 'title': slug.title(), 'date': folder[5:15],
+             'pages_required_level': 0},
+        )
+        self.repo.write_markdown(
+            f'{folder}/01-setup.md', {'title': 'Setup'}, page_body,
+            ensure_content_id=False,
+        )
+
+    def dispatched_workshops(self):
+        calls = []
+        original = orchestration._dispatch_workshops
+
+        def record(source, repo_dir, workshop_dirs, *args, **kwargs):
+            calls.append(sorted(os.path.basename(d) for d in workshop_dirs))
+            return original(source, repo_dir, workshop_dirs, *args, **kwargs)
+
+        patcher = patch.object(orchestration, '_dispatch_workshops', side_effect=record)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return calls
+
+    def test_page_body_edit_dispatches_only_its_workshop(self):
+        self.write_workshop('2026/2026-04-21-alpha', 'alpha', page_body='Edited.\n')
+        self.commit('page edit')
+        calls = self.dispatched_workshops()
+
+        self.sync()
+
+        self.assertEqual(calls, [['2026-04-21-alpha']])
+
+    def test_slug_change_redispatches_every_workshop(self):
+        # Other workshops may link to this one by folder name; their
+        # rewritten ``/workshops/<slug>`` URLs must follow the new slug.
+        self.write_workshop('2026/2026-04-21-alpha', 'alpha-renamed')
+        self.commit('rename slug')
+        calls = self.dispatched_workshops()
+
+        self.sync()
+
+        self.assertEqual(calls, [['2026-04-21-alpha', '2026-05-12-beta']])
+
+
+class ListChangedPathsTest(_GitSyncRepoTestCase):
+    def test_reports_renames_as_delete_plus_add(self):
+        self.repo.write_text('a.md', 'a')
+        self.repo.write_text('b.md', 'b')
+        base = self.commit('base')
+        self.git('mv', 'a.md', 'c.md')
+        self.repo.write_text('b.md', 'b2')
+        head = self.commit('head')
+
+        self.assertEqual(
+            sorted(list_changed_paths(str(self.repo.path), base, head)),
+            [('A', 'c.md'), ('D', 'a.md'), ('M', 'b.md')],
+        )
+
+    def test_unknown_base_returns_none(self):
+        self.repo.write_text('a.md', 'a')
+        head = self.commit('base')
+
+        self.assertIsNone(list_changed_paths(str(self.repo.path), 'f' * 40, head))
@@ -0,0 +1,212 @@
+"""Bounded concurrent multi-source sync (``sync_content_sources``).
+
+The scheduler runs ``sync_content_source`` for several sources on a thread
+pool of ``CONTENT_SYNC_PARALLELISM`` workers and records the batch's wall
+time on each SyncLog. Inside each sync, the dispatcher write phase holds a
+process-wide lock on SQLite so concurrent sources never write at once.
+"""
+
+import threading
+import uuid
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from integrations.models import ContentSource, SyncLog
+from integrations.services.github_sync import orchestration, scheduler
+from integrations.services.github_sync.scheduler import sync_content_sources
+from integrations.tests.sync_fixtures import make_sync_repo, sync_repo
+from studio.views.sync import _aggregate_batch
+
+
+class SyncContentSourcesTest(TestCase):
+    def setUp(self):
+        self.sources = [
+            ContentSource.objects.create(repo_name=f'Org/repo-{i}')
+            for i in range(3)
+        ]
+        self.logs = {
+            source.pk: SyncLog.objects.create(
+                source=source, status='success',
+                timings={'total_seconds': 1.0},
+            )
+            for source in self.sources
+        }
+
+    def patch_sync(self, side_effect):
+        patcher = patch.object(
+            scheduler, 'sync_content_source', side_effect=side_effect,
+        )
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_sources_sync_concurrently(self):
+        # Every sync waits for the other two; a serial run would time out.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_sync(source, **kwargs):
+            barrier.wait()
+            return self.logs[source.pk]
+
+        self.patch_sync(fake_sync)
+
+        logs = sync_content_sources(self.sources, max_workers=3)
+
+        self.assertEqual(logs, [self.logs[s.pk] for s in self.sources])
+
+    @override_settings(CONTENT_SYNC_PARALLELISM=2)
+    def test_parallelism_setting_bounds_the_pool(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def fake_sync(source, **kwargs):
+            with lock:
+                running.append(source.pk)
+                peak.append(len(running))
+                if len(running) == 2:
+                    release.set()
+            release.wait(timeout=5)
+            with lock:
+                running.remove(source.pk)
+            return self.logs[source.pk]
+
+        self.patch_sync(fake_sync)
+
+        sync_content_sources(self.sources)
+
+        self.assertEqual(max(peak), 2)
+
+    def test_single_worker_syncs_on_the_calling_thread(self):
+        threads = []
+
+        def fake_sync(source, **kwargs):
+            threads.append(threading.current_thread())
+            return self.logs[source.pk]
+
+        self.patch_sync(fake_sync)
+
+        sync_content_sources(self.sources, max_workers=1)
+
+        self.assertEqual(set(threads), {threading.current_thread()})
+
+    def test_batch_id_and_force_are_passed_to_every_sync(self):
+        mock_sync = self.patch_sync(lambda source, **kwargs: self.logs[source.pk])
+        batch_id = uuid.uuid4()
+
+        sync_content_sources(self.sources, batch_id=batch_id, force=True)
+
+        self.assertEqual(
+            {(c.kwargs['batch_id'], c.kwargs['force']) for c in mock_sync.call_args_list},
+            {(batch_id, True)},
+        )
+
+    def test_batch_timing_is_written_to_every_log(self):
+        self.patch_sync(lambda source, **kwargs: self.logs[source.pk])
+
+        sync_content_sources(self.sources, max_workers=2)
+
+        for log in SyncLog.objects.all():
+            batch = log.timings['batch']
+            self.assertEqual((batch['workers'], batch['sources']), (2, 3))
+            self.assertGreaterEqual(batch['wall_seconds'], 0)
+            self.assertEqual(log.timings['total_seconds'], 1.0)
+
+
+class WritePhaseLockTest(TestCase):
+    def setUp(self):
+        self.source, self.repo = make_sync_repo(
+            self, repo_name='AI-Shipping-Labs/scheduler', prefix='scheduler-',
+        )
+        self.repo.write_markdown(
+            'blog/post.md', {'title': 'Post', 'slug': 'post', 'date': '2026-01-15'},
+            'Body.\n',
+        )
+
+    def test_dispatch_runs_under_the_sqlite_write_lock(self):
+        held = []
+        original = orchestration._sync_repo
+
+        def record(*args, **kwargs):
+            held.append(orchestration._SQLITE_WRITE_PHASE_LOCK.locked())
+            return original(*args, **kwargs)
+
+        with patch.object(orchestration, '_sync_repo', side_effect=record):
+            sync_repo(self.source, self.repo)
+
+        self.assertEqual(held, [True])
+        self.assertFalse(orchestration._SQLITE_WRITE_PHASE_LOCK.locked())
+
+    @override_settings(PAGE_CACHE_ENABLED=True, TIERED_CACHE_CHECK_INTERVAL=0)
+    def test_deferred_flushes_run_under_the_sqlite_write_lock(self):
+        held = []
+
+        def record(*args, **kwargs):
+            held.append(orchestration._SQLITE_WRITE_PHASE_LOCK.locked())
+
+        with patch(
+            'content.services.tag_index.refresh_content_tags', side_effect=record,
+        ), patch(
+            'website.page_cache.shared_cache.publish', side_effect=record,
+        ):
+            sync_repo(self.source, self.repo)
+
+        self.assertTrue(held)
+        self.assertNotIn(False, held)
+
+    def test_other_backends_write_without_the_lock(self):
+        with patch.object(
+            orchestration, 'connection', SimpleNamespace(vendor='postgresql'),
+        ):
+            lock = orchestration._write_phase_lock()
+
+        self.assertIsNot(lock, orchestration._SQLITE_WRITE_PHASE_LOCK)
+
+    def test_sync_log_records_phase_timings(self):
+        log = sync_repo(self.source, self.repo)
+
+        self.assertEqual(
+            set(log.timings),
+            {'prepare_seconds', 'images_seconds', 'write_wait_seconds',
+             'write_seconds', 'total_seconds'},
+        )
+        log.refresh_from_db()
+        self.assertGreaterEqual(log.timings['total_seconds'], log.timings['write_seconds'])
+
+
+class BatchTimingAggregateTest(TestCase):
+    def setUp(self):
+        self.source = ContentSource.objects.create(repo_name='Org/content')
+
+    def _log(self, total_seconds, started_at=None, wall_seconds=None):
+        timings = {'total_seconds': total_seconds}
+        if started_at is not None:
+            timings['batch'] = {
+                'workers': 4, 'sources': 2,
+                'started_at': started_at.isoformat(),
+                'wall_seconds': wall_seconds,
+            }
+        return SyncLog.objects.create(
+            source=self.source, status='success', timings=timings,
+        )
+
+    def test_wall_time_spans_every_batch_task(self):
+        start = timezone.now()
+        logs = [
+            self._log(8.0, start, 10.0),
+            self._log(9.0, start, 10.0),
+            self._log(5.0, start + timedelta(seconds=10), 6.0),
+        ]
+
+        timing = _aggregate_batch(logs)['timing']
+
+        self.assertEqual(
+            timing, {'wall_seconds': 16.0, 'source_seconds': 22.0, 'workers': 4},
+        )
+
+    def test_logs_without_batch_timing_have_no_timing(self):
+        self.assertIsNone(_aggregate_batch([self._log(3.0)])['timing'])
@@ -0,0 +1,126 @@
+"""Tests for the per-process L1 in ``integrations.tiered_cache``.
+
+A second ``TieredCache`` instance stands in for another gunicorn worker:
+it shares ``caches['django_q']`` (the L2) but has its own L1.
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TestCase, override_settings
+
+from integrations.middleware import clear_redirect_cache, get_active_redirects
+from integrations.models import Redirect
+from integrations.tiered_cache import TieredCache, shared_cache
+
+
+@override_settings(TIERED_CACHE_CHECK_INTERVAL=3600)
+class TieredCacheTest(TestCase):
+    def setUp(self):
+        caches['django_q'].delete('tiered-test')
+        self.worker_a = TieredCache()
+        self.worker_b = TieredCache()
+
+    def tearDown(self):
+        caches['django_q'].delete('tiered-test')
+
+    def test_warm_reads_do_not_touch_backend(self):
+        self.worker_a.set('tiered-test', {'a': 1}, 60)
+        self.worker_a.get('tiered-test')
+
+        with patch.object(caches['django_q'], 'get') as backend_get:
+            for _ in range(10):
+                self.assertEqual(self.worker_a.get('tiered-test'), {'a': 1})
+
+        backend_get.assert_not_called()
+
+    def test_miss_falls_back_to_backend(self):
+        caches['django_q'].set('tiered-test', 'from-l2', 60)
+
+        self.assertEqual(self.worker_a.get('tiered-test'), 'from-l2')
+
+    def test_missing_key_returns_default(self):
+        self.assertEqual(self.worker_a.get('tiered-test', 'dflt'), 'dflt')
+
+    @override_settings(TIERED_CACHE_CHECK_INTERVAL=0)
+    def test_invalidate_reaches_other_process_after_check(self):
+        self.worker_a.set('tiered-test', 'old', 60)
+        self.assertEqual(self.worker_b.get('tiered-test'), 'old')
+
+        self.worker_a.invalidate('tiered-test')
+
+        self.assertIsNone(self.worker_b.get('tiered-test'))
+
+    @override_settings(TIERED_CACHE_CHECK_INTERVAL=0)
+    def test_publish_reaches_other_process_after_check(self):
+        self.worker_a.set('tiered-test', 'old', 60)
+        self.assertEqual(self.worker_b.get('tiered-test'), 'old')
+
+        self.worker_a.publish('tiered-test', 'new', 60)
+
+        self.assertEqual(self.worker_b.get('tiered-test'), 'new')
+
+    def test_other_process_serves_l1_within_check_window(self):
+        self.worker_a.set('tiered-test', 'old', 60)
+        self.assertEqual(self.worker_b.get('tiered-test'), 'old')
+
+        self.worker_a.invalidate('tiered-test')
+
+        # Bounded staleness: B keeps its L1 until the next check.
+        self.assertEqual(self.worker_b.get('tiered-test'), 'old')
+
+    def test_invalidate_is_immediate_in_writing_process(self):
+        self.worker_a.set('tiered-test', 'old', 60)
+
+        self.worker_a.invalidate('tiered-test')
+
+        self.assertIsNone(self.worker_a.get('tiered-test'))
+
+    def test_lru_evicts_oldest_entry(self):
+        cache = TieredCache(max_entries=2)
+        cache.get('warm-generation')
+        for key in ('k1', 'k2', 'k3'):
+            cache._store_local(key, key, 60)
+
+        self.assertEqual(list(cache._entries), ['k2', 'k3'])
+
+    @override_settings(TIERED_CACHE_L1_TTL=0)
+    def test_expired_entry_is_refetched(self):
+        self.worker_a.set('tiered-test', 'old', 60)
+        caches['django_q'].set('tiered-test', 'new', 60)
+
+        self.assertEqual(self.worker_a.get('tiered-test'), 'new')
+
+
+@override_settings(TIERED_CACHE_CHECK_INTERVAL=3600)
+class SteadyStatePageViewTest(TestCase):
+    """A warm anonymous page view reads nothing from the shared backend."""
+
+    def setUp(self):
+        clear_redirect_cache()
+
+    def tearDown(self):
+        clear_redirect_cache()
+
+    def test_warm_page_view_makes_no_backend_reads(self):
+        self.client.get('/')
+
+        with patch.object(caches['django_q'], 'get') as backend_get:
+            response = self.client.get('/')
+
+        self.assertEqual(response.status_code, 200)
+        backend_get.assert_not_called()
+
+    def test_redirects_are_shared_through_tiered_cache(self):
+        Redirect.objects.create(
+            source_path='/tiered-old', target_path='/tiered-new',
+            redirect_type=301, is_active=True,
+        )
+        clear_redirect_cache()
+        get_active_redirects()
+
+        with patch.object(caches['django_q'], 'get') as backend_get:
+            self.assertIn('/tiered-old', get_active_redirects())
+
+        backend_get.assert_not_called()
+        self.assertIs(shared_cache.backend, caches['django_q'])
@@ -0,0 +1,141 @@
+"""Per-process L1 in front of the cross-process ``django_q`` cache.
+
+Public requests read a handful of small shared values on every page view
+(active redirects, the announcement banner, the marketing nav and the
+Downloads nav flag). They live in ``caches['django_q']`` so a Studio save
+is visible to every gunicorn / django-q process, but in production that
+backend is a ``DatabaseCache``: each ``get`` is a SELECT against the
+``django_q_cache`` table plus an unpickle of the stored value.
+
+:class:`TieredCache` keeps a small LRU of those values in process memory
+(L1) and falls back to ``caches['django_q']`` (L2) on a miss.
+
+Invalidation
+============
+
+Writers publish a new opaque generation stamp under one shared key when
+they change a value (:meth:`TieredCache.invalidate` and
+:meth:`TieredCache.publish`). Every process re-reads that stamp at most
+once per ``TIERED_CACHE_CHECK_INTERVAL`` seconds and drops its whole L1
+when the stamp changed, so a save propagates everywhere within that
+window. Between checks a warm page view makes zero cache-table queries.
+Each L1 entry also expires after ``TIERED_CACHE_L1_TTL`` seconds (or the
+L2 timeout, whichever is shorter) as a backstop for L2 entries that
+expire on their own.
+
+Read-through fills use :meth:`TieredCache.set` and do not touch the
+generation — bumping it on every fill would flush every other process's
+L1 on each cold read.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+
+_GENERATION_CACHE_KEY = 'tiered_cache_generation'
+_DEFAULT_ALIAS = 'django_q'
+_DEFAULT_MAX_ENTRIES = 256
+_DEFAULT_CHECK_INTERVAL = 2
+_DEFAULT_L1_TTL = 60
+_MISSING = object()
+
+
+class TieredCache:
+    """Versioned two-tier cache: per-process LRU over a shared backend."""
+
+    def __init__(self, alias=_DEFAULT_ALIAS, max_entries=_DEFAULT_MAX_ENTRIES):
+        self.alias = alias
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = None
+        self._checked_at = None
+
+    @property
+    def backend(self):
+        return caches[self.alias]
+
+    def get(self, key, default=None):
+        """Return ``key`` from L1, falling back to the shared backend."""
+        self._sync_generation()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return default if value is _MISSING else value
+                del self._entries[key]
+
+        # Misses are cached too, so an absent key (e.g. no stamp published
+        # yet) does not cost a backend read on every call.
+        value = self.backend.get(key, _MISSING)
+        self._store_local(key, value, None)
+        return default if value is _MISSING else value
+
+    def set(self, key, value, timeout=None):
+        """Fill ``key`` in both tiers without invalidating other processes."""
+        self.backend.set(key, value, timeout)
+        self._store_local(key, value, timeout)
+
+    def publish(self, key, value, timeout=None):
+        """Write a changed value and make every process drop its L1."""
+        self.backend.set(key, value, timeout)
+        self._bump_generation()
+        self._store_local(key, value, timeout)
+
+    def invalidate(self, key):
+        """Delete ``key`` everywhere and make every process drop its L1."""
+        self.backend.delete(key)
+        self._bump_generation()
+
+    def clear_local(self):
+        """Drop this process's L1 and force a generation check on next read."""
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
+            self._checked_at = None
+
+    def _store_local(self, key, value, timeout):
+        ttl = getattr(settings, 'TIERED_CACHE_L1_TTL', _DEFAULT_L1_TTL)
+        if timeout is not None:
+            ttl = min(ttl, timeout)
+        expires_at = time.monotonic() + ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _sync_generation(self):
+        interval = getattr(
+            settings, 'TIERED_CACHE_CHECK_INTERVAL', _DEFAULT_CHECK_INTERVAL,
+        )
+        now = time.monotonic()
+        checked_at = self._checked_at
+        if checked_at is not None and now - checked_at < interval:
+            return
+        generation = self.backend.get(_GENERATION_CACHE_KEY)
+        with self._lock:
+            if checked_at is None or generation != self._generation:
+                self._entries.clear()
+            self._generation = generation
+            self._checked_at = now
+
+    def _bump_generation(self):
+        generation = uuid.uuid4().hex
+        self.backend.set(_GENERATION_CACHE_KEY, generation, None)
+        with self._lock:
+            # Another process may have bumped the stamp since our last
+            # check; adopting ours would hide that, so flush as well.
+            self._entries.clear()
+            self._generation = generation
+            self._checked_at = time.monotonic()
+
+
+shared_cache = TieredCache()
@@ -119,9 +119,9 @@ def github_webhook(request):
                 )
             else:
                 # Try to enqueue as a background job.
-                # ``force=True`` (issue #235): the webhook payload tells us
-                # a new commit just landed, so we trust it without
-                # re-checking via ``git ls-remote`` first.
+                # No ``force``: a push is synced incrementally from the last
+                # successful commit. The ``git ls-remote`` HEAD check this
+                # costs also drops redelivered webhooks for a synced commit.
                 try:
                     from django_q.tasks import async_task
 
@@ -129,7 +129,6 @@ def github_webhook(request):
                     async_task(
                         'integrations.services.github.sync_content_source',
                         source,
-                        force=True,
                         task_name=build_task_name(
                             'Sync content source',
                             source.repo_name,
@@ -148,7 +147,7 @@ def github_webhook(request):
                     )
                 except ImportError:
                     # Django-Q not available, run synchronously
-                    sync_content_source(source, force=True)
+                    sync_content_source(source)
 
             webhook_log.processed = True
             webhook_log.save()
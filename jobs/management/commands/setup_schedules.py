@@ -105,6 +105,25 @@ class Command(BaseCommand):
         )
         self.stdout.write(self.style.SUCCESS('Registered: purge-user-activity (daily at 03:30 UTC)'))
 
+        # Move staged UTM pageviews into CampaignVisit every minute. The
+        # middleware only appends to StagedCampaignVisit, so campaign
+        # traffic bursts never reach the Django-Q broker.
+        schedule(
+            'analytics.tasks.flush_staged_visits',
+            cron='* * * * *',
+            name='flush-campaign-visits',
+        )
+        self.stdout.write(self.style.SUCCESS('Registered: flush-campaign-visits (every minute)'))
+
+        # Re-aggregate UtmDailyRollup for finished days without a current
+        # marker; the Studio UTM dashboard reads whole days from it.
+        schedule(
+            'analytics.tasks.compute_utm_rollups',
+            cron='7 * * * *',
+            name='compute-utm-rollups',
+        )
+        self.stdout.write(self.style.SUCCESS('Registered: compute-utm-rollups (hourly at :07)'))
+
         # Redact expired raw #plan-sprints message text before daytime ingest.
         if background_work_enabled():
             schedule(
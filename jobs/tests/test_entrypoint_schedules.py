@@ -56,6 +56,8 @@ class EntrypointRegistersSchedulesTest(TestCase):
             'cleanup-webhook-logs',
             'cleanup-webhook-deliveries',
             'purge-user-activity',
+            'flush-campaign-visits',
+            'compute-utm-rollups',
             'event-reminders',
             'complete-finished-events',
             'expire-tier-overrides',
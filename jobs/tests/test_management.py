@@ -200,6 +200,22 @@ class SetupSchedulesCommandTest(TestCase):
         self.assertEqual(schedule.cron, '30 3 * * *')
         self.assertEqual(schedule.schedule_type, Schedule.CRON)
 
+    def test_creates_flush_campaign_visits_schedule(self):
+        """Command creates the every-minute staged visit flush."""
+        call_command('setup_schedules', stdout=StringIO())
+        schedule = Schedule.objects.get(name='flush-campaign-visits')
+        self.assertEqual(schedule.func, 'analytics.tasks.flush_staged_visits')
+        self.assertEqual(schedule.cron, '* * * * *')
+        self.assertEqual(schedule.schedule_type, Schedule.CRON)
+
+    def test_creates_compute_utm_rollups_schedule(self):
+        """Command creates the hourly UTM rollup job."""
+        call_command('setup_schedules', stdout=StringIO())
+        schedule = Schedule.objects.get(name='compute-utm-rollups')
+        self.assertEqual(schedule.func, 'analytics.tasks.compute_utm_rollups')
+        self.assertEqual(schedule.cron, '7 * * * *')
+        self.assertEqual(schedule.schedule_type, Schedule.CRON)
+
     def test_idempotent(self):
         """Running command twice does not create duplicate schedules."""
         call_command('setup_schedules', stdout=StringIO())
@@ -273,6 +289,8 @@ class SetupSchedulesCommandTest(TestCase):
             'redact-maven-enrollment-pii',
             'retry-maven-enrollment-steps',
             'purge-user-activity',
+            'flush-campaign-visits',
+            'compute-utm-rollups',
             'purge-plan-sprints-raw-text',
             'event-reminders',
             'complete-finished-events',
@@ -11,6 +11,7 @@ Usage:
 
 import logging
 from dataclasses import dataclass
+from itertools import batched
 
 from django.contrib.auth import get_user_model
 
@@ -21,6 +22,10 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+# Notifications are inserted in batches of this many rows so a fan-out to
+# every active user never holds the whole audience in memory.
+NOTIFICATION_BATCH_SIZE = 1000
+
 
 @dataclass
 class PlanSharedDelivery:
@@ -167,6 +172,25 @@ def _get_body(content):
     return ''
 
 
+def _create_notifications(users, **fields):
+    """Create one ``Notification`` per user in ``users``; return the count.
+
+    Streams user ids from the queryset and inserts in batches of
+    ``NOTIFICATION_BATCH_SIZE``, so memory stays flat however large the
+    audience is.
+    """
+    user_ids = users.values_list('pk', flat=True).iterator(
+        chunk_size=NOTIFICATION_BATCH_SIZE,
+    )
+    created = 0
+    for chunk in batched(user_ids, NOTIFICATION_BATCH_SIZE):
+        Notification.objects.bulk_create(
+            [Notification(user_id=user_id, **fields) for user_id in chunk],
+        )
+        created += len(chunk)
+    return created
+
+
 def get_email_eligible_users(content_type, content):
     """Return the email-eligible audience for a content notification.
 
@@ -216,15 +240,23 @@ def get_email_eligible_users(content_type, content):
     return base
 
 
-def _send_email_channel(email_template, content_type, content):
-    """Fan out the workshop-style email channel and return the success count.
+def _send_email_channel(email_template, content_type, content, users,
+                        dedupe_keys=None):
+    """Send the workshop-style email to ``users`` and return the success count.
 
-    Builds the context dict once and iterates over
-    :func:`get_email_eligible_users`, calling ``EmailService().send`` per
+    Builds the context dict once and calls ``EmailService().send`` per
     user inside a try/except. A single failure logs a WARNING with the
     user email and content slug, then continues to the next recipient so
-    one bad address does not block the rest of the announcement.
+    one bad address does not block the rest of the announcement. Runs on
+    a worker, one chunk of :func:`get_email_eligible_users` at a time
+    (``notifications.tasks.content_email``).
+
+    ``dedupe_keys`` maps user pk to the ``EmailLog.dedupe_key`` stamped on
+    that recipient's log, so a retried chunk can skip them.
     """
+    from django.db import IntegrityError, transaction
+
+    from email_app.models import EmailLog
     from email_app.services.email_service import EmailService
 
     slug = getattr(content, 'slug', '')
@@ -241,7 +273,7 @@ def _send_email_channel(email_template, content_type, content):
 
     service = EmailService()
     sent = 0
-    for user in get_email_eligible_users(content_type, content):
+    for user in users:
         try:
             log = service.send(user, email_template, context)
         except Exception:
@@ -254,8 +286,18 @@ def _send_email_channel(email_template, content_type, content):
         # EmailService.send returns None for skipped recipients (e.g.
         # globally unsubscribed users for promotional mail). Don't count
         # those as successful sends.
-        if log is not None:
-            sent += 1
+        if log is None:
+            continue
+        sent += 1
+        if dedupe_keys:
+            try:
+                with transaction.atomic():
+                    EmailLog.objects.filter(pk=log.pk).update(
+                        dedupe_key=dedupe_keys[user.pk],
+                    )
+            except IntegrityError:
+                # A concurrent duplicate of this chunk logged the user first.
+                pass
     return sent
 
 
@@ -334,9 +376,11 @@ class NotificationService:
     def notify(content_type, content_id, *, post_to_slack=True):
         """Create on-platform notifications for eligible users and post to Slack.
 
-        For content types with an ``email_template`` configured (workshops
-        only, issue #655), also fans out a direct email to every
-        email-eligible subscriber.
+        Notifications are bulk-inserted in ``NOTIFICATION_BATCH_SIZE``
+        chunks from a streamed id query. For content types with an
+        ``email_template`` configured (workshops only, issue #655), also
+        queues a background email fan-out to every email-eligible
+        subscriber; the call does not wait for the sends.
 
         Args:
             content_type: One of 'article', 'course', 'event', 'recording',
@@ -347,7 +391,8 @@ class NotificationService:
                            notification behavior.
 
         Returns:
-            ``{"notified": int, "emailed": int}`` -- ``emailed`` is always
+            ``{"notified": int, "emailed": int}`` -- ``emailed`` is the
+            number of recipients the email fan-out was queued for, always
             ``0`` for content types without an ``email_template`` so the
             shape stays uniform across types. Returns the same dict shape
             (with both zero) on unknown content types or load failures.
@@ -374,24 +419,19 @@ class NotificationService:
         required_level = getattr(content, config['level_field'], 0)
 
         # Create on-platform notifications for eligible users
-        eligible_users = _get_eligible_users(required_level)
-        notifications = [
-            Notification(
-                user=user,
-                title=title,
-                body=body,
-                url=url,
-                notification_type='new_content',
-            )
-            for user in eligible_users
-        ]
-        if notifications:
-            Notification.objects.bulk_create(notifications)
+        notified = _create_notifications(
+            _get_eligible_users(required_level),
+            title=title,
+            body=body,
+            url=url,
+            notification_type='new_content',
+        )
+        if notified:
             logger.info(
                 'Created %d notifications for %s/%s',
-                len(notifications), content_type, content_id,
+                notified, content_type, content_id,
             )
-        result["notified"] = len(notifications)
+        result["notified"] = notified
 
         if post_to_slack:
             try:
@@ -404,15 +444,17 @@ class NotificationService:
                 )
 
         # Issue #655: direct-email channel for content types that opt in
-        # via the ``email_template`` config key. Failures on a single
-        # recipient must not block the rest of the fan-out.
-        email_template = config.get('email_template')
-        if email_template:
-            result["emailed"] = _send_email_channel(
-                email_template,
-                content_type,
-                content,
-            )
+        # via the ``email_template`` config key. The sends run on a
+        # worker (``notifications.tasks.content_email``); ``emailed`` is
+        # the audience the fan-out was queued for.
+        if config.get('email_template'):
+            from notifications.tasks.content_email import enqueue_content_email
+
+            result["emailed"] = get_email_eligible_users(
+                content_type, content,
+            ).count()
+            if result["emailed"]:
+                enqueue_content_email(content_type, content_id)
 
         return result
 
@@ -451,24 +493,19 @@ class NotificationService:
         body = _get_body(series)
         url = series.get_absolute_url()
 
-        eligible_users = _get_eligible_users(lowest_level)
-        notifications = [
-            Notification(
-                user=user,
-                title=title,
-                body=body,
-                url=url,
-                notification_type='new_content',
-            )
-            for user in eligible_users
-        ]
-        if notifications:
-            Notification.objects.bulk_create(notifications)
+        notified = _create_notifications(
+            _get_eligible_users(lowest_level),
+            title=title,
+            body=body,
+            url=url,
+            notification_type='new_content',
+        )
+        if notified:
             logger.info(
                 'Created %d series notifications for %s',
-                len(notifications), series.slug,
+                notified, series.slug,
             )
-        return {"notified": len(notifications)}
+        return {"notified": notified}
 
     @staticmethod
     def notify_content_comment(comment):
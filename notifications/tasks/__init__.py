@@ -0,0 +1,11 @@
+from .content_email import (
+    enqueue_content_email,
+    send_content_email_batch,
+    send_content_email_fanout,
+)
+
+__all__ = [
+    'enqueue_content_email',
+    'send_content_email_batch',
+    'send_content_email_fanout',
+]
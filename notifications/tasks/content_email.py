@@ -0,0 +1,164 @@
+"""Background email channel for content notifications (issue #655).
+
+``NotificationService.notify`` creates the in-app notifications itself
+but hands the direct-email channel (workshops only) to a worker, so the
+Studio notify action returns as soon as the bell rows are written.
+
+Two-stage fan-out, mirroring the campaign ``send_campaign`` /
+``send_campaign_batch`` split:
+
+1. ``send_content_email_fanout(content_type, content_id)`` — streams the
+   email-eligible user ids and enqueues one batch task per
+   ``EMAIL_BATCH_SIZE`` ids. Only ids are held in memory, one chunk at a
+   time.
+2. ``send_content_email_batch(content_type, content_id, user_ids)`` —
+   re-loads the content and the chunk's users and sends through
+   ``EmailService``. A failing recipient is logged and skipped.
+
+Each sent email's EmailLog carries a ``dedupe_key`` naming the template,
+the content and the user. A batch skips users whose key is already
+logged, so a django-q retry of a chunk that died part-way does not
+email anyone twice.
+"""
+
+import logging
+from itertools import batched
+
+from django.contrib.auth import get_user_model
+
+from email_app.models import EmailLog
+from email_app.tasks.send_campaign import get_batch_size
+from notifications.services.notification_service import (
+    CONTENT_TYPE_CONFIG,
+    _get_content_object,
+    _send_email_channel,
+    get_email_eligible_users,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_content_email(content_type, content_id):
+    """Enqueue the stage-1 email fan-out for a content notification."""
+    from jobs.tasks import async_task, build_task_name
+
+    return async_task(
+        'notifications.tasks.content_email.send_content_email_fanout',
+        content_type,
+        content_id,
+        task_name=build_task_name(
+            'Send content email',
+            f'{content_type} #{content_id}',
+            'studio notify',
+        ),
+    )
+
+
+def _load_email_content(content_type, content_id, task):
+    """Return ``(email_template, content)`` or ``(None, None)`` when gone."""
+    email_template = CONTENT_TYPE_CONFIG.get(content_type, {}).get(
+        'email_template',
+    )
+    if not email_template:
+        logger.warning(
+            '%s: %s has no email channel', task, content_type,
+        )
+        return None, None
+    try:
+        content = _get_content_object(content_type, content_id)
+    except Exception:
+        logger.warning(
+            '%s: %s/%s no longer exists', task, content_type, content_id,
+        )
+        return None, None
+    return email_template, content
+
+
+def send_content_email_fanout(content_type, content_id):
+    """Stage-1 fan-out: enqueue one batch send per chunk of recipients."""
+    email_template, content = _load_email_content(
+        content_type, content_id, 'send_content_email_fanout',
+    )
+    if content is None:
+        return {'status': 'skipped', 'content_id': content_id}
+
+    from jobs.tasks import async_task, build_task_name
+
+    batch_size = get_batch_size()
+    user_ids = (
+        get_email_eligible_users(content_type, content)
+        .order_by('pk')
+        .values_list('pk', flat=True)
+        .iterator(chunk_size=batch_size)
+    )
+
+    total = 0
+    batch_count = 0
+    for batch_count, chunk in enumerate(batched(user_ids, batch_size), 1):
+        total += len(chunk)
+        async_task(
+            'notifications.tasks.content_email.send_content_email_batch',
+            content_type,
+            content_id,
+            list(chunk),
+            task_name=build_task_name(
+                'Send content email batch',
+                f'{content_type} #{content_id} batch {batch_count}',
+                'content email fan-out',
+            ),
+        )
+
+    logger.info(
+        'Content email fan-out for %s/%s (%s): %d recipients across '
+        '%d batches',
+        content_type, content_id, email_template, total, batch_count,
+    )
+    return {
+        'status': 'enqueued',
+        'content_id': content_id,
+        'total': total,
+        'batch_count': batch_count,
+    }
+
+
+def _dedupe_key(email_template, content_type, content_id, user_id):
+    return f'{email_template}:{content_type}:{content_id}:{user_id}'
+
+
+def send_content_email_batch(content_type, content_id, user_ids):
+    """Stage-2 batch: send the content email to one chunk of users.
+
+    Users are re-loaded here, so an account deactivated between fan-out
+    and send is skipped, and ``EmailService.send`` re-checks the
+    unsubscribe state at send time. Users who already have an EmailLog
+    for this content are skipped (idempotency for retries).
+    """
+    email_template, content = _load_email_content(
+        content_type, content_id, 'send_content_email_batch',
+    )
+    if content is None:
+        return {'status': 'skipped', 'content_id': content_id}
+
+    dedupe_keys = {
+        user_id: _dedupe_key(email_template, content_type, content_id, user_id)
+        for user_id in user_ids
+    }
+    already_sent_ids = set(
+        EmailLog.objects.filter(
+            dedupe_key__in=dedupe_keys.values(),
+        ).values_list('user_id', flat=True)
+    )
+    pending_ids = [uid for uid in user_ids if uid not in already_sent_ids]
+
+    User = get_user_model()
+    users = User.objects.filter(pk__in=pending_ids, is_active=True).order_by('pk')
+    sent = _send_email_channel(
+        email_template, content_type, content, users, dedupe_keys=dedupe_keys,
+    )
+    return {
+        'status': 'sent',
+        'content_id': content_id,
+        'batch_size': len(user_ids),
+        'sent': sent,
+        'skipped': len(already_sent_ids),
+    }
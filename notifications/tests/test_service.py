@@ -4,7 +4,7 @@ from datetime import date, timedelta
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase, tag
+from django.test import TestCase, override_settings, tag
 from django.utils import timezone
 
 from content.models import Article, Course, Download, Workshop
@@ -15,6 +15,14 @@ from voting.models import Poll
 
 User = get_user_model()
 
+# Django-Q sync mode runs queued tasks inline, so the email fan-out
+# completes inside ``notify``.
+Q_CLUSTER_SYNC = {
+    'name': 'test',
+    'sync': True,
+    'orm': 'default',
+}
+
 
 @tag('core')
 class NotificationServiceNotifyTest(TestCase):
@@ -395,6 +403,8 @@ class NotificationServiceNotifyTest(TestCase):
 
 
 @tag('core')
+@override_settings(Q_CLUSTER=Q_CLUSTER_SYNC)
+@patch('django_q.conf.Conf.SYNC', True)
 class NotificationServiceWorkshopEmailTest(TestCase):
     """Tests for the workshop email channel (issue #655).
 
@@ -402,7 +412,8 @@ class NotificationServiceWorkshopEmailTest(TestCase):
     let the real ``EmailLog`` rows land in the database. That gives us
     accurate behaviour for the per-user skip path (globally unsubscribed
     promotional recipients return ``None`` from ``send``) without making
-    real SES API calls.
+    real SES API calls. The email fan-out runs on a worker; Django-Q sync
+    mode executes the queued tasks inline.
     """
 
     def setUp(self):
@@ -549,8 +560,8 @@ class NotificationServiceWorkshopEmailTest(TestCase):
         self, mock_slack,
     ):
         """A raise from one EmailService.send call must not halt the
-        loop -- the other two users still get their email and
-        ``emailed`` reports the two successful sends."""
+        loop -- the other two users still get their email. ``emailed``
+        reports the three recipients the fan-out was queued for."""
         from email_app.services.email_service import EmailService
 
         original_send = EmailService.send
@@ -570,7 +581,16 @@ class NotificationServiceWorkshopEmailTest(TestCase):
             result = NotificationService.notify('workshop', self.workshop.pk)
 
         self.assertEqual(result['notified'], 3)
-        self.assertEqual(result['emailed'], 2)
+        self.assertEqual(result['emailed'], 3)
+        from email_app.models import EmailLog
+        self.assertEqual(
+            set(
+                EmailLog.objects.filter(
+                    email_type='workshop_announcement',
+                ).values_list('user__email', flat=True),
+            ),
+            {'user1@example.com', 'user3@example.com'},
+        )
         self.assertTrue(
             any('user2@example.com' in line for line in logs.output),
             f'Expected WARNING with user2 email; got {logs.output!r}',
@@ -726,6 +746,134 @@ class NotificationServiceWorkshopEmailTest(TestCase):
         self.assertIn(fresh, eligible)
 
 
+class NotificationServiceChunkedFanOutTest(TestCase):
+    """``notify`` streams the audience and defers the email channel."""
+
+    def setUp(self):
+        from payments.models import Tier
+
+        free_tier = Tier.objects.get(slug='free')
+        for i in range(5):
+            User.objects.create_user(
+                email=f'fan{i}@example.com', password='p',
+                tier=free_tier, email_verified=True,
+            )
+        self.workshop = Workshop.objects.create(
+            title='Chunked Workshop', slug='chunked-workshop',
+            date=date(2026, 1, 1), status='published',
+            landing_required_level=0,
+            pages_required_level=10,
+            recording_required_level=20,
+        )
+
+    @patch('notifications.services.slack_announcements.post_slack_announcement')
+    @patch(
+        'notifications.services.notification_service.NOTIFICATION_BATCH_SIZE',
+        2,
+    )
+    def test_notifications_are_inserted_in_fixed_size_batches(
+        self, mock_slack,
+    ):
+        article = Article.objects.create(
+            title='Batched', slug='batched',
+            date=date(2025, 1, 1), published=True, required_level=0,
+        )
+
+        with patch.object(
+            Notification.objects, 'bulk_create',
+            wraps=Notification.objects.bulk_create,
+        ) as mock_bulk:
+            result = NotificationService.notify('article', article.pk)
+
+        self.assertEqual(result['notified'], 5)
+        self.assertEqual(
+            [len(call.args[0]) for call in mock_bulk.call_args_list],
+            [2, 2, 1],
+        )
+        self.assertEqual(Notification.objects.count(), 5)
+
+    @patch('notifications.services.slack_announcements.post_slack_announcement')
+    @patch('jobs.tasks.helpers.q_async_task', return_value='task-id')
+    def test_notify_queues_email_fan_out_without_sending(
+        self, mock_q, mock_slack,
+    ):
+        from email_app.models import EmailLog
+
+        result = NotificationService.notify('workshop', self.workshop.pk)
+
+        self.assertEqual(result, {'notified': 5, 'emailed': 5})
+        self.assertEqual(EmailLog.objects.count(), 0)
+        mock_q.assert_called_once()
+        self.assertEqual(
+            mock_q.call_args.args[:3],
+            (
+                'notifications.tasks.content_email.send_content_email_fanout',
+                'workshop',
+                self.workshop.pk,
+            ),
+        )
+
+    @patch('jobs.tasks.helpers.q_async_task', return_value='task-id')
+    def test_fan_out_enqueues_one_batch_per_chunk(self, mock_q):
+        from notifications.tasks.content_email import (
+            send_content_email_fanout,
+        )
+
+        with patch(
+            'notifications.tasks.content_email.get_batch_size',
+            return_value=2,
+        ):
+            result = send_content_email_fanout('workshop', self.workshop.pk)
+
+        self.assertEqual(result['total'], 5)
+        self.assertEqual(result['batch_count'], 3)
+        chunks = [call.args[3] for call in mock_q.call_args_list]
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(
+            sorted(pk for chunk in chunks for pk in chunk),
+            sorted(User.objects.values_list('pk', flat=True)),
+        )
+
+    @patch('email_app.services.email_service.EmailService._send_ses',
+           return_value='ses-batch')
+    def test_batch_skips_users_deactivated_after_fan_out(self, mock_ses):
+        from email_app.models import EmailLog
+        from notifications.tasks.content_email import send_content_email_batch
+
+        users = list(User.objects.order_by('pk')[:2])
+        users[1].is_active = False
+        users[1].save(update_fields=['is_active'])
+
+        result = send_content_email_batch(
+            'workshop', self.workshop.pk, [user.pk for user in users],
+        )
+
+        self.assertEqual(result['sent'], 1)
+        self.assertEqual(
+            list(EmailLog.objects.values_list('user_id', flat=True)),
+            [users[0].pk],
+        )
+
+    @patch('email_app.services.email_service.EmailService._send_ses',
+           return_value='ses-batch')
+    def test_retried_batch_skips_users_already_emailed(self, mock_ses):
+        from email_app.models import EmailLog
+        from notifications.tasks.content_email import send_content_email_batch
+
+        user_ids = list(User.objects.order_by('pk').values_list('pk', flat=True))
+        send_content_email_batch('workshop', self.workshop.pk, user_ids[:2])
+
+        result = send_content_email_batch('workshop', self.workshop.pk, user_ids)
+
+        self.assertEqual(result['skipped'], 2)
+        self.assertEqual(result['sent'], len(user_ids) - 2)
+        self.assertEqual(mock_ses.call_count, len(user_ids))
+        self.assertEqual(
+            sorted(EmailLog.objects.values_list('user_id', flat=True)),
+            sorted(user_ids),
+        )
+
+
 @tag('core')
 class CONTENT_TYPE_CONFIGTest(TestCase):
     """Issue #655: only ``workshop`` has an ``email_template`` configured."""
@@ -1,8 +1,16 @@
-"""Stripe customer import adapter for the shared user-import runner."""
+"""Stripe customer import adapter for the shared user-import runner.
+
+Customers are read one Stripe page at a time. Each page's subscription
+lookups run on a small thread pool, and rows are yielded in customer order.
+A rate-limited lookup is retried with exponential backoff.
+"""
 
 from __future__ import annotations
 
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 import stripe
 from django.core.management.base import CommandError
@@ -21,6 +29,11 @@ CONFIGURATION_ERRORS = (
     stripe.PermissionError,
     stripe.InvalidRequestError,
 )
+# Customers per Stripe page; also the unit handed to the lookup pool.
+CUSTOMER_PAGE_SIZE = 100
+SUBSCRIPTION_LOOKUP_WORKERS = 8
+RATE_LIMIT_RETRIES = 4
+RATE_LIMIT_BACKOFF_SECONDS = 1.0
 
 
 def stripe_customer_import_adapter():
@@ -31,12 +44,25 @@ def stripe_customer_import_adapter():
 
     price_to_tier = _price_to_tier_map()
 
+    def row_for(customer):
+        return _row_for_customer(customer, secret_key=secret_key, price_to_tier=price_to_tier)
+
     try:
-        customers = stripe.Customer.list(api_key=secret_key, limit=100)
-        for customer in customers.auto_paging_iter():
-            row = _row_for_customer(customer, secret_key=secret_key, price_to_tier=price_to_tier)
-            if row is not None:
-                yield row
+        customers = stripe.Customer.list(
+            api_key=secret_key, limit=CUSTOMER_PAGE_SIZE,
+        ).auto_paging_iter()
+        pages = iter(lambda: list(islice(customers, CUSTOMER_PAGE_SIZE)), [])
+        for page in pages:
+            # Rows are built without touching the database, so the pool
+            # threads only wait on Stripe.
+            with ThreadPoolExecutor(
+                max_workers=min(SUBSCRIPTION_LOOKUP_WORKERS, len(page)),
+                thread_name_prefix="stripe-import",
+            ) as pool:
+                rows = list(pool.map(row_for, page))
+            for row in rows:
+                if row is not None:
+                    yield row
     except CONFIGURATION_ERRORS as exc:
         raise CommandError(f"Stripe import configuration error: {exc}") from exc
 
@@ -63,7 +89,7 @@ def _row_for_customer(customer, *, secret_key, price_to_tier):
             tags=["stripe:imported"],
         )
 
-    subscriptions = list(_subscriptions_for_customer(customer_id, secret_key=secret_key))
+    subscriptions = _subscriptions_for_customer(customer_id, secret_key=secret_key)
     selected = _select_active_subscription(subscriptions, price_to_tier)
     had_prior_subscriptions = bool(subscriptions)
 
@@ -115,14 +141,27 @@ def _row_for_customer(customer, *, secret_key, price_to_tier):
 
 
 def _subscriptions_for_customer(customer_id, *, secret_key):
-    subscriptions = stripe.Subscription.list(
-        api_key=secret_key,
-        customer=customer_id,
-        status="all",
-        limit=100,
-        expand=["data.items.data.price"],
-    )
-    return subscriptions.auto_paging_iter()
+    """Return every subscription for ``customer_id``, backing off on 429s."""
+    for attempt in range(RATE_LIMIT_RETRIES + 1):
+        try:
+            subscriptions = stripe.Subscription.list(
+                api_key=secret_key,
+                customer=customer_id,
+                status="all",
+                limit=100,
+                expand=["data.items.data.price"],
+            )
+            return list(subscriptions.auto_paging_iter())
+        except stripe.RateLimitError:
+            if attempt == RATE_LIMIT_RETRIES:
+                raise
+            delay = RATE_LIMIT_BACKOFF_SECONDS * 2**attempt
+            logger.info(
+                "Stripe rate limit listing subscriptions for %s; retrying in %.1fs",
+                customer_id,
+                delay,
+            )
+            time.sleep(delay)
 
 
 def _select_active_subscription(subscriptions, price_to_tier):
@@ -18,6 +18,13 @@ Design goals:
   ``canceled`` reversion via the shared ended-subscription transition) and
   preserves active overrides + community access.
 
+Large runs resolve Stripe truth in bulk: one paginated ``status=all``
+listing of every subscription, indexed by id and customer, instead of a
+retrieve/list call per member. Subscriptions the listing missed (created
+mid-run, say) fall back to the per-user lookup on a small thread pool. Both
+paths feed the same ``classify_user``, so findings do not depend on which
+one ran.
+
 Tests use mocked Stripe: they patch
 ``payments.services.subscription_reconciliation.stripe`` (or the module-level
 ``_retrieve_subscription`` / ``_list_subscriptions_for_customer`` helpers).
@@ -26,6 +33,8 @@ The service NEVER contacts live Stripe in tests.
 
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
 import stripe
@@ -33,7 +42,7 @@ from django.db import transaction
 from django.db.models import Q
 from django.utils import timezone
 
-from accounts.models import TierOverride, User
+from accounts.models import TierOverride, User, UserTag
 from integrations.config import get_config
 from payments.models import (
     StripeWebhookDeliveryAttempt,
@@ -100,9 +109,17 @@ _ENDED_STATUSES = frozenset({"canceled"})
 
 _PAID_TIER_SLUGS = frozenset({"basic", "main", "premium"})
 
+# Cohorts at least this large are resolved from one account-wide listing;
+# smaller ones make fewer Stripe calls looking users up one by one.
+BULK_MIN_COHORT = 50
+# Concurrent per-user lookups for subscriptions missing from the listing.
+STRAGGLER_WORKERS = 4
+
 Finding = SubscriptionReconciliationFinding
 Run = SubscriptionReconciliationRun
 
+logger = logging.getLogger(__name__)
+
 
 # ---------------------------------------------------------------------------
 # In-memory classification result.
@@ -181,17 +198,14 @@ def cohort_queryset():
         User.objects.filter(stripe_indicator).values_list("pk", flat=True)
     )
     # Tag indicators (``stripe:active`` / ``stripe:churned`` / ``stripe:plan-*``)
-    # are matched in Python over the small tagged population — JSONField
-    # ``contains`` / prefix lookups are not portable to SQLite.
-    for user in User.objects.exclude(tags=[]).only("pk", "tags"):
-        tags = user.tags or []
-        if any(
-            t == "stripe:active"
-            or t == "stripe:churned"
-            or str(t).startswith("stripe:plan-")
-            for t in tags
-        ):
-            base_ids.add(user.pk)
+    # come from the ``UserTag`` index: JSONField ``contains`` / prefix
+    # lookups are not portable to SQLite, the index's ``tag`` column is.
+    base_ids.update(
+        UserTag.objects.filter(
+            Q(tag__in=("stripe:active", "stripe:churned"))
+            | Q(tag__startswith="stripe:plan-")
+        ).values_list("user_id", flat=True)
+    )
     return (
         User.objects.filter(pk__in=base_ids)
         .select_related("tier", "pending_tier")
@@ -208,7 +222,7 @@ def _secret_key():
     return get_config("STRIPE_SECRET_KEY", "")
 
 
-def _retrieve_subscription(subscription_id):
+def _retrieve_subscription(subscription_id, api_key=None):
     """Retrieve one subscription by id with price data expanded.
 
     Returns the subscription payload, or ``None`` when Stripe reports it does
@@ -217,7 +231,7 @@ def _retrieve_subscription(subscription_id):
     try:
         return stripe.Subscription.retrieve(
             subscription_id,
-            api_key=_secret_key(),
+            api_key=_secret_key() if api_key is None else api_key,
             expand=["items.data.price"],
         )
     except stripe.InvalidRequestError as exc:
@@ -228,10 +242,10 @@ def _retrieve_subscription(subscription_id):
         raise
 
 
-def _list_subscriptions_for_customer(customer_id):
+def _list_subscriptions_for_customer(customer_id, api_key=None):
     """List ALL subscriptions for a customer (``status=all``), newest first."""
     response = stripe.Subscription.list(
-        api_key=_secret_key(),
+        api_key=_secret_key() if api_key is None else api_key,
         customer=customer_id,
         status="all",
         limit=100,
@@ -263,24 +277,27 @@ class _StripeState:
     lookup_error: str = ""
 
 
-def _resolve_stripe_state(user):
+def _resolve_stripe_state(user, api_key=None):
     """Resolve the authoritative Stripe subscription for a user.
 
     Uses the stored ``subscription_id`` when present; otherwise lists all of
     the customer's subscriptions (``status=all``). Selects the most relevant
     subscription: prefer an entitled (active/trialing) one; a single entitled
     subscription among several is authoritative, more than one entitled is
-    ambiguous.
+    ambiguous. ``api_key`` defaults to ``STRIPE_SECRET_KEY``, which is read
+    through the database-backed config.
     """
     try:
         if user.subscription_id:
-            sub = _retrieve_subscription(user.subscription_id)
+            sub = _retrieve_subscription(user.subscription_id, api_key)
             if sub is not None:
                 return _state_from_subscription(sub)
             # Stored subscription no longer exists — fall through to a customer
             # listing so a re-subscribe under a new id is still discovered.
         if user.stripe_customer_id:
-            subs = _list_subscriptions_for_customer(user.stripe_customer_id)
+            subs = _list_subscriptions_for_customer(
+                user.stripe_customer_id, api_key,
+            )
             return _select_state(subs)
     except CONFIGURATION_ERRORS as exc:
         message = str(exc).splitlines()[0] or exc.__class__.__name__
@@ -317,6 +334,110 @@ def _state_from_subscription(sub):
     )
 
 
+# ---------------------------------------------------------------------------
+# Bulk resolution.
+# ---------------------------------------------------------------------------
+
+
+def _list_all_subscriptions():
+    """List every subscription on the account (``status=all``)."""
+    response = stripe.Subscription.list(
+        api_key=_secret_key(),
+        status="all",
+        limit=100,
+        expand=["data.items.data.price"],
+    )
+    return response.auto_paging_iter()
+
+
+def _customer_id(sub):
+    customer = _get(sub, "customer", "")
+    if isinstance(customer, dict):
+        return customer.get("id", "")
+    return customer or ""
+
+
+def _index_subscriptions(subscriptions):
+    """Index subscriptions by id and by customer.
+
+    Per-customer lists are sorted exactly like
+    :func:`_list_subscriptions_for_customer` so :func:`_select_state` picks
+    the same subscription either way.
+    """
+    by_id = {}
+    by_customer = {}
+    for sub in subscriptions:
+        by_id[_get(sub, "id", "")] = sub
+        by_customer.setdefault(_customer_id(sub), []).append(sub)
+    for subs in by_customer.values():
+        subs.sort(key=lambda s: _get(s, "current_period_end") or 0, reverse=True)
+    return by_id, by_customer
+
+
+def _bulk_stripe_states(users, *, skip=()):
+    """Resolve Stripe state for many users from one account-wide listing.
+
+    Returns ``{user_pk: _StripeState}``. Users in ``skip`` (duplicate
+    owners, which never reach a Stripe lookup) are left out. So are users
+    whose lookup failed with anything but a configuration error, and every
+    user when the listing itself fails that way; ``classify_user`` then
+    resolves them one at a time and surfaces the error as it always has.
+    """
+    users = [user for user in users if user.pk not in skip]
+    try:
+        by_id, by_customer = _index_subscriptions(_list_all_subscriptions())
+    except CONFIGURATION_ERRORS as exc:
+        # Each per-user lookup would fail with the same error.
+        message = str(exc).splitlines()[0] or exc.__class__.__name__
+        return {
+            user.pk: (
+                _StripeState(lookup_error=message)
+                if user.subscription_id or user.stripe_customer_id
+                else _StripeState(found=False)
+            )
+            for user in users
+        }
+    except stripe.StripeError:
+        logger.warning(
+            "Bulk Stripe subscription listing failed; resolving per user",
+            exc_info=True,
+        )
+        return {}
+
+    states = {}
+    stragglers = []
+    for user in users:
+        if user.subscription_id:
+            sub = by_id.get(user.subscription_id)
+            if sub is None:
+                stragglers.append(user)
+                continue
+            states[user.pk] = _state_from_subscription(sub)
+        elif user.stripe_customer_id:
+            states[user.pk] = _select_state(by_customer.get(user.stripe_customer_id, []))
+        else:
+            states[user.pk] = _StripeState(found=False)
+
+    if stragglers:
+        # Resolve the key here: get_config can query IntegrationSetting, and
+        # a query from a pool thread would open a connection that thread
+        # never closes. With the key passed in, the threads only read fields
+        # already loaded on the user and never touch the database.
+        api_key = _secret_key()
+        with ThreadPoolExecutor(
+            max_workers=min(STRAGGLER_WORKERS, len(stragglers)),
+            thread_name_prefix="stripe-recon",
+        ) as pool:
+            futures = {
+                user.pk: pool.submit(_resolve_stripe_state, user, api_key)
+                for user in stragglers
+            }
+        for pk, future in futures.items():
+            if future.exception() is None:
+                states[pk] = future.result()
+    return states
+
+
 # ---------------------------------------------------------------------------
 # Webhook evidence correlation.
 # ---------------------------------------------------------------------------
@@ -378,8 +499,12 @@ def _inconsistent_status_tags(user):
     return "stripe:active" in tags and "stripe:churned" in tags
 
 
-def classify_user(user, *, price_to_tier=None, duplicate_ids=None):
-    """Classify one cohort user against live Stripe truth."""
+def classify_user(user, *, price_to_tier=None, duplicate_ids=None, state=None):
+    """Classify one cohort user against live Stripe truth.
+
+    ``state`` is a Stripe state already resolved in bulk; without one the
+    user's subscription/customer is looked up directly.
+    """
     price_to_tier = price_to_tier if price_to_tier is not None else _price_to_tier_map()
     duplicate_ids = duplicate_ids or set()
 
@@ -397,7 +522,8 @@ def classify_user(user, *, price_to_tier=None, duplicate_ids=None):
         )
         return result
 
-    state = _resolve_stripe_state(user)
+    if state is None:
+        state = _resolve_stripe_state(user)
 
     if state.lookup_error:
         result.classification = CLASSIFICATION_LOOKUP_ERROR
@@ -617,13 +743,17 @@ def _duplicate_ownership_map(users):
 
 
 def run_reconciliation(*, mode=Run.MODE_DIAGNOSTIC, source=Run.SOURCE_SCHEDULED,
-                       requested_by=None, users=None, confirm=False):
+                       requested_by=None, users=None, confirm=False, bulk=None):
     """Execute a cohort reconciliation run and persist a run + findings.
 
     ``mode=diagnostic`` is read-only. ``mode=apply`` performs deterministic
     writes ONLY when ``confirm`` is True; otherwise apply degrades to a
     dry-run (would_change) with no writes.
 
+    ``bulk`` forces (True) or disables (False) resolving Stripe state from
+    one account-wide listing; ``None`` uses it for cohorts of at least
+    ``BULK_MIN_COHORT`` users.
+
     Returns the persisted :class:`SubscriptionReconciliationRun`.
     """
     run = Run.objects.create(
@@ -633,10 +763,10 @@ def run_reconciliation(*, mode=Run.MODE_DIAGNOSTIC, source=Run.SOURCE_SCHEDULED,
         requested_by=requested_by,
         started_at=timezone.now(),
     )
-    return execute_run(run, users=users, confirm=confirm)
+    return execute_run(run, users=users, confirm=confirm, bulk=bulk)
 
 
-def execute_run(run, *, users=None, confirm=False):
+def execute_run(run, *, users=None, confirm=False, bulk=None):
     """Execute an already-created (queued) run in place. Returns the run.
 
     A Stripe auth/config failure fails the run and writes no membership
@@ -647,7 +777,7 @@ def execute_run(run, *, users=None, confirm=False):
     run.started_at = timezone.now()
     run.save(update_fields=["status", "started_at"])
     try:
-        _execute_run(run, users=users, confirm=confirm)
+        _execute_run(run, users=users, confirm=confirm, bulk=bulk)
     except CONFIGURATION_ERRORS as exc:
         run.status = Run.STATUS_FAILED
         run.finished_at = timezone.now()
@@ -660,10 +790,13 @@ def execute_run(run, *, users=None, confirm=False):
     return run
 
 
-def _execute_run(run, *, users, confirm):
+def _execute_run(run, *, users, confirm, bulk=None):
     price_to_tier = _price_to_tier_map()
     cohort = list(users) if users is not None else list(cohort_queryset())
     duplicate_ids = _duplicate_ownership_map(cohort)
+    if bulk is None:
+        bulk = len(cohort) >= BULK_MIN_COHORT
+    states = _bulk_stripe_states(cohort, skip=duplicate_ids) if bulk else {}
 
     cohort_count = len(cohort)
     ok_count = 0
@@ -677,7 +810,10 @@ def _execute_run(run, *, users, confirm):
     for user in cohort:
         try:
             result = classify_user(
-                user, price_to_tier=price_to_tier, duplicate_ids=duplicate_ids,
+                user,
+                price_to_tier=price_to_tier,
+                duplicate_ids=duplicate_ids,
+                state=states.get(user.pk),
             )
         except Exception as exc:  # per-user transient error; continue cohort
             warning_count += 1
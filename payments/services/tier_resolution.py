@@ -41,7 +41,7 @@ def resolve_subscription_tier(subscription, price_id, price_to_tier):
     price = _get(first_item, "price", {}) or {}
 
     price_metadata = _get(price, "metadata", {}) or {}
-    price_slug = _normalize_slug(price_metadata.get("tier_slug"))
+    price_slug = _normalize_slug(_get(price_metadata, "tier_slug"))
     if price_slug:
         tier = _tier_by_slug(price_slug)
         if tier is not None:
@@ -7,11 +7,12 @@ from django.contrib.auth import get_user_model
 from django.core.management import call_command
 from django.test import TestCase, override_settings
 from django.utils import timezone
+from stripe import RateLimitError
 
 from accounts.models import ImportBatch, TierOverride
 from accounts.services.import_users import get_import_adapter, run_import_batch
 from payments.models import Tier
-from payments.services import handle_subscription_updated
+from payments.services import handle_subscription_updated, import_stripe
 from payments.services.import_stripe import (
     register_stripe_import_adapter,
     stripe_customer_import_adapter,
@@ -533,3 +534,66 @@ class StripeImportAdapterTest(TestCase):
             user.billing_period_end,
             datetime.fromtimestamp(sub_period, tz=datetime_timezone.utc),
         )
+
+    def test_rows_keep_customer_order_across_concurrent_pages(self):
+        customers = [customer(f"cus_{n}", f"user{n}@example.com") for n in range(5)]
+        subscriptions = {"cus_3": [subscription("sub_3", price_id="price_main_monthly")]}
+        customer_patch, subscription_patch = self._patch_stripe(customers, subscriptions)
+
+        with customer_patch, subscription_patch as subscription_list, patch.object(
+            import_stripe, "CUSTOMER_PAGE_SIZE", 2,
+        ):
+            rows = list(stripe_customer_import_adapter())
+
+        self.assertEqual([row.email for row in rows], [f"user{n}@example.com" for n in range(5)])
+        self.assertEqual(rows[3].tier_slug, "main")
+        self.assertEqual(subscription_list.call_count, 5)
+
+    def test_rate_limited_subscription_lookup_backs_off_and_retries(self):
+        customers = [customer("cus_1", "one@example.com")]
+        responses = [
+            RateLimitError("Too many requests"),
+            RateLimitError("Too many requests"),
+            StripePager([subscription("sub_1", price_id="price_basic_monthly")]),
+        ]
+
+        def list_subscriptions(**kwargs):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        customer_patch, _ = self._patch_stripe(customers)
+        with customer_patch, patch(
+            "payments.services.import_stripe.stripe.Subscription.list",
+            side_effect=list_subscriptions,
+        ), patch("payments.services.import_stripe.time.sleep") as sleep:
+            rows = list(stripe_customer_import_adapter())
+
+        self.assertEqual(rows[0].tier_slug, "basic")
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1.0, 2.0])
+
+    def test_rate_limit_gives_up_after_retry_budget(self):
+        customers = [customer("cus_1", "one@example.com")]
+        customer_patch, _ = self._patch_stripe(customers)
+
+        with customer_patch, patch(
+            "payments.services.import_stripe.stripe.Subscription.list",
+            side_effect=RateLimitError("Too many requests"),
+        ) as subscription_list, patch("payments.services.import_stripe.time.sleep"):
+            with self.assertRaises(RateLimitError):
+                list(stripe_customer_import_adapter())
+
+        self.assertEqual(subscription_list.call_count, import_stripe.RATE_LIMIT_RETRIES + 1)
+
+    def test_batch_records_import_timings(self):
+        customers = [customer("cus_1", "one@example.com")]
+        customer_patch, subscription_patch = self._patch_stripe(customers)
+
+        with customer_patch, subscription_patch:
+            batch = run_import_batch("stripe", stripe_customer_import_adapter, send_welcome=False)
+
+        batch.refresh_from_db()
+        self.assertEqual(batch.timings["rows"], 1)
+        self.assertGreaterEqual(batch.timings["total_seconds"], batch.timings["source_seconds"])
+
@@ -3,13 +3,21 @@
 Stripe is always mocked — these tests never contact live Stripe. They patch
 ``payments.services.subscription_reconciliation`` module-level helpers
 ``_retrieve_subscription`` / ``_list_subscriptions_for_customer`` so the state
-contract is exercised deterministically.
+contract is exercised deterministically. The bulk-mode tests instead point
+the Stripe SDK at ``FakeStripeAPI``, a local server replaying the recorded
+subscriptions in ``fixtures/stripe_subscriptions.json``.
 """
 
+import json
+import threading
 from datetime import datetime, timedelta
 from datetime import timezone as dt_timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
 
+import stripe
 from django.contrib.auth import get_user_model
 from django.test import TestCase, override_settings
 from django.utils import timezone
@@ -379,3 +387,242 @@ class RunOrchestrationTest(ReconBase):
         user.refresh_from_db()
         self.assertEqual(user.tier.slug, "main")
         self.assertEqual(run.changed_count, 0)
+
+
+FIXTURE_PATH = Path(__file__).parent / "fixtures" / "stripe_subscriptions.json"
+
+
+class FakeStripeAPI:
+    """Local HTTP server answering subscription list/retrieve requests.
+
+    ``listed`` subscriptions appear in every listing; ``unlisted`` ones are
+    only visible to a retrieve or a per-customer listing, like a
+    subscription created after an account-wide listing has gone past it.
+    Account-wide listings are served ``page_size`` at a time. Requests are
+    recorded in ``calls`` as ``("list", customer)`` / ``("retrieve", id)``.
+    """
+
+    def __init__(self, listed, unlisted=(), *, page_size=3):
+        self.listed = list(listed)
+        self.unlisted = list(unlisted)
+        self.page_size = page_size
+        self.calls = []
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                status, body = api.respond(url.path, query)
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+
+    def respond(self, path, query):
+        if path == "/v1/subscriptions":
+            customer = query.get("customer", "")
+            self.calls.append(("list", customer))
+            if customer:
+                subs = [
+                    s for s in self.listed + self.unlisted
+                    if s["customer"] == customer
+                ]
+                return 200, {"object": "list", "data": subs, "has_more": False}
+            ids = [s["id"] for s in self.listed]
+            after = query.get("starting_after")
+            start = ids.index(after) + 1 if after else 0
+            end = start + self.page_size
+            return 200, {
+                "object": "list",
+                "url": "/v1/subscriptions",
+                "data": self.listed[start:end],
+                "has_more": end < len(self.listed),
+            }
+        sub_id = path.rsplit("/", 1)[-1]
+        self.calls.append(("retrieve", sub_id))
+        for sub in self.listed + self.unlisted:
+            if sub["id"] == sub_id:
+                return 200, sub
+        return 404, {"error": {
+            "type": "invalid_request_error",
+            "code": "resource_missing",
+            "message": f"No such subscription: '{sub_id}'",
+        }}
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host, port = self.server.server_address
+        self._base = patch.object(stripe, "api_base", f"http://{host}:{port}")
+        self._base.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._base.stop()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class BulkModeTest(ReconBase):
+    """Bulk resolution must reproduce the per-user findings exactly."""
+
+    def setUp(self):
+        self.recorded = json.loads(FIXTURE_PATH.read_text())
+        period_end = datetime.fromtimestamp(FUTURE_TS, tz=dt_timezone.utc)
+        self._user(
+            "active@t.com", tier=self.main, stripe_customer_id="cus_active",
+            subscription_id="sub_active", billing_period_end=period_end,
+        )
+        self._user(
+            "drift@t.com", tier=self.free, stripe_customer_id="cus_drift",
+            subscription_id="sub_drift",
+        )
+        self._user(
+            "scheduled@t.com", tier=self.main,
+            stripe_customer_id="cus_scheduled", subscription_id="sub_scheduled",
+        )
+        self._user(
+            "canceled@t.com", tier=self.main, stripe_customer_id="cus_canceled",
+            subscription_id="sub_canceled",
+        )
+        self._user(
+            "dunning@t.com", tier=self.main, stripe_customer_id="cus_past_due",
+            subscription_id="sub_past_due",
+        )
+        self._user("twice@t.com", tier=self.main, stripe_customer_id="cus_twice")
+        # Stored subscription was deleted; a re-subscribe lives on the customer.
+        self._user(
+            "resub@t.com", tier=self.main, stripe_customer_id="cus_resub",
+            subscription_id="sub_gone",
+        )
+        self._user(
+            "late@t.com", tier=self.free, stripe_customer_id="cus_late",
+            subscription_id="sub_late",
+        )
+        self._user(
+            "price@t.com", tier=self.main, stripe_customer_id="cus_unknown_price",
+        )
+        self._user("nolink@t.com", tier=self.main, stripe_customer_id="")
+        self._user("nothing@t.com", tier=self.main, stripe_customer_id="cus_nothing")
+        self._user("dup1@t.com", tier=self.main, stripe_customer_id="cus_dup")
+        self._user("dup2@t.com", tier=self.main, stripe_customer_id="cus_dup")
+
+    def _run(self, *, bulk):
+        with FakeStripeAPI(
+            self.recorded["listed"], self.recorded["unlisted"],
+        ) as api:
+            run = recon.run_reconciliation(mode=Run.MODE_DIAGNOSTIC, bulk=bulk)
+        findings = sorted(
+            run.findings.values_list(
+                "email", "classification", "action", "outcome", "message",
+                "stripe_subscription_id", "stripe_status",
+                "cancel_at_period_end", "stripe_period_end", "stripe_tier",
+                "webhook_evidence",
+            )
+        )
+        counts = (
+            run.status, run.cohort_count, run.ok_count,
+            run.scheduled_cancellation_count, run.actionable_count,
+            run.warning_count, run.changed_count,
+        )
+        return findings, counts, api.calls
+
+    def test_bulk_findings_match_per_user_findings(self):
+        per_user, per_user_counts, per_user_calls = self._run(bulk=False)
+        bulk, bulk_counts, bulk_calls = self._run(bulk=True)
+
+        self.assertEqual(bulk, per_user)
+        self.assertEqual(bulk_counts, per_user_counts)
+        self.assertEqual(per_user_counts[1], 13)
+        self.assertEqual(
+            {email: cls for email, cls, *_ in bulk},
+            {
+                "drift@t.com": recon.CLASSIFICATION_ACTIVE_METADATA,
+                "scheduled@t.com": recon.CLASSIFICATION_SCHEDULED,
+                "canceled@t.com": recon.CLASSIFICATION_SUSPECTED_MISSED_DELETE,
+                "dunning@t.com": recon.CLASSIFICATION_DUNNING,
+                "twice@t.com": recon.CLASSIFICATION_AMBIGUOUS_SUBSCRIPTION,
+                "resub@t.com": recon.CLASSIFICATION_ACTIVE_METADATA,
+                "late@t.com": recon.CLASSIFICATION_ACTIVE_METADATA,
+                "price@t.com": recon.CLASSIFICATION_UNKNOWN_PRICE,
+                "nolink@t.com": recon.CLASSIFICATION_MISSING_SUBSCRIPTION,
+                "nothing@t.com": recon.CLASSIFICATION_MISSING_SUBSCRIPTION,
+                "dup1@t.com": recon.CLASSIFICATION_DUPLICATE_OWNERSHIP,
+                "dup2@t.com": recon.CLASSIFICATION_DUPLICATE_OWNERSHIP,
+            },
+        )
+        self.assertEqual(len(per_user_calls), 11)
+        # Four listing pages, then per-user lookups for the two subscription
+        # ids the listing did not contain.
+        self.assertEqual(
+            sorted(bulk_calls),
+            sorted([
+                ("list", ""), ("list", ""), ("list", ""), ("list", ""),
+                ("retrieve", "sub_gone"), ("list", "cus_resub"),
+                ("retrieve", "sub_late"),
+            ]),
+        )
+
+    def test_straggler_threads_do_not_read_config(self):
+        threads = []
+        secret_key = recon._secret_key
+
+        def record():
+            threads.append(threading.current_thread())
+            return secret_key()
+
+        with patch.object(recon, "_secret_key", side_effect=record):
+            self._run(bulk=True)
+
+        self.assertTrue(threads)
+        self.assertEqual(set(threads), {threading.main_thread()})
+
+    def test_configuration_error_marks_linked_users_without_per_user_calls(self):
+        with patch.object(
+            recon, "_list_all_subscriptions",
+            side_effect=stripe.AuthenticationError("bad key"),
+        ), patch.object(recon, "_resolve_stripe_state") as per_user:
+            run = recon.run_reconciliation(mode=Run.MODE_DIAGNOSTIC, bulk=True)
+
+        per_user.assert_not_called()
+        self.assertEqual(run.status, Run.STATUS_COMPLETED)
+        errors = set(
+            run.findings.filter(
+                classification=recon.CLASSIFICATION_LOOKUP_ERROR,
+            ).values_list("email", flat=True)
+        )
+        self.assertEqual(len(errors), 10)
+        self.assertNotIn("nolink@t.com", errors)
+
+    def test_transport_error_falls_back_to_per_user(self):
+        with patch.object(
+            recon, "_list_all_subscriptions",
+            side_effect=stripe.APIConnectionError("reset"),
+        ), patch.object(
+            recon, "_resolve_stripe_state",
+            return_value=recon._StripeState(found=False),
+        ) as per_user:
+            run = recon.run_reconciliation(mode=Run.MODE_DIAGNOSTIC, bulk=True)
+
+        self.assertEqual(run.status, Run.STATUS_COMPLETED)
+        # Everyone but the two duplicate owners is looked up one by one.
+        self.assertEqual(per_user.call_count, 11)
+
+    def test_small_cohorts_stay_per_user(self):
+        with patch.object(recon, "_list_all_subscriptions") as listing, patch.object(
+            recon, "_resolve_stripe_state",
+            return_value=recon._StripeState(found=False),
+        ):
+            recon.run_reconciliation(mode=Run.MODE_DIAGNOSTIC)
+            listing.assert_not_called()
+
+            with patch.object(recon, "BULK_MIN_COHORT", 5):
+                recon.run_reconciliation(mode=Run.MODE_DIAGNOSTIC)
+            listing.assert_called_once()
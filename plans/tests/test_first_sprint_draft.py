@@ -71,6 +71,21 @@ class FirstSprintDraftCallableTest(SimpleTestCase):
         self.assertIsInstance(result.weeks[0], DraftWeek)
         self.assertIsInstance(result.resources[0], DraftResource)
 
+    def test_regenerating_never_uses_the_response_cache(self):
+        with patch(
+            'plans.services.first_sprint_draft.llm.is_enabled',
+            return_value=True,
+        ), patch(
+            'plans.services.first_sprint_draft.llm.complete',
+            return_value=LLMResult(tool_input=_tool_input()),
+        ) as complete:
+            draft_first_sprint(_input())
+            draft_first_sprint(_input())
+
+        self.assertEqual(complete.call_count, 2)
+        for call in complete.call_args_list:
+            self.assertIsNone(call.kwargs.get('cache'))
+
     def test_rejects_wrong_week_count(self):
         with patch(
             'plans.services.first_sprint_draft.llm.is_enabled',
@@ -96,6 +96,8 @@ class DraftContractTest(SimpleTestCase):
         self.assertEqual(
             kwargs['tool_choice']['name'], kwargs['tools'][0]['name'],
         )
+        # Staff regenerate drafts on purpose; a cached reply would repeat.
+        self.assertIsNone(kwargs.get('cache'))
 
     def test_empty_recent_updates_still_validates(self):
         with patch(
@@ -583,18 +583,20 @@ def create_session_for_user(email):
     ``database table is locked`` errors when the Django server thread
     (running in the same process) tries to read the session.
     """
+    from importlib import import_module
+
+    from django.conf import settings
     from django.contrib.auth import (
         BACKEND_SESSION_KEY,
         HASH_SESSION_KEY,
         SESSION_KEY,
     )
-    from django.contrib.sessions.backends.db import SessionStore
     from django.db import connection
 
     from accounts.models import User
 
     user = User.objects.get(email=email)
-    session = SessionStore()
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
     session[SESSION_KEY] = str(user.pk)
     session[BACKEND_SESSION_KEY] = (
         "django.contrib.auth.backends.ModelBackend"
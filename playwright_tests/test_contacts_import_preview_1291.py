@@ -1,6 +1,7 @@
 """Operator journeys for contact-import outcome preview (#1291)."""
 
 import os
+from importlib import import_module
 
 import pytest
 
@@ -8,7 +9,7 @@ from playwright_tests.conftest import auth_context, create_staff_user, create_us
 
 os.environ.setdefault('DJANGO_ALLOW_ASYNC_UNSAFE', 'true')
 
-from django.contrib.sessions.backends.db import SessionStore
+from django.conf import settings
 from django.db import connection
 
 pytestmark = [pytest.mark.local_only, pytest.mark.core]
@@ -262,7 +263,9 @@ class TestContactImportOutcomePreview:
         session_cookie = next(
             cookie for cookie in context.cookies() if cookie['name'] == 'sessionid'
         )
-        session = SessionStore(session_key=session_cookie['value'])
+        session = import_module(settings.SESSION_ENGINE).SessionStore(
+            session_key=session_cookie['value'],
+        )
         session.pop('studio_user_import_payload', None)
         session.save()
         connection.close()
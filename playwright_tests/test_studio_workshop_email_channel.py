@@ -57,6 +57,17 @@ from django.db import connection  # noqa: E402
 pytestmark = [pytest.mark.django_db(transaction=True), pytest.mark.local_only]
 
 
+@pytest.fixture(autouse=True)
+def _run_queued_tasks_inline(monkeypatch):
+    """Run the queued workshop email fan-out inside the notify request.
+
+    ``NotificationService.notify`` hands the email channel to a Django-Q
+    worker. The in-process test server has no worker, so switch Django-Q
+    to sync mode and the ``EmailLog`` rows exist once the POST returns.
+    """
+    monkeypatch.setattr('django_q.conf.Conf.SYNC', True)
+
+
 def _clear_state():
     """Reset workshops, notifications, AND workshop-announcement EmailLog
     rows between scenarios so per-test ``EmailLog.objects.count()``
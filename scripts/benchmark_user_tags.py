@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Compare contact-tag lookups over ``User.tags`` with the ``UserTag`` index.
+
+Usage:
+    uv run python scripts/benchmark_user_tags.py
+    uv run python scripts/benchmark_user_tags.py --users 20000 --repeat 3
+
+Creates ``--users`` throwaway users (default 100k) inside a transaction that
+is always rolled back. Every user carries a handful of tags, and index rows
+are bulk-inserted alongside them. It then times the lookups Studio user
+search and the CRM export run, in two ways: the old Python scan over every
+``tags`` list, and the indexed ``UserTag`` query.
+
+This is a manual measurement helper. It runs against the configured
+database (db.sqlite3 by default); nothing it creates is kept.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "website.settings")
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _seed(count):
+    from accounts.models import User, UserTag
+
+    users = User.objects.bulk_create(
+        [
+            User(
+                email=f"benchmark-tags-{index}@example.invalid",
+                tags=[
+                    f"cohort-{index % 50}",
+                    f"source-{index % 7}",
+                    *(["vip"] if index % 1000 == 0 else []),
+                ],
+            )
+            for index in range(count)
+        ],
+        batch_size=2000,
+    )
+    UserTag.objects.bulk_create(
+        [UserTag(user_id=user.pk, tag=tag) for user in users for tag in user.tags],
+        batch_size=2000,
+    )
+
+
+def _time(label, repeat, lookup):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        matched = lookup()
+    elapsed = (time.perf_counter() - started) * 1000 / repeat
+    print(f"{label:>18}: {elapsed:9.2f} ms ({matched} users)")
+
+
+def run(count, repeat):
+    from accounts.models import User
+    from accounts.utils.tags import (
+        user_ids_with_exact_tag,
+        user_ids_with_tag_containing,
+    )
+
+    print(f"Seeding {count} users...")
+    _seed(count)
+
+    def scan_exact():
+        return sum(
+            1 for tags in User.objects.values_list("tags", flat=True).iterator()
+            if isinstance(tags, list) and "vip" in tags
+        )
+
+    def scan_containing():
+        return sum(
+            1 for tags in User.objects.values_list("tags", flat=True).iterator()
+            if isinstance(tags, list) and any("ohort-4" in tag for tag in tags)
+        )
+
+    def indexed_exact():
+        return User.objects.filter(pk__in=user_ids_with_exact_tag("vip")).count()
+
+    def indexed_containing():
+        return User.objects.filter(
+            pk__in=user_ids_with_tag_containing("ohort-4"),
+        ).count()
+
+    _time("scan exact", repeat, scan_exact)
+    _time("indexed exact", repeat, indexed_exact)
+    _time("scan substring", repeat, scan_containing)
+    _time("indexed substring", repeat, indexed_containing)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark exact and substring contact-tag lookups.",
+    )
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    import django
+
+    django.setup()
+    from django.db import transaction
+
+    try:
+        with transaction.atomic():
+            run(args.users, args.repeat)
+            raise _Rollback
+    except _Rollback:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
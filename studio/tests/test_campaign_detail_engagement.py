@@ -60,3 +60,28 @@ class CampaignDetailEngagementTest(TestCase):
         self.assertContains(response, "Sent: 0")
         self.assertContains(response, "Opened: 0 (0.0%)")
         self.assertContains(response, "Clicked: 0 (0.0%)")
+
+    def test_campaign_detail_shows_send_progress_from_snapshot(self):
+        EmailCampaign.objects.filter(pk=self.campaign.pk).update(
+            status="sending",
+            expected_recipients=400,
+            sent_count=150,
+            batch_count=2,
+            batches_completed=1,
+        )
+
+        response = self.client.get(
+            reverse("studio_campaign_detail", args=[self.campaign.pk]),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'data-testid="campaign-send-progress"')
+        self.assertContains(response, "150 / 400 sent (37%)")
+        self.assertContains(response, "1 of 2 batches run")
+
+    def test_campaign_detail_hides_send_progress_before_fan_out(self):
+        response = self.client.get(
+            reverse("studio_campaign_detail", args=[self.campaign.pk]),
+        )
+
+        self.assertNotContains(response, 'data-testid="campaign-send-progress"')
@@ -1695,7 +1695,9 @@ class StudioSyncAllTest(TestCase):
             repo_name='AI-Shipping-Labs/content',
         )
         self.client.post('/studio/sync/all/')
-        self.assertEqual(mock_async.call_count, 2)
+        # Both sources fit in one concurrent batch task.
+        self.assertEqual(mock_async.call_count, 1)
+        self.assertEqual(len(mock_async.call_args.args[1]), 2)
 
     @patch('studio.views.sync.enqueue_content_syncs')
     def test_sync_all_uses_shared_enqueue_service(self, mock_enqueue):
@@ -1729,10 +1731,12 @@ class StudioSyncAllTest(TestCase):
             repo_name='AI-Shipping-Labs/content',
         )
         self.client.post('/studio/sync/all/')
-        batch_ids = [call.kwargs.get('batch_id') for call in mock_async.call_args_list]
-        self.assertEqual(len(batch_ids), 2)
-        self.assertIsNotNone(batch_ids[0])
-        self.assertEqual(batch_ids[0], batch_ids[1])
+        batch_id = mock_async.call_args.kwargs.get('batch_id')
+        self.assertIsNotNone(batch_id)
+        self.assertEqual(
+            SyncLog.objects.filter(batch_id=batch_id, status='queued').count(),
+            2,
+        )
 
     def test_sync_all_requires_post(self):
         response = self.client.get('/studio/sync/all/')
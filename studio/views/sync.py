@@ -653,6 +653,44 @@ def _aggregate_batch(logs, *, structured_errors=None):
         'tiers_synced': tiers_synced,
         'tiers_count': tiers_count,
         'overall_status': overall_status,
+        'timing': _batch_timing(logs),
+    }
+
+
+def _batch_timing(logs):
+    """Compare a batch's wall-clock time with its summed per-source time.
+
+    Only logs written by ``sync_content_sources`` carry ``timings['batch']``
+    (its start and wall seconds). A "Sync All" may span several such
+    worker tasks, so the batch's wall time runs from the earliest task start
+    to the latest task end. Returns None when no log has batch timings.
+    """
+    spans = []
+    source_seconds = 0.0
+    workers = 0
+    for log in logs:
+        timings = getattr(log, 'timings', None) or {}
+        source_seconds += timings.get('total_seconds') or 0
+        batch = timings.get('batch')
+        if not batch:
+            continue
+        try:
+            started = datetime.datetime.fromisoformat(batch['started_at'])
+        except (KeyError, TypeError, ValueError):
+            continue
+        spans.append((started, started + datetime.timedelta(
+            seconds=batch.get('wall_seconds') or 0,
+        )))
+        workers = max(workers, batch.get('workers') or 1)
+    if not spans:
+        return None
+    wall_seconds = (
+        max(end for _start, end in spans) - min(start for start, _end in spans)
+    ).total_seconds()
+    return {
+        'wall_seconds': wall_seconds,
+        'source_seconds': source_seconds,
+        'workers': workers,
     }
 
 
@@ -0,0 +1,295 @@
+"""Anonymous full-page cache (``website.page_cache``).
+
+Covers serving decorated public views from the per-process cache,
+CSRF token and ``aslab_aid`` hole-punching, variant keys, bypass rules,
+invalidation from content saves and content syncs, and the merged
+metrics behind ``GET /api/diagnostics/page-cache``.
+"""
+
+import re
+import uuid
+from datetime import date
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.middleware.csrf import _unmask_cipher_token
+from django.test import Client, TestCase, override_settings
+
+from content.models import Article
+from integrations.config import clear_config_cache
+from integrations.models import IntegrationSetting
+from integrations.services.github import sync_content_source
+from integrations.tests.sync_fixtures import make_sync_repo
+from integrations.tiered_cache import shared_cache
+from website import page_cache
+from website.page_cache import (
+    PAGE_CACHE_HEADER,
+    deferred_page_cache_invalidation,
+    page_cache_metrics,
+    stats,
+)
+
+User = get_user_model()
+
+CONSENT_COOKIE = 'aslab_analytics_consent'
+_CONSENT_TOKEN_RE = re.compile(r'data-csrf-token="([A-Za-z0-9]{64})"')
+
+
+def _consent_panel_token(response):
+    return _CONSENT_TOKEN_RE.search(response.content.decode()).group(1)
+
+
+def _generation_publishes(mock_publish):
+    return [
+        c for c in mock_publish.call_args_list
+        if c.args[0] == page_cache._GENERATION_KEY
+    ]
+
+
+@override_settings(PAGE_CACHE_ENABLED=True, TIERED_CACHE_CHECK_INTERVAL=0)
+class _PageCacheTestCase(TestCase):
+    def setUp(self):
+        caches['page_cache'].clear()
+        caches['django_q'].clear()
+        shared_cache.clear_local()
+        stats.reset()
+        self.article = Article.objects.create(
+            title='Cached Post', slug='cached-post', date=date(2026, 1, 15),
+            published=True,
+        )
+
+    def get(self, path, client=None, **kwargs):
+        response = (client or self.client).get(path, **kwargs)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+
+class PageCacheServeTest(_PageCacheTestCase):
+    def test_second_anonymous_request_is_served_from_cache(self):
+        first = self.get('/blog')
+        # ``update`` sends no signal, so only a cache hit hides the change.
+        Article.objects.filter(pk=self.article.pk).update(title='Renamed')
+
+        second = self.get('/blog')
+
+        self.assertEqual(first[PAGE_CACHE_HEADER], 'MISS')
+        self.assertEqual(second[PAGE_CACHE_HEADER], 'HIT')
+        self.assertContains(second, 'Cached Post')
+        self.assertNotContains(second, 'Renamed')
+
+    def test_every_listed_public_page_is_cached(self):
+        for path in ('/', '/blog', '/blog/cached-post', '/courses', '/events',
+                     '/tags', '/tags/python'):
+            with self.subTest(path=path):
+                self.get(path)
+                self.assertEqual(self.get(path)[PAGE_CACHE_HEADER], 'HIT')
+
+    def test_csrf_token_is_fresh_and_valid_on_every_hit(self):
+        self.get('/blog')
+        visitor = Client()
+
+        hit = self.get('/blog', client=visitor)
+        again = self.get('/blog', client=visitor)
+
+        token = _consent_panel_token(hit)
+        self.assertNotEqual(token, _consent_panel_token(again))
+        secret = visitor.cookies['csrftoken'].value
+        self.assertEqual(_unmask_cipher_token(token), secret)
+
+    def test_hit_sets_the_csrf_cookie_for_a_new_visitor(self):
+        self.get('/blog')
+
+        hit = self.get('/blog', client=Client())
+
+        self.assertIn('csrftoken', hit.cookies)
+        self.assertIn('Cookie', hit['Vary'])
+
+    def test_query_string_is_its_own_variant(self):
+        self.get('/blog')
+
+        self.assertEqual(self.get('/blog?tag=python')[PAGE_CACHE_HEADER], 'MISS')
+
+    def test_consent_state_is_its_own_variant(self):
+        self.client.cookies[CONSENT_COOKIE] = 'denied'
+        self.get('/blog')
+        del self.client.cookies[CONSENT_COOKIE]
+
+        self.assertEqual(self.get('/blog')[PAGE_CACHE_HEADER], 'MISS')
+        self.assertEqual(self.get('/blog')[PAGE_CACHE_HEADER], 'HIT')
+
+    def test_anonymous_id_is_never_served_to_another_visitor(self):
+        IntegrationSetting.objects.create(
+            key='GOOGLE_ANALYTICS_ID', value='G-TESTXYZ', group='analytics',
+        )
+        clear_config_cache()
+        self.addCleanup(clear_config_cache)
+        first_id, second_id = str(uuid.uuid4()), str(uuid.uuid4())
+        self.client.cookies[CONSENT_COOKIE] = 'granted'
+        self.client.cookies['aslab_aid'] = first_id
+        self.assertContains(self.get('/blog'), first_id)
+        self.client.cookies['aslab_aid'] = second_id
+
+        hit = self.get('/blog')
+
+        self.assertEqual(hit[PAGE_CACHE_HEADER], 'HIT')
+        self.assertContains(hit, f'"user_id": "{second_id}"')
+        self.assertNotContains(hit, first_id)
+
+    def test_not_found_is_not_cached(self):
+        for _ in range(2):
+            self.assertEqual(self.client.get('/blog/missing').status_code, 404)
+
+        self.assertEqual(stats.snapshot()['stores'], 0)
+
+    @override_settings(PAGE_CACHE_ENABLED=False)
+    def test_disabled_cache_leaves_views_untouched(self):
+        self.get('/blog')
+
+        self.assertNotIn(PAGE_CACHE_HEADER, self.get('/blog'))
+
+
+class PageCacheBypassTest(_PageCacheTestCase):
+    def test_logged_in_visitor_bypasses_the_cache(self):
+        self.get('/blog')
+        user = User.objects.create_user(email='member@test.com', password='pw')
+        self.client.force_login(user)
+
+        response = self.get('/blog')
+
+        self.assertEqual(response[PAGE_CACHE_HEADER], 'BYPASS')
+
+    def test_session_cookie_bypasses_the_cache(self):
+        self.client.cookies['sessionid'] = 'anything'
+
+        self.assertEqual(self.get('/blog')[PAGE_CACHE_HEADER], 'BYPASS')
+
+    def test_authenticated_page_is_not_stored_for_anonymous_visitors(self):
+        user = User.objects.create_user(email='member@test.com', password='pw')
+        member = Client()
+        member.force_login(user)
+        self.get('/', client=member)
+
+        self.assertEqual(self.get('/')[PAGE_CACHE_HEADER], 'MISS')
+
+
+class PageCacheInvalidationTest(_PageCacheTestCase):
+    def test_content_save_invalidates_cached_pages(self):
+        self.get('/blog')
+        self.article.title = 'Renamed'
+        self.article.save()
+
+        response = self.get('/blog')
+
+        self.assertEqual(response[PAGE_CACHE_HEADER], 'MISS')
+        self.assertContains(response, 'Renamed')
+
+    def test_content_delete_invalidates_cached_pages(self):
+        self.get('/blog')
+        self.article.delete()
+
+        self.assertNotContains(self.get('/blog'), 'Cached Post')
+
+    def test_member_activity_does_not_invalidate(self):
+        self.get('/blog')
+
+        User.objects.create_user(email='member@test.com', password='pw')
+
+        self.assertEqual(self.get('/blog')[PAGE_CACHE_HEADER], 'HIT')
+
+    def test_deferred_block_publishes_one_generation(self):
+        with patch.object(
+            shared_cache, 'publish', wraps=shared_cache.publish,
+        ) as publish:
+            with deferred_page_cache_invalidation():
+                for index in range(3):
+                    self.article.title = f'Title {index}'
+                    self.article.save()
+                self.assertEqual(_generation_publishes(publish), [])
+
+        self.assertEqual(len(_generation_publishes(publish)), 1)
+
+    def test_content_sync_invalidates_once_on_completion(self):
+        source, repo = make_sync_repo(
+            self, repo_name='AI-Shipping-Labs/page-cache', prefix='page-cache-',
+        )
+        for slug in ('first', 'second', 'third'):
+            repo.write_markdown(
+                f'blog/{slug}.md',
+                {'title': slug.title(), 'slug': slug, 'date': '2026-01-15'},
+                'Body.\n',
+            )
+        self.get('/blog')
+
+        with patch.object(
+            shared_cache, 'publish', wraps=shared_cache.publish,
+        ) as publish:
+            sync_content_source(source, repo_dir=str(repo.path))
+
+        self.assertEqual(len(_generation_publishes(publish)), 1)
+        self.assertContains(self.get('/blog'), 'Second')
+
+    def test_sync_that_only_removes_content_retires_the_cached_page(self):
+        source, repo = make_sync_repo(
+            self, repo_name='AI-Shipping-Labs/page-cache', prefix='page-cache-',
+        )
+        repo.write_markdown(
+            'blog/withdrawn.md',
+            {'title': 'Withdrawn Post', 'slug': 'withdrawn', 'date': '2026-01-15'},
+            'Body.\n',
+        )
+        sync_content_source(source, repo_dir=str(repo.path))
+        self.get('/blog/withdrawn')
+        self.assertEqual(self.get('/blog/withdrawn')[PAGE_CACHE_HEADER], 'HIT')
+
+        (repo.path / 'blog' / 'withdrawn.md').unlink()
+        sync_content_source(source, repo_dir=str(repo.path))
+
+        response = self.client.get('/blog/withdrawn')
+        self.assertNotEqual(response.get(PAGE_CACHE_HEADER), 'HIT')
+        self.assertEqual(response.status_code, 404)
+
+
+class PageCacheMetricsTest(_PageCacheTestCase):
+    def test_hits_misses_and_latency_are_counted(self):
+        self.get('/blog')
+        self.get('/blog')
+        self.get('/blog')
+
+        totals = page_cache_metrics()['totals']
+
+        self.assertEqual((totals['hits'], totals['misses']), (2, 1))
+        self.assertEqual(totals['hit_ratio'], 0.6667)
+        self.assertIsNotNone(totals['serve_ms']['p95'])
+        self.assertGreaterEqual(totals['serve_ms']['max'], totals['serve_ms']['avg'])
+
+    def test_snapshots_from_other_workers_are_merged(self):
+        self.get('/blog')
+        other = {
+            **stats.snapshot(),
+            'process': 'other-host:99',
+            'hits': 9, 'misses': 1,
+        }
+        caches['django_q'].set(f'{page_cache._STATS_KEY_PREFIX}other-host:99', other)
+        caches['django_q'].set(
+            page_cache._STATS_PROCESSES_KEY, ['other-host:99'],
+        )
+
+        metrics = page_cache_metrics()
+
+        self.assertEqual(len(metrics['processes']), 2)
+        self.assertEqual(
+            (metrics['totals']['hits'], metrics['totals']['misses']), (9, 2),
+        )
+
+    def test_expired_worker_snapshots_drop_out(self):
+        caches['django_q'].set(
+            page_cache._STATS_PROCESSES_KEY, ['gone-host:1'],
+        )
+
+        metrics = page_cache_metrics()
+
+        self.assertEqual(
+            [p['process'] for p in metrics['processes']],
+            [page_cache._process_id()],
+        )
@@ -0,0 +1,462 @@
+"""Anonymous full-page response cache for public content pages.
+
+Public pages (home, blog, article detail, courses, workshops, events, tags)
+render the same HTML for every anonymous visitor except for two values:
+the masked CSRF token (a fresh mask on every ``get_token`` call) and, when
+analytics consent is granted, the visitor's ``aslab_aid`` UUID in the GA
+snippet. Views opt in with :func:`anonymous_page_cache`.
+
+Requests
+========
+
+Only ``GET``/``HEAD`` requests without a session cookie, a messages cookie
+or an ``Authorization`` header are served from or stored in the cache, so
+nothing here ever touches the session table or resolves a user. Variants
+are keyed by absolute URL (path + query), consent state and whether an
+``aslab_aid`` is rendered. Middleware still runs on every hit: cookies,
+redirects and security headers are not part of the stored entry.
+
+Storage and invalidation
+========================
+
+Entries live in the per-process ``caches['page_cache']`` LocMem backend
+(one copy per gunicorn worker) for ``PAGE_CACHE_TIMEOUT`` seconds. Every
+key embeds a generation stamp read through
+``integrations.tiered_cache.shared_cache``; :func:`invalidate_page_cache`
+publishes a new stamp, which every web process picks up within
+``TIERED_CACHE_CHECK_INTERVAL`` seconds. ``content.signals`` invalidates
+on saves of public content rows and the content sync invalidates once per
+run (see :func:`deferred_page_cache_invalidation`). Studio settings that
+are not content rows (integration config, banner) reach cached pages when
+entries expire.
+
+Metrics
+=======
+
+Each process counts hits, misses, bypasses and serve-from-cache latency
+and writes a snapshot to ``caches['django_q']`` at most every
+``PAGE_CACHE_STATS_FLUSH_INTERVAL`` seconds. :func:`page_cache_metrics`
+merges the live snapshots for ``GET /api/diagnostics/page-cache``. Every
+response from a decorated view also carries ``X-Page-Cache: HIT``,
+``MISS`` or ``BYPASS``.
+"""
+
+import hashlib
+import os
+import re
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import InvalidCacheBackendError
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DatabaseError
+from django.http import HttpResponse
+from django.middleware.csrf import _unmask_cipher_token, get_token
+from django.utils import timezone
+from django.utils.cache import patch_vary_headers
+
+from analytics.consent import analytics_consent_granted, analytics_consent_state
+from integrations.tiered_cache import shared_cache
+
+PAGE_CACHE_ALIAS = 'page_cache'
+PAGE_CACHE_HEADER = 'X-Page-Cache'
+STATS_CACHE_ALIAS = 'django_q'
+
+_GENERATION_KEY = 'page_cache:generation:v1'
+_STATS_KEY_PREFIX = 'page_cache:stats:v1:'
+_STATS_PROCESSES_KEY = 'page_cache:stats:v1:processes'
+_DEFAULT_TIMEOUT = 60
+_DEFAULT_STATS_FLUSH_INTERVAL = 30
+# A snapshot older than this belongs to a worker that has exited or been
+# recycled; it drops out of the merged metrics.
+_STATS_TTL = 15 * 60
+_CACHE_ERRORS = (InvalidCacheBackendError, ImproperlyConfigured, DatabaseError)
+
+_CSRF_PLACEHOLDER = b'\x00page-cache:csrf\x00'
+_ANON_ID_PLACEHOLDER = b'\x00page-cache:aslab-aid\x00'
+_MESSAGES_COOKIE = 'messages'
+_ASLAB_AID_COOKIE = 'aslab_aid'
+# A masked CSRF token: 64 characters from Django's CSRF_ALLOWED_CHARS.
+_MASKED_TOKEN_RE = re.compile(rb'(?<![A-Za-z0-9])[A-Za-z0-9]{64}(?![A-Za-z0-9])')
+_UNCACHEABLE_CACHE_CONTROL = ('private', 'no-store', 'no-cache')
+# Upper bounds (ms) of the serve-latency histogram; the last bucket is open.
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250)
+
+
+def page_cache_enabled():
+    return getattr(settings, 'PAGE_CACHE_ENABLED', False)
+
+
+def anonymous_page_cache(view_func):
+    """Serve ``view_func`` from the anonymous page cache when possible.
+
+    Apply it outermost so ``ensure_csrf_cookie`` and other view decorators
+    only run on a miss; a hit calls ``get_token`` itself, which keeps the
+    CSRF cookie behaviour of those views.
+    """
+
+    @wraps(view_func)
+    def wrapper(request, *args, **kwargs):
+        if not page_cache_enabled():
+            return view_func(request, *args, **kwargs)
+        if not _is_cacheable_request(request):
+            return _bypass(view_func, request, *args, **kwargs)
+        started = time.perf_counter()
+        generation = _current_generation()
+        if generation is None:
+            return _bypass(view_func, request, *args, **kwargs)
+
+        key = _cache_key(request, generation)
+        entry = caches[PAGE_CACHE_ALIAS].get(key)
+        if entry is not None:
+            response = _response_from_entry(request, entry)
+            stats.record_hit(time.perf_counter() - started)
+            return response
+
+        response = view_func(request, *args, **kwargs)
+        stored = _store(request, key, response)
+        stats.record_miss(time.perf_counter() - started, stored=stored)
+        response[PAGE_CACHE_HEADER] = 'MISS'
+        return response
+
+    return wrapper
+
+
+def invalidate_page_cache():
+    """Retire every cached page in every process.
+
+    Called from content save signals (outside a sync) and once per content
+    sync. Inside :func:`deferred_page_cache_invalidation` the publish is
+    postponed to the end of the block.
+    """
+    if not page_cache_enabled():
+        return
+    if _deferred.depth:
+        _deferred.pending = True
+        return
+    try:
+        shared_cache.publish(_GENERATION_KEY, uuid.uuid4().hex, None)
+    except _CACHE_ERRORS:
+        return
+    caches[PAGE_CACHE_ALIAS].clear()
+
+
+@contextmanager
+def deferred_page_cache_invalidation():
+    """Collapse the invalidations of a block into one, published on exit.
+
+    A content sync saves hundreds of rows; publishing a new generation for
+    each would be one shared-cache write per row and would keep every
+    worker's cache cold for the whole run. The deferral is per thread, so
+    concurrent syncs in one worker each publish their own.
+    """
+    _deferred.depth += 1
+    try:
+        yield
+    finally:
+        _deferred.depth -= 1
+        if not _deferred.depth and _deferred.pending:
+            _deferred.pending = False
+            invalidate_page_cache()
+
+
+class _DeferredInvalidation(threading.local):
+    depth = 0
+    pending = False
+
+
+_deferred = _DeferredInvalidation()
+
+
+def _bypass(view_func, request, *args, **kwargs):
+    stats.record_bypass()
+    response = view_func(request, *args, **kwargs)
+    response[PAGE_CACHE_HEADER] = 'BYPASS'
+    return response
+
+
+def _is_cacheable_request(request):
+    if request.method not in ('GET', 'HEAD'):
+        return False
+    cookies = request.COOKIES
+    if settings.SESSION_COOKIE_NAME in cookies or _MESSAGES_COOKIE in cookies:
+        return False
+    return 'HTTP_AUTHORIZATION' not in request.META
+
+
+def _current_generation():
+    try:
+        return shared_cache.get(_GENERATION_KEY, '')
+    except _CACHE_ERRORS:
+        return None
+
+
+def _anon_id(request):
+    """Return the ``aslab_aid`` the page will render, or ``''``.
+
+    Mirrors ``website.context_processors._validated_aslab_anon_id``: the id
+    is only rendered with consent and when the cookie is a UUID.
+    """
+    if not analytics_consent_granted(request):
+        return ''
+    raw = request.COOKIES.get(_ASLAB_AID_COOKIE, '') or ''
+    try:
+        uuid.UUID(str(raw))
+    except (ValueError, TypeError):
+        return ''
+    return raw
+
+
+def _cache_key(request, generation):
+    variant = '|'.join((
+        request.build_absolute_uri(),
+        analytics_consent_state(request),
+        'aid' if _anon_id(request) else '',
+    ))
+    digest = hashlib.sha256(variant.encode()).hexdigest()
+    return f'page:{generation}:{digest}'
+
+
+def _is_cacheable_response(request, response):
+    if response.status_code != 200 or response.streaming:
+        return False
+    if not response.get('Content-Type', '').startswith('text/html'):
+        return False
+    # ``ensure_csrf_cookie`` sets the CSRF cookie inside the view; a hit
+    # re-issues it through ``get_token``. Any other cookie is per visitor.
+    if set(response.cookies) - {settings.CSRF_COOKIE_NAME}:
+        return False
+    cache_control = response.get('Cache-Control', '').lower()
+    if any(token in cache_control for token in _UNCACHEABLE_CACHE_CONTROL):
+        return False
+    # The view may have written to the session or queued a message; the
+    # middleware would then attach a cookie this entry cannot replay.
+    session = getattr(request, 'session', None)
+    if session is not None and session.modified:
+        return False
+    messages = getattr(request, '_messages', None)
+    return not getattr(messages, 'added_new', False)
+
+
+def _store(request, key, response):
+    if not _is_cacheable_response(request, response):
+        return False
+    content = _punch_holes(request, response.content)
+    headers = [
+        (name, value) for name, value in response.items()
+        if name.lower() not in ('content-length', PAGE_CACHE_HEADER.lower())
+    ]
+    timeout = getattr(settings, 'PAGE_CACHE_TIMEOUT', _DEFAULT_TIMEOUT)
+    caches[PAGE_CACHE_ALIAS].set(
+        key, {'content': content, 'headers': headers}, timeout,
+    )
+    return True
+
+
+def _punch_holes(request, content):
+    """Replace the request's CSRF tokens and ``aslab_aid`` with placeholders."""
+    secret = request.META.get('CSRF_COOKIE')
+    if secret:
+        def replace_token(match):
+            token = match.group().decode()
+            if _unmask_cipher_token(token) == secret:
+                return _CSRF_PLACEHOLDER
+            return match.group()
+
+        content = _MASKED_TOKEN_RE.sub(replace_token, content)
+    anon_id = _anon_id(request)
+    if anon_id:
+        content = content.replace(anon_id.encode(), _ANON_ID_PLACEHOLDER)
+    return content
+
+
+def _response_from_entry(request, entry):
+    content = entry['content']
+    # Always mint a token, like ``ensure_csrf_cookie`` on the cached views,
+    # so the middleware sets the CSRF cookie on a visitor's first hit.
+    token = get_token(request)
+    if _CSRF_PLACEHOLDER in content:
+        content = content.replace(_CSRF_PLACEHOLDER, token.encode())
+    if _ANON_ID_PLACEHOLDER in content:
+        content = content.replace(
+            _ANON_ID_PLACEHOLDER, _anon_id(request).encode(),
+        )
+    response = HttpResponse(content)
+    for name, value in entry['headers']:
+        response[name] = value
+    patch_vary_headers(response, ('Cookie',))
+    response[PAGE_CACHE_HEADER] = 'HIT'
+    return response
+
+
+class PageCacheStats:
+    """Per-process page cache counters, flushed to the shared cache."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flushed_at = None
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.stores = 0
+            self.bypasses = 0
+            self.hit_seconds = 0.0
+            self.hit_max_seconds = 0.0
+            self.miss_seconds = 0.0
+            self.hit_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record_hit(self, seconds):
+        milliseconds = seconds * 1000
+        bucket = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if milliseconds <= bound),
+            len(LATENCY_BUCKETS_MS),
+        )
+        with self._lock:
+            self.hits += 1
+            self.hit_seconds += seconds
+            self.hit_max_seconds = max(self.hit_max_seconds, seconds)
+            self.hit_buckets[bucket] += 1
+        self._maybe_flush()
+
+    def record_miss(self, seconds, *, stored):
+        with self._lock:
+            self.misses += 1
+            self.stores += int(stored)
+            self.miss_seconds += seconds
+        self._maybe_flush()
+
+    def record_bypass(self):
+        with self._lock:
+            self.bypasses += 1
+        self._maybe_flush()
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'process': _process_id(),
+                'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'bypasses': self.bypasses,
+                'hit_seconds': round(self.hit_seconds, 6),
+                'hit_max_seconds': round(self.hit_max_seconds, 6),
+                'miss_seconds': round(self.miss_seconds, 6),
+                'hit_buckets': list(self.hit_buckets),
+                'recorded_at': timezone.now().isoformat(),
+            }
+
+    def flush(self):
+        """Write this process's snapshot to the shared cache."""
+        self._flushed_at = time.monotonic()
+        snapshot = self.snapshot()
+        process = snapshot['process']
+        try:
+            backend = caches[STATS_CACHE_ALIAS]
+            backend.set(f'{_STATS_KEY_PREFIX}{process}', snapshot, _STATS_TTL)
+            # Read-modify-write: two workers flushing at once can drop each
+            # other's name, but every flush re-adds its own.
+            processes = set(backend.get(_STATS_PROCESSES_KEY) or ())
+            if process not in processes:
+                backend.set(
+                    _STATS_PROCESSES_KEY, sorted(processes | {process}), None,
+                )
+        except _CACHE_ERRORS:
+            pass
+
+    def _maybe_flush(self):
+        interval = getattr(
+            settings, 'PAGE_CACHE_STATS_FLUSH_INTERVAL', _DEFAULT_STATS_FLUSH_INTERVAL,
+        )
+        flushed_at = self._flushed_at
+        if flushed_at is not None and time.monotonic() - flushed_at < interval:
+            return
+        self.flush()
+
+
+stats = PageCacheStats()
+
+
+def _process_id():
+    # Computed per call: gunicorn ``--preload`` forks workers after import.
+    return f'{socket.gethostname()}:{os.getpid()}'
+
+
+def page_cache_metrics():
+    """Merge the live per-process snapshots into one metrics payload.
+
+    Flushes this process first so the caller's own worker is current.
+    Latency percentiles are the upper bound of the histogram bucket they
+    fall in (``None`` when they land in the open last bucket).
+    """
+    stats.flush()
+    backend = caches[STATS_CACHE_ALIAS]
+    names = backend.get(_STATS_PROCESSES_KEY) or []
+    found = backend.get_many([f'{_STATS_KEY_PREFIX}{name}' for name in names])
+    snapshots = sorted(found.values(), key=lambda snap: snap['process'])
+    live = [snap['process'] for snap in snapshots]
+    if live != sorted(names):
+        backend.set(_STATS_PROCESSES_KEY, live, None)
+
+    totals = {
+        'hits': 0, 'misses': 0, 'stores': 0, 'bypasses': 0,
+        'hit_seconds': 0.0, 'hit_max_seconds': 0.0, 'miss_seconds': 0.0,
+        'hit_buckets': [0] * (len(LATENCY_BUCKETS_MS) + 1),
+    }
+    for snap in snapshots:
+        for field in ('hits', 'misses', 'stores', 'bypasses', 'hit_seconds', 'miss_seconds'):
+            totals[field] += snap[field]
+        totals['hit_max_seconds'] = max(totals['hit_max_seconds'], snap['hit_max_seconds'])
+        totals['hit_buckets'] = [
+            a + b for a, b in zip(totals['hit_buckets'], snap['hit_buckets'], strict=True)
+        ]
+    return {
+        'enabled': page_cache_enabled(),
+        'totals': _summarize(totals),
+        'processes': [
+            {'process': snap['process'], 'recorded_at': snap['recorded_at'], **_summarize(snap)}
+            for snap in snapshots
+        ],
+    }
+
+
+def _summarize(counts):
+    hits, misses = counts['hits'], counts['misses']
+    lookups = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'stores': counts['stores'],
+        'bypasses': counts['bypasses'],
+        'hit_ratio': round(hits / lookups, 4) if lookups else None,
+        'serve_ms': {
+            'avg': round(counts['hit_seconds'] * 1000 / hits, 3) if hits else None,
+            'p50': _bucket_percentile(counts['hit_buckets'], 0.5),
+            'p95': _bucket_percentile(counts['hit_buckets'], 0.95),
+            'max': round(counts['hit_max_seconds'] * 1000, 3),
+        },
+        'miss_ms_avg': (
+            round(counts['miss_seconds'] * 1000 / misses, 3) if misses else None
+        ),
+    }
+
+
+def _bucket_percentile(buckets, fraction):
+    total = sum(buckets)
+    if not total:
+        return None
+    threshold = total * fraction
+    seen = 0
+    for bound, count in zip((*LATENCY_BUCKETS_MS, None), buckets, strict=True):
+        seen += count
+        if seen >= threshold:
+            return bound
+    return None
@@ -6,6 +6,7 @@ Generated by 'django-admin startproject' using Django 6.0.2.
 
 import os
 import sys
+import tempfile
 import warnings
 from pathlib import Path
 
@@ -182,6 +183,9 @@ MIDDLEWARE = [
     # Must come right after SecurityMiddleware so static responses still
     # get security headers but skip session / auth / CSRF processing.
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    # Read the cross-process integration settings stamp once per request
+    # instead of on every get_config() call. See integrations/config.py.
+    'integrations.middleware.IntegrationConfigSnapshotMiddleware',
     'integrations.middleware.RemoveTrailingSlashMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -201,6 +205,10 @@ MIDDLEWARE = [
 
 APPEND_SLASH = True
 
+# Database sessions that also record the logged-in user id, so signing a
+# user out everywhere is one indexed delete. See accounts/sessions.py.
+SESSION_ENGINE = 'accounts.sessions'
+
 ROOT_URLCONF = 'website.urls'
 
 TEMPLATES = [
@@ -500,6 +508,24 @@ SYNC_RUNNING_THRESHOLD_MINUTES = int(
     os.environ.get('SYNC_RUNNING_THRESHOLD_MINUTES', 30),
 )
 
+# How many content sources one worker task syncs at once. "Sync All" splits
+# its sources into chunks of this size, one django-q task per chunk, and
+# each task overlaps clone/fetch and S3 upload across its chunk. On SQLite
+# the DB write phase still runs one source at a time. See
+# integrations.services.github_sync.scheduler.
+CONTENT_SYNC_PARALLELISM = int(os.environ.get('CONTENT_SYNC_PARALLELISM', 4))
+
+# Per-source git checkouts kept on the worker's disk between content syncs
+# and updated with a depth-1 fetch instead of a fresh clone. Empty disables
+# the cache (the default under tests). Checkouts beyond
+# GITHUB_SYNC_CACHE_MAX_MB are evicted least recently used first. See
+# integrations.services.github_sync.clone_cache.
+GITHUB_SYNC_CACHE_DIR = os.environ.get(
+    'GITHUB_SYNC_CACHE_DIR',
+    '' if TESTING else os.path.join(tempfile.gettempdir(), 'github-sync-cache'),
+)
+GITHUB_SYNC_CACHE_MAX_MB = int(os.environ.get('GITHUB_SYNC_CACHE_MAX_MB', 2048))
+
 # Custom user model
 AUTH_USER_MODEL = 'accounts.User'
 
@@ -522,6 +548,16 @@ LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
 LOGIN_URL = '/accounts/login/'
 LOGIN_API_SLOW_MS = float(os.environ.get('LOGIN_API_SLOW_MS', 750))
+# Seconds a verified API token / member API key stays in the per-process
+# digest cache, skipping the PBKDF2 check on repeat requests. Revoke, delete
+# and rotate still take effect immediately. 0 disables the cache. See
+# accounts/utils/api_key_cache.py.
+API_KEY_VERIFY_CACHE_TTL = int(os.environ.get('API_KEY_VERIFY_CACHE_TTL', 300))
+# Token.last_used_at is only rewritten once it is older than this many
+# seconds, so Studio's API token list is accurate to within this window.
+API_TOKEN_LAST_USED_GRANULARITY = int(
+    os.environ.get('API_TOKEN_LAST_USED_GRANULARITY', 60)
+)
 
 # Social account settings
 SOCIALACCOUNT_AUTO_SIGNUP = True
@@ -658,8 +694,36 @@ CACHES = {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     },
     'django_q': _django_q_cache,
+    # Per-process store for website.page_cache (anonymous public pages).
+    'page_cache': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'page-cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('PAGE_CACHE_MAX_ENTRIES', 1000)),
+        },
+    },
 }
 
+# Anonymous full-page cache for public content pages (website/page_cache.py).
+# Opt-in: operators set PAGE_CACHE_ENABLED=true per deployment. Tests that
+# exercise it enable it with override_settings. PAGE_CACHE_TIMEOUT bounds
+# staleness for inputs that are not content rows (Studio settings,
+# time-relative event lists).
+PAGE_CACHE_ENABLED = _bool_env('PAGE_CACHE_ENABLED', default=False)
+PAGE_CACHE_TIMEOUT = int(os.environ.get('PAGE_CACHE_TIMEOUT', 60))
+PAGE_CACHE_STATS_FLUSH_INTERVAL = float(
+    os.environ.get('PAGE_CACHE_STATS_FLUSH_INTERVAL', '30')
+)
+
+# Per-process L1 in front of ``caches['django_q']`` for values read on every
+# public request (redirects, banner, nav flags, config stamp). Each process
+# re-reads the shared generation stamp at most once per CHECK_INTERVAL
+# seconds, so a Studio save propagates within that window; L1_TTL bounds
+# how long any single entry is served without going back to the table.
+# See integrations/tiered_cache.py.
+TIERED_CACHE_CHECK_INTERVAL = float(os.environ.get('TIERED_CACHE_CHECK_INTERVAL', '2'))
+TIERED_CACHE_L1_TTL = float(os.environ.get('TIERED_CACHE_L1_TTL', '60'))
+
 # Django-Q2 task queue configuration
 # Default workers=1 on SQLite — concurrent writers serialise on the file lock
 # and surface as "database is locked" during bulk syncs. Override with